@@ -29,35 +29,76 @@ Examples
 ...     resp = ml.manage.databases.get_list()
 """
 
-import logging.config
+from __future__ import annotations
+
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any
 
-import yaml
 from haggis.logs import add_logging_level
 
-from . import utils
-from .clients import (
-    DEFAULT_RETRY_STRATEGY,
-    MARKLOGIC_ADMIN_API_PORT,
-    MARKLOGIC_MANAGE_API_PORT,
-    MARKLOGIC_REST_API_PORT,
-    RESTART_RETRY_STRATEGY,
-    ApiClient,
-    AsyncApiClient,
-    AsyncHttpClient,
-    AsyncMLClient,
-    HttpClient,
-    MLClient,
-)
-from .ml_client_manager import MLClientManager
-from .ml_environment import MLEnvironment
-from .ml_response_parser import MLResponseParser
+from . import yaml_cache
+
+if TYPE_CHECKING:
+    from .clients import (
+        DEFAULT_RETRY_STRATEGY,
+        MARKLOGIC_ADMIN_API_PORT,
+        MARKLOGIC_MANAGE_API_PORT,
+        MARKLOGIC_REST_API_PORT,
+        RESTART_RETRY_STRATEGY,
+        ApiClient,
+        AsyncApiClient,
+        AsyncHttpClient,
+        AsyncMLClient,
+        HttpClient,
+        MLClient,
+    )
+    from .ml_client_manager import MLClientManager
+    from .ml_environment import MLEnvironment
+    from .ml_response_parser import MLResponseParser
+
+# Exported names imported on first access (PEP 562), so that importing
+# the package does not import HTTP clients, models and their dependencies
+_LAZY_IMPORTS = {
+    "DEFAULT_RETRY_STRATEGY": ".clients",
+    "MARKLOGIC_ADMIN_API_PORT": ".clients",
+    "MARKLOGIC_MANAGE_API_PORT": ".clients",
+    "MARKLOGIC_REST_API_PORT": ".clients",
+    "RESTART_RETRY_STRATEGY": ".clients",
+    "ApiClient": ".clients",
+    "AsyncApiClient": ".clients",
+    "AsyncHttpClient": ".clients",
+    "AsyncMLClient": ".clients",
+    "HttpClient": ".clients",
+    "MLClient": ".clients",
+    "MLClientManager": ".ml_client_manager",
+    "MLEnvironment": ".ml_environment",
+    "MLResponseParser": ".ml_response_parser",
+}
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    """Import an exported name on first access."""
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
 def setup_logger():
     """Set up MLClient logging configuration."""
-    with utils.get_resource("logging.yaml") as config_file:
-        config = yaml.safe_load(config_file.read())
-        logging.config.dictConfig(config)
+    config = yaml_cache.load_resource("logging.yaml")
+    # logging.config is imported here as only the CLI configures logging
+    importlib.import_module("logging.config").dictConfig(config)
 
 
 __version__ = "0.4.1"
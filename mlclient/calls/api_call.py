@@ -11,6 +11,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Any
 
 from mlclient import constants
+from mlclient.multipart import MultipartStream
 
 
 class ApiCall(metaclass=ABCMeta):
@@ -174,15 +175,15 @@ class ApiCall(metaclass=ABCMeta):
     @property
     def body(
         self,
-    ) -> str | dict | bytes | None:
+    ) -> str | dict | bytes | MultipartStream | None:
         """A request body.
 
         Returns
         -------
-        str | dict
+        str | dict | bytes | MultipartStream
             a request body
         """
-        if isinstance(self._body, (str, bytes)):
+        if isinstance(self._body, (str, bytes, MultipartStream)):
             return self._body
         if isinstance(self._body, dict):
             return self._body.copy()
@@ -191,13 +192,13 @@ class ApiCall(metaclass=ABCMeta):
     @body.setter
     def body(
         self,
-        body: str | dict | bytes,
+        body: str | dict | bytes | MultipartStream,
     ):
         """Set a request body.
 
         Parameters
         ----------
-        body : str | dict
+        body : str | dict | bytes | MultipartStream
             a request body
         """
         self._body = body
@@ -21,11 +21,10 @@ It exports 7 classes:
 
 from __future__ import annotations
 
-import json
 import re
 from typing import ClassVar
 
-from mlclient import constants, exceptions, utils
+from mlclient import constants, exceptions, json_codec, utils
 from mlclient.calls.api_call import ApiCall
 
 
@@ -139,7 +138,7 @@ class DatabasesPostCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="POST", content_type=content_type, body=body)
 
     @property
@@ -292,7 +291,7 @@ class DatabasePostCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="POST", content_type=content_type, body=body)
         self._database = database
 
@@ -488,7 +487,7 @@ class DatabasePropertiesPutCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="PUT", content_type=content_type, body=body)
         self._database = database
 
@@ -11,14 +11,13 @@ It exports 3 classes:
 
 from __future__ import annotations
 
-import json
 from typing import ClassVar
 
-from mlclient import constants, exceptions, utils
+from mlclient import constants, exceptions, json_codec, utils
 from mlclient.calls.api_call import ApiCall
 from mlclient.models.http import Category
 from mlclient.models.http import DocumentsBodyPart as BodyPart
-from mlclient.multipart import MultipartPart, encode_multipart_mixed
+from mlclient.multipart import MultipartPart, MultipartStream, encode_multipart_mixed
 
 
 class DocumentsGetCall(ApiCall):
@@ -199,6 +198,8 @@ class DocumentsPostCall(ApiCall):
         txid: str | None = None,
         temporal_collection: str | None = None,
         system_time: str | None = None,
+        *,
+        stream: bool = False,
     ):
         """Initialize DocumentsPostCall instance.
 
@@ -229,6 +230,10 @@ class DocumentsPostCall(ApiCall):
             Set the system start time for the insertion or update.
             This time will override the system time set by MarkLogic.
             Ignored if temporal-collection is not included in the request.
+        stream : bool, default False
+            Build the body as a MultipartStream sent chunk by chunk instead of
+            a single bytes object. Part contents are not copied and the
+            Content-Length header is computed up front from part sizes.
         """
         self._validate_params(body_parts)
 
@@ -243,7 +248,15 @@ class DocumentsPostCall(ApiCall):
             for trans_param_name, value in transform_params.items():
                 param = self._TRANS_PARAM_PREFIX + trans_param_name
                 self.add_param(param, value)
-        body, content_type = self._build_body(body_parts)
+        if stream:
+            body = self._build_body_stream(body_parts)
+            content_type = body.content_type
+            self.add_header(
+                constants.HEADER_NAME_CONTENT_LENGTH,
+                str(body.content_length),
+            )
+        else:
+            body, content_type = self._build_body(body_parts)
         self.add_header(constants.HEADER_NAME_CONTENT_TYPE, content_type)
         self.body = body
 
@@ -277,14 +290,22 @@ class DocumentsPostCall(ApiCall):
         parts = [cls._build_multipart_part(body_part) for body_part in body_parts]
         return encode_multipart_mixed(parts)
 
+    @classmethod
+    def _build_body_stream(
+        cls,
+        body_parts: list[BodyPart],
+    ) -> MultipartStream:
+        parts = [cls._build_multipart_part(body_part) for body_part in body_parts]
+        return MultipartStream(parts)
+
     @staticmethod
     def _build_multipart_part(
         body_part: BodyPart,
     ) -> MultipartPart:
         data = body_part.content
         if isinstance(data, dict):
-            data = json.dumps(data)
-        if isinstance(data, str):
+            data = json_codec.dumps_bytes(data)
+        elif isinstance(data, str):
             data = data.encode("utf-8")
         content_disp = body_part.disposition.to_header()
         return MultipartPart(
@@ -23,11 +23,10 @@ It exports 8 classes:
 
 from __future__ import annotations
 
-import json
 import re
 from typing import ClassVar
 
-from mlclient import constants, exceptions, utils
+from mlclient import constants, exceptions, json_codec, utils
 from mlclient.calls.api_call import ApiCall
 
 
@@ -180,7 +179,7 @@ class ForestsPostCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="POST", content_type=content_type, body=body)
         if wait_for_forest_to_mount is not None:
             wait_for_forest_to_mount = str(wait_for_forest_to_mount).lower()
@@ -238,7 +237,7 @@ class ForestsPutCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="PUT", content_type=content_type, body=body)
 
     @property
@@ -610,7 +609,7 @@ class ForestPropertiesPutCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="PUT", content_type=content_type, body=body)
         self._forest = forest
 
@@ -19,11 +19,10 @@ It exports 6 classes:
 
 from __future__ import annotations
 
-import json
 import re
 from typing import ClassVar
 
-from mlclient import constants, exceptions, utils
+from mlclient import constants, exceptions, json_codec, utils
 from mlclient.calls.api_call import ApiCall
 
 
@@ -129,7 +128,7 @@ class UsersPostCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="POST", content_type=content_type, body=body)
 
     @property
@@ -376,7 +375,7 @@ class UserPropertiesPutCall(ApiCall):
         self._validate_params(body)
         content_type = utils.get_content_type_header_for_data(body)
         if content_type == constants.HEADER_JSON and isinstance(body, str):
-            body = json.loads(body)
+            body = json_codec.loads(body)
         super().__init__(method="PUT", content_type=content_type, body=body)
         self._user = user
 
@@ -16,14 +16,16 @@ import logging
 from typing import ClassVar
 
 from cleo.application import Application
+from cleo.commands.command import Command
 from cleo.formatters.style import Style
 from cleo.io.inputs.input import Input
 from cleo.io.io import IO
 from cleo.io.outputs.output import Output, Verbosity
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
 
 from mlclient import __version__ as ml_client_version
 from mlclient import setup_logger
-from mlclient.cli.commands import CallEvalCommand, CallLogsCommand
+from mlclient.cli import commands
 
 
 class MLCLIentApplication(Application):
@@ -38,8 +40,15 @@ class MLCLIentApplication(Application):
         """Initialize MLCLIentApplication instance."""
         super().__init__(self._APP_NAME, ml_client_version)
         self.set_display_name(self._DISPLAY_NAME)
-        self.add(CallLogsCommand())
-        self.add(CallEvalCommand())
+        # Commands (and the client modules they use) are imported when run
+        self.set_command_loader(
+            FactoryCommandLoader(
+                {
+                    "call eval": _call_eval_command,
+                    "call logs": _call_logs_command,
+                },
+            ),
+        )
 
     def create_io(
         self,
@@ -145,6 +154,16 @@ class CleoAppHandler(logging.Handler):
         logger.handlers = [cleo_handler]
 
 
+def _call_eval_command() -> Command:
+    """Return a new call eval command."""
+    return commands.CallEvalCommand()
+
+
+def _call_logs_command() -> Command:
+    """Return a new call logs command."""
+    return commands.CallLogsCommand()
+
+
 def main() -> int:
     """Run an MLCLIent Application."""
     setup_logger()
@@ -13,7 +13,38 @@ It exports the following commands:
         Sends a GET request to the /manage/v2/logs endpoint.
 """
 
-from .call_eval import CallEvalCommand
-from .call_logs import CallLogsCommand
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .call_eval import CallEvalCommand
+    from .call_logs import CallLogsCommand
+
+# Commands imported on first access (PEP 562), so that the CLI imports
+# only the command being run
+_LAZY_IMPORTS = {
+    "CallEvalCommand": ".call_eval",
+    "CallLogsCommand": ".call_logs",
+}
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    """Import a command on first access."""
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = ["CallEvalCommand", "CallLogsCommand"]
@@ -7,6 +7,18 @@ Exports:
     * AsyncMLClient - async variant of MLClient
     * HttpClient - raw HTTP client
     * AsyncHttpClient - async variant of HttpClient
+    * PoolStats - a snapshot of an HTTP connection pool's statistics
+    * limits_for_concurrency - connection pool limits sized for a concurrency
+    * POOL_REGISTRY - the process-wide registry of pooled HTTP transports
+    * DIGEST_SESSION_CACHE - the process-wide cache of digest challenges
+    * Instrumentation - a base class of hooks observing HTTP requests
+    * CallbackInstrumentation - an instrumentation calling plain functions
+    * CompositeInstrumentation - an instrumentation notifying many of them
+    * MetricsRegistry - in-memory request metrics with a Prometheus exporter
+    * OpenTelemetryInstrumentation - OpenTelemetry spans of requests
+    * RequestInfo / RequestMetrics - a request and its metrics passed to hooks
+    * EndpointMetrics - request metrics aggregated for an endpoint
+    * HttpTracer - a formatter of HTTP traces with body caps, sampling and redaction
     * ApiClient - mid-level API client with call()
     * AsyncApiClient - async variant of ApiClient
 
@@ -17,28 +29,112 @@ Examples
 ...     resp = ml.manage.databases.get_list()
 """
 
-from .api_client import ApiClient, AsyncApiClient
-from .http_client import (
-    DEFAULT_RETRY_STRATEGY,
-    MARKLOGIC_ADMIN_API_PORT,
-    MARKLOGIC_MANAGE_API_PORT,
-    MARKLOGIC_REST_API_PORT,
-    RESTART_RETRY_STRATEGY,
-    AsyncHttpClient,
-    HttpClient,
-)
-from .ml_client import AsyncMLClient, MLClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_client import ApiClient, AsyncApiClient
+    from .digest_auth import DIGEST_SESSION_CACHE
+    from .http_client import (
+        DEFAULT_POOL_LIMITS,
+        DEFAULT_RETRY_STRATEGY,
+        MARKLOGIC_ADMIN_API_PORT,
+        MARKLOGIC_MANAGE_API_PORT,
+        MARKLOGIC_REST_API_PORT,
+        RESTART_RETRY_STRATEGY,
+        AsyncHttpClient,
+        HttpClient,
+        PoolStats,
+        limits_for_concurrency,
+    )
+    from .http_trace import HttpTracer
+    from .instrumentation import (
+        CallbackInstrumentation,
+        CompositeInstrumentation,
+        EndpointMetrics,
+        Instrumentation,
+        MetricsRegistry,
+        OpenTelemetryInstrumentation,
+        RequestInfo,
+        RequestMetrics,
+    )
+    from .ml_client import AsyncMLClient, MLClient
+    from .pool_registry import POOL_REGISTRY
+
+# Exported names imported on first access (PEP 562), so that a client
+# imports only the modules it needs
+_LAZY_IMPORTS = {
+    "ApiClient": ".api_client",
+    "AsyncApiClient": ".api_client",
+    "DIGEST_SESSION_CACHE": ".digest_auth",
+    "AsyncHttpClient": ".http_client",
+    "DEFAULT_POOL_LIMITS": ".http_client",
+    "DEFAULT_RETRY_STRATEGY": ".http_client",
+    "HttpClient": ".http_client",
+    "MARKLOGIC_ADMIN_API_PORT": ".http_client",
+    "MARKLOGIC_MANAGE_API_PORT": ".http_client",
+    "MARKLOGIC_REST_API_PORT": ".http_client",
+    "PoolStats": ".http_client",
+    "RESTART_RETRY_STRATEGY": ".http_client",
+    "limits_for_concurrency": ".http_client",
+    "HttpTracer": ".http_trace",
+    "CallbackInstrumentation": ".instrumentation",
+    "CompositeInstrumentation": ".instrumentation",
+    "EndpointMetrics": ".instrumentation",
+    "Instrumentation": ".instrumentation",
+    "MetricsRegistry": ".instrumentation",
+    "OpenTelemetryInstrumentation": ".instrumentation",
+    "RequestInfo": ".instrumentation",
+    "RequestMetrics": ".instrumentation",
+    "AsyncMLClient": ".ml_client",
+    "MLClient": ".ml_client",
+    "POOL_REGISTRY": ".pool_registry",
+}
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    """Import an exported name on first access."""
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
+    "DEFAULT_POOL_LIMITS",
     "DEFAULT_RETRY_STRATEGY",
+    "DIGEST_SESSION_CACHE",
     "MARKLOGIC_ADMIN_API_PORT",
     "MARKLOGIC_MANAGE_API_PORT",
     "MARKLOGIC_REST_API_PORT",
+    "POOL_REGISTRY",
     "RESTART_RETRY_STRATEGY",
     "ApiClient",
     "AsyncApiClient",
     "AsyncHttpClient",
     "AsyncMLClient",
+    "CallbackInstrumentation",
+    "CompositeInstrumentation",
+    "EndpointMetrics",
     "HttpClient",
+    "HttpTracer",
+    "Instrumentation",
     "MLClient",
+    "MetricsRegistry",
+    "OpenTelemetryInstrumentation",
+    "PoolStats",
+    "RequestInfo",
+    "RequestMetrics",
+    "limits_for_concurrency",
 ]
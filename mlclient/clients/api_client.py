@@ -6,6 +6,9 @@ via ApiCall objects.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
 from httpx import Response
 
 from mlclient.calls import ApiCall
@@ -38,8 +41,33 @@ class ApiClient:
             params=call_.params,
             headers=call_.headers,
             body=call_.body,
+            label=call_.__class__.__name__,
         )
 
+    @contextmanager
+    def stream(self, call_: ApiCall) -> Iterator[Response]:
+        """Send a request using an ApiCall object and stream the response body.
+
+        Parameters
+        ----------
+        call_ : ApiCall
+            A specific endpoint call implementation
+
+        Returns
+        -------
+        Iterator[Response]
+            A context manager yielding an HTTP response with an unread body
+        """
+        with self._http.stream(
+            method=call_.method,
+            endpoint=call_.endpoint,
+            params=call_.params,
+            headers=call_.headers,
+            body=call_.body,
+            label=call_.__class__.__name__,
+        ) as resp:
+            yield resp
+
 
 class AsyncApiClient:
     """Async mid-level client providing call() for ApiCall objects."""
@@ -66,4 +94,29 @@ class AsyncApiClient:
             params=call_.params,
             headers=call_.headers,
             body=call_.body,
+            label=call_.__class__.__name__,
         )
+
+    @asynccontextmanager
+    async def stream(self, call_: ApiCall) -> AsyncIterator[Response]:
+        """Send a request using an ApiCall object and stream the response body.
+
+        Parameters
+        ----------
+        call_ : ApiCall
+            A specific endpoint call implementation
+
+        Returns
+        -------
+        AsyncIterator[Response]
+            An async context manager yielding an HTTP response with an unread body
+        """
+        async with self._http.stream(
+            method=call_.method,
+            endpoint=call_.endpoint,
+            params=call_.params,
+            headers=call_.headers,
+            body=call_.body,
+            label=call_.__class__.__name__,
+        ) as resp:
+            yield resp
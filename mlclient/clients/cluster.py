@@ -0,0 +1,244 @@
+"""The ML Cluster module.
+
+It exports tools spreading requests across hosts of a MarkLogic cluster:
+    * HostBalancer
+        A thread-safe balancer of requests across cluster hosts.
+    * parse_host_names
+        Parse host names keyed by host id from a Manage API hosts response.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterable
+
+from mlclient import json_codec
+from mlclient.exceptions import WrongParametersError
+
+logger = logging.getLogger(__name__)
+
+HOSTS_ENDPOINT = "/manage/v2/hosts"
+ROUND_ROBIN = "round-robin"
+LEAST_OUTSTANDING = "least-outstanding"
+
+
+class HostBalancer:
+    """A thread-safe balancer of requests across cluster hosts.
+
+    Every request acquires a host and releases it once its response has been
+    read, reporting whether the host was healthy. Hosts are chosen in turns
+    (round-robin) or by the lowest number of requests in flight
+    (least-outstanding). An unhealthy host is ejected for eject_duration
+    seconds; afterward, a single request is let through to probe it - the host
+    is re-admitted when the probe succeeds and ejected again otherwise. When
+    all hosts are ejected, the one to be re-admitted first is used anyway.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        strategy: str = ROUND_ROBIN,
+        eject_duration: float = 30.0,
+    ):
+        """Initialize HostBalancer instance.
+
+        Parameters
+        ----------
+        hosts : Iterable[str]
+            Host names to spread requests across
+        strategy : str, default "round-robin"
+            A balancing strategy (round-robin / least-outstanding)
+        eject_duration : float, default 30.0
+            A number of seconds an unhealthy host is ejected for
+
+        Raises
+        ------
+        WrongParametersError
+            If there are no hosts or the strategy is unknown
+        """
+        self._hosts: list[str] = list(dict.fromkeys(hosts))
+        if not self._hosts:
+            msg = "HostBalancer requires at least one host!"
+            raise WrongParametersError(msg)
+        if strategy not in {ROUND_ROBIN, LEAST_OUTSTANDING}:
+            msg = (
+                f"Unknown balancing strategy [{strategy}]! "
+                f"Available: {ROUND_ROBIN}, {LEAST_OUTSTANDING}"
+            )
+            raise WrongParametersError(msg)
+        self._strategy: str = strategy
+        self._eject_duration: float = eject_duration
+        self._outstanding: dict[str, int] = dict.fromkeys(self._hosts, 0)
+        self._ejected_until: dict[str, float] = {}
+        self._probing: set[str] = set()
+        self._turn: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def hosts(
+        self,
+    ) -> list[str]:
+        """Return all balanced hosts."""
+        return list(self._hosts)
+
+    @property
+    def strategy(
+        self,
+    ) -> str:
+        """Return the balancing strategy."""
+        return self._strategy
+
+    @property
+    def healthy_hosts(
+        self,
+    ) -> list[str]:
+        """Return hosts not ejected at the moment."""
+        with self._lock:
+            return [host for host in self._hosts if host not in self._ejected_until]
+
+    def outstanding(
+        self,
+        host: str,
+    ) -> int:
+        """Return a number of requests in flight to a host."""
+        return self._outstanding[host]
+
+    def acquire(
+        self,
+        exclude: Iterable[str] = (),
+    ) -> str | None:
+        """Choose a host for a request.
+
+        Parameters
+        ----------
+        exclude : Iterable[str], default ()
+            Hosts not to choose (e.g. the ones a request has already failed on)
+
+        Returns
+        -------
+        str | None
+            A host name, or None if all hosts are excluded
+        """
+        excluded = set(exclude)
+        with self._lock:
+            host = (
+                self._next_probe(excluded)
+                or self._next_healthy(excluded)
+                or self._next_ejected(excluded)
+            )
+            if host is not None:
+                self._outstanding[host] += 1
+            return host
+
+    def release(
+        self,
+        host: str,
+        healthy: bool = True,
+    ):
+        """Release a host once a request has been completed.
+
+        Parameters
+        ----------
+        host : str
+            A host name returned by acquire()
+        healthy : bool, default True
+            Whether the host has served the request properly
+        """
+        with self._lock:
+            self._outstanding[host] -= 1
+            probed = host in self._probing
+            self._probing.discard(host)
+            if not healthy:
+                self._eject(host)
+            elif probed:
+                del self._ejected_until[host]
+                logger.info("Host [%s] has been re-admitted", host)
+
+    def eject(
+        self,
+        host: str,
+    ):
+        """Eject a host for the eject duration."""
+        with self._lock:
+            self._eject(host)
+
+    def _eject(
+        self,
+        host: str,
+    ):
+        """Eject a host (the lock is held by the caller)."""
+        self._ejected_until[host] = time.monotonic() + self._eject_duration
+        logger.warning(
+            "Host [%s] has been ejected for %s seconds",
+            host,
+            self._eject_duration,
+        )
+
+    def _next_probe(
+        self,
+        excluded: set[str],
+    ) -> str | None:
+        """Return an ejected host due for a probe, if any."""
+        now = time.monotonic()
+        for host, until in self._ejected_until.items():
+            if until <= now and host not in self._probing and host not in excluded:
+                self._probing.add(host)
+                return host
+        return None
+
+    def _next_healthy(
+        self,
+        excluded: set[str],
+    ) -> str | None:
+        """Return a healthy host according to the strategy."""
+        candidates = [
+            host
+            for host in self._hosts
+            if host not in self._ejected_until and host not in excluded
+        ]
+        if not candidates:
+            return None
+        if self._strategy == LEAST_OUTSTANDING:
+            return min(candidates, key=self._outstanding.__getitem__)
+        while self._hosts[self._turn] not in candidates:
+            self._turn = (self._turn + 1) % len(self._hosts)
+        host = self._hosts[self._turn]
+        self._turn = (self._turn + 1) % len(self._hosts)
+        return host
+
+    def _next_ejected(
+        self,
+        excluded: set[str],
+    ) -> str | None:
+        """Return the ejected host to be re-admitted first."""
+        candidates = [host for host in self._ejected_until if host not in excluded]
+        if not candidates:
+            return None
+        return min(candidates, key=self._ejected_until.__getitem__)
+
+
+def parse_host_names(
+    content: bytes | str,
+) -> dict[str, str]:
+    """Parse host names keyed by host id from a Manage API hosts response.
+
+    Parameters
+    ----------
+    content : bytes | str
+        A JSON body of a GET /manage/v2/hosts?format=json response
+
+    Returns
+    -------
+    dict[str, str]
+        Host names keyed by host id
+    """
+    host_list = json_codec.loads(content)["host-default-list"]
+    data = host_list["list-items"]["list-item"]
+    hosts = data if isinstance(data, list) else [data]
+    return {
+        host_info["idref"]: host_info["nameref"]
+        for host_info in hosts
+        if host_info.get("idref") and host_info.get("nameref")
+    }
@@ -0,0 +1,201 @@
+"""The ML Digest Auth module.
+
+It exports a digest authentication with challenges cached across clients:
+    * DigestSessionCache
+        A thread-safe cache of digest challenges keyed by server.
+    * CachedDigestAuth
+        A digest authentication sending preemptive Authorization headers.
+    * DIGEST_SESSION_CACHE
+        The process-wide DigestSessionCache instance.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Generator
+
+from httpx import Cookies, DigestAuth, Request, Response, codes
+
+logger = logging.getLogger(__name__)
+
+
+class _DigestSession:
+    """A cached digest challenge with its nonce count."""
+
+    __slots__ = ("challenge", "nonce_count")
+
+    def __init__(
+        self,
+        challenge: object,
+    ):
+        self.challenge: object = challenge
+        self.nonce_count: int = 0
+
+
+class DigestSessionCache:
+    """A thread-safe cache of digest challenges keyed by server.
+
+    A challenge (realm, nonce, ...) received from a server is reused by all
+    CachedDigestAuth instances authenticating against it, with a nonce count
+    incremented for every request. It is replaced only when the server rejects
+    it (e.g. with a stale nonce).
+    """
+
+    def __init__(
+        self,
+    ):
+        """Initialize DigestSessionCache instance."""
+        self._sessions: dict[tuple, _DigestSession] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return a number of cached challenges."""
+        return len(self._sessions)
+
+    def next_use(
+        self,
+        key: tuple,
+    ) -> tuple[object, int] | None:
+        """Return a cached challenge with its next nonce count.
+
+        Parameters
+        ----------
+        key : tuple
+            A server key (scheme, host, port)
+
+        Returns
+        -------
+        tuple[object, int] | None
+            A challenge with a nonce count, or None if no challenge is cached
+        """
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                return None
+            session.nonce_count += 1
+            return session.challenge, session.nonce_count
+
+    def store(
+        self,
+        key: tuple,
+        challenge: object,
+    ) -> int:
+        """Cache a new challenge of a server.
+
+        Parameters
+        ----------
+        key : tuple
+            A server key (scheme, host, port)
+        challenge : object
+            A parsed digest challenge
+
+        Returns
+        -------
+        int
+            The nonce count of the first use of the challenge
+        """
+        with self._lock:
+            session = _DigestSession(challenge)
+            session.nonce_count = 1
+            self._sessions[key] = session
+            return session.nonce_count
+
+    def clear(
+        self,
+    ):
+        """Remove all cached challenges."""
+        with self._lock:
+            self._sessions.clear()
+
+
+DIGEST_SESSION_CACHE = DigestSessionCache()
+
+
+class CachedDigestAuth(DigestAuth):
+    """A digest authentication sending preemptive Authorization headers.
+
+    Unlike httpx.DigestAuth keeping the last challenge per instance, it keeps
+    challenges in a DigestSessionCache, so new clients authenticate their first
+    request without an extra 401 round trip. When a cached challenge is
+    rejected, the request is retried once with the new one.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cache: DigestSessionCache | None = None,
+    ):
+        """Initialize CachedDigestAuth instance.
+
+        Parameters
+        ----------
+        username : str
+            A username
+        password : str
+            A password
+        cache : DigestSessionCache | None, default None
+            A challenge cache; the process-wide one if not provided
+        """
+        super().__init__(username, password)
+        self._cache: DigestSessionCache = cache or DIGEST_SESSION_CACHE
+        self._lock: threading.Lock = threading.Lock()
+
+    def auth_flow(
+        self,
+        request: Request,
+    ) -> Generator[Request, Response, None]:
+        """Authenticate a request, preemptively when a challenge is cached."""
+        key = (request.url.scheme, request.url.host, request.url.port)
+        cached = self._cache.next_use(key)
+        if cached is not None:
+            request.headers["Authorization"] = self._authorization(request, *cached)
+
+        response = yield request
+
+        auth_header = self._digest_challenge_header(response)
+        if auth_header is None:
+            return
+
+        challenge = self._parse_challenge(request, response, auth_header)
+        if cached is not None:
+            logger.debug(
+                "Cached digest challenge rejected by [%s] (stale: %s)",
+                request.url.host,
+                "stale=true" in auth_header.lower(),
+            )
+        nonce_count = self._cache.store(key, challenge)
+        request.headers["Authorization"] = self._authorization(
+            request,
+            challenge,
+            nonce_count,
+        )
+        if response.cookies:
+            Cookies(response.cookies).set_cookie_header(request=request)
+        yield request
+
+    def _authorization(
+        self,
+        request: Request,
+        challenge: object,
+        nonce_count: int,
+    ) -> str:
+        """Build an Authorization header value with a given nonce count."""
+        with self._lock:
+            self._nonce_count = nonce_count
+            return self._build_auth_header(request, challenge)
+
+    @staticmethod
+    def _digest_challenge_header(
+        response: Response,
+    ) -> str | None:
+        """Return a digest WWW-Authenticate header of a 401 response."""
+        if response.status_code != codes.UNAUTHORIZED:
+            return None
+        for auth_header in response.headers.get_list("www-authenticate"):
+            if auth_header.lower().startswith("digest "):
+                return auth_header
+        return None
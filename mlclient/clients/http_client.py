@@ -1,14 +1,32 @@
 """The HTTP Client module (HttpClient / AsyncHttpClient).
 
-Exports sync and async HTTP clients for raw communication with MarkLogic.
+Exports sync and async HTTP clients for raw communication with MarkLogic,
+along with connection pool settings and statistics:
+    * HttpClient
+        A low-level class used to send HTTP requests to a MarkLogic instance.
+    * AsyncHttpClient
+        An async low-level class used to send HTTP requests.
+    * PoolStats
+        A snapshot of an HTTP connection pool's statistics.
+    * limits_for_concurrency
+        Return connection pool limits sized for a number of concurrent requests.
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
-import ssl
-from collections.abc import Mapping
+import threading
+from collections.abc import AsyncIterable, AsyncIterator, Iterator, Mapping
+from contextlib import (
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
 from types import TracebackType
+from typing import Callable, NamedTuple
 
 import httpx
 from httpx import (
@@ -17,16 +35,36 @@ from httpx import (
     Auth,
     BasicAuth,
     Client,
-    DigestAuth,
     HTTPTransport,
+    Limits,
+    Request,
     Response,
 )
 from httpx_retries import Retry, RetryTransport
 
 from mlclient import constants as const
+from mlclient import json_codec
+from mlclient.exceptions import WrongParametersError
 from mlclient.mimetypes import Mimetypes
 from mlclient.models import DocumentType
 
+from .cluster import HOSTS_ENDPOINT, ROUND_ROBIN, HostBalancer, parse_host_names
+from .digest_auth import CachedDigestAuth
+from .http_trace import HttpTracer, LazyMessage
+from .instrumentation import (
+    Instrumentation,
+    RequestInfo,
+    RequestRecorder,
+    current_recorder,
+    record_request,
+)
+from .pool_registry import (
+    POOL_REGISTRY,
+    SHARED_SSL_CONTEXT,
+    AsyncSharedTransport,
+    SharedTransport,
+    credentials_digest,
+)
 from .restart_waiter import RestartWaiter
 
 logger = logging.getLogger(__name__)
@@ -35,10 +73,12 @@ MARKLOGIC_REST_API_PORT = 8000
 MARKLOGIC_ADMIN_API_PORT = 8001
 MARKLOGIC_MANAGE_API_PORT = 8002
 
-# Reuse a single SSL context across all clients. Without this, every
-# HTTPTransport() call invokes ssl.SSLContext.load_verify_locations which
-# re-reads the system CA bundle from disk (~60-120 ms each).
-_SHARED_SSL_CONTEXT = ssl.create_default_context()
+# httpx defaults, kept explicit so that they can be reported in pool statistics
+DEFAULT_POOL_LIMITS = Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=5.0,
+)
 
 DEFAULT_RETRY_STRATEGY = Retry(
     total=5,
@@ -61,6 +101,75 @@ RESTART_RETRY_STRATEGY = Retry(
 )
 
 
+class PoolStats(NamedTuple):
+    """A snapshot of an HTTP connection pool's statistics.
+
+    Attributes
+    ----------
+    connections : int
+        a number of open connections
+    in_use : int
+        a number of connections serving requests
+    idle : int
+        a number of idle keep-alive connections
+    requests : int
+        a number of requests in flight, including the ones waiting
+        for a connection
+    queued : int
+        a total number of requests sent when requests in flight already
+        occupied all connections allowed, so that they were queued by the pool
+        (an estimate, counted for HTTP/1.1 only - HTTP/2 multiplexes requests)
+    max_connections : int | None
+        a maximum number of connections (None for no limit)
+    max_keepalive_connections : int | None
+        a maximum number of idle keep-alive connections (None for no limit)
+    http2 : bool
+        whether HTTP/2 is enabled
+    hosts : int
+        a number of hosts with their own pools (in the cluster mode, limits
+        apply to every host separately and other values are summed up)
+    """
+
+    connections: int
+    in_use: int
+    idle: int
+    requests: int
+    queued: int
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    http2: bool
+    hosts: int = 1
+
+
+def limits_for_concurrency(
+    concurrency: int,
+    keepalive_expiry: float | None = 5.0,
+) -> Limits:
+    """Return connection pool limits sized for a number of concurrent requests.
+
+    Every concurrent request gets its own connection, kept alive between
+    requests, so that no request waits for a free connection and no
+    connection is re-established while the concurrency is sustained.
+
+    Parameters
+    ----------
+    concurrency : int
+        A maximum number of concurrent requests
+    keepalive_expiry : float | None, default 5.0
+        A number of seconds an idle connection is kept alive for
+
+    Returns
+    -------
+    Limits
+        Connection pool limits
+    """
+    return Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
 class HttpClientBase:
     """Shared base for sync and async HTTP clients.
 
@@ -80,6 +189,18 @@ class HttpClientBase:
         a password
     base_url : str
         a base url built based on the protocol, the host name and the port
+    limits : Limits
+        connection pool limits
+    http2 : bool
+        whether HTTP/2 is enabled
+    cluster : bool
+        whether requests are spread across all hosts of a cluster
+    balancing : str
+        a strategy of spreading requests across hosts
+    instrumentation : Instrumentation | None
+        hooks observing requests and their metrics
+    tracer : HttpTracer
+        a formatter of HTTP traces logged at the DEBUG and FINE levels
     """
 
     def __init__(
@@ -91,6 +212,13 @@ class HttpClientBase:
         username: str = "admin",
         password: str = "admin",
         retry: Retry | None = None,
+        *,
+        limits: Limits | None = None,
+        http2: bool = False,
+        cluster: bool = False,
+        balancing: str = ROUND_ROBIN,
+        instrumentation: Instrumentation | None = None,
+        tracer: HttpTracer | None = None,
     ):
         """Initialize HttpClientBase instance.
 
@@ -110,7 +238,37 @@ class HttpClientBase:
             A password
         retry : Retry | None, default Retry(total=5, backoff_factor=0.5)
             A retry strategy
+        limits : Limits | None, default Limits(100, 20, 5.0)
+            Connection pool limits (max connections, max keep-alive connections
+            and keep-alive expiry)
+        http2 : bool, default False
+            Whether to negotiate HTTP/2 (requires the h2 package). Over HTTPS
+            concurrent requests are then multiplexed over a single connection.
+        cluster : bool, default False
+            Whether to spread requests across all hosts of a cluster. Hosts are
+            discovered through the Manage API (/manage/v2/hosts) on connect,
+            every host gets its own connection pool, and unhealthy hosts are
+            ejected until a probe request succeeds. Host names must resolve
+            from the client machine.
+        balancing : str, default "round-robin"
+            A strategy of spreading requests across hosts in the cluster mode
+            (round-robin / least-outstanding)
+        instrumentation : Instrumentation | None, default None
+            Hooks observing requests and their metrics (e.g. MetricsRegistry).
+            Every attempt of a request is recorded, including retries. Without
+            instrumentation requests are not measured at all.
+        tracer : HttpTracer | None, default HttpTracer()
+            A formatter of HTTP traces, capping traced bodies at 4 KiB. Traces
+            are built only when logged at an enabled level.
+
+        Raises
+        ------
+        WrongParametersError
+            If HTTP/2 is enabled but the h2 package is not installed
         """
+        if http2 and importlib.util.find_spec("h2") is None:
+            msg = "HTTP/2 requires the h2 package to be installed!"
+            raise WrongParametersError(msg)
         self.protocol: str = protocol
         self.host: str = host
         self.port: int = port
@@ -119,16 +277,35 @@ class HttpClientBase:
         self.password: str = password
         self.base_url: str = f"{protocol}://{host}:{port}"
         self._retry: Retry = retry or DEFAULT_RETRY_STRATEGY
-        auth_impl = BasicAuth if auth_method == "basic" else DigestAuth
+        self.limits: Limits = limits or DEFAULT_POOL_LIMITS
+        self.http2: bool = http2
+        self.cluster: bool = cluster
+        self.balancing: str = balancing
+        self.instrumentation: Instrumentation | None = instrumentation
+        self.tracer: HttpTracer = tracer or HttpTracer()
+        auth_impl = BasicAuth if auth_method == "basic" else CachedDigestAuth
         self._auth: Auth = auth_impl(username, password)
 
+    @property
+    def auth(
+        self,
+    ) -> Auth:
+        """Return the authentication handler.
+
+        Digest challenges are cached per server, so other clients of the same
+        server authenticate preemptively, without an extra 401 round trip.
+        """
+        return self._auth
+
     def _prepare_request(
         self,
         params: dict | None = None,
         headers: dict | None = None,
         body: str | dict | None = None,
+        *,
+        traced: bool = False,
     ) -> dict:
-        """Prepare request details."""
+        """Prepare request details, tracing them if the request is sampled."""
         request = {
             "params": params or {},
             "headers": headers or {},
@@ -138,31 +315,91 @@ class HttpClientBase:
             content_type = (headers or {}).get(const.HEADER_NAME_CONTENT_TYPE)
             doc_type = Mimetypes.get_doc_type(content_type) if content_type else None
             if doc_type == DocumentType.JSON:
-                request["json"] = body
+                request["content"] = json_codec.dumps_bytes(body)
             elif isinstance(body, Mapping):
                 request["data"] = body
             else:
                 request["content"] = body
 
-        logger.debug(
-            "Request details: %s",
-            " ".join(
-                f"{k} [{v if k != 'auth' else v.__class__.__name__}]"
-                for k, v in request.items()
-            ),
-        )
+        if traced:
+            logger.debug(
+                "Request details: %s",
+                LazyMessage(self.tracer.format_request, request),
+            )
         return request
 
-    @classmethod
+    def _sample_trace(
+        self,
+    ) -> bool:
+        """Return True if a request and its response should be traced."""
+        return logger.isEnabledFor(logging.DEBUG) and self.tracer.sample()
+
+    def _recording(
+        self,
+        method: str,
+        endpoint: str,
+        label: str | None,
+    ) -> AbstractContextManager[RequestRecorder | None]:
+        """Return a context manager recording a request when instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        info = RequestInfo(label or "", method.upper(), endpoint)
+        return record_request(self.instrumentation, info)
+
+    def _pool_key(
+        self,
+        host: str,
+        port: int,
+    ) -> tuple:
+        """Return a key of a pooled transport in the registry."""
+        return (
+            self.protocol,
+            host,
+            port,
+            self.auth_method,
+            credentials_digest(self.username, self.password),
+            self.limits.max_connections,
+            self.limits.max_keepalive_connections,
+            self.limits.keepalive_expiry,
+            self.http2,
+        )
+
+    def _hosts_url(
+        self,
+    ) -> str:
+        """Return the Manage API URL listing cluster hosts."""
+        return (
+            f"{self.protocol}://{self.host}:{MARKLOGIC_MANAGE_API_PORT}{HOSTS_ENDPOINT}"
+        )
+
+    def _build_balancer(
+        self,
+        response: Response | None,
+    ) -> HostBalancer:
+        """Build a host balancer from a hosts response (the seed host on failure)."""
+        hosts = []
+        if response is not None and response.status_code == httpx.codes.OK:
+            try:
+                hosts = list(parse_host_names(response.content).values())
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Unexpected hosts response: %s", response.text)
+        if not hosts:
+            logger.warning("No cluster hosts discovered, using [%s] only", self.host)
+            hosts = [self.host]
+        logger.debug("Spreading requests across hosts: %s", ", ".join(hosts))
+        return HostBalancer(hosts, self.balancing)
+
     def _log_response(
-        cls,
+        self,
         method: str,
         endpoint: str,
         response: Response,
+        traced: bool,
     ):
         """Log response details and restart warning, if applicable."""
         logger.debug("Response retrieved")
-        logger.fine(cls._format_http_response(response))
+        if traced and logger.isEnabledFor(logging.FINE):
+            logger.fine("%s", LazyMessage(self.tracer.format_response, response))
 
         if RestartWaiter.is_restart_response(response):
             logger.warning(
@@ -174,17 +411,18 @@ class HttpClientBase:
                 response.headers.get("Location"),
             )
 
-    @staticmethod
-    def _format_http_response(
+    def _log_stream_response(
+        self,
         response: Response,
-    ) -> str:
-        """Format an HTTP response in a protocol-like representation."""
-        reason_phrase = httpx.codes.get_reason_phrase(response.status_code)
-        start_line = f"HTTP/1.1 {response.status_code} {reason_phrase}"
-        headers = "\n".join(f"{name}: {val}" for name, val in response.headers.items())
-        if response.text:
-            return f"{start_line}\n{headers}\n\n{response.text}"
-        return f"{start_line}\n{headers}"
+        traced: bool,
+    ):
+        """Log streamed response details without consuming its body."""
+        logger.debug("Streamed response retrieved")
+        if traced and logger.isEnabledFor(logging.FINE):
+            logger.fine(
+                "%s",
+                LazyMessage(self.tracer.format_response, response, False),
+            )
 
 
 class HttpClient(HttpClientBase):
@@ -206,6 +444,18 @@ class HttpClient(HttpClientBase):
         a password
     base_url : str
         a base url built based on the protocol, the host name and the port
+    limits : Limits
+        connection pool limits
+    http2 : bool
+        whether HTTP/2 is enabled
+    cluster : bool
+        whether requests are spread across all hosts of a cluster
+    balancing : str
+        a strategy of spreading requests across hosts
+    instrumentation : Instrumentation | None
+        hooks observing requests and their metrics
+    tracer : HttpTracer
+        a formatter of HTTP traces logged at the DEBUG and FINE levels
     """
 
     def __init__(self, **kwargs):
@@ -227,9 +477,23 @@ class HttpClient(HttpClientBase):
             A password
         retry : Retry | None, default Retry(total=5, backoff_factor=0.5)
             A retry strategy
+        limits : Limits | None, default Limits(100, 20, 5.0)
+            Connection pool limits
+        http2 : bool, default False
+            Whether to negotiate HTTP/2 (requires the h2 package)
+        cluster : bool, default False
+            Whether to spread requests across all hosts of a cluster
+        balancing : str, default "round-robin"
+            A strategy of spreading requests across hosts
+            (round-robin / least-outstanding)
+        instrumentation : Instrumentation | None, default None
+            Hooks observing requests and their metrics
+        tracer : HttpTracer | None, default HttpTracer()
+            A formatter of HTTP traces
         """
         super().__init__(**kwargs)
         self._client: Client | None = None
+        self._transport: SharedTransport | _ClusterTransport | None = None
 
     def __enter__(self):
         """Connect and return self for use as a context manager."""
@@ -248,11 +512,15 @@ class HttpClient(HttpClientBase):
     def connect(self):
         """Start an HTTP session."""
         logger.debug("Initiating a connection with %s", self.base_url)
-        transport = HTTPTransport(verify=_SHARED_SSL_CONTEXT)
-        self._client = Client(
-            transport=RetryTransport(transport=transport, retry=self._retry),
-            follow_redirects=True,
-        )
+        if self.cluster:
+            self._transport = _ClusterTransport(
+                self.host,
+                self._discover_hosts(),
+                self._shared_transport,
+            )
+        else:
+            self._transport = self._shared_transport()
+        self._client = self._build_client(self._transport)
 
     def disconnect(self):
         """Close an HTTP session."""
@@ -260,6 +528,7 @@ class HttpClient(HttpClientBase):
             logger.debug("Closing a connection")
             self._client.close()
             self._client = None
+            self._transport = None
 
     def is_connected(self) -> bool:
         """Return a connection status.
@@ -271,6 +540,22 @@ class HttpClient(HttpClientBase):
         """
         return self._client is not None
 
+    def pool_stats(self) -> PoolStats | None:
+        """Return the connection pool statistics.
+
+        The pool is shared by all clients connected with the same settings,
+        so the statistics include their requests as well.
+
+        Returns
+        -------
+        PoolStats | None
+            A snapshot of the connection pool, or None if the client
+            is not connected
+        """
+        if self._transport is None:
+            return None
+        return self._transport.pool_stats()
+
     def get(
         self,
         endpoint: str,
@@ -385,6 +670,7 @@ class HttpClient(HttpClientBase):
         *,
         params: dict | None = None,
         headers: dict | None = None,
+        label: str | None = None,
     ) -> Response:
         """Send an HTTP request.
 
@@ -400,17 +686,82 @@ class HttpClient(HttpClientBase):
             Request parameters
         headers : dict | None
             Request headers
+        label : str | None
+            A label of the request in instrumentation (e.g. an API call name)
 
         Returns
         -------
         Response
             An HTTP response
         """
-        request = self._prepare_request(params, headers, body)
-        resp = self._send_request(method, endpoint, request)
-        self._log_response(method, endpoint, resp)
+        traced = self._sample_trace()
+        request = self._prepare_request(params, headers, body, traced=traced)
+        with self._recording(method, endpoint, label):
+            resp = self._send_request(method, endpoint, request)
+        self._log_response(method, endpoint, resp, traced)
         return resp
 
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        body: str | dict | None = None,
+        *,
+        params: dict | None = None,
+        headers: dict | None = None,
+        label: str | None = None,
+    ) -> Iterator[Response]:
+        """Send an HTTP request and stream the response body.
+
+        The response is returned as soon as its headers are received; the body
+        is read lazily (``Response.iter_bytes()``) while the context is open.
+
+        Parameters
+        ----------
+        method : str
+            An HTTP request method
+        endpoint : str
+            A REST endpoint to call
+        body : str | dict | None
+            A request body
+        params : dict | None
+            Request parameters
+        headers : dict | None
+            Request headers
+        label : str | None
+            A label of the request in instrumentation (e.g. an API call name)
+
+        Returns
+        -------
+        Iterator[Response]
+            A context manager yielding an HTTP response with an unread body
+        """
+        traced = self._sample_trace()
+        request = self._prepare_request(params, headers, body, traced=traced)
+        logger.info("Sending a request... %s %s", method.upper(), endpoint)
+
+        url = self.base_url + endpoint
+        with self._recording(method, endpoint, label):
+            if self.is_connected():
+                with self._client.stream(method, url, **request) as resp:
+                    self._log_stream_response(resp, traced)
+                    yield resp
+                return
+
+            logger.warning(
+                "HttpClient is not connected -- "
+                "A request will be sent in an ad-hoc initialized session (%s %s)",
+                method.upper(),
+                endpoint,
+            )
+            with (
+                self._build_client(self._shared_transport()) as client,
+                client.stream(method, url, **request) as resp,
+            ):
+                self._log_stream_response(resp, traced)
+                yield resp
+
     def _send_request(
         self,
         method: str,
@@ -430,12 +781,51 @@ class HttpClient(HttpClientBase):
             method.upper(),
             endpoint,
         )
-        transport = HTTPTransport(verify=_SHARED_SSL_CONTEXT)
-        with Client(
+        with self._build_client(self._shared_transport()) as client:
+            return client.request(method, url, **request)
+
+    def _discover_hosts(
+        self,
+    ) -> HostBalancer:
+        """Discover cluster hosts and return a balancer spreading requests."""
+        response = None
+        transport = self._shared_transport(port=MARKLOGIC_MANAGE_API_PORT)
+        with self._build_client(transport) as client:
+            try:
+                response = client.get(
+                    self._hosts_url(),
+                    params={"format": "json"},
+                    auth=self._auth,
+                )
+            except httpx.HTTPError:
+                logger.exception("Unable to discover cluster hosts")
+        return self._build_balancer(response)
+
+    def _shared_transport(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+    ) -> SharedTransport:
+        """Return a reference to a pooled transport from the registry."""
+        key = self._pool_key(host or self.host, port or self.port)
+        transport = POOL_REGISTRY.acquire(
+            key,
+            lambda: _PoolTransport(self.limits, self.http2),
+            idle_expiry=self.limits.keepalive_expiry,
+        )
+        return SharedTransport(transport, key)
+
+    def _build_client(
+        self,
+        transport: SharedTransport | _ClusterTransport,
+    ) -> Client:
+        """Build an HTTP session retrying requests over a pooled transport."""
+        if self.instrumentation is not None:
+            transport = _InstrumentedTransport(transport)
+        return Client(
             transport=RetryTransport(transport=transport, retry=self._retry),
             follow_redirects=True,
-        ) as client:
-            return client.request(method, url, **request)
+        )
 
 
 class AsyncHttpClient(HttpClientBase):
@@ -457,6 +847,18 @@ class AsyncHttpClient(HttpClientBase):
         a password
     base_url : str
         a base url built based on the protocol, the host name and the port
+    limits : Limits
+        connection pool limits
+    http2 : bool
+        whether HTTP/2 is enabled
+    cluster : bool
+        whether requests are spread across all hosts of a cluster
+    balancing : str
+        a strategy of spreading requests across hosts
+    instrumentation : Instrumentation | None
+        hooks observing requests and their metrics
+    tracer : HttpTracer
+        a formatter of HTTP traces logged at the DEBUG and FINE levels
     """
 
     def __init__(self, **kwargs):
@@ -478,9 +880,23 @@ class AsyncHttpClient(HttpClientBase):
             A password
         retry : Retry | None, default Retry(total=5, backoff_factor=0.5)
             A retry strategy
+        limits : Limits | None, default Limits(100, 20, 5.0)
+            Connection pool limits
+        http2 : bool, default False
+            Whether to negotiate HTTP/2 (requires the h2 package)
+        cluster : bool, default False
+            Whether to spread requests across all hosts of a cluster
+        balancing : str, default "round-robin"
+            A strategy of spreading requests across hosts
+            (round-robin / least-outstanding)
+        instrumentation : Instrumentation | None, default None
+            Hooks observing requests and their metrics
+        tracer : HttpTracer | None, default HttpTracer()
+            A formatter of HTTP traces
         """
         super().__init__(**kwargs)
         self._client: AsyncClient | None = None
+        self._transport: AsyncSharedTransport | _AsyncClusterTransport | None = None
 
     async def __aenter__(self):
         """Connect and return self for use as an async context manager."""
@@ -499,11 +915,15 @@ class AsyncHttpClient(HttpClientBase):
     async def connect(self):
         """Start an async HTTP session."""
         logger.debug("Initiating a connection with %s", self.base_url)
-        transport = AsyncHTTPTransport(verify=_SHARED_SSL_CONTEXT)
-        self._client = AsyncClient(
-            transport=RetryTransport(transport=transport, retry=self._retry),
-            follow_redirects=True,
-        )
+        if self.cluster:
+            self._transport = _AsyncClusterTransport(
+                self.host,
+                await self._discover_hosts(),
+                self._shared_transport,
+            )
+        else:
+            self._transport = self._shared_transport()
+        self._client = self._build_client(self._transport)
 
     async def disconnect(self):
         """Close an async HTTP session."""
@@ -511,6 +931,7 @@ class AsyncHttpClient(HttpClientBase):
             logger.debug("Closing a connection")
             await self._client.aclose()
             self._client = None
+            self._transport = None
 
     def is_connected(self) -> bool:
         """Return a connection status.
@@ -522,6 +943,42 @@ class AsyncHttpClient(HttpClientBase):
         """
         return self._client is not None
 
+    def pool_stats(self) -> PoolStats | None:
+        """Return the connection pool statistics.
+
+        The pool is shared by all clients connected with the same settings,
+        so the statistics include their requests as well.
+
+        Returns
+        -------
+        PoolStats | None
+            A snapshot of the connection pool, or None if the client
+            is not connected
+        """
+        if self._transport is None:
+            return None
+        return self._transport.pool_stats()
+
+    def _prepare_request(
+        self,
+        params: dict | None = None,
+        headers: dict | None = None,
+        body: str | dict | None = None,
+        *,
+        traced: bool = False,
+    ) -> dict:
+        """Prepare request details, tracing them if the request is sampled.
+
+        httpx treats any sync iterable content as a sync byte stream, which
+        an AsyncClient refuses to send, so bodies iterable in both ways are
+        exposed to it through their async iterator only.
+        """
+        request = super()._prepare_request(params, headers, body, traced=traced)
+        content = request.get("content")
+        if isinstance(content, AsyncIterable) and not isinstance(content, Mapping):
+            request["content"] = _AsyncByteStream(content)
+        return request
+
     async def get(
         self,
         endpoint: str,
@@ -648,6 +1105,7 @@ class AsyncHttpClient(HttpClientBase):
         *,
         params: dict | None = None,
         headers: dict | None = None,
+        label: str | None = None,
     ) -> Response:
         """Send an async HTTP request.
 
@@ -663,17 +1121,82 @@ class AsyncHttpClient(HttpClientBase):
             Request parameters
         headers : dict | None
             Request headers
+        label : str | None
+            A label of the request in instrumentation (e.g. an API call name)
 
         Returns
         -------
         Response
             An HTTP response
         """
-        request = self._prepare_request(params, headers, body)
-        resp = await self._send_request(method, endpoint, request)
-        self._log_response(method, endpoint, resp)
+        traced = self._sample_trace()
+        request = self._prepare_request(params, headers, body, traced=traced)
+        with self._recording(method, endpoint, label):
+            resp = await self._send_request(method, endpoint, request)
+        self._log_response(method, endpoint, resp, traced)
         return resp
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        endpoint: str,
+        body: str | dict | None = None,
+        *,
+        params: dict | None = None,
+        headers: dict | None = None,
+        label: str | None = None,
+    ) -> AsyncIterator[Response]:
+        """Send an async HTTP request and stream the response body.
+
+        The response is returned as soon as its headers are received; the body
+        is read lazily (``Response.aiter_bytes()``) while the context is open.
+
+        Parameters
+        ----------
+        method : str
+            An HTTP request method
+        endpoint : str
+            A REST endpoint to call
+        body : str | dict | None
+            A request body
+        params : dict | None
+            Request parameters
+        headers : dict | None
+            Request headers
+        label : str | None
+            A label of the request in instrumentation (e.g. an API call name)
+
+        Returns
+        -------
+        AsyncIterator[Response]
+            An async context manager yielding an HTTP response with an unread body
+        """
+        traced = self._sample_trace()
+        request = self._prepare_request(params, headers, body, traced=traced)
+        logger.info("Sending a request... %s %s", method.upper(), endpoint)
+
+        url = self.base_url + endpoint
+        with self._recording(method, endpoint, label):
+            if self.is_connected():
+                async with self._client.stream(method, url, **request) as resp:
+                    self._log_stream_response(resp, traced)
+                    yield resp
+                return
+
+            logger.warning(
+                "AsyncHttpClient is not connected -- "
+                "A request will be sent in an ad-hoc initialized session (%s %s)",
+                method.upper(),
+                endpoint,
+            )
+            async with (
+                self._build_client(self._shared_transport()) as client,
+                client.stream(method, url, **request) as resp,
+            ):
+                self._log_stream_response(resp, traced)
+                yield resp
+
     async def _send_request(
         self,
         method: str,
@@ -693,9 +1216,496 @@ class AsyncHttpClient(HttpClientBase):
             method.upper(),
             endpoint,
         )
-        transport = AsyncHTTPTransport(verify=_SHARED_SSL_CONTEXT)
-        async with AsyncClient(
+        async with self._build_client(self._shared_transport()) as client:
+            return await client.request(method, url, **request)
+
+    async def _discover_hosts(
+        self,
+    ) -> HostBalancer:
+        """Discover cluster hosts and return a balancer spreading requests."""
+        response = None
+        transport = self._shared_transport(port=MARKLOGIC_MANAGE_API_PORT)
+        async with self._build_client(transport) as client:
+            try:
+                response = await client.get(
+                    self._hosts_url(),
+                    params={"format": "json"},
+                    auth=self._auth,
+                )
+            except httpx.HTTPError:
+                logger.exception("Unable to discover cluster hosts")
+        return self._build_balancer(response)
+
+    def _shared_transport(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+    ) -> AsyncSharedTransport:
+        """Return a reference to a pooled transport from the registry."""
+        key = self._pool_key(host or self.host, port or self.port)
+        loop = asyncio.get_running_loop()
+        transport = POOL_REGISTRY.acquire(
+            key,
+            lambda: _AsyncPoolTransport(self.limits, self.http2),
+            loop,
+        )
+        return AsyncSharedTransport(transport, key, loop)
+
+    def _build_client(
+        self,
+        transport: AsyncSharedTransport | _AsyncClusterTransport,
+    ) -> AsyncClient:
+        """Build an async HTTP session retrying requests over a pooled transport."""
+        if self.instrumentation is not None:
+            transport = _AsyncInstrumentedTransport(transport)
+        return AsyncClient(
             transport=RetryTransport(transport=transport, retry=self._retry),
             follow_redirects=True,
-        ) as client:
-            return await client.request(method, url, **request)
+        )
+
+
+class _AsyncByteStream:
+    """An async-only view of a request body iterable in both ways."""
+
+    def __init__(
+        self,
+        body: AsyncIterable[bytes],
+    ):
+        self._body = body
+
+    def __aiter__(
+        self,
+    ) -> AsyncIterator[bytes]:
+        return self._body.__aiter__()
+
+    def __repr__(
+        self,
+    ) -> str:
+        return repr(self._body)
+
+
+class _PoolMonitor:
+    """Counts requests in flight and the ones queued for a pooled connection."""
+
+    def __init__(
+        self,
+        limits: Limits,
+        http2: bool,
+    ):
+        self.limits: Limits = limits
+        self.http2: bool = http2
+        self.requests: int = 0
+        self.queued: int = 0
+        self._capacity: int | None = None if http2 else limits.max_connections
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(
+        self,
+    ):
+        with self._lock:
+            self.requests += 1
+            if self._capacity is not None and self.requests > self._capacity:
+                self.queued += 1
+
+    def release(
+        self,
+    ):
+        with self._lock:
+            self.requests -= 1
+
+    def snapshot(
+        self,
+        connections: list,
+    ) -> PoolStats:
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return PoolStats(
+            connections=len(connections),
+            in_use=len(connections) - idle,
+            idle=idle,
+            requests=self.requests,
+            queued=self.queued,
+            max_connections=self.limits.max_connections,
+            max_keepalive_connections=self.limits.max_keepalive_connections,
+            http2=self.http2,
+        )
+
+
+class _PoolTransport(HTTPTransport):
+    """An HTTP transport with a shared SSL context and pool statistics.
+
+    A request is in flight until its response stream is closed.
+    """
+
+    def __init__(
+        self,
+        limits: Limits,
+        http2: bool,
+    ):
+        super().__init__(verify=SHARED_SSL_CONTEXT, limits=limits, http2=http2)
+        self._monitor: _PoolMonitor = _PoolMonitor(limits, http2)
+
+    def handle_request(
+        self,
+        request: Request,
+    ) -> Response:
+        self._monitor.acquire()
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            self._monitor.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, self._monitor.release)
+        return response
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        return self._monitor.snapshot(self._pool.connections)
+
+
+class _AsyncPoolTransport(AsyncHTTPTransport):
+    """An async HTTP transport with a shared SSL context and pool statistics.
+
+    A request is in flight until its response stream is closed.
+    """
+
+    def __init__(
+        self,
+        limits: Limits,
+        http2: bool,
+    ):
+        super().__init__(verify=SHARED_SSL_CONTEXT, limits=limits, http2=http2)
+        self._monitor: _PoolMonitor = _PoolMonitor(limits, http2)
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        self._monitor.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._monitor.release()
+            raise
+        response.stream = _AsyncReleasingStream(
+            response.stream,
+            self._monitor.release,
+        )
+        return response
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        return self._monitor.snapshot(self._pool.connections)
+
+
+class _ClusterTransport(httpx.BaseTransport):
+    """An HTTP transport spreading requests across cluster hosts.
+
+    Requests to the seed host are sent to a host chosen by the balancer,
+    through the host's own pool. A request failing to connect is sent to
+    another host; transport errors and 503 responses eject a host. Requests
+    to other hosts (e.g. redirects) are sent as they are.
+    """
+
+    def __init__(
+        self,
+        seed_host: str,
+        balancer: HostBalancer,
+        pool_factory: Callable[[str], SharedTransport],
+    ):
+        self.balancer: HostBalancer = balancer
+        self._seed_host: str = seed_host
+        self._pools: dict[str, SharedTransport] = {
+            host: pool_factory(host) for host in balancer.hosts
+        }
+        self._direct: SharedTransport = pool_factory(seed_host)
+
+    def handle_request(
+        self,
+        request: Request,
+    ) -> Response:
+        if not _is_balanced(request, self._seed_host, self._pools):
+            return self._direct.handle_request(request)
+        tried = []
+        while True:
+            host, routed = _route_request(request, self.balancer, tried)
+            try:
+                response = self._pools[host].handle_request(routed)
+            except httpx.TransportError as err:
+                self.balancer.release(host, healthy=False)
+                if _can_fail_over(err, tried, self._pools):
+                    continue
+                raise
+            except BaseException:
+                self.balancer.release(host)
+                raise
+            response.stream = _ReleasingStream(
+                response.stream,
+                _host_releaser(self.balancer, host, response),
+            )
+            return response
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        return _sum_pool_stats([pool.pool_stats() for pool in self._pools.values()])
+
+    def close(
+        self,
+    ):
+        for pool in (*self._pools.values(), self._direct):
+            pool.close()
+
+
+class _AsyncClusterTransport(httpx.AsyncBaseTransport):
+    """An async HTTP transport spreading requests across cluster hosts.
+
+    Requests to the seed host are sent to a host chosen by the balancer,
+    through the host's own pool. A request failing to connect is sent to
+    another host; transport errors and 503 responses eject a host. Requests
+    to other hosts (e.g. redirects) are sent as they are.
+    """
+
+    def __init__(
+        self,
+        seed_host: str,
+        balancer: HostBalancer,
+        pool_factory: Callable[[str], AsyncSharedTransport],
+    ):
+        self.balancer: HostBalancer = balancer
+        self._seed_host: str = seed_host
+        self._pools: dict[str, AsyncSharedTransport] = {
+            host: pool_factory(host) for host in balancer.hosts
+        }
+        self._direct: AsyncSharedTransport = pool_factory(seed_host)
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        if not _is_balanced(request, self._seed_host, self._pools):
+            return await self._direct.handle_async_request(request)
+        tried = []
+        while True:
+            host, routed = _route_request(request, self.balancer, tried)
+            try:
+                response = await self._pools[host].handle_async_request(routed)
+            except httpx.TransportError as err:
+                self.balancer.release(host, healthy=False)
+                if _can_fail_over(err, tried, self._pools):
+                    continue
+                raise
+            except BaseException:
+                self.balancer.release(host)
+                raise
+            response.stream = _AsyncReleasingStream(
+                response.stream,
+                _host_releaser(self.balancer, host, response),
+            )
+            return response
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        return _sum_pool_stats([pool.pool_stats() for pool in self._pools.values()])
+
+    async def aclose(
+        self,
+    ):
+        for pool in (*self._pools.values(), self._direct):
+            await pool.aclose()
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """An HTTP transport recording attempts of instrumented requests.
+
+    It is placed under the retrying transport, so every retry is recorded.
+    """
+
+    def __init__(
+        self,
+        transport: SharedTransport | _ClusterTransport,
+    ):
+        self._transport: SharedTransport | _ClusterTransport = transport
+
+    def handle_request(
+        self,
+        request: Request,
+    ) -> Response:
+        recorder = current_recorder()
+        if recorder is None:
+            return self._transport.handle_request(request)
+        recorder.start_attempt(request)
+        request.extensions = {**request.extensions, "trace": recorder.trace}
+        try:
+            recorder.response = self._transport.handle_request(request)
+        finally:
+            recorder.end_attempt()
+        return recorder.response
+
+    def close(
+        self,
+    ):
+        self._transport.close()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """An async HTTP transport recording attempts of instrumented requests.
+
+    It is placed under the retrying transport, so every retry is recorded.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncSharedTransport | _AsyncClusterTransport,
+    ):
+        self._transport: AsyncSharedTransport | _AsyncClusterTransport = transport
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        recorder = current_recorder()
+        if recorder is None:
+            return await self._transport.handle_async_request(request)
+        recorder.start_attempt(request)
+        request.extensions = {**request.extensions, "trace": recorder.atrace}
+        try:
+            recorder.response = await self._transport.handle_async_request(request)
+        finally:
+            recorder.end_attempt()
+        return recorder.response
+
+    async def aclose(
+        self,
+    ):
+        await self._transport.aclose()
+
+
+def _is_balanced(
+    request: Request,
+    seed_host: str,
+    pools: dict,
+) -> bool:
+    """Return whether a request is addressed to the cluster."""
+    return request.url.host == seed_host or request.url.host in pools
+
+
+def _route_request(
+    request: Request,
+    balancer: HostBalancer,
+    tried: list[str],
+) -> tuple[str, Request]:
+    """Return a host chosen by the balancer and a request copy addressed to it.
+
+    The original request is left intact, so that retries are balanced again.
+    """
+    host = balancer.acquire(exclude=tried)
+    tried.append(host)
+    routed = Request(
+        request.method,
+        request.url.copy_with(host=host),
+        headers=request.headers,
+        stream=request.stream,
+        extensions=request.extensions,
+    )
+    routed.headers["Host"] = routed.url.netloc.decode("ascii")
+    return host, routed
+
+
+def _can_fail_over(
+    err: httpx.TransportError,
+    tried: list[str],
+    pools: dict,
+) -> bool:
+    """Return whether a request can be safely sent to another host.
+
+    Only connection errors qualify, as the request has not been sent then.
+    """
+    if not isinstance(err, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return False
+    return len(tried) < len(pools)
+
+
+def _host_releaser(
+    balancer: HostBalancer,
+    host: str,
+    response: Response,
+) -> Callable[[], None]:
+    """Return a callback releasing a host once a response is closed."""
+    healthy = response.status_code != httpx.codes.SERVICE_UNAVAILABLE
+    return lambda: balancer.release(host, healthy=healthy)
+
+
+def _sum_pool_stats(
+    hosts_stats: list[PoolStats],
+) -> PoolStats:
+    """Sum up pool statistics of cluster hosts."""
+    first = hosts_stats[0]
+    return PoolStats(
+        connections=sum(stats.connections for stats in hosts_stats),
+        in_use=sum(stats.in_use for stats in hosts_stats),
+        idle=sum(stats.idle for stats in hosts_stats),
+        requests=sum(stats.requests for stats in hosts_stats),
+        queued=sum(stats.queued for stats in hosts_stats),
+        max_connections=first.max_connections,
+        max_keepalive_connections=first.max_keepalive_connections,
+        http2=first.http2,
+        hosts=len(hosts_stats),
+    )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """A response stream calling back once it is closed."""
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        on_close: Callable[[], None],
+    ):
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    def __iter__(
+        self,
+    ) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(
+        self,
+    ):
+        try:
+            self._stream.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """An async response stream calling back once it is closed."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        on_close: Callable[[], None],
+    ):
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(
+        self,
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(
+        self,
+    ):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
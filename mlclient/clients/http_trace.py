@@ -0,0 +1,268 @@
+"""The ML HTTP Trace module.
+
+It exports tools formatting HTTP traces logged by HTTP clients:
+    * HttpTracer
+        A formatter of HTTP traces with body size caps, sampling and redaction.
+    * LazyMessage
+        A log message argument formatted only when a record is emitted.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Callable
+
+import httpx
+from httpx import Response
+
+from mlclient import constants as const
+from mlclient.exceptions import WrongParametersError
+from mlclient.mimetypes import Mimetypes
+from mlclient.models import DocumentType
+
+# Headers with credentials, hidden in traces by default
+DEFAULT_REDACTED_HEADERS = (
+    "Authorization",
+    "Cookie",
+    "Proxy-Authorization",
+    "Set-Cookie",
+)
+DEFAULT_MAX_BODY_SIZE = 4096
+
+_REDACTED = "[REDACTED]"
+
+
+class LazyMessage:
+    """A log message argument formatted only when a record is emitted.
+
+    Loggers check their own level only, so a record can still be dropped by
+    a handler of a higher level; the message is not built in such a case.
+
+    Examples
+    --------
+    >>> logger.debug("Response: %s", LazyMessage(tracer.format_response, resp))
+    """
+
+    __slots__ = ("_args", "_func")
+
+    def __init__(
+        self,
+        func: Callable[..., str],
+        *args: Any,
+    ):
+        """Initialize LazyMessage instance.
+
+        Parameters
+        ----------
+        func : Callable[..., str]
+            A function building the message
+        *args : Any
+            Arguments of the function
+        """
+        self._func = func
+        self._args = args
+
+    def __str__(
+        self,
+    ) -> str:
+        """Build the message."""
+        return self._func(*self._args)
+
+
+class HttpTracer:
+    """A formatter of HTTP traces with body size caps, sampling and redaction.
+
+    Bodies are truncated before they are decoded, so traces of large
+    responses (e.g. multipart documents) cost no more than the cap. Only
+    textual bodies are decoded; binary ones are reported by their size.
+    With sampling, only every n-th request is traced, together with its response.
+
+    Examples
+    --------
+    >>> from mlclient import MLClient
+    >>> from mlclient.clients import HttpTracer
+    >>> tracer = HttpTracer(max_body_size=1024, sample_every=100)
+    >>> with MLClient(tracer=tracer) as ml:
+    ...     resp = ml.manage.databases.get_list()
+    """
+
+    def __init__(
+        self,
+        max_body_size: int | None = DEFAULT_MAX_BODY_SIZE,
+        sample_every: int = 1,
+        redacted_headers: Iterable[str] = DEFAULT_REDACTED_HEADERS,
+        redact_body: Callable[[str], str] | None = None,
+    ):
+        """Initialize HttpTracer instance.
+
+        Parameters
+        ----------
+        max_body_size : int | None, default 4096
+            A maximum number of body bytes traced; None for whole bodies
+        sample_every : int, default 1
+            A number of requests per a traced one (1 to trace all of them)
+        redacted_headers : Iterable[str], default DEFAULT_REDACTED_HEADERS
+            Names of headers with values hidden in traces
+        redact_body : Callable[[str], str] | None, default None
+            A function masking sensitive data in (truncated) traced bodies
+
+        Raises
+        ------
+        WrongParametersError
+            If the sampling rate is lower than 1
+        """
+        if sample_every < 1:
+            msg = f"A sampling rate must be a positive number: [{sample_every}]!"
+            raise WrongParametersError(msg)
+        self.max_body_size: int | None = max_body_size
+        self.sample_every: int = sample_every
+        self.redacted_headers: frozenset[str] = frozenset(
+            name.lower() for name in redacted_headers
+        )
+        self.redact_body: Callable[[str], str] | None = redact_body
+        self._counter: Iterator[int] = itertools.count()
+
+    def sample(
+        self,
+    ) -> bool:
+        """Return True if the current request and its response should be traced."""
+        return self.sample_every == 1 or next(self._counter) % self.sample_every == 0
+
+    def format_request(
+        self,
+        request: dict,
+    ) -> str:
+        """Format request details prepared by an HTTP client.
+
+        Parameters
+        ----------
+        request : dict
+            Keyword arguments of an httpx request
+
+        Returns
+        -------
+        str
+            Request details with redacted headers and a truncated body
+        """
+        details = []
+        headers = request.get("headers") or {}
+        for key, value in request.items():
+            if key == "auth":
+                details.append(f"{key} [{value.__class__.__name__}]")
+            elif key == "headers":
+                details.append(f"{key} [{self._redact_headers(value)}]")
+            elif key in {"content", "data"}:
+                content_type = headers.get(const.HEADER_NAME_CONTENT_TYPE)
+                details.append(f"{key} [{self._format_body(value, content_type)}]")
+            else:
+                details.append(f"{key} [{value}]")
+        return " ".join(details)
+
+    def format_response(
+        self,
+        response: Response,
+        with_body: bool = True,
+    ) -> str:
+        """Format an HTTP response in a protocol-like representation.
+
+        Parameters
+        ----------
+        response : Response
+            An HTTP response
+        with_body : bool, default True
+            Whether to include the (read) response body
+
+        Returns
+        -------
+        str
+            A start line, redacted headers and a truncated body
+        """
+        reason_phrase = httpx.codes.get_reason_phrase(response.status_code)
+        start_line = f"{response.http_version} {response.status_code} {reason_phrase}"
+        headers = "\n".join(
+            f"{name}: {self._redact_header(name, value)}"
+            for name, value in response.headers.items()
+        )
+        if with_body and response.content:
+            body = self._format_bytes(
+                response.content,
+                response.headers.get("Content-Type"),
+                response.charset_encoding,
+            )
+            return f"{start_line}\n{headers}\n\n{body}"
+        return f"{start_line}\n{headers}"
+
+    def _redact_headers(
+        self,
+        headers: Mapping[str, str],
+    ) -> dict:
+        """Return headers with redacted values hidden."""
+        return {name: self._redact_header(name, val) for name, val in headers.items()}
+
+    def _redact_header(
+        self,
+        name: str,
+        value: str,
+    ) -> str:
+        """Return a header value, or a placeholder when it is redacted."""
+        return _REDACTED if name.lower() in self.redacted_headers else value
+
+    def _format_body(
+        self,
+        body: Any,
+        content_type: str | None,
+    ) -> str:
+        """Format a request body, truncating strings and bytes."""
+        if isinstance(body, Mapping):
+            body = str(body)
+        if isinstance(body, str):
+            prefix = body[: self._limit(len(body))]
+            return self._format_text(prefix, len(prefix), len(body))
+        if isinstance(body, bytes):
+            return self._format_bytes(body, content_type, "utf-8")
+        return repr(body)
+
+    def _format_bytes(
+        self,
+        content: bytes,
+        content_type: str | None,
+        encoding: str | None,
+    ) -> str:
+        """Format body bytes, decoding a truncated prefix of textual ones."""
+        if not _is_textual(content_type):
+            return f"[binary body of {len(content)} bytes]"
+        prefix = content[: self._limit(len(content))]
+        text = prefix.decode(encoding or "utf-8", errors="replace")
+        return self._format_text(text, len(prefix), len(content))
+
+    def _format_text(
+        self,
+        text: str,
+        traced: int,
+        size: int,
+    ) -> str:
+        """Redact a traced body and mark it when truncated."""
+        if self.redact_body is not None:
+            text = self.redact_body(text)
+        if size > traced:
+            return f"{text}... [{size - traced} of {size} truncated]"
+        return text
+
+    def _limit(
+        self,
+        size: int,
+    ) -> int:
+        """Return a number of units of a body to trace."""
+        return size if self.max_body_size is None else min(size, self.max_body_size)
+
+
+def _is_textual(
+    content_type: str | None,
+) -> bool:
+    """Verify if a body of a content type can be traced as text."""
+    if content_type is None:
+        return True
+    if content_type.startswith("multipart/"):
+        return True
+    return Mimetypes.get_doc_type(content_type) != DocumentType.BINARY
@@ -0,0 +1,765 @@
+"""The ML Instrumentation module.
+
+It exports hooks observing HTTP requests sent to MarkLogic and their metrics:
+    * Instrumentation
+        A base class of request hooks, all of them doing nothing.
+    * CallbackInstrumentation
+        An instrumentation calling plain functions.
+    * CompositeInstrumentation
+        An instrumentation notifying a number of instrumentations.
+    * MetricsRegistry
+        An in-memory registry of request metrics with a Prometheus text exporter.
+    * OpenTelemetryInstrumentation
+        An instrumentation recording OpenTelemetry spans of requests.
+    * RequestInfo
+        A request being sent: an API call label, a method and an endpoint.
+    * RequestMetrics
+        Metrics of a finished request, including all its retries.
+    * EndpointMetrics
+        Metrics aggregated by MetricsRegistry for a single endpoint.
+    * RequestRecorder
+        A recorder of a single request, fed by HTTP transports.
+    * record_request
+        Return a context manager recording a request sent within it.
+    * current_recorder
+        Return a recorder of the request being sent in the current context.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+from httpx import Request, Response
+
+from mlclient.exceptions import WrongParametersError
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+# Upper bounds (in seconds) of latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_CURRENT_RECORDER: ContextVar[RequestRecorder | None] = ContextVar(
+    "mlclient_request_recorder",
+    default=None,
+)
+
+
+class RequestInfo(NamedTuple):
+    """A request being sent: an API call label, a method and an endpoint."""
+
+    call: str
+    method: str
+    endpoint: str
+
+
+class RequestMetrics(NamedTuple):
+    """Metrics of a finished request, including all its retries.
+
+    Durations are in seconds. The status code is None and the error holds
+    an exception name when a request failed without a response.
+    """
+
+    call: str
+    method: str
+    endpoint: str
+    status_code: int | None
+    duration: float
+    bytes_sent: int
+    bytes_received: int
+    attempts: int
+    backoff: float
+    pool_wait: float
+    error: str | None
+
+    @property
+    def retries(
+        self,
+    ) -> int:
+        """Return a number of attempts repeating the first one."""
+        return max(self.attempts - 1, 0)
+
+
+class EndpointMetrics(NamedTuple):
+    """Metrics aggregated by MetricsRegistry for a single endpoint.
+
+    Bucket counts are cumulative, matching MetricsRegistry.buckets.
+    Outcomes are counted by status codes, or by exception names for requests
+    that failed without a response.
+    """
+
+    call: str
+    method: str
+    endpoint: str
+    requests: int
+    outcomes: dict[str, int]
+    duration: float
+    duration_buckets: tuple[int, ...]
+    bytes_sent: int
+    bytes_received: int
+    retries: int
+    backoff: float
+    pool_wait: float
+    pool_wait_buckets: tuple[int, ...]
+
+
+class Instrumentation:
+    """A base class of request hooks, all of them doing nothing.
+
+    Hooks are called synchronously on the path of every request, so they
+    should return quickly. A context returned by request_started() is passed
+    to the remaining hooks of the same request.
+    """
+
+    def request_started(
+        self,
+        info: RequestInfo,
+    ) -> Any:
+        """Handle a request about to be sent.
+
+        Parameters
+        ----------
+        info : RequestInfo
+            A request being sent
+
+        Returns
+        -------
+        Any
+            A context of the request passed to the remaining hooks
+        """
+        return None
+
+    def request_retried(
+        self,
+        info: RequestInfo,
+        attempt: int,
+        backoff: float,
+        context: Any,
+    ):
+        """Handle a retry of a request.
+
+        Parameters
+        ----------
+        info : RequestInfo
+            A request being sent
+        attempt : int
+            A number of the attempt being started (2 for the first retry)
+        backoff : float
+            Seconds waited since the previous attempt
+        context : Any
+            A context returned by request_started()
+        """
+
+    def request_finished(
+        self,
+        metrics: RequestMetrics,
+        context: Any,
+    ):
+        """Handle a finished request.
+
+        Parameters
+        ----------
+        metrics : RequestMetrics
+            Metrics of the request
+        context : Any
+            A context returned by request_started()
+        """
+
+
+class CallbackInstrumentation(Instrumentation):
+    """An instrumentation calling plain functions.
+
+    Examples
+    --------
+    >>> from mlclient.clients import CallbackInstrumentation, HttpClient
+    >>> instrumentation = CallbackInstrumentation(on_finished=print)
+    >>> with HttpClient(instrumentation=instrumentation) as client:
+    ...     resp = client.get("/manage/v2/databases")
+    """
+
+    def __init__(
+        self,
+        on_started: Callable[[RequestInfo], Any] | None = None,
+        on_retried: Callable[[RequestInfo, int, float], None] | None = None,
+        on_finished: Callable[[RequestMetrics], None] | None = None,
+    ):
+        """Initialize CallbackInstrumentation instance.
+
+        Parameters
+        ----------
+        on_started : Callable[[RequestInfo], Any] | None, default None
+            A function called with a request about to be sent
+        on_retried : Callable[[RequestInfo, int, float], None] | None, default None
+            A function called with a request, an attempt number and a backoff
+        on_finished : Callable[[RequestMetrics], None] | None, default None
+            A function called with metrics of a finished request
+        """
+        self._on_started = on_started
+        self._on_retried = on_retried
+        self._on_finished = on_finished
+
+    def request_started(
+        self,
+        info: RequestInfo,
+    ) -> Any:
+        """Call on_started function."""
+        if self._on_started is not None:
+            self._on_started(info)
+
+    def request_retried(
+        self,
+        info: RequestInfo,
+        attempt: int,
+        backoff: float,
+        context: Any,
+    ):
+        """Call on_retried function."""
+        if self._on_retried is not None:
+            self._on_retried(info, attempt, backoff)
+
+    def request_finished(
+        self,
+        metrics: RequestMetrics,
+        context: Any,
+    ):
+        """Call on_finished function."""
+        if self._on_finished is not None:
+            self._on_finished(metrics)
+
+
+class CompositeInstrumentation(Instrumentation):
+    """An instrumentation notifying a number of instrumentations.
+
+    Examples
+    --------
+    >>> from mlclient.clients import (
+    ...     CompositeInstrumentation,
+    ...     MetricsRegistry,
+    ...     OpenTelemetryInstrumentation,
+    ... )
+    >>> registry = MetricsRegistry()
+    >>> instrumentation = CompositeInstrumentation(
+    ...     registry,
+    ...     OpenTelemetryInstrumentation(),
+    ... )
+    """
+
+    def __init__(
+        self,
+        *instrumentations: Instrumentation,
+    ):
+        """Initialize CompositeInstrumentation instance.
+
+        Parameters
+        ----------
+        *instrumentations : Instrumentation
+            Instrumentations notified in order
+        """
+        self._instrumentations: tuple[Instrumentation, ...] = instrumentations
+
+    def request_started(
+        self,
+        info: RequestInfo,
+    ) -> list:
+        """Notify all instrumentations and return their contexts."""
+        return [i.request_started(info) for i in self._instrumentations]
+
+    def request_retried(
+        self,
+        info: RequestInfo,
+        attempt: int,
+        backoff: float,
+        context: list,
+    ):
+        """Notify all instrumentations with their contexts."""
+        for instrumentation, ctx in zip(self._instrumentations, context):
+            instrumentation.request_retried(info, attempt, backoff, ctx)
+
+    def request_finished(
+        self,
+        metrics: RequestMetrics,
+        context: list,
+    ):
+        """Notify all instrumentations with their contexts."""
+        for instrumentation, ctx in zip(self._instrumentations, context):
+            instrumentation.request_finished(metrics, ctx)
+
+
+class _Histogram:
+    """Counts of observed values in buckets, with their sum."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(
+        self,
+        buckets: Sequence[float],
+    ):
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0.0
+
+    def observe(
+        self,
+        buckets: Sequence[float],
+        value: float,
+    ):
+        index = len(buckets)
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.sum += value
+
+    def cumulative(
+        self,
+    ) -> tuple[int, ...]:
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return tuple(cumulative)
+
+
+class _EndpointAggregate:
+    """Mutable metrics of a single endpoint kept by MetricsRegistry."""
+
+    __slots__ = (
+        "backoff",
+        "bytes_received",
+        "bytes_sent",
+        "duration",
+        "outcomes",
+        "pool_wait",
+        "retries",
+    )
+
+    def __init__(
+        self,
+        buckets: Sequence[float],
+    ):
+        self.duration: _Histogram = _Histogram(buckets)
+        self.pool_wait: _Histogram = _Histogram(buckets)
+        self.outcomes: dict[str, int] = {}
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.retries: int = 0
+        self.backoff: float = 0.0
+
+
+class MetricsRegistry(Instrumentation):
+    """An in-memory registry of request metrics with a Prometheus text exporter.
+
+    Metrics are aggregated per API call label, method and endpoint:
+    latency and connection pool wait histograms, bytes sent and received,
+    retries, backoff and outcome (status code) counts. The registry is
+    thread-safe and can be shared by any number of clients.
+
+    Examples
+    --------
+    >>> from mlclient import MLClient
+    >>> from mlclient.clients import MetricsRegistry
+    >>> registry = MetricsRegistry()
+    >>> with MLClient(instrumentation=registry) as ml:
+    ...     resp = ml.manage.databases.get_list()
+    >>> print(registry.to_prometheus())
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        namespace: str = "mlclient",
+    ):
+        """Initialize MetricsRegistry instance.
+
+        Parameters
+        ----------
+        buckets : Sequence[float], default DEFAULT_BUCKETS
+            Upper bounds of histogram buckets in seconds
+        namespace : str, default "mlclient"
+            A prefix of exported metric names
+
+        Raises
+        ------
+        WrongParametersError
+            If buckets are not sorted in the ascending order
+        """
+        if list(buckets) != sorted(set(buckets)):
+            msg = "Histogram buckets must be unique and sorted in ascending order!"
+            raise WrongParametersError(msg)
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        self.namespace: str = namespace
+        self._endpoints: dict[tuple[str, str, str], _EndpointAggregate] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def request_finished(
+        self,
+        metrics: RequestMetrics,
+        context: Any,
+    ):
+        """Aggregate metrics of a finished request."""
+        key = (metrics.call, metrics.method, metrics.endpoint)
+        outcome = metrics.error or str(metrics.status_code)
+        with self._lock:
+            aggregate = self._endpoints.get(key)
+            if aggregate is None:
+                aggregate = _EndpointAggregate(self.buckets)
+                self._endpoints[key] = aggregate
+            aggregate.duration.observe(self.buckets, metrics.duration)
+            aggregate.pool_wait.observe(self.buckets, metrics.pool_wait)
+            aggregate.outcomes[outcome] = aggregate.outcomes.get(outcome, 0) + 1
+            aggregate.bytes_sent += metrics.bytes_sent
+            aggregate.bytes_received += metrics.bytes_received
+            aggregate.retries += metrics.retries
+            aggregate.backoff += metrics.backoff
+
+    def snapshot(
+        self,
+    ) -> list[EndpointMetrics]:
+        """Return metrics aggregated so far, sorted by endpoints.
+
+        Returns
+        -------
+        list[EndpointMetrics]
+            Metrics of every (call, method, endpoint) observed
+        """
+        with self._lock:
+            return [
+                EndpointMetrics(
+                    call=call,
+                    method=method,
+                    endpoint=endpoint,
+                    requests=sum(aggregate.outcomes.values()),
+                    outcomes=dict(aggregate.outcomes),
+                    duration=aggregate.duration.sum,
+                    duration_buckets=aggregate.duration.cumulative(),
+                    bytes_sent=aggregate.bytes_sent,
+                    bytes_received=aggregate.bytes_received,
+                    retries=aggregate.retries,
+                    backoff=aggregate.backoff,
+                    pool_wait=aggregate.pool_wait.sum,
+                    pool_wait_buckets=aggregate.pool_wait.cumulative(),
+                )
+                for (call, method, endpoint), aggregate in sorted(
+                    self._endpoints.items(),
+                    key=lambda item: (item[0][2], item[0][1], item[0][0]),
+                )
+            ]
+
+    def clear(
+        self,
+    ):
+        """Remove all metrics aggregated so far."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(
+        self,
+    ) -> str:
+        """Return metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Metrics ready to be served under a /metrics endpoint
+        """
+        snapshot = self.snapshot()
+        ns = self.namespace
+        bounds = [*(repr(float(bound)) for bound in self.buckets), "+Inf"]
+        lines = []
+        for name, field, help_ in (
+            ("request_duration_seconds", "duration", "Duration including retries."),
+            ("pool_wait_seconds", "pool_wait", "Time waiting for a connection."),
+        ):
+            lines.append(f"# HELP {ns}_{name} {help_}")
+            lines.append(f"# TYPE {ns}_{name} histogram")
+            for metrics in snapshot:
+                labels = _labels(metrics)
+                buckets = getattr(metrics, f"{field}_buckets")
+                for bound, count in zip(bounds, buckets):
+                    lines.append(f'{ns}_{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{ns}_{name}_sum{{{labels}}} {getattr(metrics, field)!r}")
+                lines.append(f"{ns}_{name}_count{{{labels}}} {metrics.requests}")
+        lines.append(f"# HELP {ns}_requests_total Requests by outcome.")
+        lines.append(f"# TYPE {ns}_requests_total counter")
+        for metrics in snapshot:
+            labels = _labels(metrics)
+            for outcome, count in sorted(metrics.outcomes.items()):
+                status = _escape(outcome)
+                lines.append(
+                    f'{ns}_requests_total{{{labels},status="{status}"}} {count}',
+                )
+        for name, field, help_ in (
+            ("sent_bytes_total", "bytes_sent", "Bytes of request bodies sent."),
+            ("received_bytes_total", "bytes_received", "Bytes of responses received."),
+            ("retries_total", "retries", "Attempts repeating failed requests."),
+            ("backoff_seconds_total", "backoff", "Time spent between attempts."),
+        ):
+            lines.append(f"# HELP {ns}_{name} {help_}")
+            lines.append(f"# TYPE {ns}_{name} counter")
+            for metrics in snapshot:
+                value = getattr(metrics, field)
+                lines.append(f"{ns}_{name}{{{_labels(metrics)}}} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """An instrumentation recording OpenTelemetry spans of requests.
+
+    Every request is a client span named after its method and API call,
+    with retries recorded as span events. It requires the opentelemetry-api
+    package.
+    """
+
+    def __init__(
+        self,
+        tracer: Any | None = None,
+    ):
+        """Initialize OpenTelemetryInstrumentation instance.
+
+        Parameters
+        ----------
+        tracer : Any | None, default None
+            An OpenTelemetry tracer; the global tracer provider's by default
+
+        Raises
+        ------
+        WrongParametersError
+            If the opentelemetry-api package is not installed
+        """
+        if otel_trace is None:
+            msg = "OpenTelemetry spans require the opentelemetry-api package!"
+            raise WrongParametersError(msg)
+        self._tracer = tracer or otel_trace.get_tracer("mlclient")
+
+    def request_started(
+        self,
+        info: RequestInfo,
+    ) -> Any:
+        """Start a client span of the request."""
+        return self._tracer.start_span(
+            f"{info.method} {info.call or info.endpoint}",
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "url.path": info.endpoint,
+                "mlclient.call": info.call,
+            },
+        )
+
+    def request_retried(
+        self,
+        info: RequestInfo,
+        attempt: int,
+        backoff: float,
+        context: Any,
+    ):
+        """Add a retry event to the span."""
+        context.add_event(
+            "retry",
+            attributes={"mlclient.attempt": attempt, "mlclient.backoff": backoff},
+        )
+
+    def request_finished(
+        self,
+        metrics: RequestMetrics,
+        context: Any,
+    ):
+        """Set metrics as span attributes and end the span."""
+        if metrics.status_code is not None:
+            context.set_attribute("http.response.status_code", metrics.status_code)
+        context.set_attribute("mlclient.attempts", metrics.attempts)
+        context.set_attribute("mlclient.bytes_sent", metrics.bytes_sent)
+        context.set_attribute("mlclient.bytes_received", metrics.bytes_received)
+        context.set_attribute("mlclient.pool_wait", metrics.pool_wait)
+        if metrics.error is not None:
+            context.set_status(otel_trace.StatusCode.ERROR, metrics.error)
+        context.end()
+
+
+class RequestRecorder:
+    """A recorder of a single request, fed by HTTP transports.
+
+    Attempts are recorded below the retrying transport, so every retry
+    is visible: backoff is the time between attempts, and connection pool
+    wait is the time until the connection pool hands a connection over.
+    """
+
+    __slots__ = (
+        "_attempt_ended",
+        "_attempt_started",
+        "_context",
+        "_instrumentation",
+        "_pool_waiting",
+        "_started",
+        "attempts",
+        "backoff",
+        "bytes_sent",
+        "info",
+        "pool_wait",
+        "response",
+    )
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        info: RequestInfo,
+    ):
+        """Initialize RequestRecorder instance and notify the instrumentation.
+
+        Parameters
+        ----------
+        instrumentation : Instrumentation
+            An instrumentation notified of the request
+        info : RequestInfo
+            A request being sent
+        """
+        self._instrumentation: Instrumentation = instrumentation
+        self.info: RequestInfo = info
+        self.response: Response | None = None
+        self.attempts: int = 0
+        self.bytes_sent: int = 0
+        self.backoff: float = 0.0
+        self.pool_wait: float = 0.0
+        self._attempt_started: float = 0.0
+        self._attempt_ended: float | None = None
+        self._pool_waiting: bool = False
+        self._started: float = perf_counter()
+        self._context: Any = instrumentation.request_started(info)
+
+    def start_attempt(
+        self,
+        request: Request,
+    ):
+        """Record an attempt to send a request."""
+        now = perf_counter()
+        self.attempts += 1
+        if self._attempt_ended is not None:
+            backoff = now - self._attempt_ended
+            self.backoff += backoff
+            self._instrumentation.request_retried(
+                self.info,
+                self.attempts,
+                backoff,
+                self._context,
+            )
+        self.bytes_sent += int(request.headers.get("Content-Length", 0))
+        self._attempt_started = now
+        self._pool_waiting = True
+
+    def end_attempt(
+        self,
+    ):
+        """Record the end of an attempt."""
+        self._pool_waiting = False
+        self._attempt_ended = perf_counter()
+
+    def trace(
+        self,
+        event_name: str,
+        info: dict,
+    ):
+        """Record the first connection event of an attempt (an httpcore trace)."""
+        if self._pool_waiting:
+            self._pool_waiting = False
+            self.pool_wait += perf_counter() - self._attempt_started
+
+    async def atrace(
+        self,
+        event_name: str,
+        info: dict,
+    ):
+        """Record the first connection event of an async attempt."""
+        self.trace(event_name, info)
+
+    def finish(
+        self,
+        error: BaseException | None = None,
+    ):
+        """Notify the instrumentation of the finished request."""
+        response = self.response
+        metrics = RequestMetrics(
+            call=self.info.call,
+            method=self.info.method,
+            endpoint=self.info.endpoint,
+            status_code=response.status_code if response is not None else None,
+            duration=perf_counter() - self._started,
+            bytes_sent=self.bytes_sent,
+            bytes_received=response.num_bytes_downloaded if response else 0,
+            attempts=self.attempts,
+            backoff=self.backoff,
+            pool_wait=self.pool_wait,
+            error=error.__class__.__name__ if error is not None else None,
+        )
+        self._instrumentation.request_finished(metrics, self._context)
+
+
+@contextmanager
+def record_request(
+    instrumentation: Instrumentation,
+    info: RequestInfo,
+) -> Iterator[RequestRecorder]:
+    """Return a context manager recording a request sent within it.
+
+    A request is finished when the context exits, so the metrics of streamed
+    responses include reading their bodies.
+
+    Parameters
+    ----------
+    instrumentation : Instrumentation
+        An instrumentation notified of the request
+    info : RequestInfo
+        A request being sent
+
+    Returns
+    -------
+    Iterator[RequestRecorder]
+        A context manager yielding a recorder; set its response once received
+    """
+    recorder = RequestRecorder(instrumentation, info)
+    # Streams abandoned by their consumers are closed in another context,
+    # where a token of this one cannot be reset
+    previous = _CURRENT_RECORDER.get()
+    _CURRENT_RECORDER.set(recorder)
+    error = None
+    try:
+        yield recorder
+    except GeneratorExit:
+        # A stream closed before its end is not a failed request
+        raise
+    except BaseException as err:
+        error = err
+        raise
+    finally:
+        _CURRENT_RECORDER.set(previous)
+        recorder.finish(error)
+
+
+def current_recorder() -> RequestRecorder | None:
+    """Return a recorder of the request being sent in the current context."""
+    return _CURRENT_RECORDER.get()
+
+
+def _labels(
+    metrics: EndpointMetrics,
+) -> str:
+    """Return Prometheus labels of an endpoint."""
+    return (
+        f'call="{_escape(metrics.call)}",'
+        f'method="{_escape(metrics.method)}",'
+        f'endpoint="{_escape(metrics.endpoint)}"'
+    )
+
+
+def _escape(
+    value: str,
+) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -16,7 +16,7 @@ import logging
 from functools import cached_property
 from types import TracebackType
 
-from httpx import BasicAuth, DigestAuth, Response
+from httpx import Limits, Response
 from httpx_retries import Retry
 
 from mlclient.api.admin_api import AdminApi, AsyncAdminApi
@@ -28,6 +28,7 @@ from mlclient.services.eval import AsyncEvalService, EvalService
 from mlclient.services.logs import AsyncLogsService, LogsService
 
 from .api_client import ApiClient, AsyncApiClient
+from .cluster import ROUND_ROBIN
 from .http_client import (
     DEFAULT_RETRY_STRATEGY,
     MARKLOGIC_ADMIN_API_PORT,
@@ -37,6 +38,8 @@ from .http_client import (
     AsyncHttpClient,
     HttpClient,
 )
+from .http_trace import HttpTracer
+from .instrumentation import Instrumentation
 from .restart_waiter import RestartWaiter
 
 logger = logging.getLogger(__name__)
@@ -130,6 +133,13 @@ class MLClient:
         username: str = "admin",
         password: str = "admin",
         retry: Retry | None = None,
+        *,
+        limits: Limits | None = None,
+        http2: bool = False,
+        cluster: bool = False,
+        balancing: str = ROUND_ROBIN,
+        instrumentation: Instrumentation | None = None,
+        tracer: HttpTracer | None = None,
     ):
         """Initialize MLClient instance.
 
@@ -149,6 +159,20 @@ class MLClient:
             A password
         retry : Retry | None, default Retry(total=5, backoff_factor=0.5)
             A retry strategy
+        limits : Limits | None, default Limits(100, 20, 5.0)
+            Connection pool limits of every underlying HTTP client
+        http2 : bool, default False
+            Whether to negotiate HTTP/2 (requires the h2 package)
+        cluster : bool, default False
+            Whether to spread requests on the main port across all hosts of
+            a cluster, discovered through the Manage API on connect
+        balancing : str, default "round-robin"
+            A strategy of spreading requests across hosts
+            (round-robin / least-outstanding)
+        instrumentation : Instrumentation | None, default None
+            Hooks observing requests of every underlying HTTP client
+        tracer : HttpTracer | None, default HttpTracer()
+            A formatter of HTTP traces of every underlying HTTP client
         """
         self._http = HttpClient(
             protocol=protocol,
@@ -158,6 +182,12 @@ class MLClient:
             username=username,
             password=password,
             retry=retry,
+            limits=limits,
+            http2=http2,
+            cluster=cluster,
+            balancing=balancing,
+            instrumentation=instrumentation,
+            tracer=tracer,
         )
         self._manage_http = None
         self._admin_http = None
@@ -272,12 +302,10 @@ class MLClient:
         )
 
     def _get_restart_waiter(self) -> RestartWaiter:
-        auth_impl = BasicAuth if self._http.auth_method == "basic" else DigestAuth
-        auth = auth_impl(self._http.username, self._http.password)
         return RestartWaiter(
             protocol=self._http.protocol,
             host=self._http.host,
-            auth=auth,
+            auth=self._http.auth,
             default_retry=DEFAULT_RETRY_STRATEGY,
         )
 
@@ -318,6 +346,10 @@ class MLClient:
             auth_method=self._http.auth_method,
             username=self._http.username,
             password=self._http.password,
+            limits=self._http.limits,
+            http2=self._http.http2,
+            instrumentation=self._http.instrumentation,
+            tracer=self._http.tracer,
         )
         if self.is_connected():
             http.connect()
@@ -349,6 +381,13 @@ class AsyncMLClient:
         username: str = "admin",
         password: str = "admin",
         retry: Retry | None = None,
+        *,
+        limits: Limits | None = None,
+        http2: bool = False,
+        cluster: bool = False,
+        balancing: str = ROUND_ROBIN,
+        instrumentation: Instrumentation | None = None,
+        tracer: HttpTracer | None = None,
     ):
         """Initialize AsyncMLClient instance.
 
@@ -368,6 +407,20 @@ class AsyncMLClient:
             A password
         retry : Retry | None, default Retry(total=5, backoff_factor=0.5)
             A retry strategy
+        limits : Limits | None, default Limits(100, 20, 5.0)
+            Connection pool limits of every underlying HTTP client
+        http2 : bool, default False
+            Whether to negotiate HTTP/2 (requires the h2 package)
+        cluster : bool, default False
+            Whether to spread requests on the main port across all hosts of
+            a cluster, discovered through the Manage API on connect
+        balancing : str, default "round-robin"
+            A strategy of spreading requests across hosts
+            (round-robin / least-outstanding)
+        instrumentation : Instrumentation | None, default None
+            Hooks observing requests of every underlying HTTP client
+        tracer : HttpTracer | None, default HttpTracer()
+            A formatter of HTTP traces of every underlying HTTP client
         """
         http_kwargs = {
             "protocol": protocol,
@@ -376,8 +429,17 @@ class AsyncMLClient:
             "username": username,
             "password": password,
             "retry": retry,
+            "limits": limits,
+            "http2": http2,
+            "instrumentation": instrumentation,
+            "tracer": tracer,
         }
-        self._http = AsyncHttpClient(port=port, **http_kwargs)
+        self._http = AsyncHttpClient(
+            port=port,
+            cluster=cluster,
+            balancing=balancing,
+            **http_kwargs,
+        )
         self._manage_http = (
             self._http
             if port == MARKLOGIC_MANAGE_API_PORT
@@ -499,11 +561,9 @@ class AsyncMLClient:
         )
 
     def _get_restart_waiter(self) -> RestartWaiter:
-        auth_impl = BasicAuth if self._http.auth_method == "basic" else DigestAuth
-        auth = auth_impl(self._http.username, self._http.password)
         return RestartWaiter(
             protocol=self._http.protocol,
             host=self._http.host,
-            auth=auth,
+            auth=self._http.auth,
             default_retry=DEFAULT_RETRY_STRATEGY,
         )
@@ -0,0 +1,437 @@
+"""The ML Connection Pool Registry module.
+
+It exports a process-wide registry of pooled HTTP transports shared by clients:
+    * ConnectionPoolRegistry
+        A thread-safe registry of reference-counted, pooled HTTP transports.
+    * SharedTransport
+        A client's reference to a pooled transport from the registry.
+    * AsyncSharedTransport
+        A client's reference to a pooled async transport from the registry.
+    * credentials_digest
+        Return a digest identifying credentials in transport keys.
+    * POOL_REGISTRY
+        The process-wide ConnectionPoolRegistry instance.
+    * SHARED_SSL_CONTEXT
+        The SSL context shared by all transports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import os
+import ssl
+import threading
+import time
+import weakref
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING, Any, Callable
+
+import httpx
+
+if TYPE_CHECKING:
+    from httpx import Request, Response
+
+    from .http_client import PoolStats
+
+# Reuse a single SSL context across all clients. Without this, every
+# transport creation invokes ssl.SSLContext.load_verify_locations which
+# re-reads the system CA bundle from disk (~60-120 ms each).
+SHARED_SSL_CONTEXT = ssl.create_default_context()
+
+# A maximum number of unreferenced sync transports kept open for reuse
+MAX_IDLE_TRANSPORTS = 8
+
+# A key of credentials digests, so that they cannot be matched outside the process
+_CREDENTIALS_KEY = os.urandom(32)
+
+
+class ConnectionPoolRegistry:
+    """A thread-safe registry of reference-counted, pooled HTTP transports.
+
+    Clients connecting with the same settings (protocol, host, port,
+    credentials and pool settings) get the same transport, so a short-lived
+    client reuses keep-alive connections warmed up by the previous ones.
+    A sync transport stays registered when its last reference is released,
+    until its idle expiry passes (see Limits.keepalive_expiry) or more than
+    MAX_IDLE_TRANSPORTS unreferenced ones are registered - then it is
+    unregistered and closed, the least recently released first.
+
+    Async transports are bound to an event loop - they are registered per
+    loop and unregistered with their last reference, to be closed by the
+    releasing client before the loop is.
+    """
+
+    def __init__(
+        self,
+    ):
+        """Initialize ConnectionPoolRegistry instance."""
+        self._entries: dict[Hashable, _Entry] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._timer_deadline: float | None = None
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return a number of registered transports."""
+        return len(self._entries)
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        loop: asyncio.AbstractEventLoop | None = None,
+        idle_expiry: float | None = None,
+    ) -> Any:
+        """Return a registered transport, creating it when needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            A transport key
+        factory : Callable[[], Any]
+            A transport factory called when the key is not registered
+        loop : asyncio.AbstractEventLoop | None, default None
+            An event loop an async transport is bound to
+        idle_expiry : float | None, default None
+            Seconds an unreferenced sync transport is kept open for reuse
+            (None to keep it until evicted by newer ones)
+
+        Returns
+        -------
+        Any
+            A transport with its reference count incremented
+        """
+        if loop is not None:
+            key = (key, id(loop))
+        with self._lock:
+            self._drop_orphans()
+            expired = self._evict_idle()
+            entry = self._entries.get(key)
+            if entry is None or entry.is_loop_closed():
+                entry = _Entry(factory(), loop, idle_expiry)
+                self._entries[key] = entry
+            entry.references += 1
+            entry.released_at = None
+        _close(expired)
+        return entry.transport
+
+    def release(
+        self,
+        key: Hashable,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> Any | None:
+        """Release a reference to a registered transport.
+
+        Parameters
+        ----------
+        key : Hashable
+            A transport key
+        loop : asyncio.AbstractEventLoop | None, default None
+            An event loop an async transport is bound to
+
+        Returns
+        -------
+        Any | None
+            An async transport to close, when its last reference was released
+        """
+        if loop is not None:
+            key = (key, id(loop))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.references == 0:
+                return None
+            entry.references -= 1
+            if entry.references > 0:
+                return None
+            if entry.is_async:
+                del self._entries[key]
+                return entry.transport
+            entry.released_at = time.monotonic()
+            expired = self._evict_idle()
+            self._schedule_eviction()
+        _close(expired)
+        return None
+
+    def references(
+        self,
+        key: Hashable,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> int:
+        """Return a number of references to a registered transport."""
+        if loop is not None:
+            key = (key, id(loop))
+        entry = self._entries.get(key)
+        return entry.references if entry is not None else 0
+
+    def clear(
+        self,
+    ):
+        """Close unreferenced sync transports and unregister all transports."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._cancel_eviction()
+        _close(
+            entry.transport
+            for entry in entries
+            if not entry.is_async and entry.references == 0
+        )
+
+    def _evict_idle(
+        self,
+    ) -> list:
+        """Unregister expired and excess unreferenced sync transports.
+
+        Returns
+        -------
+        list
+            Unregistered transports to close (outside the lock)
+        """
+        now = time.monotonic()
+        idle = sorted(
+            (
+                (entry.released_at, key, entry)
+                for key, entry in self._entries.items()
+                if entry.released_at is not None
+            ),
+            key=lambda item: item[0],
+        )
+        excess = len(idle) - MAX_IDLE_TRANSPORTS
+        evicted = []
+        for i, (_, key, entry) in enumerate(idle):
+            if i < excess or entry.is_expired(now):
+                del self._entries[key]
+                evicted.append(entry.transport)
+        return evicted
+
+    def _schedule_eviction(
+        self,
+    ):
+        """Schedule eviction of unreferenced sync transports when they expire."""
+        deadlines = [
+            entry.released_at + entry.idle_expiry
+            for entry in self._entries.values()
+            if entry.released_at is not None and entry.idle_expiry is not None
+        ]
+        if not deadlines:
+            return
+        deadline = min(deadlines)
+        if self._timer_deadline is not None and self._timer_deadline <= deadline:
+            return
+        self._cancel_eviction()
+        self._timer = threading.Timer(
+            max(deadline - time.monotonic(), 0.0),
+            self._evict_expired,
+        )
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _cancel_eviction(
+        self,
+    ):
+        """Cancel scheduled eviction of unreferenced sync transports."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_deadline = None
+
+    def _evict_expired(
+        self,
+    ):
+        """Close expired unreferenced sync transports and schedule next ones."""
+        with self._lock:
+            self._timer = None
+            self._timer_deadline = None
+            expired = self._evict_idle()
+            self._schedule_eviction()
+        _close(expired)
+
+    def _drop_orphans(
+        self,
+    ):
+        """Unregister unreferenced async transports of closed event loops."""
+        orphans = [
+            key
+            for key, entry in self._entries.items()
+            if entry.references == 0 and entry.is_loop_closed()
+        ]
+        for key in orphans:
+            del self._entries[key]
+
+
+class _Entry:
+    """A registered transport with its reference count."""
+
+    __slots__ = ("_loop_ref", "idle_expiry", "references", "released_at", "transport")
+
+    def __init__(
+        self,
+        transport: Any,
+        loop: asyncio.AbstractEventLoop | None,
+        idle_expiry: float | None,
+    ):
+        self.transport: Any = transport
+        self.references: int = 0
+        self.idle_expiry: float | None = idle_expiry
+        self.released_at: float | None = None
+        self._loop_ref = weakref.ref(loop) if loop is not None else None
+
+    @property
+    def is_async(
+        self,
+    ) -> bool:
+        return self._loop_ref is not None
+
+    def is_loop_closed(
+        self,
+    ) -> bool:
+        if self._loop_ref is None:
+            return False
+        loop = self._loop_ref()
+        return loop is None or loop.is_closed()
+
+    def is_expired(
+        self,
+        now: float,
+    ) -> bool:
+        if self.released_at is None or self.idle_expiry is None:
+            return False
+        return now - self.released_at >= self.idle_expiry
+
+
+class SharedTransport(httpx.BaseTransport):
+    """A client's reference to a pooled transport from the registry.
+
+    Closing it releases the reference, leaving the pooled transport open
+    for reuse until it is evicted.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        key: Hashable,
+    ):
+        """Initialize SharedTransport instance.
+
+        Parameters
+        ----------
+        transport : httpx.BaseTransport
+            A pooled transport acquired from POOL_REGISTRY
+        key : Hashable
+            A key the transport was acquired with
+        """
+        self._transport: httpx.BaseTransport = transport
+        self._key: Hashable | None = key
+
+    def handle_request(
+        self,
+        request: Request,
+    ) -> Response:
+        """Send a request through the pooled transport."""
+        return self._transport.handle_request(request)
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        """Return statistics of the pooled transport."""
+        return self._transport.pool_stats()
+
+    def close(
+        self,
+    ):
+        """Release the reference to the pooled transport."""
+        if self._key is not None:
+            POOL_REGISTRY.release(self._key)
+            self._key = None
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """A client's reference to a pooled async transport from the registry.
+
+    Closing it releases the reference; the pooled transport is closed with
+    its last reference, as it cannot outlive its event loop.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        key: Hashable,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        """Initialize AsyncSharedTransport instance.
+
+        Parameters
+        ----------
+        transport : httpx.AsyncBaseTransport
+            A pooled transport acquired from POOL_REGISTRY
+        key : Hashable
+            A key the transport was acquired with
+        loop : asyncio.AbstractEventLoop
+            An event loop the transport was acquired for
+        """
+        self._transport: httpx.AsyncBaseTransport = transport
+        self._key: Hashable | None = key
+        self._loop: asyncio.AbstractEventLoop = loop
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        """Send a request through the pooled transport."""
+        return await self._transport.handle_async_request(request)
+
+    def pool_stats(
+        self,
+    ) -> PoolStats:
+        """Return statistics of the pooled transport."""
+        return self._transport.pool_stats()
+
+    async def aclose(
+        self,
+    ):
+        """Release the reference, closing the pooled transport with the last one."""
+        if self._key is not None:
+            released = POOL_REGISTRY.release(self._key, self._loop)
+            self._key = None
+            if released is not None:
+                await released.aclose()
+
+
+def credentials_digest(
+    username: str,
+    password: str,
+) -> str:
+    """Return a digest identifying credentials in transport keys.
+
+    Keys are kept for the life of the process, so they include a keyed hash
+    of credentials rather than a password.
+
+    Parameters
+    ----------
+    username : str
+        A username
+    password : str
+        A password
+
+    Returns
+    -------
+    str
+        A hexadecimal HMAC-SHA256 digest of the credentials
+    """
+    credentials = f"{username}\0{password}".encode()
+    return hmac.new(_CREDENTIALS_KEY, credentials, hashlib.sha256).hexdigest()
+
+
+def _close(
+    transports: Iterable,
+):
+    """Close unregistered sync transports."""
+    for transport in transports:
+        transport.close()
+
+
+POOL_REGISTRY = ConnectionPoolRegistry()
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import ssl
 import time
 from typing import NoReturn, Union
 from xml.etree import ElementTree
@@ -15,17 +14,19 @@ from httpx import AsyncClient, AsyncHTTPTransport, Auth, Response
 from httpx_retries import Retry, RetryTransport
 
 from mlclient import constants as const
+from mlclient import json_codec
 
-logger = logging.getLogger(__name__)
+from .cluster import HOSTS_ENDPOINT, parse_host_names
+from .pool_registry import POOL_REGISTRY, SHARED_SSL_CONTEXT, AsyncSharedTransport
 
-# See ml_client._SHARED_SSL_CONTEXT for rationale (avoid repeated CA bundle loading).
-_SHARED_SSL_CONTEXT = ssl.create_default_context()
+logger = logging.getLogger(__name__)
 
 _RestartTimestampBaseline = Union[asyncio.Future, str, None]
 _MARKLOGIC_ADMIN_API_PORT = 8001
 _MARKLOGIC_MANAGE_API_PORT = 8002
-_HOSTS_ENDPOINT = "/manage/v2/hosts"
 _RESTART_TIMESTAMP_PATH = "/admin/v1/timestamp"
+_HOSTS_TRANSPORT_KEY = "restart-waiter-hosts"
+_PROBE_TRANSPORT_KEY = "restart-waiter-probes"
 
 
 class RestartWaiter:
@@ -193,7 +194,7 @@ class RestartWaiter:
     ) -> dict[str, str]:
         """Parse restart timestamps from a MarkLogic JSON payload."""
         try:
-            data = json.loads(content)
+            data = json_codec.loads(content)
         except json.JSONDecodeError:
             return {}
 
@@ -390,13 +391,13 @@ class RestartWaiter:
         """Return MarkLogic host names keyed by host id."""
         async with AsyncClient(
             transport=RetryTransport(
-                transport=AsyncHTTPTransport(verify=_SHARED_SSL_CONTEXT),
+                transport=self._shared_transport(_HOSTS_TRANSPORT_KEY),
                 retry=self._default_retry,
             ),
         ) as client:
             response = await client.get(
                 f"{self._protocol}://{self._host}:{_MARKLOGIC_MANAGE_API_PORT}"
-                f"{_HOSTS_ENDPOINT}",
+                f"{HOSTS_ENDPOINT}",
                 auth=self._auth,
                 params={"format": "json"},
             )
@@ -404,13 +405,20 @@ class RestartWaiter:
         if response.status_code != httpx.codes.OK:
             return {}
 
-        data = response.json()["host-default-list"]["list-items"]["list-item"]
-        hosts = data if isinstance(data, list) else [data]
-        return {
-            host_info["idref"]: host_info["nameref"]
-            for host_info in hosts
-            if host_info.get("idref") and host_info.get("nameref")
-        }
+        return parse_host_names(response.content)
+
+    @staticmethod
+    def _shared_transport(
+        key: str,
+    ) -> AsyncSharedTransport:
+        """Return a reference to a pooled transport for the running event loop."""
+        loop = asyncio.get_running_loop()
+        transport = POOL_REGISTRY.acquire(
+            key,
+            lambda: AsyncHTTPTransport(verify=SHARED_SSL_CONTEXT),
+            loop,
+        )
+        return AsyncSharedTransport(transport, key, loop)
 
     async def _wait_for_host_ready(
         self,
@@ -421,8 +429,9 @@ class RestartWaiter:
         retry: Retry,
     ) -> None:
         """Wait for a single host to report readiness via the timestamp endpoint."""
+        # Probes use fresh connections - pooled ones may be stale after a restart
         async with AsyncClient(
-            transport=AsyncHTTPTransport(verify=_SHARED_SSL_CONTEXT),
+            transport=self._shared_transport(_PROBE_TRANSPORT_KEY),
             headers={"Connection": "close"},
             timeout=self._probe_timeout,
         ) as client:
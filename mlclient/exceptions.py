@@ -102,8 +102,10 @@ class MarkLogicError(Exception):
         error : dict | str
             An error response object or a raw error message
         """
+        self.status_code: int | None = None
         if isinstance(error, dict):
             status_code = error.get("statusCode")
+            self.status_code = status_code
             status = error.get("status")
             msg_code = error.get("messageCode")
             msg = error.get("message")
@@ -7,13 +7,17 @@ It exports a class parsing files into Documents:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from collections.abc import Generator
+from collections import deque
+from collections.abc import AsyncIterator, Generator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 
 from mlclient.mimetypes import Mimetypes
-from mlclient.models import Document, Metadata
+from mlclient.models import Document, DocumentType, FileContent, Metadata
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +42,9 @@ class DocumentsLoader:
         at the beginning. Both options can be customized with the uri_prefix
         parameter.
         File bytes are stored as-is on the resulting Document; structural parsing
-        (XML, JSON) happens lazily on first ``.content`` access.
+        (XML, JSON) happens lazily on first ``.content`` access. Binary files are
+        not read at all - they are referenced with a FileContent and streamed
+        in chunks when sent.
         Metadata is identified for a file at the same level with .metadata.json or
         .metadata.xml suffix.
 
@@ -61,14 +67,126 @@ class DocumentsLoader:
             yield cls.load_document(file_path, uri)
         else:
             logger.debug("Loading documents from [%s] directory", path)
-            for dir_path, _, file_names in os.walk(path):
-                for file_name in file_names:
-                    if file_name.endswith(cls._METADATA_SUFFIXES):
-                        continue
+            for entry in cls._scan(path, uri_prefix):
+                yield cls._read_document(*entry)
 
-                    file_path = str(Path(dir_path) / file_name)
-                    uri = file_path.replace(path, uri_prefix)
-                    yield cls.load_document(file_path, uri)
+    @classmethod
+    def load_parallel(
+        cls,
+        path: str,
+        uri_prefix: str = "",
+        *,
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator[Document]:
+        """Load documents from files under a path using a thread pool.
+
+        Works like load(), but files are read concurrently by a pool of
+        threads, so that reads (and metadata sidecars) on high-latency storage
+        are not issued one at a time. At most twice as many files as workers
+        are read ahead, which keeps memory use bounded.
+
+        Parameters
+        ----------
+        path : str
+            A path to a directory or a single file.
+        uri_prefix : str, default ""
+            URIs prefix to apply
+        max_workers : int | None, default None
+            A number of reading threads (default: ThreadPoolExecutor's default)
+        ordered : bool, default True
+            Yield documents in the directory listing order. Otherwise, each
+            document is yielded as soon as it has been read.
+
+        Returns
+        -------
+        Iterator[Document]
+            An iterator of Document instances
+        """
+        if Path(path).is_file():
+            yield from cls.load(path, uri_prefix)
+            return
+
+        logger.debug("Loading documents from [%s] directory in parallel", path)
+        workers = cls._get_workers_count(max_workers)
+        read_ahead = workers * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future] = deque()
+            for entry in cls._scan(path, uri_prefix):
+                pending.append(executor.submit(cls._read_document, *entry))
+                if len(pending) >= read_ahead:
+                    yield from cls._pop_completed(pending, ordered=ordered)
+            while pending:
+                yield from cls._pop_completed(pending, ordered=ordered)
+
+    @classmethod
+    async def aload(
+        cls,
+        path: str,
+        uri_prefix: str = "",
+        *,
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[Document]:
+        """Load documents from files under a path asynchronously.
+
+        Directory listings and file reads are performed by a pool of threads,
+        so the event loop is never blocked by the filesystem. At most twice as
+        many files as workers are read ahead.
+
+        Parameters
+        ----------
+        path : str
+            A path to a directory or a single file.
+        uri_prefix : str, default ""
+            URIs prefix to apply
+        max_workers : int | None, default None
+            A number of reading threads (default: ThreadPoolExecutor's default)
+        ordered : bool, default True
+            Yield documents in the directory listing order. Otherwise, each
+            document is yielded as soon as it has been read.
+
+        Returns
+        -------
+        AsyncIterator[Document]
+            An async iterator of Document instances
+        """
+        loop = asyncio.get_running_loop()
+        workers = cls._get_workers_count(max_workers)
+        read_ahead = workers * 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if await loop.run_in_executor(executor, Path(path).is_file):
+                yield await loop.run_in_executor(
+                    executor,
+                    lambda: next(cls.load(path, uri_prefix)),
+                )
+                return
+
+            logger.debug("Loading documents from [%s] directory asynchronously", path)
+            entries = cls._scan(path, uri_prefix)
+            pending: deque[asyncio.Future] = deque()
+            scanned = False
+            while not scanned or pending:
+                if not scanned and len(pending) < read_ahead:
+                    count = read_ahead - len(pending)
+                    chunk = await loop.run_in_executor(
+                        executor,
+                        lambda count=count: list(islice(entries, count)),
+                    )
+                    scanned = len(chunk) < count
+                    pending.extend(
+                        loop.run_in_executor(executor, cls._read_document, *entry)
+                        for entry in chunk
+                    )
+                if not pending:
+                    break
+                if ordered:
+                    yield await pending.popleft()
+                    continue
+                done, _ = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
 
     @classmethod
     def load_document(
@@ -81,7 +199,9 @@ class DocumentsLoader:
         By default, returns a Document without URI. It can be customized with
         the uri parameter.
         File bytes are stored as-is on the resulting Document; structural parsing
-        (XML, JSON) happens lazily on first ``.content`` access.
+        (XML, JSON) happens lazily on first ``.content`` access. Binary files are
+        not read at all - they are referenced with a FileContent and streamed
+        in chunks when sent.
         Metadata is identified for a file at the same level with .metadata.json or
         .metadata.xml suffix.
 
@@ -98,8 +218,7 @@ class DocumentsLoader:
             A Document instance
         """
         doc_type = Mimetypes.get_doc_type(path)
-        with Path(path).open("rb") as file:
-            content = file.read()
+        content = cls._read_content(path, doc_type)
         metadata = cls._load_metadata(path)
 
         return Document.create(
@@ -109,6 +228,17 @@ class DocumentsLoader:
             metadata=metadata,
         )
 
+    @staticmethod
+    def _read_content(
+        path: str,
+        doc_type: DocumentType,
+    ) -> bytes | FileContent:
+        """Read a file content, deferring binary files to a lazy FileContent."""
+        if doc_type == DocumentType.BINARY:
+            return FileContent(path)
+        with Path(path).open("rb") as file:
+            return file.read()
+
     @classmethod
     def _load_metadata(
         cls,
@@ -144,3 +274,103 @@ class DocumentsLoader:
         logger.fine("Document [%s] loaded with metadata [%s]", path, metadata_file_path)
         with Path(metadata_file_path).open("rb") as metadata_file:
             return Metadata(raw=metadata_file.read())
+
+    @classmethod
+    def _scan(
+        cls,
+        path: str,
+        uri_prefix: str,
+    ) -> Iterator[tuple[str, str, str | None]]:
+        """Scan a directory tree for documents to load.
+
+        Each directory is listed once with os.scandir; metadata sidecars are
+        identified within that listing instead of with per-file stat calls.
+        Symbolic links to directories are not followed (like os.walk does).
+
+        Returns
+        -------
+        Iterator[tuple[str, str, str | None]]
+            Tuples of a file path, its URI and its metadata file path
+        """
+        dir_paths = [path]
+        while dir_paths:
+            dir_path = dir_paths.pop()
+            file_names = []
+            sub_dir_paths = []
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dir_paths.append(entry.path)
+                    elif entry.is_file():
+                        file_names.append(entry.name)
+            names = set(file_names)
+            for file_name in file_names:
+                if file_name.endswith(cls._METADATA_SUFFIXES):
+                    continue
+                file_path = str(Path(dir_path) / file_name)
+                uri = file_path.replace(path, uri_prefix)
+                yield file_path, uri, cls._find_metadata(dir_path, file_name, names)
+            dir_paths.extend(reversed(sub_dir_paths))
+
+    @classmethod
+    def _find_metadata(
+        cls,
+        dir_path: str,
+        file_name: str,
+        names: set[str],
+    ) -> str | None:
+        """Return a metadata sidecar path for a file in a directory listing."""
+        stem = Path(file_name).stem
+        for suffix in (cls._JSON_METADATA_SUFFIX, cls._XML_METADATA_SUFFIX):
+            if stem + suffix in names:
+                return str(Path(dir_path) / (stem + suffix))
+        return None
+
+    @classmethod
+    def _read_document(
+        cls,
+        path: str,
+        uri: str,
+        metadata_path: str | None,
+    ) -> Document:
+        """Read a document with an already identified metadata sidecar."""
+        doc_type = Mimetypes.get_doc_type(path)
+        content = cls._read_content(path, doc_type)
+        metadata = None
+        if metadata_path is not None:
+            logger.fine("Document [%s] loaded with metadata [%s]", path, metadata_path)
+            with Path(metadata_path).open("rb") as metadata_file:
+                metadata = Metadata(raw=metadata_file.read())
+
+        return Document.create(
+            content=content,
+            doc_type=doc_type,
+            uri=uri,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _pop_completed(
+        pending: deque[Future],
+        *,
+        ordered: bool,
+    ) -> Iterator[Document]:
+        """Wait for pending reads and yield completed documents.
+
+        In the ordered mode the oldest read is awaited; otherwise all reads
+        completed so far are yielded.
+        """
+        if ordered:
+            yield pending.popleft().result()
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield future.result()
+
+    @staticmethod
+    def _get_workers_count(
+        max_workers: int | None,
+    ) -> int:
+        """Return a number of reading threads, defaulting as ThreadPoolExecutor."""
+        return max_workers or min(32, (os.cpu_count() or 1) + 4)
@@ -5,24 +5,54 @@ It contains the following modules
 
     * documents_jobs
         The ML Documents Jobs module.
+    * adaptive_controller
+        The ML Jobs Adaptive Controller module.
+    * query_batcher
+        The ML Query Batcher module.
+    * journal
+        The ML Jobs Journal module.
 
 This package exports the following classes:
     * WriteDocumentsJob
         An async job writing documents into a MarkLogic database.
     * ReadDocumentsJob
         An async job reading documents from a MarkLogic database.
+    * QueryDocumentsJob
+        An async job reading documents matching a query from a MarkLogic database.
+    * DeleteDocumentsJob
+        An async job deleting documents from a MarkLogic database.
     * DocumentJobReport
         A class representing a documents job report.
+    * AdaptiveController
+        An AIMD controller of a job's concurrency and batch size.
+    * QueryBatcher
+        An enumerator of URIs matching a query, partitioned by forests.
+    * JobJournal
+        An on-disk journal of documents completed by a job, used to resume it.
 
 Examples
 --------
 >>> from mlclient.jobs import WriteDocumentsJob
 """
 
-from .documents_jobs import DocumentJobReport, ReadDocumentsJob, WriteDocumentsJob
+from .adaptive_controller import AdaptiveController
+from .documents_jobs import (
+    DeleteDocumentsJob,
+    DocumentJobReport,
+    QueryDocumentsJob,
+    ReadDocumentsJob,
+    WriteDocumentsJob,
+)
+from .journal import JobJournal
+from .query_batcher import QueryBatcher
 
 __all__ = [
+    "AdaptiveController",
+    "DeleteDocumentsJob",
     "DocumentJobReport",
+    "JobJournal",
+    "QueryBatcher",
+    "QueryDocumentsJob",
     "ReadDocumentsJob",
     "WriteDocumentsJob",
 ]
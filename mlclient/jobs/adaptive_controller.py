@@ -0,0 +1,285 @@
+"""The ML Jobs Adaptive Controller module.
+
+It exports a class tuning document jobs' settings while they run:
+    * AdaptiveController
+        An AIMD controller of a job's concurrency and batch size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from mlclient.exceptions import MarkLogicError
+
+
+class AdaptiveController:
+    """An AIMD controller of a job's concurrency and batch size.
+
+    Every completed batch is recorded with its size, latency and error, if
+    any. After each round of successful batches (as many as the current
+    concurrency), the controller compares the smoothed per-document latency
+    with the best one observed so far: while it stays within the tolerance,
+    both the concurrency and the batch size grow additively; once latency
+    degrades, both are decreased by one step and the current latency becomes
+    the new baseline, so that a lasting rise (e.g. larger documents) does not
+    keep shrinking them. A 5xx response or a timeout multiplicatively shrinks
+    both values, at most once per round.
+    Values always stay within the bounds set by the caller.
+
+    The concurrency is enforced by the slot() context manager, so a job can
+    start as many workers as the upper bound and let the controller decide
+    how many of them send requests at a time. Batches should be recorded
+    before their slot is released, so that waiting workers see the new
+    concurrency as soon as they are woken up.
+    """
+
+    _LATENCY_SMOOTHING: float = 0.3
+
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1000,
+        *,
+        concurrency: int | None = None,
+        batch_size: int | None = None,
+        latency_tolerance: float = 1.5,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize AdaptiveController instance.
+
+        Parameters
+        ----------
+        min_concurrency : int, default 1
+            A lower bound of concurrent batch requests
+        max_concurrency : int, default 32
+            An upper bound of concurrent batch requests
+        min_batch_size : int, default 10
+            A lower bound of a batch size
+        max_batch_size : int, default 1000
+            An upper bound of a batch size
+        concurrency : int | None, default None
+            An initial concurrency (default: min_concurrency)
+        batch_size : int | None, default None
+            An initial batch size (default: min_batch_size)
+        latency_tolerance : float, default 1.5
+            A ratio of the smoothed to the best per-document latency above
+            which the concurrency and the batch size stop growing and are
+            decreased
+        decrease_factor : float, default 0.5
+            A factor applied to both values on 5xx responses and timeouts
+
+        Raises
+        ------
+        ValueError
+            If bounds are not positive or a lower bound exceeds an upper one
+        """
+        if not 0 < min_concurrency <= max_concurrency:
+            msg = "Concurrency bounds must satisfy 0 < min <= max."
+            raise ValueError(msg)
+        if not 0 < min_batch_size <= max_batch_size:
+            msg = "Batch size bounds must satisfy 0 < min <= max."
+            raise ValueError(msg)
+        self._min_concurrency: int = min_concurrency
+        self._max_concurrency: int = max_concurrency
+        self._min_batch_size: int = min_batch_size
+        self._max_batch_size: int = max_batch_size
+        self._concurrency: int = self._clamp_concurrency(
+            concurrency or min_concurrency,
+        )
+        self._batch_size: int = self._clamp_batch_size(batch_size or min_batch_size)
+        self._batch_step: int = max(1, (max_batch_size - min_batch_size) // 10)
+        self._latency_tolerance: float = latency_tolerance
+        self._decrease_factor: float = decrease_factor
+        self._best_latency: float | None = None
+        self._latency: float | None = None
+        self._round_batches: int = 0
+        self._batches_since_decrease: int | None = None
+        self._in_flight: int = 0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def fixed(
+        cls,
+        concurrency: int,
+        batch_size: int,
+    ) -> AdaptiveController:
+        """Return a controller keeping constant settings."""
+        return cls(
+            min_concurrency=concurrency,
+            max_concurrency=concurrency,
+            min_batch_size=batch_size,
+            max_batch_size=batch_size,
+        )
+
+    @property
+    def concurrency(
+        self,
+    ) -> int:
+        """A current number of concurrent batch requests."""
+        return self._concurrency
+
+    @property
+    def max_concurrency(
+        self,
+    ) -> int:
+        """An upper bound of concurrent batch requests."""
+        return self._max_concurrency
+
+    @property
+    def batch_size(
+        self,
+    ) -> int:
+        """A current batch size."""
+        return self._batch_size
+
+    @property
+    def max_batch_size(
+        self,
+    ) -> int:
+        """An upper bound of a batch size."""
+        return self._max_batch_size
+
+    @asynccontextmanager
+    async def slot(
+        self,
+    ) -> AsyncIterator[None]:
+        """Wait until fewer batches than the current concurrency are in flight."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._concurrency)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    def record(
+        self,
+        batch_size: int,
+        latency: float,
+        err: Exception | None = None,
+    ) -> bool:
+        """Record a completed batch and adjust settings.
+
+        Parameters
+        ----------
+        batch_size : int
+            A number of documents in the batch
+        latency : float
+            A batch processing time in seconds
+        err : Exception | None, default None
+            An error the batch failed with
+
+        Returns
+        -------
+        bool
+            True if the concurrency or the batch size has changed
+        """
+        if self._batches_since_decrease is not None:
+            self._batches_since_decrease += 1
+        if err is not None:
+            if self.is_overload_error(err):
+                return self._decrease()
+            return False
+
+        doc_latency = latency / max(batch_size, 1)
+        if self._latency is None:
+            self._latency = doc_latency
+        else:
+            self._latency += self._LATENCY_SMOOTHING * (doc_latency - self._latency)
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+
+        self._round_batches += 1
+        if self._round_batches < self._concurrency:
+            return False
+        self._round_batches = 0
+        if self._latency > self._best_latency * self._latency_tolerance:
+            self._best_latency = self._latency
+            return self._update(
+                self._concurrency - 1,
+                self._batch_size - self._batch_step,
+            )
+        return self._update(
+            self._concurrency + 1,
+            self._batch_size + self._batch_step,
+        )
+
+    @staticmethod
+    def is_overload_error(
+        err: Exception,
+    ) -> bool:
+        """Return True if an error indicates an overloaded server or network."""
+        if isinstance(err, httpx.TimeoutException):
+            return True
+        if isinstance(err, httpx.HTTPStatusError):
+            return err.response.is_server_error
+        if isinstance(err, MarkLogicError):
+            return (
+                isinstance(err.status_code, int)
+                and err.status_code >= httpx.codes.INTERNAL_SERVER_ERROR
+            )
+        return False
+
+    def _decrease(
+        self,
+    ) -> bool:
+        """Shrink settings multiplicatively, at most once per round."""
+        if (
+            self._batches_since_decrease is not None
+            and self._batches_since_decrease < self._concurrency
+        ):
+            return False
+        self._batches_since_decrease = 0
+        self._round_batches = 0
+        return self._update(
+            int(self._concurrency * self._decrease_factor),
+            int(self._batch_size * self._decrease_factor),
+        )
+
+    def _update(
+        self,
+        concurrency: int,
+        batch_size: int,
+    ) -> bool:
+        """Set new settings within bounds."""
+        concurrency = self._clamp_concurrency(concurrency)
+        batch_size = self._clamp_batch_size(batch_size)
+        changed = (concurrency, batch_size) != (self._concurrency, self._batch_size)
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        return changed
+
+    def _get_condition(
+        self,
+    ) -> asyncio.Condition:
+        """Return a condition bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    def _clamp_concurrency(
+        self,
+        concurrency: int,
+    ) -> int:
+        """Return concurrency within bounds."""
+        return max(self._min_concurrency, min(self._max_concurrency, concurrency))
+
+    def _clamp_batch_size(
+        self,
+        batch_size: int,
+    ) -> int:
+        """Return batch size within bounds."""
+        return max(self._min_batch_size, min(self._max_batch_size, batch_size))
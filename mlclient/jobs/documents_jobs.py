@@ -5,6 +5,10 @@ It exports high-level class to perform bulk operations in a MarkLogic server:
         An async job writing documents into a MarkLogic database.
     * ReadDocumentsJob
         An async job reading documents from a MarkLogic database.
+    * QueryDocumentsJob
+        An async job reading documents matching a query from a MarkLogic database.
+    * DeleteDocumentsJob
+        An async job deleting documents from a MarkLogic database.
     * DocumentJobReport
         A class representing a documents job report.
     * DocumentReport
@@ -13,42 +17,66 @@ It exports high-level class to perform bulk operations in a MarkLogic server:
         A document's status enum.
     * DocumentStatusDetails
         A class representing a document's status details.
+    * JobTuning
+        A class representing job settings chosen while running.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Iterable
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
 from copy import copy
 from enum import Enum
+from itertools import chain, count, islice
 from pathlib import Path
 
 from pydantic import BaseModel
 
-from mlclient.clients import AsyncMLClient
+from mlclient.clients import AsyncMLClient, PoolStats, limits_for_concurrency
+from mlclient.exceptions import WrongParametersError
 from mlclient.io import DocumentsLoader, DocumentsWriter
-from mlclient.models import Document
+from mlclient.models import BinaryDocument, Document, Metadata
 from mlclient.models.http import Category
 
+from .adaptive_controller import AdaptiveController
+from .journal import JobJournal
+from .query_batcher import QueryBatcher, QuerySnapshot
+
 logger = logging.getLogger(__name__)
 
+# Sizes of JSON keys and punctuation in serialized metadata and permissions
+_METADATA_JSON_OVERHEAD = 91
+_PERMISSION_JSON_OVERHEAD = 40
+
 
 class WriteDocumentsJob:
     """An async job writing documents into a MarkLogic database.
 
-    Uses asyncio with a concurrency-limited semaphore to send document batches
-    in parallel via AsyncMLClient.
+    Runs as a producer/consumer pipeline: a loader stage pulls documents lazily
+    from the job's inputs and feeds batches into a bounded queue, drained by
+    a fixed number of worker tasks sending them via AsyncMLClient. Memory use
+    is therefore bounded by concurrency x batch_size documents regardless of
+    the input size.
+
+    Batches are closed by document count and, optionally, by their byte size
+    (content plus metadata) - whichever limit is hit first. A document larger
+    than the byte limit on its own is sent in a solo request.
 
     Recommended settings based on benchmarks (1000 documents):
         concurrency: 4-12 (default: 8)
         batch_size: 50-200 (default: 100)
+    As the best values depend on document sizes, cluster load and network,
+    they can be tuned while the job runs with with_adaptive_tuning().
     """
 
     def __init__(
         self,
         concurrency: int | None = None,
         batch_size: int = 100,
+        max_batch_bytes: int | None = None,
     ):
         """Initialize WriteDocumentsJob instance.
 
@@ -58,12 +86,22 @@ class WriteDocumentsJob:
             Maximum number of concurrent batch requests (default: 8)
         batch_size : int, default 100
             A number of documents in a single batch
+        max_batch_bytes : int | None, default None
+            A maximum summed size of documents' content and metadata in a single
+            batch. When None, batches are limited by the number of documents only.
         """
         self._concurrency: int = concurrency or 8
         self._batch_size: int = batch_size
+        self._max_batch_bytes: int | None = max_batch_bytes
+        self._overflow: Document | None = None
         self._config: dict = {}
         self._database: str | None = None
-        self._documents: list[Document] = []
+        self._inputs: list[Iterable[Document]] = []
+        self._controller: AdaptiveController | None = None
+        self._tuner: AdaptiveController | None = None
+        self._journal_path: str | None = None
+        self._journal: JobJournal = JobJournal(None)
+        self._resuming: bool = False
         self._report = DocumentJobReport()
 
     @property
@@ -72,7 +110,12 @@ class WriteDocumentsJob:
         return copy(self._report)
 
     def with_client_config(self, **config):
-        """Set AsyncMLClient configuration."""
+        """Set AsyncMLClient configuration.
+
+        Unless limits are configured explicitly, the connection pool is sized
+        for the job's maximum concurrency. With cluster=True, batches are
+        spread across all hosts of the cluster, each with a pool of that size.
+        """
         self._config = config
 
     def with_database(self, database: str):
@@ -80,30 +123,88 @@ class WriteDocumentsJob:
         self._database = database
 
     def with_documents_input(self, documents: Iterable[Document]):
-        """Add Documents to the job's input."""
-        self._documents.extend(documents)
+        """Add Documents to the job's input.
+
+        The iterable is consumed lazily, batch by batch, while the job runs.
+        """
+        self._inputs.append(documents)
 
     def with_filesystem_input(self, path: str, uri_prefix: str = ""):
-        """Load files and add parsed Documents to the job's input."""
-        self._documents.extend(DocumentsLoader.load(path, uri_prefix))
+        """Add files to the job's input, loaded lazily while the job runs.
+
+        Files are read ahead by a pool of threads (see
+        DocumentsLoader.load_parallel()).
+        """
+        self._inputs.append(DocumentsLoader.load_parallel(path, uri_prefix))
+
+    def with_journal(self, path: str):
+        """Record outcomes of documents in an on-disk journal (see JobJournal).
+
+        A journal lets the job be resumed with resume() after a crash.
+        """
+        self._journal_path = path
+
+    def with_adaptive_tuning(self, **bounds):
+        """Tune concurrency and batch size while the job runs.
+
+        Keyword arguments are passed to AdaptiveController; by default the job
+        starts from its own settings, within 1 to twice the concurrency and
+        a quarter to four times the batch size. Chosen values are recorded in
+        the job report.
+        """
+        self._controller = _build_controller(
+            self._concurrency,
+            self._batch_size,
+            **bounds,
+        )
 
     async def run(self) -> DocumentJobReport:
         """Execute the job and return a report when complete."""
-        for doc in self._documents:
-            self._report.add_pending_doc(doc.uri)
+        self._tuner = self._controller or AdaptiveController.fixed(
+            self._concurrency,
+            self._batch_size,
+        )
+        self._report.add_tuning(self._tuner.concurrency, self._tuner.batch_size)
+        workers_count = self._tuner.max_concurrency
+        queue = asyncio.Queue(maxsize=workers_count)
+        config = _client_config(self._config, workers_count)
+        journal = JobJournal(self._journal_path, resume=self._resuming)
+        async with journal, AsyncMLClient(**config) as ml:
+            self._journal = journal
+            workers = [
+                asyncio.create_task(self._consume_batches(queue, ml))
+                for _ in range(workers_count)
+            ]
+            try:
+                await self._produce_batches(queue)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                self._report.set_pool_stats(ml.http.pool_stats())
 
-        batches = [
-            self._documents[i : i + self._batch_size]
-            for i in range(0, len(self._documents), self._batch_size)
-        ]
+        return copy(self._report)
 
-        sem = asyncio.Semaphore(self._concurrency)
-        async with AsyncMLClient(**self._config) as ml:
-            await asyncio.gather(
-                *(self._send_batch(sem, batch, ml) for batch in batches),
-            )
+    async def resume(self) -> DocumentJobReport:
+        """Execute the job, skipping documents completed by a previous run.
 
-        return copy(self._report)
+        Requires a journal (see with_journal()). Documents that failed or were
+        not processed by the previous run are processed again.
+        """
+        _require_journal(self._journal_path)
+        self._resuming = True
+        try:
+            return await self.run()
+        finally:
+            self._resuming = False
+
+    def resume_sync(self) -> DocumentJobReport:
+        """Resume the job synchronously.
+
+        Wrapper around asyncio.run(self.resume()). Cannot be called from within
+        a running event loop.
+        """
+        return asyncio.run(self.resume())
 
     def run_sync(self) -> DocumentJobReport:
         """Execute the job synchronously.
@@ -113,36 +214,111 @@ class WriteDocumentsJob:
         """
         return asyncio.run(self.run())
 
+    async def _produce_batches(
+        self,
+        queue: asyncio.Queue,
+    ):
+        """Feed document batches into the queue, then one sentinel per worker.
+
+        Batches are built in a worker thread, so that reading input files does
+        not block requests in flight. The bounded queue suspends the producer
+        whenever all workers are busy.
+        """
+        documents = (
+            doc
+            for doc in chain.from_iterable(self._inputs)
+            if not self._journal.is_completed(doc.uri)
+        )
+        self._overflow = None
+        while batch := await asyncio.to_thread(self._next_batch, documents):
+            self._report.add_pending_docs([doc.uri for doc in batch])
+            await queue.put(batch)
+        for _ in range(self._tuner.max_concurrency):
+            await queue.put(None)
+
+    def _next_batch(
+        self,
+        documents: Iterator[Document],
+    ) -> list[Document]:
+        """Take the next batch of documents from the input.
+
+        With max_batch_bytes set, a batch is closed as soon as adding the next
+        document would push its byte size past the limit; that document opens
+        the next batch. A document exceeding the limit on its own is yielded
+        alone.
+        """
+        max_count = self._tuner.batch_size
+        if self._max_batch_bytes is None:
+            return list(islice(documents, max_count))
+        if self._overflow is not None:
+            documents = chain((self._overflow,), documents)
+            self._overflow = None
+        batch: list[Document] = []
+        batch_bytes = 0
+        for doc in documents:
+            doc_bytes = _document_bytes(doc)
+            if batch and batch_bytes + doc_bytes > self._max_batch_bytes:
+                self._overflow = doc
+                break
+            batch.append(doc)
+            batch_bytes += doc_bytes
+            if len(batch) >= max_count:
+                break
+        return batch
+
+    async def _consume_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+    ):
+        """Send queued batches until a sentinel is received."""
+        while (batch := await queue.get()) is not None:
+            await _send_tuned_batch(
+                self._tuner,
+                self._report,
+                len(batch),
+                self._send_batch(batch, ml),
+            )
+
     async def _send_batch(
         self,
-        sem: asyncio.Semaphore,
         batch: list[Document],
         ml: AsyncMLClient,
-    ):
+    ) -> Exception | None:
         """Send a documents batch to /v1/documents endpoint."""
         batch_uris = [doc.uri for doc in batch]
-        async with sem:
-            try:
-                await ml.documents.write(batch, database=self._database)
-                self._report.add_successful_docs(batch_uris)
-            except Exception as err:
-                self._report.add_failed_docs(batch_uris, err)
-                logger.exception(
-                    "An unexpected error occurred while writing documents",
-                )
+        try:
+            await ml.documents.write(batch, database=self._database)
+            self._report.add_successful_docs(batch_uris)
+            self._journal.record_successful(batch_uris)
+        except Exception as err:
+            self._report.add_failed_docs(batch_uris, err)
+            self._journal.record_failed(batch_uris, err)
+            logger.exception(
+                "An unexpected error occurred while writing documents",
+            )
+            return err
+        return None
 
 
 class ReadDocumentsJob:
     """An async job reading documents from a MarkLogic database.
 
-    Uses asyncio with a concurrency-limited semaphore to send URI batches
-    in parallel via AsyncMLClient.
+    Runs as a streaming pipeline: URI batches are fed into a bounded queue
+    drained by reader tasks sending them via AsyncMLClient. Read documents are
+    passed on as soon as they are parsed - to a bounded queue drained by
+    concurrent filesystem writers, to the caller of run_stream(), and to the
+    in-memory output only when it has been requested with
+    with_documents_output(). Memory use is therefore bounded regardless of
+    the number of documents read.
 
     Recommended settings based on benchmarks (10000 documents):
         concurrency: 8-24 (default: 16)
         batch_size: 300-1000 (default: 400)
     Higher concurrency combined with larger batch sizes yields the best
     read throughput, with improvements of 30-40% over synchronous execution.
+    As the best values depend on document sizes, cluster load and network,
+    they can be tuned while the job runs with with_adaptive_tuning().
     """
 
     def __init__(
@@ -155,7 +331,8 @@ class ReadDocumentsJob:
         Parameters
         ----------
         concurrency : int | None, default None
-            Maximum number of concurrent batch requests (default: 16)
+            Maximum number of concurrent batch requests and filesystem writes
+            (default: 16)
         batch_size : int, default 400
             A number of URIs in a single batch
         """
@@ -163,10 +340,15 @@ class ReadDocumentsJob:
         self._batch_size: int = batch_size
         self._config: dict = {}
         self._database: str | None = None
-        self._uris: list[str] = []
+        self._inputs: list[Iterable[str]] = []
         self._categories: list[str] = ["content"]
         self._fs_output_path: Path | None = None
-        self._documents: list[Document] = []
+        self._documents: list[Document] | None = None
+        self._controller: AdaptiveController | None = None
+        self._tuner: AdaptiveController | None = None
+        self._journal_path: str | None = None
+        self._journal: JobJournal = JobJournal(None)
+        self._resuming: bool = False
         self._report = DocumentJobReport()
 
     @property
@@ -176,11 +358,20 @@ class ReadDocumentsJob:
 
     @property
     def documents(self) -> list[Document]:
-        """Return all read documents from the job."""
-        return list(self._documents)
+        """Return all read documents from the job.
+
+        Documents are retained only when with_documents_output() was called;
+        otherwise the list is empty.
+        """
+        return list(self._documents or [])
 
     def with_client_config(self, **config):
-        """Set AsyncMLClient configuration."""
+        """Set AsyncMLClient configuration.
+
+        Unless limits are configured explicitly, the connection pool is sized
+        for the job's maximum concurrency. With cluster=True, batches are
+        spread across all hosts of the cluster, each with a pool of that size.
+        """
         self._config = config
 
     def with_database(self, database: str):
@@ -197,33 +388,66 @@ class ReadDocumentsJob:
             )
 
     def with_uris_input(self, uris: Iterable[str]):
-        """Add URIs to the job's input."""
-        self._uris.extend(uris)
+        """Add URIs to the job's input.
+
+        The iterable is consumed lazily, batch by batch, while the job runs.
+        """
+        self._inputs.append(uris)
+
+    def with_documents_output(self):
+        """Retain read documents in memory, available as job.documents."""
+        self._documents = []
 
     def with_filesystem_output(self, output_path: str):
         """Set filesystem output directory to save documents inside."""
         self._fs_output_path = Path(output_path).resolve().absolute()
 
+    def with_journal(self, path: str):
+        """Record outcomes of documents in an on-disk journal (see JobJournal).
+
+        A journal lets the job be resumed with resume() after a crash.
+        """
+        self._journal_path = path
+
+    def with_adaptive_tuning(self, **bounds):
+        """Tune concurrency and batch size while the job runs.
+
+        Keyword arguments are passed to AdaptiveController; by default the job
+        starts from its own settings, within 1 to twice the concurrency and
+        a quarter to four times the batch size. Chosen values are recorded in
+        the job report.
+        """
+        self._controller = _build_controller(
+            self._concurrency,
+            self._batch_size,
+            **bounds,
+        )
+
     async def run(self) -> DocumentJobReport:
         """Execute the job and return a report when complete."""
-        for uri in self._uris:
-            self._report.add_pending_doc(uri)
+        await self._execute()
+        return copy(self._report)
 
-        batches = [
-            self._uris[i : i + self._batch_size]
-            for i in range(0, len(self._uris), self._batch_size)
-        ]
+    async def resume(self) -> DocumentJobReport:
+        """Execute the job, skipping documents completed by a previous run.
 
-        sem = asyncio.Semaphore(self._concurrency)
-        async with AsyncMLClient(**self._config) as ml:
-            await asyncio.gather(
-                *(self._send_batch(sem, batch, ml) for batch in batches),
-            )
+        Requires a journal (see with_journal()). Documents that failed or were
+        not processed by the previous run are processed again.
+        """
+        _require_journal(self._journal_path)
+        self._resuming = True
+        try:
+            return await self.run()
+        finally:
+            self._resuming = False
 
-        if self._fs_output_path is not None:
-            await self._save_documents()
+    def resume_sync(self) -> DocumentJobReport:
+        """Resume the job synchronously.
 
-        return copy(self._report)
+        Wrapper around asyncio.run(self.resume()). Cannot be called from within
+        a running event loop.
+        """
+        return asyncio.run(self.resume())
 
     def run_sync(self) -> DocumentJobReport:
         """Execute the job synchronously.
@@ -233,30 +457,172 @@ class ReadDocumentsJob:
         """
         return asyncio.run(self.run())
 
+    async def run_stream(self) -> AsyncIterator[Document]:
+        """Execute the job, yielding documents while the read is in flight.
+
+        Documents are yielded as soon as they are parsed, in the order they
+        arrive. Any configured output is populated as well. The job's report
+        is complete once the iterator is exhausted.
+
+        Returns
+        -------
+        AsyncIterator[Document]
+            Read documents
+        """
+        results = asyncio.Queue(maxsize=self._batch_size)
+        task = asyncio.create_task(self._execute(results))
+        try:
+            while (doc := await results.get()) is not None:
+                yield doc
+            await task
+        finally:
+            task.cancel()
+
+    async def _execute(
+        self,
+        results: asyncio.Queue | None = None,
+    ):
+        """Run the reading pipeline, closing the results queue when finished."""
+        try:
+            await self._run_pipeline(results)
+        finally:
+            if results is not None:
+                await results.put(None)
+
+    async def _run_pipeline(
+        self,
+        results: asyncio.Queue | None,
+    ):
+        """Start readers and writers, and feed them until the input is drained."""
+        self._tuner = self._controller or AdaptiveController.fixed(
+            self._concurrency,
+            self._batch_size,
+        )
+        self._report.add_tuning(self._tuner.concurrency, self._tuner.batch_size)
+        readers_count = self._tuner.max_concurrency
+        uris_queue = asyncio.Queue(maxsize=readers_count)
+        docs_queue = None
+        if self._fs_output_path is not None:
+            docs_queue = asyncio.Queue(maxsize=self._batch_size)
+        config = _client_config(self._config, readers_count)
+        journal = JobJournal(self._journal_path, resume=self._resuming)
+        async with journal, AsyncMLClient(**config) as ml:
+            self._journal = journal
+            readers = []
+            writers = []
+            try:
+                # Started within the try block, so that they are always cancelled
+                if docs_queue is not None:
+                    writers = [
+                        asyncio.create_task(self._consume_documents(docs_queue))
+                        for _ in range(self._concurrency)
+                    ]
+                readers = [
+                    asyncio.create_task(
+                        self._consume_batches(uris_queue, ml, docs_queue, results),
+                    )
+                    for _ in range(readers_count)
+                ]
+                await self._produce_batches(uris_queue, ml)
+                await asyncio.gather(*readers)
+                for _ in writers:
+                    await docs_queue.put(None)
+                await asyncio.gather(*writers)
+            finally:
+                for task in (*readers, *writers):
+                    task.cancel()
+                self._report.set_pool_stats(ml.http.pool_stats())
+
+    async def _produce_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+    ):
+        """Feed URI batches into the queue, then one sentinel per reader."""
+        await self._feed_batches(queue, ml)
+        for _ in range(self._tuner.max_concurrency):
+            await queue.put(None)
+
+    async def _feed_batches(
+        self,
+        queue: asyncio.Queue,
+        _ml: AsyncMLClient,
+    ):
+        """Feed batches of the URIs input into the queue."""
+        uris = (
+            uri
+            for uri in chain.from_iterable(self._inputs)
+            if not self._journal.is_completed(uri)
+        )
+        while batch := list(islice(uris, self._tuner.batch_size)):
+            self._report.add_pending_docs(batch)
+            await queue.put(batch)
+
+    def _read_options(
+        self,
+    ) -> dict:
+        """Return keyword arguments of documents read requests."""
+        options = {"database": self._database}
+        if self._categories != ["content"]:
+            options["category"] = list(dict.fromkeys(self._categories))
+        return options
+
+    async def _consume_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+        docs_queue: asyncio.Queue | None,
+        results: asyncio.Queue | None,
+    ):
+        """Read queued URI batches until a sentinel is received."""
+        while (batch := await queue.get()) is not None:
+            await _send_tuned_batch(
+                self._tuner,
+                self._report,
+                len(batch),
+                self._send_batch(batch, ml, docs_queue, results),
+            )
+
     async def _send_batch(
         self,
-        sem: asyncio.Semaphore,
         batch: list[str],
         ml: AsyncMLClient,
-    ):
-        """Send a URIs batch to /v1/documents endpoint."""
-        async with sem:
-            try:
-                kwargs = {"database": self._database}
-                if self._categories != ["content"]:
-                    kwargs["category"] = list(dict.fromkeys(self._categories))
-                async for doc in ml.documents.read_stream(batch, **kwargs):
-                    self._report.add_successful_doc(doc.uri)
+        docs_queue: asyncio.Queue | None,
+        results: asyncio.Queue | None,
+    ) -> Exception | None:
+        """Send a URIs batch to /v1/documents endpoint and pass documents on.
+
+        When the stream fails, only documents not received yet are failed.
+        """
+        received = set()
+        try:
+            options = self._read_options()
+            async for doc in ml.documents.read_stream(batch, **options):
+                received.add(doc.uri)
+                self._report.add_successful_doc(doc.uri)
+                self._journal.record_successful((doc.uri,))
+                if self._documents is not None:
                     self._documents.append(doc)
-            except Exception as err:
-                self._report.add_failed_docs(batch, err)
-                logger.exception(
-                    "An unexpected error occurred while reading documents",
-                )
+                if docs_queue is not None:
+                    await docs_queue.put(doc)
+                if results is not None:
+                    await results.put(doc)
+        except Exception as err:
+            failed = [uri for uri in batch if uri not in received]
+            self._report.add_failed_docs(failed, err)
+            self._journal.record_failed(failed, err)
+            logger.exception(
+                "An unexpected error occurred while reading documents",
+            )
+            return err
+        return None
 
-    async def _save_documents(self):
-        """Save read documents to the filesystem."""
-        for doc in self._documents:
+    async def _consume_documents(
+        self,
+        queue: asyncio.Queue,
+    ):
+        """Save queued documents to the filesystem until a sentinel is received."""
+        while (doc := await queue.get()) is not None:
             await self._save_document(doc)
 
     async def _save_document(self, doc: Document):
@@ -265,22 +631,520 @@ class ReadDocumentsJob:
             await DocumentsWriter.write_document(doc, self._fs_output_path)
         except Exception as err:
             self._report.add_failed_doc(doc.uri, err)
+            self._journal.record_failed((doc.uri,), err)
+
+
+class QueryDocumentsJob(ReadDocumentsJob):
+    """An async job reading documents matching a query from a MarkLogic database.
+
+    Instead of requiring all URIs up front, it enumerates them on the server
+    for collections, a directory and/or a cts query (see QueryBatcher). Every
+    forest is a separate partition whose URI pages are fetched concurrently
+    with other forests' and fed straight into the reading pipeline, so a full
+    export scales with the number of forests and hosts. URIs and documents
+    are all read at one point-in-time timestamp, taken when the job starts
+    unless set with with_timestamp().
+
+    URIs added with with_uris_input() are read as well, at the same timestamp.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        batch_size: int = 400,
+    ):
+        """Initialize QueryDocumentsJob instance.
+
+        Parameters
+        ----------
+        concurrency : int | None, default None
+            Maximum number of concurrent batch requests, URI page requests
+            and filesystem writes (default: 16)
+        batch_size : int, default 400
+            A number of URIs in a single page and batch
+        """
+        super().__init__(concurrency, batch_size)
+        self._collections: list[str] = []
+        self._directory: str | None = None
+        self._query: dict | None = None
+        self._timestamp: str | None = None
+
+    @property
+    def timestamp(self) -> str | None:
+        """Return the point-in-time timestamp documents are read at."""
+        return self._timestamp
+
+    def with_collections(self, *collections: str):
+        """Read documents in any of the collections."""
+        self._collections.extend(collections)
+
+    def with_directory(self, directory: str):
+        """Read documents in a directory (with subdirectories)."""
+        self._directory = directory
+
+    def with_query(self, query: dict):
+        """Read documents matching a serialized cts query."""
+        self._query = query
+
+    def with_timestamp(self, timestamp: str):
+        """Read documents at a point-in-time timestamp."""
+        self._timestamp = timestamp
+
+    async def _feed_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+    ):
+        """Feed URI pages of all forests, then the URIs input into the queue."""
+        batcher = QueryBatcher(
+            collections=self._collections,
+            directory=self._directory,
+            query=self._query,
+            database=self._database,
+        )
+        snapshot = await batcher.snapshot(ml)
+        if self._timestamp is None:
+            self._timestamp = snapshot.timestamp
+        snapshot = QuerySnapshot(self._timestamp, snapshot.forests)
+        pages = _QueryPages(batcher, snapshot, self._tuner, self._report)
+        await pages.feed(queue, ml, self._journal)
+        await super()._feed_batches(queue, ml)
+
+    def _read_options(
+        self,
+    ) -> dict:
+        """Return keyword arguments of documents read requests."""
+        return {**super()._read_options(), "timestamp": self._timestamp}
+
+
+class DeleteDocumentsJob:
+    """An async job deleting documents from a MarkLogic database.
+
+    Runs as a producer/consumer pipeline: URI batches are fed into a bounded
+    queue drained by worker tasks deleting them via AsyncMLClient, with at
+    most concurrency requests in flight. URIs come from iterables and/or are
+    enumerated on the server for collections, a directory or a cts query
+    (see QueryBatcher) - forest by forest, at the timestamp the job starts
+    at. Without any query criteria, nothing is enumerated.
+
+    With categories set, only the documents' metadata categories are reset
+    instead of removing the documents. Outcomes are reported per URI.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        batch_size: int = 400,
+    ):
+        """Initialize DeleteDocumentsJob instance.
+
+        Parameters
+        ----------
+        concurrency : int | None, default None
+            Maximum number of concurrent batch requests (default: 8)
+        batch_size : int, default 400
+            A number of URIs in a single batch
+        """
+        self._concurrency: int = concurrency or 8
+        self._batch_size: int = batch_size
+        self._config: dict = {}
+        self._database: str | None = None
+        self._inputs: list[Iterable[str]] = []
+        self._collections: list[str] = []
+        self._directory: str | None = None
+        self._query: dict | None = None
+        self._categories: list[str] = []
+        self._temporal_collection: str | None = None
+        self._wipe_temporal: bool | None = None
+        self._controller: AdaptiveController | None = None
+        self._tuner: AdaptiveController | None = None
+        self._journal_path: str | None = None
+        self._journal: JobJournal = JobJournal(None)
+        self._resuming: bool = False
+        self._report = DocumentJobReport()
+
+    @property
+    def report(self) -> DocumentJobReport:
+        """A status of the job."""
+        return copy(self._report)
+
+    def with_client_config(self, **config):
+        """Set AsyncMLClient configuration.
+
+        Unless limits are configured explicitly, the connection pool is sized
+        for the job's maximum concurrency. With cluster=True, batches are
+        spread across all hosts of the cluster, each with a pool of that size.
+        """
+        self._config = config
+
+    def with_database(self, database: str):
+        """Set a database name."""
+        self._database = database
+
+    def with_uris_input(self, uris: Iterable[str]):
+        """Add URIs to the job's input.
+
+        The iterable is consumed lazily, batch by batch, while the job runs.
+        """
+        self._inputs.append(uris)
+
+    def with_collections(self, *collections: str):
+        """Delete documents in any of the collections."""
+        self._collections.extend(collections)
+
+    def with_directory(self, directory: str):
+        """Delete documents in a directory (with subdirectories)."""
+        self._directory = directory
+
+    def with_query(self, query: dict):
+        """Delete documents matching a serialized cts query."""
+        self._query = query
+
+    def with_metadata(self, *args: Category | str):
+        """Reset metadata category/ies instead of deleting documents."""
+        if len(args) == 0:
+            self._categories.append("metadata")
+        else:
+            self._categories.extend(
+                c.value if isinstance(c, Category) else c for c in args
+            )
+
+    def with_temporal_collection(
+        self,
+        temporal_collection: str,
+        wipe_temporal: bool | None = None,
+    ):
+        """Delete temporal documents, optionally with all their versions."""
+        self._temporal_collection = temporal_collection
+        self._wipe_temporal = wipe_temporal
+
+    def with_journal(self, path: str):
+        """Record outcomes of documents in an on-disk journal (see JobJournal).
+
+        A journal lets the job be resumed with resume() after a crash.
+        """
+        self._journal_path = path
+
+    def with_adaptive_tuning(self, **bounds):
+        """Tune concurrency and batch size while the job runs.
+
+        Keyword arguments are passed to AdaptiveController; by default the job
+        starts from its own settings, within 1 to twice the concurrency and
+        a quarter to four times the batch size. Chosen values are recorded in
+        the job report.
+        """
+        self._controller = _build_controller(
+            self._concurrency,
+            self._batch_size,
+            **bounds,
+        )
+
+    async def run(self) -> DocumentJobReport:
+        """Execute the job and return a report when complete."""
+        self._tuner = self._controller or AdaptiveController.fixed(
+            self._concurrency,
+            self._batch_size,
+        )
+        self._report.add_tuning(self._tuner.concurrency, self._tuner.batch_size)
+        workers_count = self._tuner.max_concurrency
+        queue = asyncio.Queue(maxsize=workers_count)
+        config = _client_config(self._config, workers_count)
+        journal = JobJournal(self._journal_path, resume=self._resuming)
+        async with journal, AsyncMLClient(**config) as ml:
+            self._journal = journal
+            workers = [
+                asyncio.create_task(self._consume_batches(queue, ml))
+                for _ in range(workers_count)
+            ]
+            try:
+                await self._produce_batches(queue, ml)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                self._report.set_pool_stats(ml.http.pool_stats())
+
+        return copy(self._report)
+
+    async def resume(self) -> DocumentJobReport:
+        """Execute the job, skipping documents completed by a previous run.
+
+        Requires a journal (see with_journal()). Documents that failed or were
+        not processed by the previous run are processed again.
+        """
+        _require_journal(self._journal_path)
+        self._resuming = True
+        try:
+            return await self.run()
+        finally:
+            self._resuming = False
+
+    def resume_sync(self) -> DocumentJobReport:
+        """Resume the job synchronously.
+
+        Wrapper around asyncio.run(self.resume()). Cannot be called from within
+        a running event loop.
+        """
+        return asyncio.run(self.resume())
+
+    def run_sync(self) -> DocumentJobReport:
+        """Execute the job synchronously.
+
+        Wrapper around asyncio.run(self.run()). Cannot be called from within
+        a running event loop.
+        """
+        return asyncio.run(self.run())
+
+    async def _produce_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+    ):
+        """Feed URI batches into the queue, then one sentinel per worker."""
+        if self._collections or self._directory is not None or self._query:
+            batcher = QueryBatcher(
+                collections=self._collections,
+                directory=self._directory,
+                query=self._query,
+                database=self._database,
+            )
+            snapshot = await batcher.snapshot(ml)
+            pages = _QueryPages(batcher, snapshot, self._tuner, self._report)
+            await pages.feed(queue, ml, self._journal)
+        uris = (
+            uri
+            for uri in chain.from_iterable(self._inputs)
+            if not self._journal.is_completed(uri)
+        )
+        while batch := list(islice(uris, self._tuner.batch_size)):
+            self._report.add_pending_docs(batch)
+            await queue.put(batch)
+        for _ in range(self._tuner.max_concurrency):
+            await queue.put(None)
+
+    async def _consume_batches(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+    ):
+        """Delete queued URI batches until a sentinel is received."""
+        while (batch := await queue.get()) is not None:
+            await _send_tuned_batch(
+                self._tuner,
+                self._report,
+                len(batch),
+                self._send_batch(batch, ml),
+            )
+
+    async def _send_batch(
+        self,
+        batch: list[str],
+        ml: AsyncMLClient,
+    ) -> Exception | None:
+        """Send a URIs batch to /v1/documents endpoint."""
+        try:
+            await ml.documents.delete(
+                batch,
+                category=list(dict.fromkeys(self._categories)) or None,
+                database=self._database,
+                temporal_collection=self._temporal_collection,
+                wipe_temporal=self._wipe_temporal,
+            )
+            self._report.add_successful_docs(batch)
+            self._journal.record_successful(batch)
+        except Exception as err:
+            self._report.add_failed_docs(batch, err)
+            self._journal.record_failed(batch, err)
+            logger.exception(
+                "An unexpected error occurred while deleting documents",
+            )
+            return err
+        return None
+
+
+class _QueryPages:
+    """A feeder of URI pages of all forests in a query snapshot.
+
+    Forests are paged concurrently, with at most max_concurrency page
+    requests in flight.
+    """
+
+    def __init__(
+        self,
+        batcher: QueryBatcher,
+        snapshot: QuerySnapshot,
+        tuner: AdaptiveController,
+        report: DocumentJobReport,
+    ):
+        self._batcher: QueryBatcher = batcher
+        self._snapshot: QuerySnapshot = snapshot
+        self._tuner: AdaptiveController = tuner
+        self._report: DocumentJobReport = report
+        self._requests: asyncio.Semaphore = asyncio.Semaphore(tuner.max_concurrency)
+
+    async def feed(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+        journal: JobJournal,
+    ):
+        """Feed URI pages of all forests into the queue, skipping completed URIs."""
+        logger.info(
+            "Enumerating URIs in %s forests at timestamp [%s]",
+            len(self._snapshot.forests),
+            self._snapshot.timestamp,
+        )
+        await asyncio.gather(
+            *(
+                self._feed_forest(queue, ml, journal, forest)
+                for forest in self._snapshot.forests
+            ),
+        )
+
+    async def _feed_forest(
+        self,
+        queue: asyncio.Queue,
+        ml: AsyncMLClient,
+        journal: JobJournal,
+        forest: str,
+    ):
+        """Feed URI pages of a single forest into the queue."""
+        after = ""
+        while True:
+            limit = self._tuner.batch_size
+            async with self._requests:
+                page = await self._batcher.fetch_page(
+                    ml,
+                    self._snapshot,
+                    forest,
+                    limit,
+                    after,
+                )
+            if len(page) == limit:
+                after = page[-1]
+            batch = [uri for uri in page if not journal.is_completed(uri)]
+            if batch:
+                self._report.add_pending_docs(batch)
+                await queue.put(batch)
+            if len(page) < limit:
+                return
+
+
+def _document_bytes(
+    document: Document,
+) -> int:
+    """Return the size of a document's content and metadata in bytes.
+
+    Content bytes are cached by documents and reused in request body parts.
+    The size of parsed metadata is estimated from its fields, so that it is
+    serialized once only, when its body part is built.
+    """
+    # Document.__subclasshook__ makes isinstance() match every document type
+    if BinaryDocument in type(document).__mro__:
+        size = document.content_length
+    else:
+        size = len(document.content_bytes or b"")
+    metadata = document.metadata
+    if metadata is not None:
+        raw = metadata.raw()
+        size += len(raw) if raw is not None else _metadata_bytes(metadata)
+    return size
+
+
+def _metadata_bytes(
+    metadata: Metadata,
+) -> int:
+    """Estimate the size of metadata serialized to JSON without serializing it."""
+    size = _METADATA_JSON_OVERHEAD + len(str(metadata.quality()))
+    size += sum(len(collection) + 4 for collection in metadata.collections())
+    for permission in metadata.permissions():
+        size += len(permission.role_name()) + _PERMISSION_JSON_OVERHEAD
+        size += sum(len(capability) + 4 for capability in permission.capabilities())
+    for values in (metadata.properties(), metadata.metadata_values()):
+        size += sum(len(str(k)) + len(str(v)) + 8 for k, v in values.items())
+    return size
+
+
+def _require_journal(
+    path: str | None,
+):
+    """Verify that a job has a journal to be resumed from."""
+    if path is None:
+        msg = "A job can be resumed only with a journal (see with_journal())!"
+        raise WrongParametersError(msg)
+
+
+def _client_config(
+    config: dict,
+    concurrency: int,
+) -> dict:
+    """Return AsyncMLClient configuration with a pool sized for the concurrency."""
+    if "limits" in config:
+        return config
+    return {**config, "limits": limits_for_concurrency(concurrency)}
+
+
+def _build_controller(
+    concurrency: int,
+    batch_size: int,
+    **bounds,
+) -> AdaptiveController:
+    """Build an adaptive controller starting from job settings."""
+    settings = {
+        "min_concurrency": 1,
+        "max_concurrency": concurrency * 2,
+        "min_batch_size": max(1, batch_size // 4),
+        "max_batch_size": batch_size * 4,
+        "concurrency": concurrency,
+        "batch_size": batch_size,
+    }
+    settings.update(bounds)
+    return AdaptiveController(**settings)
+
+
+async def _send_tuned_batch(
+    controller: AdaptiveController,
+    report: DocumentJobReport,
+    batch_size: int,
+    send_batch: Awaitable[Exception | None],
+):
+    """Send a batch within a controller's slot and record its outcome."""
+    async with controller.slot():
+        start = time.perf_counter()
+        err = await send_batch
+        if controller.record(batch_size, time.perf_counter() - start, err):
+            report.add_tuning(controller.concurrency, controller.batch_size)
 
 
 class DocumentJobReport:
-    """A class representing documents job report."""
+    """A class representing documents job report.
+
+    Reports are stored in columns rather than one model per document: every
+    URI is interned once and mapped to a slot in a status array, so status
+    counters are maintained live and read in O(1). Failure details are kept
+    only for failed documents, sharing a single (error class, message) pair
+    per failed batch. Copies share the append-only URI columns and copy status
+    chunks only when either side modifies them, so the job's ``report``
+    property stays cheap to poll at any scale. DocumentReport models are built
+    on demand only.
+    """
+
+    _PENDING: int = 0
+    _SUCCESS: int = 1
+    _FAILURE: int = 2
 
     def __init__(
         self,
     ):
         """Initialize DocumentJobReport instance."""
-        self._doc_reports: dict[str, DocumentReport] = {}
+        self._store: _ReportStore = _ReportStore()
+        self._tuning: tuple[JobTuning, ...] = ()
+        self._pool_stats: PoolStats | None = None
 
     def __copy__(self):
-        """Copy DocumentJobReport instance."""
-        report_copy = self.__class__()
-        for report in self._doc_reports.values():
-            report_copy.add_doc_report(report)
+        """Copy DocumentJobReport instance sharing the store until modified."""
+        report_copy = self.__class__.__new__(self.__class__)
+        report_copy.__dict__.update(self.__dict__, _store=self._store.copy())
         return report_copy
 
     @property
@@ -288,7 +1152,7 @@ class DocumentJobReport:
         self,
     ) -> int:
         """Return number of pending documents."""
-        return len(self.pending_docs)
+        return self._store.counts[self._PENDING]
 
     @property
     def completed(
@@ -302,14 +1166,14 @@ class DocumentJobReport:
         self,
     ) -> int:
         """Return number of successfully completed documents."""
-        return len(self.successful_docs)
+        return self._store.counts[self._SUCCESS]
 
     @property
     def failed(
         self,
     ) -> int:
         """Return number of completed documents that failed."""
-        return len(self.failed_docs)
+        return self._store.counts[self._FAILURE]
 
     @property
     def pending_docs(
@@ -332,14 +1196,28 @@ class DocumentJobReport:
         """Return completed documents' URIs that failed."""
         return self._get_docs_by_status(DocumentStatus.failure)
 
+    @property
+    def tuning(
+        self,
+    ) -> list[JobTuning]:
+        """Return job settings in the order they were chosen."""
+        return [tuning.model_copy() for tuning in self._tuning]
+
+    @property
+    def pool_stats(
+        self,
+    ) -> PoolStats | None:
+        """Return the connection pool statistics taken when the job finished."""
+        return self._pool_stats
+
     @property
     def full(
         self,
     ) -> dict[str, DocumentReport]:
         """Return full documents job report."""
         return {
-            uri: report.model_copy(deep=True)
-            for uri, report in self._doc_reports.items()
+            uri: self._build_doc_report(slot)
+            for slot, uri in enumerate(self._store.iter_uris())
         }
 
     def add_pending_docs(
@@ -347,16 +1225,14 @@ class DocumentJobReport:
         uris: list[str],
     ):
         """Add pending documents' reports."""
-        for uri in uris:
-            self.add_pending_doc(uri)
+        self._set_status(uris, self._PENDING)
 
     def add_successful_docs(
         self,
         uris: list[str],
     ):
         """Add successfully completed documents' reports."""
-        for uri in uris:
-            self.add_successful_doc(uri)
+        self._set_status(uris, self._SUCCESS)
 
     def add_failed_docs(
         self,
@@ -364,22 +1240,21 @@ class DocumentJobReport:
         err: Exception,
     ):
         """Add failed documents' reports."""
-        for uri in uris:
-            self.add_failed_doc(uri, err)
+        self._set_status(uris, self._FAILURE, (err.__class__, str(err)))
 
     def add_pending_doc(
         self,
         uri: str,
     ):
         """Add a pending document report."""
-        self.add_doc_report(DocumentReport(uri=uri, status=DocumentStatus.pending))
+        self._set_status((uri,), self._PENDING)
 
     def add_successful_doc(
         self,
         uri: str,
     ):
         """Add a successfully completed document report."""
-        self.add_doc_report(DocumentReport(uri=uri, status=DocumentStatus.success))
+        self._set_status((uri,), self._SUCCESS)
 
     def add_failed_doc(
         self,
@@ -387,40 +1262,278 @@ class DocumentJobReport:
         err: Exception,
     ):
         """Add a failed document report."""
-        self.add_doc_report(
-            DocumentReport(
-                uri=uri,
-                status=DocumentStatus.failure,
-                details=DocumentStatusDetails(
-                    error=err.__class__,
-                    message=str(err),
-                ),
-            ),
+        self._set_status((uri,), self._FAILURE, (err.__class__, str(err)))
+
+    def add_tuning(
+        self,
+        concurrency: int,
+        batch_size: int,
+    ):
+        """Record job settings chosen at the current progress."""
+        tuning = JobTuning(
+            concurrency=concurrency,
+            batch_size=batch_size,
+            completed=self.completed,
         )
+        self._tuning = (*self._tuning, tuning)
+
+    def set_pool_stats(
+        self,
+        pool_stats: PoolStats | None,
+    ):
+        """Record the connection pool statistics."""
+        self._pool_stats = pool_stats
 
     def add_doc_report(
         self,
         report: DocumentReport,
     ):
         """Add a document report."""
-        self._doc_reports[report.uri] = report
+        code = self._status_code(report.status)
+        details = None
+        if report.details is not None:
+            details = (report.details.error, report.details.message)
+        self._set_status((report.uri,), code, details)
 
     def get_doc_report(
         self,
         uri: str,
     ):
         """Return a document report."""
-        return self._doc_reports.get(uri)
+        slot = self._store.slot_of(uri)
+        if slot is None:
+            return None
+        return self._build_doc_report(slot)
 
     def _get_docs_by_status(
         self,
         status: DocumentStatus,
     ) -> list[str]:
         """Return documents' URIs having a specific status."""
+        code = self._status_code(status)
+        if self._store.counts[code] == 0:
+            return []
         return [
-            uri for uri, report in self._doc_reports.items() if report.status == status
+            uri
+            for uri, slot_code in zip(
+                self._store.iter_uris(),
+                self._store.iter_statuses(),
+            )
+            if slot_code == code
         ]
 
+    def _set_status(
+        self,
+        uris: Iterable[str],
+        code: int,
+        details: tuple[type, str] | None = None,
+    ):
+        """Set a status (and optional failure details) for documents."""
+        if details is not None:
+            details = (details[0], sys.intern(details[1]))
+        self._store.set_status(uris, code, details)
+
+    def _build_doc_report(
+        self,
+        slot: int,
+    ) -> DocumentReport:
+        """Build a document report model for a slot in the store.
+
+        Stored values are already valid, so models are constructed without
+        validation.
+        """
+        store = self._store
+        report = DocumentReport.model_construct(
+            uri=store.uris[slot],
+            status=self._status_of(store.status_of(slot)),
+        )
+        details = store.failure_of(slot)
+        if details is not None:
+            report.details = DocumentStatusDetails.model_construct(
+                error=details[0],
+                message=details[1],
+            )
+        return report
+
+    @classmethod
+    def _status_code(
+        cls,
+        status: DocumentStatus | str,
+    ) -> int:
+        """Return a status code stored in the status array."""
+        return {
+            DocumentStatus.pending: cls._PENDING,
+            DocumentStatus.success: cls._SUCCESS,
+            DocumentStatus.failure: cls._FAILURE,
+        }[DocumentStatus(status)]
+
+    @classmethod
+    def _status_of(
+        cls,
+        code: int,
+    ) -> DocumentStatus:
+        """Return a document status for a code stored in the status array."""
+        return (
+            DocumentStatus.pending,
+            DocumentStatus.success,
+            DocumentStatus.failure,
+        )[code]
+
+
+class _ReportStore:
+    """A columnar store of documents' statuses backing DocumentJobReport.
+
+    URIs are only appended, so copies share the index and the URIs list, and
+    see the slots registered before they were made. Statuses and failures are
+    split into chunks, and a store copies a chunk on its first write to it after
+    the store was copied. Copying is therefore proportional to the number of
+    chunks, and the job pays for a poll of its report with the chunks it
+    modifies afterwards.
+    """
+
+    __slots__ = (
+        "chunk_owners",
+        "counts",
+        "failures",
+        "index",
+        "owns_uris",
+        "size",
+        "statuses",
+        "token",
+        "uris",
+    )
+
+    _CHUNK_SIZE: int = 4096
+    _tokens: Iterator[int] = count()
+
+    def __init__(
+        self,
+    ):
+        self.index: dict[str, int] = {}
+        self.uris: list[str] = []
+        self.size: int = 0
+        self.statuses: list[bytearray] = []
+        self.failures: list[dict[int, tuple[type, str]]] = []
+        self.counts: list[int] = [0, 0, 0]
+        self.chunk_owners: list[int] = []
+        self.owns_uris: bool = True
+        self.token: int = next(self._tokens)
+
+    def copy(
+        self,
+    ) -> _ReportStore:
+        """Return a copy of the store sharing its columns until modified."""
+        store = _ReportStore.__new__(_ReportStore)
+        store.index = self.index
+        store.uris = self.uris
+        store.size = self.size
+        store.statuses = self.statuses.copy()
+        store.failures = self.failures.copy()
+        store.counts = self.counts.copy()
+        store.chunk_owners = self.chunk_owners.copy()
+        store.owns_uris = False
+        store.token = next(self._tokens)
+        # Chunks owned so far are shared from now on
+        self.token = next(self._tokens)
+        return store
+
+    def slot_of(
+        self,
+        uri: str,
+    ) -> int | None:
+        """Return a slot of a URI, if registered in the store."""
+        slot = self.index.get(uri)
+        if slot is None or slot >= self.size:
+            return None
+        return slot
+
+    def status_of(
+        self,
+        slot: int,
+    ) -> int:
+        """Return a status code of a slot."""
+        chunk, offset = divmod(slot, self._CHUNK_SIZE)
+        return self.statuses[chunk][offset]
+
+    def failure_of(
+        self,
+        slot: int,
+    ) -> tuple[type, str] | None:
+        """Return failure details of a slot, if failed."""
+        return self.failures[slot // self._CHUNK_SIZE].get(slot)
+
+    def iter_uris(
+        self,
+    ) -> Iterator[str]:
+        """Iterate over URIs in the order of their slots."""
+        return islice(self.uris, self.size)
+
+    def iter_statuses(
+        self,
+    ) -> Iterator[int]:
+        """Iterate over status codes in the order of their slots."""
+        return chain.from_iterable(self.statuses)
+
+    def set_status(
+        self,
+        uris: Iterable[str],
+        code: int,
+        details: tuple[type, str] | None,
+    ):
+        """Set a status for documents, registering unknown URIs."""
+        counts = self.counts
+        for uri in uris:
+            slot = self.slot_of(uri)
+            if slot is None:
+                slot = self._register(uri, code)
+                chunk = slot // self._CHUNK_SIZE
+            else:
+                chunk, offset = divmod(slot, self._CHUNK_SIZE)
+                if self.chunk_owners[chunk] != self.token:
+                    self._own_chunk(chunk)
+                statuses = self.statuses[chunk]
+                counts[statuses[offset]] -= 1
+                statuses[offset] = code
+                counts[code] += 1
+            if details is not None:
+                self.failures[chunk][slot] = details
+            else:
+                self.failures[chunk].pop(slot, None)
+
+    def _register(
+        self,
+        uri: str,
+        code: int,
+    ) -> int:
+        """Register a URI in a new slot with a status."""
+        if not self.owns_uris:
+            self.uris = self.uris[: self.size]
+            self.index = dict(zip(self.uris, range(self.size)))
+            self.owns_uris = True
+        slot = self.size
+        chunk = slot // self._CHUNK_SIZE
+        if chunk == len(self.statuses):
+            self.statuses.append(bytearray())
+            self.failures.append({})
+            self.chunk_owners.append(self.token)
+        elif self.chunk_owners[chunk] != self.token:
+            self._own_chunk(chunk)
+        self.index[sys.intern(uri)] = slot
+        self.uris.append(uri)
+        self.statuses[chunk].append(code)
+        self.counts[code] += 1
+        self.size += 1
+        return slot
+
+    def _own_chunk(
+        self,
+        chunk: int,
+    ):
+        """Replace a shared chunk with a private copy."""
+        self.statuses[chunk] = self.statuses[chunk][:]
+        self.failures[chunk] = self.failures[chunk].copy()
+        self.chunk_owners[chunk] = self.token
+
 
 class DocumentReport(BaseModel):
     """A class representing a document's report."""
@@ -443,3 +1556,11 @@ class DocumentStatusDetails(BaseModel):
 
     error: type
     message: str
+
+
+class JobTuning(BaseModel):
+    """A class representing job settings chosen while running."""
+
+    concurrency: int
+    batch_size: int
+    completed: int
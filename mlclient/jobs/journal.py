@@ -0,0 +1,197 @@
+"""The ML Jobs Journal module.
+
+It exports a persistent checkpoint journal of documents jobs:
+    * JobJournal
+        An on-disk journal of documents completed by a job, used to resume it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+_SUCCESS: int = 1
+_FAILURE: int = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    uri TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    error TEXT,
+    message TEXT
+) WITHOUT ROWID
+"""
+
+
+class JobJournal:
+    """An on-disk journal of documents completed by a job, used to resume it.
+
+    Outcomes of documents are kept in an SQLite database in WAL mode, one row
+    per URI (the latest outcome wins). Recording only appends to an in-memory
+    buffer, so it never slows requests down - the buffer is written in
+    a worker thread every flush_interval seconds and when the journal closes.
+    Outcomes recorded after the last flush of a killed job are lost; their
+    documents are processed again when the job is resumed.
+
+    Without a path, the journal is disabled: nothing is stored and no
+    documents are completed.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None,
+        resume: bool = False,
+        flush_interval: float = 1.0,
+    ):
+        """Initialize JobJournal instance.
+
+        Parameters
+        ----------
+        path : str | Path | None
+            A journal file path; None to disable journaling
+        resume : bool, default False
+            Whether to keep outcomes of a previous run (otherwise they are removed)
+        flush_interval : float, default 1.0
+            A number of seconds between writes of recorded outcomes
+        """
+        self._path: Path | None = Path(path) if path is not None else None
+        self._resume: bool = resume
+        self._flush_interval: float = flush_interval
+        self._connection: sqlite3.Connection | None = None
+        self._completed: frozenset[str] = frozenset()
+        self._buffer: list[tuple[str, int, str | None, str | None]] = []
+        self._buffer_lock: threading.Lock = threading.Lock()
+        self._lock: threading.Lock = threading.Lock()
+        self._flusher: asyncio.Task | None = None
+
+    async def __aenter__(
+        self,
+    ) -> JobJournal:
+        """Open the journal and start writing recorded outcomes periodically."""
+        if self._path is not None:
+            await asyncio.to_thread(self.open)
+            self._flusher = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ):
+        """Write all recorded outcomes and close the journal."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        if self._connection is not None:
+            await asyncio.to_thread(self.close)
+
+    @property
+    def completed(
+        self,
+    ) -> frozenset[str]:
+        """Return URIs completed successfully by a previous run."""
+        return self._completed
+
+    def open(
+        self,
+    ):
+        """Open the journal, loading or removing outcomes of a previous run."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(_SCHEMA)
+        if self._resume:
+            rows = connection.execute(
+                "SELECT uri FROM documents WHERE status = ?",
+                (_SUCCESS,),
+            )
+            self._completed = frozenset(uri for (uri,) in rows)
+            logger.info(
+                "Resuming from journal [%s] with %s completed documents",
+                self._path,
+                len(self._completed),
+            )
+        else:
+            connection.execute("DELETE FROM documents")
+        connection.commit()
+        self._connection = connection
+
+    def close(
+        self,
+    ):
+        """Write all recorded outcomes and close the journal."""
+        self.flush()
+        with self._lock:
+            self._connection.close()
+            self._connection = None
+
+    def is_completed(
+        self,
+        uri: str,
+    ) -> bool:
+        """Verify if a document was completed successfully by a previous run."""
+        return uri in self._completed
+
+    def record_successful(
+        self,
+        uris: Iterable[str],
+    ):
+        """Record documents completed successfully."""
+        if self._path is not None:
+            self._append([(uri, _SUCCESS, None, None) for uri in uris])
+
+    def record_failed(
+        self,
+        uris: Iterable[str],
+        err: Exception,
+    ):
+        """Record documents that failed."""
+        if self._path is not None:
+            error = err.__class__.__name__
+            message = str(err)
+            self._append([(uri, _FAILURE, error, message) for uri in uris])
+
+    def flush(
+        self,
+    ):
+        """Write recorded outcomes in a single transaction."""
+        with self._lock:
+            if self._connection is None:
+                return
+            with self._buffer_lock:
+                buffer, self._buffer = self._buffer, []
+            if not buffer:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                    buffer,
+                )
+
+    def _append(
+        self,
+        records: list[tuple[str, int, str | None, str | None]],
+    ):
+        """Append records to the buffer written by flush()."""
+        with self._buffer_lock:
+            self._buffer.extend(records)
+
+    async def _flush_periodically(
+        self,
+    ):
+        """Write recorded outcomes every flush interval."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await asyncio.to_thread(self.flush)
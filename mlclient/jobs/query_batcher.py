@@ -0,0 +1,190 @@
+"""The ML Query Batcher module.
+
+It exports tools enumerating URIs of documents matching a query on the server:
+    * QueryBatcher
+        An enumerator of URIs matching a query, partitioned by forests.
+    * QuerySnapshot
+        Forests of a database and a point-in-time timestamp to enumerate at.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from mlclient import json_codec
+from mlclient.clients import AsyncMLClient
+from mlclient.exceptions import WrongParametersError
+
+_SNAPSHOT_SCRIPT = """'use strict';
+({
+  timestamp: String(xdmp.requestTimestamp()),
+  forests: xdmp.databaseForests(xdmp.database()).toArray().map(String),
+})
+"""
+
+_PAGE_SCRIPT = """'use strict';
+var forest;
+var after;
+var limit;
+var timestamp;
+var query;
+const uris = xdmp.invokeFunction(
+  () => cts.uris(
+    after,
+    ["limit=" + (limit + 1)],
+    query ? cts.query(JSON.parse(query)) : cts.trueQuery(),
+    0,
+    [xs.unsignedLong(forest)],
+  ),
+  {timestamp: xs.unsignedLong(timestamp)},
+).toArray();
+({uris: uris.filter((uri) => uri !== after).slice(0, limit)})
+"""
+
+
+class QuerySnapshot(NamedTuple):
+    """Forests of a database and a point-in-time timestamp to enumerate at."""
+
+    timestamp: str
+    forests: list[str]
+
+
+class QueryBatcher:
+    """An enumerator of URIs matching a query, partitioned by forests.
+
+    URIs are listed from the URI lexicon on the server, page by page, with
+    every forest being a separate partition. All pages are read at a single
+    point-in-time timestamp, so the enumeration is consistent even when
+    the database is modified meanwhile. Pages of different forests can be
+    fetched concurrently.
+
+    Examples
+    --------
+    >>> from mlclient.clients import AsyncMLClient
+    >>> from mlclient.jobs import QueryBatcher
+    >>> batcher = QueryBatcher(collections=["orders"])
+    >>> async with AsyncMLClient() as ml:
+    ...     snapshot = await batcher.snapshot(ml)
+    ...     forest = snapshot.forests[0]
+    ...     page = await batcher.fetch_page(ml, snapshot, forest, limit=500)
+    """
+
+    def __init__(
+        self,
+        collections: list[str] | None = None,
+        directory: str | None = None,
+        query: dict | None = None,
+        database: str | None = None,
+    ):
+        """Initialize QueryBatcher instance.
+
+        Criteria are combined with AND; with none, all URIs are enumerated.
+
+        Parameters
+        ----------
+        collections : list[str] | None, default None
+            Collections of documents (any of them)
+        directory : str | None, default None
+            A directory of documents (with subdirectories)
+        query : dict | None, default None
+            A serialized cts query (e.g. {"wordQuery": {"text": ["foo"]}})
+        database : str | None, default None
+            A database name
+
+        Raises
+        ------
+        WrongParametersError
+            If the directory does not end with a slash
+        """
+        if directory is not None and not directory.endswith("/"):
+            msg = f"A directory must end with a slash: [{directory}]!"
+            raise WrongParametersError(msg)
+        self._database: str | None = database
+        self._query: str = self._serialize_query(collections, directory, query)
+
+    @property
+    def query(
+        self,
+    ) -> str:
+        """Return the serialized cts query (an empty string for all URIs)."""
+        return self._query
+
+    async def snapshot(
+        self,
+        ml: AsyncMLClient,
+    ) -> QuerySnapshot:
+        """Return forests of the database and the current timestamp.
+
+        Parameters
+        ----------
+        ml : AsyncMLClient
+            A connected client
+
+        Returns
+        -------
+        QuerySnapshot
+            Forest ids and a timestamp to enumerate URIs at
+        """
+        result = await ml.eval.javascript(_SNAPSHOT_SCRIPT, database=self._database)
+        return QuerySnapshot(timestamp=result["timestamp"], forests=result["forests"])
+
+    async def fetch_page(
+        self,
+        ml: AsyncMLClient,
+        snapshot: QuerySnapshot,
+        forest: str,
+        limit: int,
+        after: str = "",
+    ) -> list[str]:
+        """Return the next page of URIs matching the query in a forest.
+
+        Parameters
+        ----------
+        ml : AsyncMLClient
+            A connected client
+        snapshot : QuerySnapshot
+            A snapshot returned by snapshot()
+        forest : str
+            A forest id
+        limit : int
+            A maximum number of URIs
+        after : str, default ""
+            The last URI of the previous page
+
+        Returns
+        -------
+        list[str]
+            URIs in lexicon order; fewer than the limit for the last page
+        """
+        result = await ml.eval.javascript(
+            _PAGE_SCRIPT,
+            database=self._database,
+            forest=forest,
+            after=after,
+            limit=limit,
+            timestamp=snapshot.timestamp,
+            query=self._query,
+        )
+        return list(result["uris"])
+
+    @staticmethod
+    def _serialize_query(
+        collections: list[str] | None,
+        directory: str | None,
+        query: dict | None,
+    ) -> str:
+        """Combine criteria into a serialized cts query."""
+        queries = []
+        if collections:
+            queries.append({"collectionQuery": {"uris": list(collections)}})
+        if directory is not None:
+            queries.append(
+                {"directoryQuery": {"uris": [directory], "depth": "infinity"}},
+            )
+        if query is not None:
+            queries.append(query)
+        if not queries:
+            return ""
+        if len(queries) == 1:
+            return json_codec.dumps(queries[0])
+        return json_codec.dumps({"andQuery": {"queries": queries}})
@@ -0,0 +1,266 @@
+"""The JSON Codec module.
+
+It provides a single entry point for JSON encoding and decoding within MLClient.
+By default (the auto backend) documents are decoded with orjson when it is
+installed, with the standard library results, while encoding keeps the standard
+library output format. The orjson backend decodes and encodes with orjson only,
+producing compact JSON, but it reads integers wider than 64 bits as floats and
+rejects NaN and infinite numbers. The backend can be switched at runtime:
+    * loads
+        Deserialize a JSON document from bytes or a string.
+    * dumps
+        Serialize an object to a JSON string.
+    * dumps_bytes
+        Serialize an object to UTF-8 encoded JSON bytes.
+    * get_backend
+        Return the name of the active JSON backend.
+    * set_backend
+        Switch the JSON backend.
+
+Examples
+--------
+>>> from mlclient import json_codec
+>>> json_codec.loads(b'{"root": "data"}')
+{'root': 'data'}
+>>> json_codec.set_backend("json")
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, ClassVar
+
+from mlclient.exceptions import WrongParametersError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+AUTO_BACKEND = "auto"
+JSON_BACKEND = "json"
+ORJSON_BACKEND = "orjson"
+
+# Numbers orjson could read as floats, like integers wider than 64 bits, are
+# found as runs of digits in a document with digits and other bytes unified
+_DIGITS_TABLE = bytes.maketrans(bytes(range(256)), b" " * 48 + b"0" * 10 + b" " * 198)
+_WIDE_NUMBER_DIGITS = b"0" * 19
+
+
+class _JsonBackend:
+    """The standard library JSON backend."""
+
+    NAME: ClassVar[str] = JSON_BACKEND
+
+    @staticmethod
+    def loads(
+        data: bytes | bytearray | memoryview | str,
+    ) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(
+        obj: Any,
+        indent: int | None = None,
+    ) -> str:
+        return json.dumps(obj, indent=indent)
+
+    @staticmethod
+    def dumps_bytes(
+        obj: Any,
+    ) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+class _OrjsonBackend:
+    """The orjson backend.
+
+    It decodes straight from bytes and encodes to UTF-8 bytes without an
+    intermediate string. Objects orjson does not support (e.g. integers wider
+    than 64 bits) and indents other than 2 are delegated to the standard library.
+    """
+
+    NAME: ClassVar[str] = ORJSON_BACKEND
+
+    @staticmethod
+    def loads(
+        data: bytes | bytearray | memoryview | str,
+    ) -> Any:
+        return orjson.loads(data)
+
+    @classmethod
+    def dumps(
+        cls,
+        obj: Any,
+        indent: int | None = None,
+    ) -> str:
+        if indent not in {None, 2}:
+            return _JsonBackend.dumps(obj, indent=indent)
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        return cls._dumps(obj, option).decode("utf-8")
+
+    @classmethod
+    def dumps_bytes(
+        cls,
+        obj: Any,
+    ) -> bytes:
+        return cls._dumps(obj, orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def _dumps(
+        obj: Any,
+        option: int,
+    ) -> bytes:
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            indent = 2 if option & orjson.OPT_INDENT_2 else None
+            return json.dumps(obj, indent=indent).encode("utf-8")
+
+
+class _AutoBackend(_JsonBackend):
+    """The default backend decoding with orjson when it is installed.
+
+    Results are the same as with the standard library: documents with
+    numbers of 19 or more digits, and documents orjson rejects (e.g. with NaN
+    or numbers out of the float range), are decoded by the standard library.
+    Encoding is delegated to the standard library to keep its output format.
+    """
+
+    NAME: ClassVar[str] = AUTO_BACKEND
+
+    @staticmethod
+    def loads(
+        data: bytes | bytearray | memoryview | str,
+    ) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        if orjson is None or _has_wide_numbers(data):
+            return _JsonBackend.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _JsonBackend.loads(data)
+
+
+def _has_wide_numbers(
+    data: bytes | bytearray | str,
+) -> bool:
+    """Verify if a JSON document may include numbers wider than 64 bits."""
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return _WIDE_NUMBER_DIGITS in data.translate(_DIGITS_TABLE)
+
+
+_BACKENDS = {
+    AUTO_BACKEND: _AutoBackend,
+    JSON_BACKEND: _JsonBackend,
+    ORJSON_BACKEND: _OrjsonBackend,
+}
+
+
+class _Codec:
+    """The active JSON backend holder."""
+
+    backend: ClassVar[type] = _AutoBackend
+
+
+def loads(
+    data: bytes | bytearray | memoryview | str,
+) -> Any:
+    """Deserialize a JSON document from bytes or a string.
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview | str
+        A JSON document; bytes are decoded without an intermediate string
+
+    Returns
+    -------
+    Any
+        A deserialized Python object
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the data is not a valid JSON document
+    """
+    return _Codec.backend.loads(data)
+
+
+def dumps(
+    obj: Any,
+    indent: int | None = None,
+) -> str:
+    """Serialize an object to a JSON string.
+
+    Parameters
+    ----------
+    obj : Any
+        An object to serialize
+    indent : int | None, default None
+        A number of spaces per indent level
+
+    Returns
+    -------
+    str
+        A JSON string
+    """
+    return _Codec.backend.dumps(obj, indent=indent)
+
+
+def dumps_bytes(
+    obj: Any,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Parameters
+    ----------
+    obj : Any
+        An object to serialize
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON bytes
+    """
+    return _Codec.backend.dumps_bytes(obj)
+
+
+def get_backend() -> str:
+    """Return the name of the active JSON backend.
+
+    Returns
+    -------
+    str
+        A backend name: auto, orjson or json
+    """
+    return _Codec.backend.NAME
+
+
+def set_backend(
+    name: str,
+):
+    """Switch the JSON backend.
+
+    Parameters
+    ----------
+    name : str
+        A backend name: auto, orjson or json
+
+    Raises
+    ------
+    WrongParametersError
+        If the backend is unknown or orjson is not installed
+    """
+    if name not in _BACKENDS:
+        msg = f"Unknown JSON backend [{name}]! Available: {', '.join(_BACKENDS)}"
+        raise WrongParametersError(msg)
+    if name == ORJSON_BACKEND and orjson is None:
+        msg = "The orjson backend requires the orjson package to be installed!"
+        raise WrongParametersError(msg)
+    _Codec.backend = _BACKENDS[name]
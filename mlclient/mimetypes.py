@@ -8,11 +8,11 @@ This module extracts a class fetching mimetypes with file extensions and documen
 
 from __future__ import annotations
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import ClassVar
 
-import yaml
-
-from mlclient import utils
+from mlclient import yaml_cache
 from mlclient.models.types import DocumentType, Mimetype
 
 
@@ -20,10 +20,15 @@ class Mimetypes:
     """The Mimetypes utilities provider.
 
     This class is not meant to be instantiated. It provides a set of useful static
-    methods related to mimetypes in MarkLogic.
+    methods related to mimetypes in MarkLogic. Mimetypes are indexed by extension
+    and mime type once, on first use, so lookups do not scan the registry.
     """
 
     _MIMETYPES: ClassVar[list[Mimetype]] = None
+    _EXTENSION_INDEX: ClassVar[dict[str, tuple[int, Mimetype]]] = {}
+    _MIME_TYPE_INDEX: ClassVar[dict[str, tuple[int, Mimetype]]] = {}
+    _MIME_TYPE_LENGTHS: ClassVar[tuple[int, ...]] = ()
+    _MEDIA_TYPES: ClassVar[frozenset[str]] = frozenset()
     _DOC_TYPE_MIMETYPES: ClassVar[dict[DocumentType, list[Mimetype]]] = {
         DocumentType.XML: [],
         DocumentType.JSON: [],
@@ -71,12 +76,8 @@ class Mimetypes:
             A mimetype linked to a specific extension
         """
         cls._init_mimetypes()
-        gen = (
-            mimetype.mime_type
-            for mimetype in cls._MIMETYPES
-            if uri.endswith(cls._dotted_extensions(mimetype))
-        )
-        return next(gen, None)
+        match = cls._match_extension(uri)
+        return match[1].mime_type if match is not None else None
 
     @classmethod
     def get_doc_type(
@@ -96,23 +97,72 @@ class Mimetypes:
             A document type for a specific file or mime type
         """
         cls._init_mimetypes()
-        for mimetype in cls._MIMETYPES:
-            if uri_or_mimetype.startswith(
-                mimetype.mime_type,
-            ) or uri_or_mimetype.endswith(cls._dotted_extensions(mimetype)):
-                return mimetype.document_type
-        return DocumentType.BINARY
-
-    @staticmethod
-    def _dotted_extensions(mimetype: Mimetype) -> tuple[str, ...]:
-        """Return ``mimetype.extensions`` prefixed with a dot.
-
-        Without the dot, ``"c.txt".endswith(("t", ...))`` returns True for
-        the bare ``t`` registered under ``application/x-troff``, so unrelated
-        files like ``.txt`` get misclassified. The dot anchors the match to
-        the actual file extension boundary.
+        matches = [
+            match
+            for match in (
+                cls._match_mime_type(uri_or_mimetype),
+                cls._match_extension(uri_or_mimetype),
+            )
+            if match is not None
+        ]
+        if not matches:
+            return DocumentType.BINARY
+        return min(matches, key=itemgetter(0))[1].document_type
+
+    @classmethod
+    def _match_mime_type(
+        cls,
+        value: str,
+    ) -> tuple[int, Mimetype] | None:
+        """Return the first registered mimetype the value starts with.
+
+        Only values starting with a registered media type (e.g. ``application``)
+        are checked, for prefixes of registered mime type lengths.
+        """
+        if value.partition("/")[0] not in cls._MEDIA_TYPES:
+            return None
+        matches = [
+            cls._MIME_TYPE_INDEX[value[:length]]
+            for length in cls._MIME_TYPE_LENGTHS
+            if value[:length] in cls._MIME_TYPE_INDEX
+        ]
+        return min(matches, key=itemgetter(0), default=None)
+
+    @classmethod
+    def _match_extension(
+        cls,
+        uri: str,
+    ) -> tuple[int, Mimetype] | None:
+        """Return the first registered mimetype with an extension ending the URI.
+
+        Extensions never contain path separators, so only the dotted tail of
+        the URI's last segment (e.g. ``.tar.gz`` for ``/dir/doc.tar.gz``) can
+        match. The tail is matched case-insensitively.
         """
-        return tuple(f".{ext}" for ext in mimetype.extensions)
+        name = uri[max(uri.rfind("/"), uri.rfind("\\")) + 1 :]
+        dot = name.find(".")
+        if dot == -1:
+            return None
+        return cls._match_extension_tail(name[dot:].lower())
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _match_extension_tail(
+        cls,
+        tail: str,
+    ) -> tuple[int, Mimetype] | None:
+        """Return the first registered mimetype for a dotted file name tail.
+
+        Every dot anchors a candidate extension: ``.tar.gz`` is looked up as
+        ``tar.gz`` and ``gz``. Anchoring on the dot keeps the bare ``t``
+        registered under ``application/x-troff`` from matching ``.txt`` files.
+        """
+        matches = [
+            cls._EXTENSION_INDEX[tail[i + 1 :]]
+            for i, char in enumerate(tail)
+            if char == "." and tail[i + 1 :] in cls._EXTENSION_INDEX
+        ]
+        return min(matches, key=itemgetter(0), default=None)
 
     @classmethod
     def _init_doc_type_mimetypes(
@@ -138,7 +188,27 @@ class Mimetypes:
     ):
         """Initialize an internal list of mimetypes."""
         if cls._MIMETYPES is None:
-            with utils.get_resource("mimetypes.yaml") as mimetypes_file:
-                mimetypes_yaml = yaml.safe_load(mimetypes_file.read())
-                mimetypes = mimetypes_yaml["mimetypes"]
-                cls._MIMETYPES = [Mimetype(**mimetype) for mimetype in mimetypes]
+            mimetypes = yaml_cache.load_resource("mimetypes.yaml")["mimetypes"]
+            cls._MIMETYPES = [Mimetype(**mimetype) for mimetype in mimetypes]
+            cls._init_indexes()
+
+    @classmethod
+    def _init_indexes(
+        cls,
+    ):
+        """Index mimetypes by extension and mime type.
+
+        Each index entry keeps the mimetype's position in the registry, so
+        lookups resolve overlapping matches to the first registered mimetype.
+        """
+        extension_index = {}
+        mime_type_index = {}
+        for position, mimetype in enumerate(cls._MIMETYPES):
+            for extension in mimetype.extensions:
+                extension_index.setdefault(extension.lower(), (position, mimetype))
+            mime_type_index.setdefault(mimetype.mime_type, (position, mimetype))
+        cls._EXTENSION_INDEX = extension_index
+        cls._MIME_TYPE_INDEX = mime_type_index
+        cls._MIME_TYPE_LENGTHS = tuple(sorted({len(key) for key in mime_type_index}))
+        cls._MEDIA_TYPES = frozenset(key.partition("/")[0] for key in mime_type_index)
+        cls._match_extension_tail.cache_clear()
@@ -17,10 +17,9 @@ import logging
 from enum import Enum
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field, field_serializer
 
-from mlclient import constants
+from mlclient import constants, yaml_cache
 from mlclient.exceptions import (
     MLClientDirectoryNotFoundError,
     MLClientEnvironmentNotFoundError,
@@ -259,6 +258,8 @@ class MLEnvironment(BaseModel):
     ) -> dict:
         """Load a source MLClient's configuration YAML file.
 
+        The file is parsed once and cached until it changes.
+
         Parameters
         ----------
         file_path : str
@@ -269,5 +270,4 @@ class MLEnvironment(BaseModel):
         dict
             A source MLClient's configuration
         """
-        with Path(file_path).open() as config_file:
-            return yaml.safe_load(config_file.read())
+        return yaml_cache.load_file(file_path)
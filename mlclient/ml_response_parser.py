@@ -7,7 +7,6 @@ It exports 1 class:
 
 from __future__ import annotations
 
-import json
 import logging
 import xml.etree.ElementTree as ElemTree
 from datetime import datetime
@@ -16,6 +15,7 @@ from typing import ClassVar
 from httpx import Headers, Response
 
 from mlclient import constants as const
+from mlclient import json_codec, xml_codec
 from mlclient.mimetypes import Mimetypes
 from mlclient.models import DocumentType
 from mlclient.multipart import MultipartPart, decode_multipart_mixed
@@ -180,7 +180,7 @@ class MLResponseParser:
         content_type = response.headers.get(const.HEADER_NAME_CONTENT_TYPE)
         if not response.is_success:
             if content_type.startswith(const.HEADER_JSON):
-                error = response.json()
+                error = json_codec.loads(response.content)
             elif content_type.startswith(const.HEADER_XML):
                 error = cls._parse_xml_error(response)
             else:
@@ -226,11 +226,11 @@ class MLResponseParser:
         content_type = response.headers.get(const.HEADER_NAME_CONTENT_TYPE)
         if not response.is_success:
             if content_type.startswith(const.HEADER_JSON):
-                json_error = response.json()
-                error = json.dumps(json_error)
+                json_error = json_codec.loads(response.content)
+                error = json_codec.dumps(json_error)
             elif content_type.startswith(const.HEADER_XML):
                 json_error = cls._parse_xml_error(response)
-                error = json.dumps(json_error)
+                error = json_codec.dumps(json_error)
             else:
                 error = cls._parse_html_error(response)
             logger.warning("MarkLogic error occurred [%s]", error)
@@ -274,11 +274,11 @@ class MLResponseParser:
         content_type = response.headers.get(const.HEADER_NAME_CONTENT_TYPE)
         if not response.is_success:
             if content_type.startswith(const.HEADER_JSON):
-                json_error = response.json()
-                error = json.dumps(json_error).encode("utf-8")
+                json_error = json_codec.loads(response.content)
+                error = json_codec.dumps_bytes(json_error)
             elif content_type.startswith(const.HEADER_XML):
                 json_error = cls._parse_xml_error(response)
-                error = json.dumps(json_error).encode("utf-8")
+                error = json_codec.dumps_bytes(json_error)
             else:
                 error = cls._parse_html_error(response).encode("utf-8")
             logger.warning("MarkLogic error occurred [%s]", error)
@@ -451,10 +451,10 @@ class MLResponseParser:
         if doc_type == DocumentType.TEXT and primitive_type in cls._PLAIN_TEXT_PARSERS:
             return cls._PLAIN_TEXT_PARSERS[primitive_type](body_part.text)
         if doc_type == DocumentType.JSON:
-            return json.loads(body_part.text)
+            return json_codec.loads(body_part.content)
         if doc_type == DocumentType.XML:
-            element = ElemTree.fromstring(body_part.text)
+            element = xml_codec.fromstring(body_part.content)
             if primitive_type in [None, const.HEADER_PRIMITIVE_DOCUMENT_NODE]:
-                return ElemTree.ElementTree(element)
+                return xml_codec.to_tree(element)
             return element
         return body_part.content
@@ -22,6 +22,8 @@ This package exports the following classes:
         A Document implementation representing a single MarkLogic BINARY document.
     * MetadataDocument
         A Document implementation representing a single MarkLogic document's metadata.
+    * FileContent
+        A lazy, file-backed binary content source.
     * Metadata
         A class representing MarkLogic's document metadata.
     * Permission:
@@ -34,22 +36,64 @@ Examples
 >>> from mlclient.models import Document, DocumentType, Metadata
 """
 
-from .documents import (
-    BinaryDocument,
-    Document,
-    JSONDocument,
-    Metadata,
-    MetadataDocument,
-    Permission,
-    TextDocument,
-    XMLDocument,
-)
-from .types import DocumentType, Mimetype
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .documents import (
+        BinaryDocument,
+        Document,
+        FileContent,
+        JSONDocument,
+        Metadata,
+        MetadataDocument,
+        Permission,
+        TextDocument,
+        XMLDocument,
+    )
+    from .types import DocumentType, Mimetype
+
+# Exported names imported on first access (PEP 562), so that modules using
+# document types only do not import document models
+_LAZY_IMPORTS = {
+    "BinaryDocument": ".documents",
+    "Document": ".documents",
+    "FileContent": ".documents",
+    "JSONDocument": ".documents",
+    "Metadata": ".documents",
+    "MetadataDocument": ".documents",
+    "Permission": ".documents",
+    "TextDocument": ".documents",
+    "XMLDocument": ".documents",
+    "DocumentType": ".types",
+    "Mimetype": ".types",
+}
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    """Import an exported name on first access."""
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "BinaryDocument",
     "Document",
     "DocumentType",
+    "FileContent",
     "JSONDocument",
     "Metadata",
     "MetadataDocument",
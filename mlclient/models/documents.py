@@ -15,6 +15,8 @@ It exports the following classes:
         A Document implementation representing a single MarkLogic BINARY document.
     * MetadataDocument
         A Document implementation representing a single MarkLogic document's metadata.
+    * FileContent
+        A lazy, file-backed binary content source.
     * Metadata
         A class representing MarkLogic's document metadata.
     * Permission:
@@ -26,17 +28,20 @@ It exports the following classes:
 from __future__ import annotations
 
 import copy
-import json
+import io
 import logging
 import re
 import xml.etree.ElementTree as ElemTree
 from abc import ABCMeta, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any, ClassVar, TextIO
 from xml.dom import minidom
 
+import aiofiles
 import xmltodict
 
+from mlclient import json_codec, xml_codec
 from mlclient.exceptions import InvalidMetadataError
 from mlclient.mimetypes import Mimetypes
 from mlclient.models.types import DocumentType
@@ -104,7 +109,7 @@ class Document(metaclass=ABCMeta):
     def create(
         cls,
         uri: str | None = None,
-        content: ElemTree.Element | dict | str | bytes | None = None,
+        content: ElemTree.Element | dict | str | bytes | FileContent | None = None,
         *,
         doc_type: DocumentType | str | None = None,
         metadata: Metadata | bytes | str | None = None,
@@ -127,13 +132,14 @@ class Document(metaclass=ABCMeta):
            (fallback: BINARY when the extension is unrecognised).
         5. ``str`` content, no URI -> TEXT.
         6. ``bytes`` content, no URI -> BINARY.
+        7. ``FileContent`` content -> BINARY.
 
         Parameters
         ----------
         uri : str | None, default None
             A document URI.
-        content : ElemTree.Element | dict | str | bytes | None, default None
-            A document content.
+        content : ElemTree.Element | dict | str | bytes | FileContent | None
+            A document content, by default None.
         doc_type : DocumentType | str | None, default None
             A document type override.
         metadata : Metadata | bytes | str | None, default None
@@ -282,7 +288,7 @@ class Document(metaclass=ABCMeta):
     def binary(
         cls,
         uri: str | None = None,
-        content: bytes | None = None,
+        content: bytes | FileContent | None = None,
         *,
         metadata: Metadata | bytes | str | None = None,
         temporal_collection: str | None = None,
@@ -293,8 +299,9 @@ class Document(metaclass=ABCMeta):
         ----------
         uri : str | None, default None
             A document URI.
-        content : bytes
-            Binary content. Required; ``None`` raises ``TypeError``.
+        content : bytes | FileContent
+            Binary content, or a lazy file-backed content source.
+            Required; ``None`` raises ``TypeError``.
         metadata : Metadata | bytes | str | None, default None
             A document metadata.
         temporal_collection : str | None, default None
@@ -495,7 +502,7 @@ class JSONDocument(Document):
                 if self._content_bytes is not None
                 else self._content_string
             )
-            self._parsed = json.loads(raw)
+            self._parsed = json_codec.loads(raw)
         return self._parsed
 
     @property
@@ -513,7 +520,7 @@ class JSONDocument(Document):
             if self._content_string is not None:
                 self._content_bytes = self._content_string.encode("utf-8")
             else:
-                self._content_bytes = json.dumps(self._parsed).encode("utf-8")
+                self._content_bytes = json_codec.dumps_bytes(self._parsed)
         return self._content_bytes
 
     @property
@@ -531,7 +538,7 @@ class JSONDocument(Document):
             if self._content_bytes is not None:
                 self._content_string = self._content_bytes.decode("utf-8")
             else:
-                self._content_string = json.dumps(self._parsed)
+                self._content_string = json_codec.dumps(self._parsed)
         return self._content_string
 
     def invalidate(self) -> JSONDocument:
@@ -582,9 +589,9 @@ class XMLDocument(Document):
             )
             raise TypeError(msg)
         super().__init__(uri, DocumentType.XML, metadata, temporal_collection)
-        if isinstance(content, ElemTree.Element):
-            self._parsed: ElemTree.ElementTree | None = ElemTree.ElementTree(content)
-        elif isinstance(content, ElemTree.ElementTree):
+        if xml_codec.is_element(content):
+            self._parsed: ElemTree.ElementTree | None = xml_codec.to_tree(content)
+        elif xml_codec.is_tree(content):
             self._parsed = content
         else:
             self._parsed = None
@@ -598,7 +605,8 @@ class XMLDocument(Document):
         """A parsed ElementTree representation of the XML content.
 
         Parsing from the raw string/bytes form is deferred to the first access
-        and cached for subsequent calls.
+        and cached for subsequent calls. It uses the active ``xml_codec``
+        backend, so the tree is an lxml one when that backend is enabled.
 
         Returns
         -------
@@ -607,12 +615,10 @@ class XMLDocument(Document):
         """
         if self._parsed is None:
             if self._content_bytes is not None:
-                self._parsed = ElemTree.ElementTree(
-                    ElemTree.fromstring(self._content_bytes),
-                )
+                self._parsed = xml_codec.parse(self._content_bytes)
             else:
                 source = self._XML_DECL_RE.sub("", self._content_string, count=1)
-                self._parsed = ElemTree.ElementTree(ElemTree.fromstring(source))
+                self._parsed = xml_codec.parse(source)
         return self._parsed
 
     @property
@@ -654,16 +660,16 @@ class XMLDocument(Document):
     def _serialize_tree(self) -> bytes:
         """Serialize the parsed ElementTree to UTF-8 bytes with XML declaration."""
         return _normalize_xml_declaration(
-            ElemTree.tostring(
-                self._parsed.getroot(),
-                encoding="UTF-8",
-                xml_declaration=True,
-            ),
+            xml_codec.tostring(self._parsed.getroot(), xml_declaration=True),
         )
 
     def xpath(self, expr: str, **namespaces: str) -> list:
         """Run an XPath expression against the document content.
 
+        With the lxml backend the expression is evaluated as full XPath 1.0 and
+        its compiled form is cached; with ElementTree only the ``findall``
+        subset of XPath is supported.
+
         Parameters
         ----------
         expr : str
@@ -676,7 +682,26 @@ class XMLDocument(Document):
         list
             Matching elements.
         """
-        return self.content.findall(expr, namespaces or None)
+        return xml_codec.xpath(self.content, expr, namespaces or None)
+
+    def iterparse(self, tag: str | None = None) -> Iterator[ElemTree.Element]:
+        """Iterate over the document elements without building the whole tree.
+
+        Elements are parsed incrementally from ``.content_bytes`` and cleared
+        once the iteration moves on, which keeps memory flat for large
+        documents. The parsed ``.content`` is neither used nor cached.
+
+        Parameters
+        ----------
+        tag : str | None, default None
+            A (Clark notation) tag of elements to yield; all elements if None.
+
+        Returns
+        -------
+        Iterator[ElemTree.Element]
+            Parsed elements, in document order of their end tags.
+        """
+        return xml_codec.iterparse(io.BytesIO(self.content_bytes), tag)
 
     def invalidate(self) -> XMLDocument:
         """Drop cached bytes/string serializations of the parsed ElementTree.
@@ -768,12 +793,14 @@ class TextDocument(Document):
 class BinaryDocument(Document):
     """A Document implementation representing a single MarkLogic BINARY document.
 
-    This implementation stores content in bytes format.
+    This implementation stores content in bytes format, or references a file
+    with a FileContent instance - in that case the file is read only when
+    the content is accessed or streamed into a request body.
     """
 
     def __init__(
         self,
-        content: bytes,
+        content: bytes | FileContent,
         uri: str | None = None,
         metadata: Metadata | bytes | str | None = None,
         temporal_collection: str | None = None,
@@ -796,17 +823,21 @@ class BinaryDocument(Document):
         bytes
             The binary content.
         """
-        return self._content_bytes
+        return self.content_bytes
 
     @property
     def content_bytes(self) -> bytes:
         """A document content as bytes.
 
+        File-backed content is read on every access and is not cached.
+
         Returns
         -------
         bytes
             The binary content.
         """
+        if isinstance(self._content_bytes, FileContent):
+            return self._content_bytes.read()
         return self._content_bytes
 
     @property
@@ -821,6 +852,108 @@ class BinaryDocument(Document):
         """
         return None
 
+    @property
+    def content_source(self) -> bytes | FileContent:
+        """A document content as stored - bytes or a lazy FileContent."""
+        return self._content_bytes
+
+    @property
+    def content_length(self) -> int:
+        """A document content size in bytes, without reading a file."""
+        return len(self._content_bytes)
+
+
+class FileContent:
+    """A lazy, file-backed binary content source.
+
+    The file is not opened until its content is read or iterated. Iteration
+    yields the file in chunks, so content can be streamed into a request body
+    with memory use independent of the file size. An instance can be iterated
+    any number of times (e.g. when a request is retried).
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(
+        self,
+        path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """Initialize FileContent instance.
+
+        Parameters
+        ----------
+        path : str | Path
+            A file path
+        chunk_size : int, default 65536
+            A size of chunks yielded when iterating
+        """
+        self._path = Path(path)
+        self._chunk_size = chunk_size
+        self._size = self._path.stat().st_size
+
+    @property
+    def path(
+        self,
+    ) -> Path:
+        """A file path."""
+        return self._path
+
+    @property
+    def size(
+        self,
+    ) -> int:
+        """A file size in bytes, captured at initialization."""
+        return self._size
+
+    def read(
+        self,
+    ) -> bytes:
+        """Read the whole file content."""
+        with self._path.open("rb") as file:
+            return file.read()
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return the file size in bytes."""
+        return self._size
+
+    def __iter__(
+        self,
+    ) -> Iterator[bytes]:
+        """Iterate over file chunks."""
+        with self._path.open("rb") as file:
+            while chunk := file.read(self._chunk_size):
+                yield chunk
+
+    async def __aiter__(
+        self,
+    ) -> AsyncIterator[bytes]:
+        """Iterate asynchronously over file chunks."""
+        async with aiofiles.open(self._path, mode="rb") as file:
+            while chunk := await file.read(self._chunk_size):
+                yield chunk
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """Compare file contents by path."""
+        return isinstance(other, FileContent) and self._path == other.path
+
+    def __hash__(
+        self,
+    ) -> int:
+        """Hash a file content by path."""
+        return hash(self._path)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Return a short representation without the file content."""
+        return f"FileContent(path='{self._path}', size={self._size})"
+
 
 class MetadataDocument(Document):
     """A Document implementation for metadata-only updates.
@@ -885,7 +1018,7 @@ _TYPED_IMPLS: dict[DocumentType, type] = {
 
 
 def _resolve_doc_type(
-    content: ElemTree.Element | dict | str | bytes | None,
+    content: ElemTree.Element | dict | str | bytes | FileContent | None,
     doc_type: DocumentType | None,
     uri: str | None,
 ) -> DocumentType:
@@ -898,10 +1031,13 @@ def _resolve_doc_type(
     4. ``str``/``bytes`` + ``uri`` -> ``Mimetypes.get_doc_type(uri)``.
     5. ``str`` + no URI -> TEXT.
     6. ``bytes`` + no URI -> BINARY.
+    7. ``FileContent`` -> BINARY.
     """
     if doc_type is not None:
         return doc_type
-    if isinstance(content, ElemTree.Element):
+    if isinstance(content, FileContent):
+        return DocumentType.BINARY
+    if xml_codec.is_element(content):
         return DocumentType.XML
     if isinstance(content, dict):
         return DocumentType.JSON
@@ -1014,7 +1150,7 @@ class Metadata:
         content: str,
     ) -> dict:
         """Parse a JSON metadata payload to Metadata constructor kwargs."""
-        raw_metadata = json.loads(content)
+        raw_metadata = json_codec.loads(content)
         if "permissions" in raw_metadata:
             permissions = []
             for permission in raw_metadata["permissions"]:
@@ -1088,13 +1224,15 @@ class Metadata:
         content: str,
     ) -> None:
         """Validate XML metadata structure before parsing."""
-        root = ElemTree.fromstring(content)
+        root = xml_codec.fromstring(content)
         expected_root = f"{{{cls._RAPI_NS_URI}}}metadata"
         if root.tag != expected_root:
             msg = f"Unexpected root element [{root.tag}]; expected [{expected_root}]"
             raise InvalidMetadataError(msg)
         valid_namespaces = {cls._RAPI_NS_URI, cls._PROP_NS_URI}
         for child in root:
+            if not isinstance(child.tag, str):
+                continue
             ns = child.tag.split("}")[0].lstrip("{") if "}" in child.tag else None
             if ns not in valid_namespaces:
                 msg = f"Unexpected element [{child.tag}] in metadata"
@@ -1521,7 +1659,7 @@ class Metadata:
             stripped = source.lstrip()
             if stripped.startswith(("{", "[")):
                 return source
-        return json.dumps(self.to_json(), indent=indent)
+        return json_codec.dumps(self.to_json(), indent=indent)
 
     def to_json(
         self,
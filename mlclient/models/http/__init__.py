@@ -12,6 +12,8 @@ This package exports the following classes:
         A class representing /v1/documents body part.
     * DocumentsDisposition
         A class representing /v1/documents body part Content-Disposition header.
+    * DocumentsDispositionRecord
+        A lightweight, non-validating Content-Disposition record.
     * DocumentsBodyPartType
         An enumeration class representing /v1/documents body part types.
     * Repair
@@ -31,6 +33,7 @@ from .documents import BodyPart as DocumentsBodyPart
 from .documents import BodyPartType as DocumentsBodyPartType
 from .documents import Category
 from .documents import Disposition as DocumentsDisposition
+from .documents import DispositionRecord as DocumentsDispositionRecord
 from .documents import Extract, Repair
 
 __all__ = [
@@ -38,6 +41,7 @@ __all__ = [
     "DocumentsBodyPart",
     "DocumentsBodyPartType",
     "DocumentsDisposition",
+    "DocumentsDispositionRecord",
     "Extract",
     "Repair",
 ]
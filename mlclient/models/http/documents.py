@@ -7,6 +7,8 @@ It exports the following classes:
         A class representing /v1/documents body part.
     * Disposition
         A class representing /v1/documents body part Content-Disposition header.
+    * DispositionRecord
+        A lightweight, non-validating Content-Disposition record.
     * BodyPartType
         An enumeration class representing /v1/documents body part types.
     * Repair
@@ -19,13 +21,15 @@ It exports the following classes:
 
 from __future__ import annotations
 
+import re
 from enum import Enum
-from typing import ClassVar, Optional, Union
+from functools import lru_cache
+from typing import ClassVar, NamedTuple, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 from mlclient.constants import HEADER_JSON
-from mlclient.models import DocumentType
+from mlclient.models import DocumentType, FileContent
 from mlclient.utils import BiDict
 
 
@@ -161,10 +165,9 @@ class Disposition(BaseModel):
         Disposition
             A parsed Disposition instance
         """
-        m = _DispositionMapping
         disp_dict = {}
-        for disp in header.split(m.DISP_SEP):
-            key, value = cls._parse_header_part(disp)
+        for disp in _DISPOSITION_PARAM_RE.finditer(header):
+            key, value = cls._parse_header_part(disp.group().strip(" ;"))
             curr_value = disp_dict.get(key)
             if curr_value is None:
                 disp_dict[key] = value
@@ -182,14 +185,25 @@ class Disposition(BaseModel):
         str
             A raw Content-Disposition header value
         """
-        m = _DispositionMapping
-        parts = [self._serialize_field(key) for key in m.FIELD_ORDER]
-        return m.DISP_SEP.join([p for p in parts if p is not None])
+        return self.to_record().to_header()
+
+    def to_record(self) -> DispositionRecord:
+        """Convert this instance to a lightweight DispositionRecord.
+
+        Returns
+        -------
+        DispositionRecord
+            A record with the same field values
+        """
+        fields = dict(self)
+        if isinstance(self.category, list):
+            fields[_DispositionMapping.CLASS_KEY_CATEGORY] = tuple(self.category)
+        return DispositionRecord(**fields)
 
     @staticmethod
     def _parse_header_part(disp: str) -> tuple[str, str]:
         m = _DispositionMapping
-        key_value_pair = disp.split(m.KEY_VALUE_SEP)
+        key_value_pair = disp.split(m.KEY_VALUE_SEP, 1)
         if len(key_value_pair) == 1:
             key = None
             value = key_value_pair[0]
@@ -202,44 +216,117 @@ class Disposition(BaseModel):
         return key, value
 
     def _serialize_field(self, class_key: str) -> str | None:
-        m = _DispositionMapping
-        disp_value = self.model_dump().get(class_key)
+        disp_value = getattr(self, class_key)
         if disp_value is None:
             return None
-        disp = m.DISPOSITIONS.get(class_key)
+        disp = _DispositionMapping.DISPOSITIONS.get(class_key)
+        return _serialize_param(disp, disp_value)
+
+
+class DispositionRecord(NamedTuple):
+    """A lightweight, non-validating Content-Disposition record.
+
+    It mirrors Disposition fields and is used on hot paths - for every document
+    written or read - where building and validating a pydantic model per body
+    part is too costly. Parsing and serialization are memoized for repeated
+    headers; a filename, unique per document, is kept out of memoized keys.
+    Multiple categories are stored as a tuple.
+    """
+
+    type_: BodyPartType
+    category: Category | tuple[Category, ...] | None = None
+    repair: Repair | None = None
+    filename: str | None = None
+    extension: str | None = None
+    directory: str | None = None
+    extract: Extract | None = None
+    version_id: int | None = None
+    temporal_document: str | None = None
+    format_: DocumentType | None = None
 
-        if not isinstance(disp_value, list):
-            disp_value = [disp_value]
+    @property
+    def is_attachment(self) -> bool:
+        """Whether this disposition is an attachment (document-specific part)."""
+        return self.type_ == BodyPartType.ATTACHMENT
 
-        dispositions = []
-        for value in disp_value:
-            if isinstance(value, Enum):
-                final_value = value.value
-            elif disp == m.DISP_KEY_FILENAME:
-                final_value = f'"{value}"'
-            else:
-                final_value = value
-            disposition = final_value if disp is None else f"{disp}={final_value}"
-            dispositions.append(disposition)
-        return "; ".join(dispositions)
+    @property
+    def is_inline(self) -> bool:
+        """Whether this disposition is inline (default metadata part)."""
+        return self.type_ == BodyPartType.INLINE
+
+    @classmethod
+    def from_header(cls, header: str) -> DispositionRecord:
+        """Parse a raw Content-Disposition header string without validation.
+
+        Parameters
+        ----------
+        header : str
+            A raw Content-Disposition header value
+
+        Returns
+        -------
+        DispositionRecord
+            A parsed DispositionRecord instance
+
+        Raises
+        ------
+        ValueError
+            If a parameter value is not allowed
+        """
+        filename_match = _FILENAME_PARAM_RE.search(header)
+        if filename_match is None:
+            return _parse_disposition(header)
+        header_rest = header[: filename_match.start()] + header[filename_match.end() :]
+        record = _parse_disposition(header_rest)
+        return record._replace(filename=filename_match.group(1))
+
+    def to_header(self) -> str:
+        """Serialize this record to a raw Content-Disposition header string.
+
+        Returns
+        -------
+        str
+            A raw Content-Disposition header value
+        """
+        if self.filename is None:
+            return "".join(_serialize_disposition(self))
+        type_disp, rest = _serialize_disposition(self._replace(filename=None))
+        return f'{type_disp}; filename="{self.filename}"{rest}'
+
+    def to_disposition(self) -> Disposition:
+        """Convert this record to a validated Disposition model.
+
+        Returns
+        -------
+        Disposition
+            A Disposition instance with the same field values
+        """
+        fields = self._asdict()
+        if isinstance(self.category, tuple):
+            fields[_DispositionMapping.CLASS_KEY_CATEGORY] = list(self.category)
+        return Disposition(**fields)
 
 
 class BodyPart(BaseModel):
     """A class representing /v1/documents body part."""
 
+    model_config = {"arbitrary_types_allowed": True}
+
     content_type: str = Field(alias="content-type", default=HEADER_JSON)
-    disposition: Disposition = Field(
+    disposition: Union[Disposition, DispositionRecord] = Field(
         alias="content-disposition",
     )
-    content: Union[str, bytes, dict]
+    content: Union[str, bytes, dict, FileContent]
 
     @field_validator("disposition", mode="before")
     @classmethod
     def parse_disposition(
         cls,
-        value: str | dict,
-    ) -> Disposition:
+        value: str | dict | Disposition | DispositionRecord,
+    ) -> Disposition | DispositionRecord:
         """Parse a Content-Disposition header."""
+        if isinstance(value, (Disposition, DispositionRecord)):
+            return value
         if isinstance(value, dict):
             return Disposition(**value)
         return Disposition.from_header(value)
@@ -297,3 +384,76 @@ class _DispositionMapping:
         CLASS_KEY_TEMPORAL_DOC,
         CLASS_KEY_FORMAT,
     ]
+
+
+_DISPOSITION_PARAM_RE = re.compile(r'\s*([^;=\s]+)(?:=("[^"]*"|[^;]*))?\s*(?:;|$)')
+_FILENAME_PARAM_RE = re.compile(r'(?:^|;)\s*filename="([^"]*)"')
+_PARAM_CONVERTERS = {
+    _DispositionMapping.CLASS_KEY_TYPE: BodyPartType,
+    _DispositionMapping.CLASS_KEY_CATEGORY: Category,
+    _DispositionMapping.CLASS_KEY_REPAIR: Repair,
+    _DispositionMapping.CLASS_KEY_EXTRACT: Extract,
+    _DispositionMapping.CLASS_KEY_VERSION_ID: int,
+    _DispositionMapping.CLASS_KEY_FORMAT: DocumentType,
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_disposition(header: str) -> DispositionRecord:
+    """Parse a Content-Disposition header in a single regex pass."""
+    m = _DispositionMapping
+    fields = {}
+    for disp in _DISPOSITION_PARAM_RE.finditer(header):
+        disp_key, value = disp.groups()
+        if value is None:
+            key, value = m.CLASS_KEY_TYPE, disp_key
+        else:
+            key = m.DISPOSITIONS.get(disp_key)
+            if key is None:
+                continue
+        value = _PARAM_CONVERTERS.get(key, str)(value.strip().strip('"'))
+        if key == m.CLASS_KEY_CATEGORY and key in fields:
+            curr_value = fields[key]
+            if not isinstance(curr_value, tuple):
+                curr_value = (curr_value,)
+            value = (*curr_value, value)
+        fields[key] = value
+    return DispositionRecord(**fields)
+
+
+@lru_cache(maxsize=256)
+def _serialize_disposition(record: DispositionRecord) -> tuple[str, str]:
+    """Serialize a record in a single pass.
+
+    Returns the disposition type and the remaining parameters separately,
+    so a filename can be inserted between them (as per ``FIELD_ORDER``).
+    """
+    m = _DispositionMapping
+    params = [
+        _serialize_param(m.DISPOSITIONS.get(key), getattr(record, key))
+        for key in m.FIELD_ORDER[1:]
+        if getattr(record, key) is not None
+    ]
+    type_disp = _serialize_param(m.DISP_KEY_TYPE, record.type_)
+    return type_disp, "".join(f"{m.DISP_SEP}{param}" for param in params)
+
+
+def _serialize_param(
+    disp_key: str | None,
+    disp_value: object,
+) -> str:
+    """Serialize a Content-Disposition parameter with all its values."""
+    if not isinstance(disp_value, (list, tuple)):
+        disp_value = [disp_value]
+    dispositions = []
+    for value in disp_value:
+        if isinstance(value, Enum):
+            final_value = value.value
+        elif disp_key == _DispositionMapping.DISP_KEY_FILENAME:
+            final_value = f'"{value}"'
+        else:
+            final_value = value
+        dispositions.append(
+            final_value if disp_key is None else f"{disp_key}={final_value}",
+        )
+    return _DispositionMapping.DISP_SEP.join(dispositions)
@@ -1,27 +1,45 @@
 """The Multipart/Mixed module.
 
-It provides functions and a data class for building and parsing
+It provides functions and classes for building and parsing
 multipart/mixed HTTP messages:
     * MultipartPart
         A single part of a multipart/mixed message.
+    * MultipartStream
+        A re-iterable multipart/mixed body streamed chunk by chunk.
+    * MultipartDecoder
+        An incremental multipart/mixed decoder.
     * encode_multipart_mixed
         Encode parts into a multipart/mixed body.
     * decode_multipart_mixed
         Parse a multipart/mixed body into parts.
+    * iter_multipart_mixed
+        Parse a multipart/mixed body stream into parts as they arrive.
+    * aiter_multipart_mixed
+        Async variant of iter_multipart_mixed.
 """
 
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass
 
+_CRLF = b"\r\n"
+_HEADERS_END = b"\r\n\r\n"
+_CLOSE_MARKER = b"--"
+
 
 @dataclass
 class MultipartPart:
-    """A single part of a multipart/mixed message."""
+    """A single part of a multipart/mixed message.
+
+    Parts to encode may carry, instead of bytes, any sized iterable of bytes
+    chunks (e.g. a lazy file-backed content); its ``len()`` must return
+    the total size in bytes.
+    """
 
     headers: dict[str, str]
-    content: bytes
+    content: bytes | Iterable[bytes]
 
     @property
     def text(self) -> str:
@@ -35,6 +53,202 @@ class MultipartPart:
         return self.content.decode(charset)
 
 
+class MultipartStream:
+    """A re-iterable multipart/mixed body streamed chunk by chunk.
+
+    Part contents are never copied: iterating the stream yields each part's
+    encoded headers followed by its content object as-is, or by its chunks
+    when the content is a sized iterable of bytes. Header blocks are
+    encoded once, up front, so the total body size is known before sending
+    and can be used as the Content-Length header value.
+
+    The stream can be iterated both synchronously and asynchronously, and any
+    number of times (e.g. when a request is retried).
+    """
+
+    def __init__(
+        self,
+        parts: list[MultipartPart],
+        boundary: str | None = None,
+    ):
+        """Initialize MultipartStream instance.
+
+        Parameters
+        ----------
+        parts : list[MultipartPart]
+            The parts to encode
+        boundary : str | None
+            An optional boundary string; generated if not provided
+        """
+        if boundary is None:
+            boundary = uuid.uuid4().hex
+        self._boundary: str = boundary
+        self._chunks: list[bytes | Iterable[bytes]] = []
+        delimiter = f"--{boundary}\r\n".encode()
+        for part in parts:
+            head = (
+                delimiter
+                + "".join(
+                    f"{name}: {value}\r\n" for name, value in part.headers.items()
+                ).encode()
+            )
+            self._chunks.extend((head + _CRLF, part.content, _CRLF))
+        self._chunks.append(f"--{boundary}--\r\n".encode())
+        self._parts_count: int = len(parts)
+        self._content_length: int = sum(len(chunk) for chunk in self._chunks)
+
+    @property
+    def boundary(
+        self,
+    ) -> str:
+        """A multipart boundary."""
+        return self._boundary
+
+    @property
+    def content_type(
+        self,
+    ) -> str:
+        """A Content-Type header value including the boundary."""
+        return f"multipart/mixed; boundary={self._boundary}"
+
+    @property
+    def content_length(
+        self,
+    ) -> int:
+        """The total size of the encoded body in bytes."""
+        return self._content_length
+
+    def __iter__(
+        self,
+    ) -> Iterator[bytes]:
+        """Iterate over encoded body chunks."""
+        for chunk in self._chunks:
+            if isinstance(chunk, (bytes, bytearray, memoryview)):
+                yield chunk
+            else:
+                yield from chunk
+
+    async def __aiter__(
+        self,
+    ) -> AsyncIterator[bytes]:
+        """Iterate asynchronously over encoded body chunks."""
+        for chunk in self._chunks:
+            if isinstance(chunk, (bytes, bytearray, memoryview)):
+                yield chunk
+            elif isinstance(chunk, AsyncIterable):
+                async for sub_chunk in chunk:
+                    yield sub_chunk
+            else:
+                for sub_chunk in chunk:
+                    yield sub_chunk
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Return a short representation without the body content."""
+        return (
+            f"MultipartStream(parts={self._parts_count}, "
+            f"content_length={self._content_length})"
+        )
+
+
+class MultipartDecoder:
+    r"""An incremental multipart/mixed decoder.
+
+    Body chunks are fed as they arrive from the wire; every part is returned
+    as soon as its closing delimiter has been received. Boundaries split
+    across chunk edges are detected, and only the bytes of the part currently
+    being received are buffered.
+
+    Examples
+    --------
+    >>> decoder = MultipartDecoder("multipart/mixed; boundary=b")
+    >>> decoder.feed(b"--b\r\nContent-Type: text/plain\r\n\r\nhel")
+    []
+    >>> decoder.feed(b"lo\r\n--b--\r\n")
+    [MultipartPart(headers={'Content-Type': 'text/plain'}, content=b'hello')]
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+    ):
+        """Initialize MultipartDecoder instance.
+
+        Parameters
+        ----------
+        content_type : str
+            The Content-Type header value containing the boundary
+
+        Raises
+        ------
+        ValueError
+            If the Content-Type header does not contain a boundary
+        """
+        boundary = _extract_boundary(content_type)
+        self._delimiter: bytes = f"\r\n--{boundary}".encode()
+        # A leading CRLF lets the opening boundary match the same delimiter
+        # as the following ones, whether a preamble is present or not.
+        self._buffer: bytearray = bytearray(_CRLF)
+        self._search_from: int = 0
+        self._in_part: bool = False
+        self._finished: bool = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the closing boundary has been received."""
+        return self._finished
+
+    def feed(
+        self,
+        chunk: bytes,
+    ) -> list[MultipartPart]:
+        """Consume a body chunk and return all parts completed by it.
+
+        Parameters
+        ----------
+        chunk : bytes
+            A next chunk of the raw multipart body
+
+        Returns
+        -------
+        list[MultipartPart]
+            Parts completed within the chunk (possibly none)
+        """
+        if self._finished:
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        delimiter = self._delimiter
+        parts = []
+        start = 0
+        search_from = self._search_from
+        while True:
+            idx = buffer.find(delimiter, search_from)
+            if idx < 0:
+                search_from = max(start, len(buffer) - len(delimiter) + 1)
+                break
+            marker_start = idx + len(delimiter)
+            if len(buffer) < marker_start + len(_CLOSE_MARKER):
+                search_from = idx
+                break
+            if self._in_part:
+                parts.append(_decode_part(buffer, start, idx))
+            start = marker_start
+            search_from = marker_start
+            self._in_part = True
+            if buffer[marker_start : marker_start + 2] == _CLOSE_MARKER:
+                self._finished = True
+                break
+        if self._finished:
+            buffer.clear()
+            self._search_from = 0
+        else:
+            del buffer[:start]
+            self._search_from = search_from - start
+        return parts
+
+
 def encode_multipart_mixed(
     parts: list[MultipartPart],
     boundary: str | None = None,
@@ -53,20 +267,8 @@ def encode_multipart_mixed(
     tuple[bytes, str]
         A tuple of (body_bytes, content_type_header)
     """
-    if boundary is None:
-        boundary = uuid.uuid4().hex
-    segments = []
-    for part in parts:
-        segment = f"--{boundary}\r\n".encode()
-        for name, value in part.headers.items():
-            segment += f"{name}: {value}\r\n".encode()
-        segment += b"\r\n"
-        segment += part.content
-        segment += b"\r\n"
-        segments.append(segment)
-    body = b"".join(segments) + f"--{boundary}--\r\n".encode()
-    content_type = f"multipart/mixed; boundary={boundary}"
-    return body, content_type
+    stream = MultipartStream(parts, boundary)
+    return b"".join(stream), stream.content_type
 
 
 def decode_multipart_mixed(
@@ -87,26 +289,80 @@ def decode_multipart_mixed(
     list[MultipartPart]
         The parsed parts
     """
-    boundary = _extract_boundary(content_type)
-    delimiter = f"\r\n--{boundary}".encode()
-    pieces = content.split(delimiter)
-    first = f"--{boundary}\r\n".encode()
-    if pieces[0].startswith(first):
-        pieces[0] = pieces[0][len(first) :]
+    return MultipartDecoder(content_type).feed(content)
+
+
+def iter_multipart_mixed(
+    chunks: Iterable[bytes],
+    content_type: str,
+) -> Iterator[MultipartPart]:
+    """Parse a multipart/mixed body stream into parts as they arrive.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The raw multipart body chunks (e.g. ``Response.iter_bytes()``)
+    content_type : str
+        The Content-Type header value containing the boundary
+
+    Returns
+    -------
+    Iterator[MultipartPart]
+        The parsed parts, yielded as soon as each one is complete
+    """
+    decoder = MultipartDecoder(content_type)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+        if decoder.finished:
+            return
+
+
+async def aiter_multipart_mixed(
+    chunks: AsyncIterable[bytes],
+    content_type: str,
+) -> AsyncIterator[MultipartPart]:
+    """Parse a multipart/mixed body stream into parts as they arrive.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        The raw multipart body chunks (e.g. ``Response.aiter_bytes()``)
+    content_type : str
+        The Content-Type header value containing the boundary
+
+    Returns
+    -------
+    AsyncIterator[MultipartPart]
+        The parsed parts, yielded as soon as each one is complete
+    """
+    decoder = MultipartDecoder(content_type)
+    async for chunk in chunks:
+        for part in decoder.feed(chunk):
+            yield part
+        if decoder.finished:
+            return
+
+
+def _decode_part(
+    buffer: bytes | bytearray,
+    start: int,
+    end: int,
+) -> MultipartPart:
+    """Decode a single part located between two delimiters of a buffer."""
+    if buffer.startswith(_CRLF, start):
+        start += len(_CRLF)
+    headers_end = buffer.find(_HEADERS_END, start, end)
+    if headers_end < 0:
+        header_block = bytes(buffer[start:end])
+        body = b""
     else:
-        pieces.pop(0)
-    # Last piece is "--\r\n" (closing marker)
-    pieces.pop()
-    parts = []
-    for raw in pieces:
-        chunk = raw[2:] if raw.startswith(b"\r\n") else raw
-        header_block, _, body = chunk.partition(b"\r\n\r\n")
-        headers = {}
-        for line in header_block.split(b"\r\n"):
-            name, _, value = line.partition(b": ")
-            headers[name.decode()] = value.decode()
-        parts.append(MultipartPart(headers=headers, content=body))
-    return parts
+        header_block = bytes(buffer[start:headers_end])
+        body = bytes(buffer[headers_end + len(_HEADERS_END) : end])
+    headers = {}
+    for line in header_block.split(_CRLF):
+        name, _, value = line.partition(b": ")
+        headers[name.decode()] = value.decode()
+    return MultipartPart(headers=headers, content=body)
 
 
 def _extract_boundary(content_type: str) -> str:
@@ -5,10 +5,11 @@ Provides parsed document operations on MarkLogic.
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import closing
 from typing import TYPE_CHECKING, Any
 
-from httpx import Response
+from httpx import Headers, Response
 
 from mlclient import constants
 from mlclient.calls import DocumentsDeleteCall, DocumentsGetCall, DocumentsPostCall
@@ -20,10 +21,16 @@ if TYPE_CHECKING:
 
 from mlclient.mimetypes import Mimetypes
 from mlclient.ml_response_parser import MLResponseParser
-from mlclient.models import Document, Metadata, MetadataDocument
+from mlclient.models import BinaryDocument, Document, Metadata, MetadataDocument
 from mlclient.models.http import Category
 from mlclient.models.http import DocumentsBodyPart as BodyPart
-from mlclient.models.http import DocumentsDisposition as Disposition
+from mlclient.models.http import DocumentsBodyPartType as BodyPartType
+from mlclient.models.http import DocumentsDispositionRecord as DispositionRecord
+from mlclient.multipart import (
+    MultipartPart,
+    aiter_multipart_mixed,
+    iter_multipart_mixed,
+)
 
 _MAX_QUERY_BYTES = 48 * 1024
 """Soft limit on the total size of ``uri=...`` query parameters per request.
@@ -129,6 +136,7 @@ class DocumentsService:
             body_parts=body_parts,
             database=database,
             temporal_collection=temporal_collection,
+            stream=True,
         )
         resp = self._api.call(call)
         if not resp.is_success:
@@ -142,6 +150,7 @@ class DocumentsService:
         *,
         category: Category | str | list[Category | str] | None = None,
         database: str | None = None,
+        timestamp: str | None = None,
     ) -> Document | dict[str, Document]:
         """Return document(s) content or metadata from a MarkLogic database.
 
@@ -156,6 +165,8 @@ class DocumentsService:
             The category of data to fetch about the requested document.
         database : str | None, default None
             Perform this operation on the named content database.
+        timestamp : str | None, default None
+            A point-in-time timestamp to read documents at.
 
         Returns
         -------
@@ -171,8 +182,13 @@ class DocumentsService:
             uris,
             category=category,
             database=database,
+            timestamp=timestamp,
         )
-        return next(docs) if isinstance(uris, str) else {doc.uri: doc for doc in docs}
+        if isinstance(uris, str):
+            # Close the stream to release its connection after the first document
+            with closing(docs):
+                return next(docs)
+        return {doc.uri: doc for doc in docs}
 
     def read_stream(
         self,
@@ -180,12 +196,15 @@ class DocumentsService:
         *,
         category: Category | str | list[Category | str] | None = None,
         database: str | None = None,
+        timestamp: str | None = None,
     ) -> Iterator[Document]:
         """Return document(s) as an iterator, suitable for batch processing.
 
         Unlike read(), does not materialize results into a dict. URIs are
         transparently split into batches whose combined query string stays below
         the httpx URL length limit; each batch is a separate HTTP request.
+        Multipart responses are decoded while they are being received, so each
+        document is yielded as soon as its body part is complete.
 
         Parameters
         ----------
@@ -195,6 +214,8 @@ class DocumentsService:
             The category of data to fetch about the requested document.
         database : str | None, default None
             Perform this operation on the named content database.
+        timestamp : str | None, default None
+            A point-in-time timestamp to read documents at.
 
         Returns
         -------
@@ -213,12 +234,14 @@ class DocumentsService:
                 category=category,
                 database=database,
                 data_format="json",
+                timestamp=timestamp,
             )
-            resp = self._api.call(call)
-            if not resp.is_success:
-                resp_body = MLResponseParser.parse(resp)
-                raise MarkLogicError(resp_body["errorResponse"])
-            yield from DocumentsReader.parse(resp, batch, category)
+            with self._api.stream(call) as resp:
+                if not resp.is_success:
+                    resp.read()
+                    resp_body = MLResponseParser.parse(resp)
+                    raise MarkLogicError(resp_body["errorResponse"])
+                yield from DocumentsReader.parse_stream(resp, batch, category)
 
     def delete(
         self,
@@ -301,16 +324,24 @@ class DocumentsSender:
         cls,
         document: Document,
     ) -> BodyPart:
-        """Instantiate BodyPart with Document's content."""
+        """Instantiate BodyPart with Document's content.
+
+        File-backed binary content is passed as-is to be streamed on send.
+        """
+        # Document.__subclasshook__ makes isinstance() match every document type
+        if BinaryDocument in type(document).__mro__:
+            content = document.content_source
+        else:
+            content = document.content_bytes
         return BodyPart(
             **{
                 "content-type": Mimetypes.get_mimetype(document.uri),
-                "content-disposition": {
-                    "type": "attachment",
-                    "filename": document.uri,
-                    "format": document.doc_type,
-                },
-                "content": document.content_bytes,
+                "content-disposition": DispositionRecord(
+                    type_=BodyPartType.ATTACHMENT,
+                    filename=document.uri,
+                    format_=document.doc_type,
+                ),
+                "content": content,
             },
         )
 
@@ -323,11 +354,11 @@ class DocumentsSender:
         return BodyPart(
             **{
                 "content-type": constants.HEADER_JSON,
-                "content-disposition": {
-                    "type": "attachment",
-                    "filename": document.uri,
-                    "category": "metadata",
-                },
+                "content-disposition": DispositionRecord(
+                    type_=BodyPartType.ATTACHMENT,
+                    filename=document.uri,
+                    category=Category.METADATA,
+                ),
                 "content": document.metadata.to_json_string(),
             },
         )
@@ -341,10 +372,10 @@ class DocumentsSender:
         return BodyPart(
             **{
                 "content-type": constants.HEADER_JSON,
-                "content-disposition": {
-                    "type": "inline",
-                    "category": "metadata",
-                },
+                "content-disposition": DispositionRecord(
+                    type_=BodyPartType.INLINE,
+                    category=Category.METADATA,
+                ),
                 "content": metadata.to_json_string(),
             },
         )
@@ -367,6 +398,61 @@ class DocumentsReader:
         documents_data = cls._pre_format_data(parsed_resp, is_multipart, uris, category)
         return cls._parse_to_documents(documents_data)
 
+    @classmethod
+    def parse_stream(
+        cls,
+        resp: Response,
+        uris: str | list[str] | tuple[str] | set[str],
+        category: str | list[str] | None,
+    ) -> Iterator[Document]:
+        """Parse a streamed MarkLogic response to Documents part by part.
+
+        A multipart/mixed body is decoded incrementally from
+        ``Response.iter_bytes()``; any other response is read fully and parsed
+        with ``parse()``.
+        """
+        content_type = resp.headers.get(constants.HEADER_NAME_CONTENT_TYPE, "")
+        if not content_type.startswith(constants.HEADER_MULTIPART_MIXED):
+            resp.read()
+            yield from cls.parse(resp, uris, category)
+            return
+        parts = iter_multipart_mixed(resp.iter_bytes(), content_type)
+        parsed_parts = (cls._parse_part(part) for part in parts)
+        documents_data = cls._pre_format_documents(parsed_parts, category)
+        yield from cls._parse_to_documents(documents_data)
+
+    @classmethod
+    async def aparse_stream(
+        cls,
+        resp: Response,
+        uris: str | list[str] | tuple[str] | set[str],
+        category: str | list[str] | None,
+    ) -> AsyncIterator[Document]:
+        """Parse an async streamed MarkLogic response to Documents part by part.
+
+        A multipart/mixed body is decoded incrementally from
+        ``Response.aiter_bytes()``; any other response is read fully and parsed
+        with ``parse()``.
+        """
+        content_type = resp.headers.get(constants.HEADER_NAME_CONTENT_TYPE, "")
+        if not content_type.startswith(constants.HEADER_MULTIPART_MIXED):
+            await resp.aread()
+            for doc in cls.parse(resp, uris, category):
+                yield doc
+            return
+        expect_content, expect_metadata = cls._expect_categories(category)
+        pending_data = {}
+        async for part in aiter_multipart_mixed(resp.aiter_bytes(), content_type):
+            headers, body = cls._parse_part(part)
+            document_data = cls._pre_format_part(
+                headers,
+                body,
+                expect_content and expect_metadata,
+                pending_data,
+            )
+            if document_data is not None:
+                yield cls._parse_to_document(document_data)
+
     @classmethod
     def _parse_response(
         cls,
@@ -394,30 +480,62 @@ class DocumentsReader:
             return cls._pre_format_documents(parsed_resp, category)
         return cls._pre_format_document(parsed_resp, uris, category)
 
+    @classmethod
+    def _parse_part(
+        cls,
+        part: MultipartPart,
+    ) -> tuple[Headers, bytes]:
+        """Return a streamed body part as a (headers, raw content) tuple."""
+        return Headers(part.headers), part.content
+
     @classmethod
     def _pre_format_documents(
         cls,
-        parsed_resp: list[tuple],
+        parsed_resp: Iterable[tuple],
         origin_category: str | list[str] | None,
     ) -> Iterator[dict]:
         """Prepare document parts to initialize Document instances."""
         expect_content, expect_metadata = cls._expect_categories(origin_category)
         pre_formatted_data = {}
         for headers, parse_resp_body in parsed_resp:
-            raw_content_disp = headers.get(constants.HEADER_NAME_CONTENT_DISP)
-            content_disp = Disposition.from_header(raw_content_disp)
-            partial_data = cls._get_partial_data(content_disp, parse_resp_body)
-
-            if not (expect_content and expect_metadata):
-                yield partial_data
-            elif content_disp.filename not in pre_formatted_data:
-                pre_formatted_data[content_disp.filename] = partial_data
-            elif content_disp.category == Category.CONTENT:
-                pre_formatted_data[content_disp.filename].update(partial_data)
-                yield pre_formatted_data[content_disp.filename]
-            else:
-                partial_data.update(pre_formatted_data[content_disp.filename])
-                yield partial_data
+            document_data = cls._pre_format_part(
+                headers,
+                parse_resp_body,
+                expect_content and expect_metadata,
+                pre_formatted_data,
+            )
+            if document_data is not None:
+                yield document_data
+
+    @classmethod
+    def _pre_format_part(
+        cls,
+        headers: Headers,
+        parsed_resp_body: Any,
+        pair_parts: bool,
+        pre_formatted_data: dict[str, dict],
+    ) -> dict | None:
+        """Prepare a single document part, pairing content with metadata.
+
+        When both content and metadata are expected, the first part of a
+        document is kept in ``pre_formatted_data`` until its counterpart
+        arrives; None is returned until the document is complete.
+        """
+        raw_content_disp = headers.get(constants.HEADER_NAME_CONTENT_DISP)
+        content_disp = DispositionRecord.from_header(raw_content_disp)
+        partial_data = cls._get_partial_data(content_disp, parsed_resp_body)
+
+        if not pair_parts:
+            return partial_data
+        if content_disp.filename not in pre_formatted_data:
+            pre_formatted_data[content_disp.filename] = partial_data
+            return None
+        if content_disp.category == Category.CONTENT:
+            document_data = pre_formatted_data.pop(content_disp.filename)
+            document_data.update(partial_data)
+            return document_data
+        partial_data.update(pre_formatted_data.pop(content_disp.filename))
+        return partial_data
 
     @classmethod
     def _pre_format_document(
@@ -467,7 +585,7 @@ class DocumentsReader:
     @classmethod
     def _get_partial_data(
         cls,
-        content_disp: Disposition,
+        content_disp: DispositionRecord,
         parsed_resp_body: Any,
     ) -> dict:
         """Return pre-formatted partial data."""
@@ -534,6 +652,7 @@ class AsyncDocumentsService:
             body_parts=body_parts,
             database=database,
             temporal_collection=temporal_collection,
+            stream=True,
         )
         resp = await self._api.call(call)
         if not resp.is_success:
@@ -547,15 +666,21 @@ class AsyncDocumentsService:
         *,
         category: Category | str | list[Category | str] | None = None,
         database: str | None = None,
+        timestamp: str | None = None,
     ) -> Document | dict[str, Document]:
         """Read documents from MarkLogic."""
         stream = self.read_stream(
             uris,
             category=category,
             database=database,
+            timestamp=timestamp,
         )
         if isinstance(uris, str):
-            return await stream.__anext__()
+            # Close the stream to release its connection after the first document
+            try:
+                return await stream.__anext__()
+            finally:
+                await stream.aclose()
         return {doc.uri: doc async for doc in stream}
 
     async def read_stream(
@@ -564,12 +689,15 @@ class AsyncDocumentsService:
         *,
         category: Category | str | list[Category | str] | None = None,
         database: str | None = None,
+        timestamp: str | None = None,
     ) -> AsyncIterator[Document]:
         """Read documents from MarkLogic as a stream.
 
         URIs are transparently split into batches whose combined query string
         stays below the httpx URL length limit; each batch is awaited
-        separately so iteration remains lazy.
+        separately so iteration remains lazy. Multipart responses are decoded
+        while they are being received, so each document is yielded as soon as
+        its body part is complete.
         """
         category = _normalize_category(category)
         for batch in _batched_uris(uris):
@@ -578,13 +706,15 @@ class AsyncDocumentsService:
                 category=category,
                 database=database,
                 data_format="json",
+                timestamp=timestamp,
             )
-            resp = await self._api.call(call)
-            if not resp.is_success:
-                resp_body = MLResponseParser.parse(resp)
-                raise MarkLogicError(resp_body["errorResponse"])
-            for doc in DocumentsReader.parse(resp, batch, category):
-                yield doc
+            async with self._api.stream(call) as resp:
+                if not resp.is_success:
+                    await resp.aread()
+                    resp_body = MLResponseParser.parse(resp)
+                    raise MarkLogicError(resp_body["errorResponse"])
+                async for doc in DocumentsReader.aparse_stream(resp, batch, category):
+                    yield doc
 
     async def delete(
         self,
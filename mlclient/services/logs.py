@@ -10,6 +10,7 @@ from collections.abc import Iterator
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from mlclient import json_codec
 from mlclient.calls import LogsCall
 from mlclient.clients.api_client import ApiClient
 from mlclient.exceptions import InvalidLogTypeError, MarkLogicError
@@ -108,7 +109,7 @@ class LogsService:
         )
 
         resp = self._api.call(call)
-        resp_body = resp.json()
+        resp_body = json_codec.loads(resp.content)
         if not resp.is_success:
             raise MarkLogicError(resp_body["errorResponse"])
 
@@ -138,7 +139,7 @@ class LogsService:
         call = self._get_call(host=host)
 
         resp = self._api.call(call)
-        resp_body = resp.json()
+        resp_body = json_codec.loads(resp.content)
         if "errorResponse" in resp_body:
             raise MarkLogicError(resp_body["errorResponse"])
 
@@ -287,7 +288,7 @@ class AsyncLogsService(LogsService):
         )
 
         resp = await self._api.call(call)
-        resp_body = resp.json()
+        resp_body = json_codec.loads(resp.content)
         if not resp.is_success:
             raise MarkLogicError(resp_body["errorResponse"])
 
@@ -301,7 +302,7 @@ class AsyncLogsService(LogsService):
         call = self._get_call(host=host)
 
         resp = await self._api.call(call)
-        resp_body = resp.json()
+        resp_body = json_codec.loads(resp.content)
         if "errorResponse" in resp_body:
             raise MarkLogicError(resp_body["errorResponse"])
 
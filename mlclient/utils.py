@@ -19,10 +19,9 @@ It also exports a single class:
 from __future__ import annotations
 
 import importlib.resources as pkg_resources
-import json
 from typing import Any, TextIO
 
-from mlclient import constants, exceptions
+from mlclient import constants, exceptions, json_codec
 from mlclient import resources as data
 from mlclient.exceptions import ResourceNotFoundError
 
@@ -80,7 +79,7 @@ def get_content_type_header_for_data(
     if isinstance(content, dict):
         return constants.HEADER_JSON
     try:
-        json.loads(content)
+        json_codec.loads(content)
     except ValueError:
         return constants.HEADER_XML
     else:
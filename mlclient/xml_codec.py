@@ -0,0 +1,377 @@
+"""The XML Codec module.
+
+It provides a single entry point for XML parsing and serialization within MLClient.
+The standard library ElementTree is used by default. When lxml is installed,
+it can be enabled at runtime for faster C parsing and serialization and for
+real XPath 1.0 support with compiled expressions cached:
+    * fromstring
+        Parse an XML document to its root element.
+    * parse
+        Parse an XML document to an element tree.
+    * to_tree
+        Wrap an element in an element tree.
+    * tostring
+        Serialize an element to UTF-8 encoded bytes.
+    * is_element
+        Verify if an object is an XML element of any backend.
+    * is_tree
+        Verify if an object is an XML element tree of any backend.
+    * xpath
+        Evaluate an XPath expression against an element or an element tree.
+    * iterparse
+        Parse an XML document incrementally.
+    * get_backend
+        Return the name of the active XML backend.
+    * set_backend
+        Switch the XML backend.
+
+Examples
+--------
+>>> from mlclient import xml_codec
+>>> xml_codec.set_backend("lxml")
+>>> tree = xml_codec.parse(b"<root><child>data</child></root>")
+>>> [child.text for child in xml_codec.xpath(tree, "//child[text()='data']")]
+['data']
+"""
+
+from __future__ import annotations
+
+import threading
+import xml.etree.ElementTree as ElemTree
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import IO, Any, ClassVar
+
+from mlclient.exceptions import WrongParametersError
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+ETREE_BACKEND = "etree"
+LXML_BACKEND = "lxml"
+
+
+class _EtreeBackend:
+    """The standard library ElementTree backend."""
+
+    NAME: ClassVar[str] = ETREE_BACKEND
+
+    @staticmethod
+    def fromstring(
+        data: bytes | str,
+    ) -> ElemTree.Element:
+        return ElemTree.fromstring(data)
+
+    @staticmethod
+    def to_tree(
+        element: ElemTree.Element,
+    ) -> ElemTree.ElementTree:
+        return ElemTree.ElementTree(element)
+
+    @staticmethod
+    def iterparse(
+        source: IO[bytes],
+        tag: str | None,
+    ) -> Iterator[ElemTree.Element]:
+        for _, element in ElemTree.iterparse(source, events=("end",)):
+            if tag is None or element.tag == tag:
+                yield element
+                element.clear()
+
+
+class _LxmlBackend:
+    """The lxml backend.
+
+    String documents are parsed as UTF-8, whatever their XML declaration says,
+    with thread-local parsers (lxml parsers must not be shared between threads).
+    """
+
+    NAME: ClassVar[str] = LXML_BACKEND
+
+    _PARSERS: ClassVar[threading.local] = threading.local()
+
+    @classmethod
+    def fromstring(
+        cls,
+        data: bytes | str,
+    ) -> Any:
+        if isinstance(data, str):
+            return lxml_etree.fromstring(data.encode("utf-8"), cls._str_parser())
+        return lxml_etree.fromstring(data)
+
+    @staticmethod
+    def to_tree(
+        element: Any,
+    ) -> Any:
+        return element.getroottree()
+
+    @staticmethod
+    def iterparse(
+        source: IO[bytes],
+        tag: str | None,
+    ) -> Iterator[Any]:
+        for _, element in lxml_etree.iterparse(source, events=("end",), tag=tag):
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    @classmethod
+    def _str_parser(
+        cls,
+    ) -> Any:
+        parser = getattr(cls._PARSERS, "parser", None)
+        if parser is None:
+            parser = lxml_etree.XMLParser(encoding="utf-8")
+            cls._PARSERS.parser = parser
+        return parser
+
+
+_BACKENDS = {
+    ETREE_BACKEND: _EtreeBackend,
+    LXML_BACKEND: _LxmlBackend,
+}
+
+
+class _Codec:
+    """The active XML backend holder."""
+
+    backend: ClassVar[type] = _EtreeBackend
+
+
+def fromstring(
+    data: bytes | str,
+) -> Any:
+    """Parse an XML document to its root element.
+
+    Parameters
+    ----------
+    data : bytes | str
+        An XML document
+
+    Returns
+    -------
+    Any
+        A root element (ElemTree.Element, or an lxml element)
+    """
+    return _Codec.backend.fromstring(data)
+
+
+def parse(
+    data: bytes | str,
+) -> Any:
+    """Parse an XML document to an element tree.
+
+    Parameters
+    ----------
+    data : bytes | str
+        An XML document
+
+    Returns
+    -------
+    Any
+        An element tree (ElemTree.ElementTree, or an lxml element tree)
+    """
+    return to_tree(fromstring(data))
+
+
+def to_tree(
+    element: Any,
+) -> Any:
+    """Wrap an element in an element tree of the element's backend.
+
+    Parameters
+    ----------
+    element : Any
+        An XML element
+
+    Returns
+    -------
+    Any
+        An element tree
+    """
+    return _backend_of(element).to_tree(element)
+
+
+def tostring(
+    element: Any,
+    xml_declaration: bool = False,
+) -> bytes:
+    """Serialize an element to UTF-8 encoded bytes.
+
+    Parameters
+    ----------
+    element : Any
+        An XML element of any backend
+    xml_declaration : bool, default False
+        Whether to prepend an XML declaration
+
+    Returns
+    -------
+    bytes
+        A serialized element
+    """
+    impl = lxml_etree if _backend_of(element) is _LxmlBackend else ElemTree
+    return impl.tostring(element, encoding="UTF-8", xml_declaration=xml_declaration)
+
+
+def is_element(
+    obj: Any,
+) -> bool:
+    """Verify if an object is an XML element of any backend.
+
+    Parameters
+    ----------
+    obj : Any
+        An object to verify
+
+    Returns
+    -------
+    bool
+        True if the object is an XML element
+    """
+    if isinstance(obj, ElemTree.Element):
+        return True
+    return lxml_etree is not None and lxml_etree.iselement(obj)
+
+
+def is_tree(
+    obj: Any,
+) -> bool:
+    """Verify if an object is an XML element tree of any backend.
+
+    Parameters
+    ----------
+    obj : Any
+        An object to verify
+
+    Returns
+    -------
+    bool
+        True if the object is an XML element tree
+    """
+    if isinstance(obj, ElemTree.ElementTree):
+        return True
+    return (
+        lxml_etree is not None
+        and hasattr(obj, "getroot")
+        and lxml_etree.iselement(obj.getroot())
+    )
+
+
+def xpath(
+    node: Any,
+    expr: str,
+    namespaces: dict[str, str] | None = None,
+) -> list:
+    """Evaluate an XPath expression against an element or an element tree.
+
+    lxml nodes are evaluated with real XPath 1.0, using compiled expressions
+    cached by expression and namespaces. ElementTree nodes support the limited
+    XPath syntax of ``findall``.
+
+    Parameters
+    ----------
+    node : Any
+        An element or an element tree
+    expr : str
+        An XPath expression
+    namespaces : dict[str, str] | None, default None
+        Namespace prefix-to-URI mappings used in the expression
+
+    Returns
+    -------
+    list
+        Matching nodes
+    """
+    if _backend_of(node) is _LxmlBackend:
+        namespaces_key = tuple(sorted((namespaces or {}).items()))
+        return _compile_xpath(expr, namespaces_key, threading.get_ident())(node)
+    return node.findall(expr, namespaces)
+
+
+def iterparse(
+    source: IO[bytes],
+    tag: str | None = None,
+) -> Iterator[Any]:
+    """Parse an XML document incrementally.
+
+    Every yielded element is cleared once the iteration moves on, so large
+    documents can be processed without building the whole tree.
+
+    Parameters
+    ----------
+    source : IO[bytes]
+        A binary file-like object
+    tag : str | None, default None
+        A (Clark notation) tag of elements to yield; all elements if None
+
+    Returns
+    -------
+    Iterator[Any]
+        Parsed elements, in document order of their end tags
+    """
+    return _Codec.backend.iterparse(source, tag)
+
+
+def get_backend() -> str:
+    """Return the name of the active XML backend.
+
+    Returns
+    -------
+    str
+        A backend name: etree or lxml
+    """
+    return _Codec.backend.NAME
+
+
+def set_backend(
+    name: str,
+):
+    """Switch the XML backend.
+
+    Documents parsed before the switch keep working - every function
+    dispatches on the backend of the node it receives.
+
+    Parameters
+    ----------
+    name : str
+        A backend name: etree or lxml
+
+    Raises
+    ------
+    WrongParametersError
+        If the backend is unknown or lxml is not installed
+    """
+    if name not in _BACKENDS:
+        msg = f"Unknown XML backend [{name}]! Available: {', '.join(_BACKENDS)}"
+        raise WrongParametersError(msg)
+    if name == LXML_BACKEND and lxml_etree is None:
+        msg = "The lxml backend requires the lxml package to be installed!"
+        raise WrongParametersError(msg)
+    _Codec.backend = _BACKENDS[name]
+
+
+def _backend_of(
+    node: Any,
+) -> type:
+    """Return a backend a node has been created with."""
+    if isinstance(node, (ElemTree.Element, ElemTree.ElementTree)):
+        return _EtreeBackend
+    return _LxmlBackend
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(
+    expr: str,
+    namespaces: tuple[tuple[str, str], ...],
+    _thread_id: int,
+) -> Any:
+    """Compile an XPath expression with lxml.
+
+    Compiled expressions are cached per thread, as lxml evaluators must not be
+    used concurrently.
+    """
+    return lxml_etree.XPath(expr, namespaces=dict(namespaces))
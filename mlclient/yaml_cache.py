@@ -0,0 +1,199 @@
+"""The ML YAML Cache module.
+
+It exports functions loading YAML files through a cache of parsed contents:
+    * load_file
+        Return parsed contents of a YAML file.
+    * load_resource
+        Return parsed contents of an MLClient YAML resource.
+    * get_cache_dir
+        Return a directory of parsed YAML files shared between processes.
+
+Parsed contents are kept in memory, and parsed MLClient resources also in JSON
+files of the cache directory, so that short-lived processes (e.g. CLI calls
+in shell scripts) neither import nor run the YAML parser until a resource
+changes. A cached file is used only if the modification time and the size
+of its source match. Other YAML files (e.g. environment configurations holding
+credentials) are cached on disk only when MLCLIENT_CACHE_DIR is set, and such
+cached files are readable by their owner only.
+
+Examples
+--------
+>>> from mlclient import yaml_cache
+>>> config = yaml_cache.load_file(".mlclient/mlclient-local.yaml")
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import importlib.resources as pkg_resources
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from mlclient import json_codec
+from mlclient import resources as data
+from mlclient.exceptions import ResourceNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# An environment variable overriding the cache directory; empty to disable it.
+# When set, parsed YAML files other than MLClient resources are cached there too.
+CACHE_DIR_ENV_VAR = "MLCLIENT_CACHE_DIR"
+
+_MEMORY_CACHE: dict[tuple[str, int, int], Any] = {}
+
+
+def load_file(
+    file_path: str | Path,
+) -> Any:
+    """Return parsed contents of a YAML file.
+
+    It is cached on disk only when MLCLIENT_CACHE_DIR is set, as the file may
+    hold credentials.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        A YAML file path
+
+    Returns
+    -------
+    Any
+        Parsed contents (a copy, safe to modify)
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    return _load(file_path, Path(cache_dir) if cache_dir else None)
+
+
+def load_resource(
+    resource_name: str,
+) -> Any:
+    """Return parsed contents of an MLClient YAML resource.
+
+    Parameters
+    ----------
+    resource_name : str
+        A name of a resource in mlclient.resources package
+
+    Returns
+    -------
+    Any
+        Parsed contents (a copy, safe to modify)
+
+    Raises
+    ------
+    ResourceNotFoundError
+        If the resource does not exist
+    """
+    resource = pkg_resources.files(data).joinpath(resource_name)
+    if not resource.is_file():
+        raise ResourceNotFoundError(resource_name)
+    with pkg_resources.as_file(resource) as resource_path:
+        return _load(resource_path, get_cache_dir())
+
+
+def get_cache_dir() -> Path | None:
+    """Return a directory of parsed YAML files shared between processes.
+
+    It is MLCLIENT_CACHE_DIR if set (an empty value disables the directory),
+    or mlclient under XDG_CACHE_HOME (~/.cache by default).
+
+    Returns
+    -------
+    Path | None
+        A cache directory; None when disabled
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir is not None:
+        return Path(cache_dir) if cache_dir else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "mlclient"
+
+
+def _load(
+    file_path: str | Path,
+    cache_dir: Path | None,
+) -> Any:
+    """Return parsed contents of a YAML file, cached in a directory if given."""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    key = (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+    if key not in _MEMORY_CACHE:
+        cache_file = _cache_file(cache_dir, key[0])
+        found, contents = _read_cached(cache_file, key)
+        if not found:
+            contents = _parse(path.read_text(encoding="utf-8"))
+            _write_cached(cache_file, key, contents)
+        _MEMORY_CACHE[key] = contents
+    return copy.deepcopy(_MEMORY_CACHE[key])
+
+
+def _parse(
+    text: str,
+) -> Any:
+    """Parse YAML with the libyaml-based loader, if available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
+def _cache_file(
+    cache_dir: Path | None,
+    source: str,
+) -> Path | None:
+    """Return a cache file of a YAML file."""
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(source.encode()).hexdigest()[:32]
+    return cache_dir / f"{digest}.json"
+
+
+def _read_cached(
+    cache_file: Path | None,
+    key: tuple[str, int, int],
+) -> tuple[bool, Any]:
+    """Return parsed contents from a cache file, if up to date."""
+    if cache_file is None:
+        return False, None
+    try:
+        cached = json_codec.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(cached, dict):
+        return False, None
+    if (cached.get("source"), cached.get("mtime_ns"), cached.get("size")) != key:
+        return False, None
+    return True, cached["contents"]
+
+
+def _write_cached(
+    cache_file: Path | None,
+    key: tuple[str, int, int],
+    contents: Any,
+):
+    """Write parsed contents to a cache file, if JSON can hold them."""
+    if cache_file is None:
+        return
+    source, mtime_ns, size = key
+    cached = {
+        "source": source,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "contents": contents,
+    }
+    try:
+        serialized = json_codec.dumps(cached)
+        # YAML-only types (e.g. dates) would come back from JSON as other types
+        if json_codec.loads(serialized)["contents"] != contents:
+            return
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        with os.fdopen(os.open(temp_file, flags, 0o600), "w", encoding="utf-8") as f:
+            f.write(serialized)
+        temp_file.replace(cache_file)
+    except (OSError, TypeError, ValueError):
+        logger.debug("Unable to cache parsed YAML file [%s]", source, exc_info=True)
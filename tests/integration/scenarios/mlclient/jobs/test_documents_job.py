@@ -45,6 +45,7 @@ def test_read_job_with_documents_output():
         job = ReadDocumentsJob()
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
+        job.with_documents_output()
         job.run_sync()
         read_docs = job.documents
         for actual_doc in read_docs:
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from tests.utils.ml_server import MLStandInConfig, MLStandInServer
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ml-server", "MarkLogic server of performance tests")
+    group.addoption(
+        "--ml-server",
+        choices=("live", "stand-in"),
+        default="live",
+        help="run against a live MarkLogic or an offline stand-in (default: live)",
+    )
+    group.addoption(
+        "--ml-latency",
+        type=float,
+        default=0.0,
+        help="seconds added by the stand-in to every response",
+    )
+    group.addoption(
+        "--ml-bandwidth",
+        type=int,
+        default=None,
+        help="bytes per second transferred by the stand-in in each direction",
+    )
+    group.addoption(
+        "--ml-error-rate",
+        type=float,
+        default=0.0,
+        help="a fraction of stand-in /v1 requests failing with 503",
+    )
+    group.addoption(
+        "--ml-restart-every",
+        type=int,
+        default=None,
+        help="a number of stand-in /v1 requests after which it restarts",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ml_server(
+    request: pytest.FixtureRequest,
+):
+    if request.config.getoption("--ml-server") == "live":
+        yield None
+        return
+    config = MLStandInConfig(
+        latency=request.config.getoption("--ml-latency"),
+        bandwidth=request.config.getoption("--ml-bandwidth"),
+        error_rate=request.config.getoption("--ml-error-rate"),
+        restart_every=request.config.getoption("--ml-restart-every"),
+    )
+    with MLStandInServer(config) as server:
+        yield server
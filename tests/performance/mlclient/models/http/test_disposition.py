@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.models.http import DocumentsDisposition as Disposition
+from mlclient.models.http import DocumentsDispositionRecord as DispositionRecord
+
+NUMBER_OF_HEADERS = 1000
+HEADERS = [
+    pytest.param('attachment; filename="/doc-{}.xml"; format=xml', id="content"),
+    pytest.param(
+        'attachment; filename="/doc-{}.xml"; category=collections; '
+        "category=permissions; category=quality; format=json",
+        id="metadata",
+    ),
+    pytest.param("inline; category=metadata", id="default-metadata"),
+]
+MODELS = [
+    pytest.param(Disposition, id="model"),
+    pytest.param(DispositionRecord, id="record"),
+]
+
+
+@pytest.mark.parametrize("header", HEADERS)
+@pytest.mark.parametrize("model", MODELS)
+def test_parsing_disposition(benchmark, model, header):
+    headers = [header.format(i) for i in range(NUMBER_OF_HEADERS)]
+
+    dispositions = benchmark(_parse_dispositions, model, headers)
+
+    assert len(dispositions) == NUMBER_OF_HEADERS
+
+
+@pytest.mark.parametrize("header", HEADERS)
+@pytest.mark.parametrize("model", MODELS)
+def test_serializing_disposition(benchmark, model, header):
+    headers = [header.format(i) for i in range(NUMBER_OF_HEADERS)]
+    dispositions = _parse_dispositions(model, headers)
+
+    serialized = benchmark(_serialize_dispositions, dispositions)
+
+    assert len(serialized) == NUMBER_OF_HEADERS
+
+
+def _parse_dispositions(
+    model: type,
+    headers: list[str],
+) -> list:
+    return [model.from_header(header) for header in headers]
+
+
+def _serialize_dispositions(
+    dispositions: list,
+) -> list[str]:
+    return [disposition.to_header() for disposition in dispositions]
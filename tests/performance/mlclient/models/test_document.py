@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.models import Document
+from tests.utils import corpora
+
+
+@pytest.mark.parametrize("doc_type", corpora.DOC_TYPES)
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_creating_documents(benchmark, corpus, doc_type):
+    count, size = corpus
+    contents = [corpora.content(i, size, doc_type) for i in range(count)]
+    uris = [corpora.uri(i, doc_type) for i in range(count)]
+
+    docs = benchmark(_create_documents, uris, contents, doc_type)
+
+    assert len(docs) == count
+
+
+@pytest.mark.parametrize("doc_type", corpora.DOC_TYPES)
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_creating_and_parsing_documents(benchmark, corpus, doc_type):
+    count, size = corpus
+    contents = [corpora.content(i, size, doc_type) for i in range(count)]
+    uris = [corpora.uri(i, doc_type) for i in range(count)]
+
+    docs = benchmark(_create_and_parse_documents, uris, contents, doc_type)
+
+    assert len(docs) == count
+
+
+def _create_documents(
+    uris: list[str],
+    contents: list[bytes],
+    doc_type,
+) -> list[Document]:
+    return [
+        Document.create(uri, content, doc_type=doc_type)
+        for uri, content in zip(uris, contents)
+    ]
+
+
+def _create_and_parse_documents(
+    uris: list[str],
+    contents: list[bytes],
+    doc_type,
+) -> list[Document]:
+    docs = _create_documents(uris, contents, doc_type)
+    for doc in docs:
+        assert doc.content is not None
+    return docs
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.models import Metadata
+from tests.utils import corpora
+
+NUMBER_OF_METADATA = 1000
+
+
+@pytest.fixture(scope="module")
+def metadata() -> list[Metadata]:
+    return [corpora.metadata(i) for i in range(NUMBER_OF_METADATA)]
+
+
+@pytest.mark.parametrize("data_format", ["json", "xml"])
+def test_parsing_metadata(benchmark, metadata, data_format):
+    raw = [_serialize(meta, data_format).encode() for meta in metadata]
+
+    parsed = benchmark(_parse_metadata, raw)
+
+    assert [sorted(meta.collections()) for meta in parsed] == [
+        sorted(meta.collections()) for meta in metadata
+    ]
+
+
+@pytest.mark.parametrize("data_format", ["json", "xml"])
+def test_serializing_metadata(benchmark, metadata, data_format):
+    serialized = benchmark(_serialize_metadata, metadata, data_format)
+
+    assert len(serialized) == NUMBER_OF_METADATA
+
+
+def _parse_metadata(
+    raw: list[bytes],
+) -> list[Metadata]:
+    parsed = [Metadata(raw=payload) for payload in raw]
+    for meta in parsed:
+        meta.quality()
+    return parsed
+
+
+def _serialize_metadata(
+    metadata: list[Metadata],
+    data_format: str,
+) -> list[str]:
+    return [_serialize(meta, data_format) for meta in metadata]
+
+
+def _serialize(
+    metadata: Metadata,
+    data_format: str,
+) -> str:
+    if data_format == "json":
+        return metadata.to_json_string()
+    return metadata.to_xml_string()
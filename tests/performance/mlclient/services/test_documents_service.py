@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from httpx import Response
+
+from mlclient.models import DocumentType
+from mlclient.services.documents import DocumentsReader, DocumentsSender
+from tests.utils import corpora
+
+
+@pytest.mark.parametrize("with_metadata", [False, True])
+@pytest.mark.parametrize("doc_type", corpora.DOC_TYPES)
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_sending_documents(benchmark, corpus, doc_type, with_metadata):
+    docs = corpora.documents(corpus, doc_type, with_metadata)
+
+    body_parts = benchmark(DocumentsSender.parse, docs)
+
+    assert len(body_parts) == corpus[0] * (2 if with_metadata else 1)
+
+
+@pytest.mark.parametrize("with_metadata", [False, True])
+@pytest.mark.parametrize("doc_type", corpora.DOC_TYPES)
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_reading_documents(benchmark, corpus, doc_type, with_metadata):
+    resp = corpora.response(corpus, doc_type, with_metadata)
+    uris = [corpora.uri(i, doc_type) for i in range(corpus[0])]
+    category = ["content", "metadata"] if with_metadata else None
+
+    docs = benchmark(_read_documents, resp, uris, category)
+
+    assert len(docs) == corpus[0]
+    assert all(doc.doc_type == doc_type for doc in docs)
+
+
+def _read_documents(
+    resp: Response,
+    uris: str | list[str],
+    category: list[str] | None,
+) -> list:
+    return list(DocumentsReader.parse(resp, uris, category))
+
+
+def test_reading_single_document(benchmark):
+    content = corpora.content(0, 10 * 1024)
+    headers = {
+        "Content-Type": "application/xml; charset=utf-8",
+        "vnd.marklogic.document-format": DocumentType.XML.value,
+    }
+    resp = Response(200, headers=headers, content=content)
+
+    docs = benchmark(_read_documents, resp, corpora.uri(0), None)
+
+    assert docs[0].content_bytes == content
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Target budgets (in seconds) of importing modules in a fresh interpreter
+IMPORT_TIME_BUDGETS = {
+    "mlclient": 0.1,
+    "mlclient.cli.app": 0.2,
+}
+IMPORT_TIME_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+__import__(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+
+
+def _import_time(
+    module: str,
+) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_TIME_SCRIPT, module],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.parametrize(("module", "budget"), IMPORT_TIME_BUDGETS.items())
+def test_import_time(benchmark, module, budget):
+    _import_time(module)  # warm up bytecode and parsed YAML caches
+    import_times = []
+
+    benchmark.pedantic(
+        lambda: import_times.append(_import_time(module)),
+        rounds=10,
+        iterations=1,
+    )
+
+    assert min(import_times) < budget
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+from httpx import Response
+
+from mlclient import json_codec
+from mlclient.calls import DocumentsPostCall
+from mlclient.models import JSONDocument
+from mlclient.multipart import MultipartPart, encode_multipart_mixed
+from mlclient.services.documents import DocumentsReader, DocumentsSender
+
+NUMBER_OF_DOCS = 1000
+BACKENDS = ["json", "auto", "orjson"]
+
+
+@pytest.fixture(params=BACKENDS)
+def _backend(request):
+    initial_backend = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(initial_backend)
+
+
+@pytest.fixture(scope="module")
+def documents_response() -> Response:
+    parts = [
+        MultipartPart(
+            headers={
+                "Content-Type": "application/json",
+                "Content-Disposition": (
+                    f'attachment; filename="/doc-{i}.json"; '
+                    "category=content; format=json"
+                ),
+            },
+            content=json_codec.dumps_bytes(_get_doc_content(i)),
+        )
+        for i in range(NUMBER_OF_DOCS)
+    ]
+    body, content_type = encode_multipart_mixed(parts)
+    return Response(200, headers={"Content-Type": content_type}, content=body)
+
+
+@pytest.mark.usefixtures("_backend")
+def test_reading_json_documents(benchmark, documents_response):
+    uris = [f"/doc-{i}.json" for i in range(NUMBER_OF_DOCS)]
+    benchmark(_read_documents, documents_response, uris)
+
+
+@pytest.mark.usefixtures("_backend")
+def test_writing_json_documents(benchmark):
+    benchmark(_write_documents)
+
+
+def _read_documents(
+    resp: Response,
+    uris: list[str],
+):
+    for doc in DocumentsReader.parse(resp, uris, None):
+        assert "root" in doc.content
+
+
+def _write_documents():
+    docs = [
+        JSONDocument(_get_doc_content(i), f"/doc-{i}.json")
+        for i in range(NUMBER_OF_DOCS)
+    ]
+    call = DocumentsPostCall(body_parts=DocumentsSender.parse(docs))
+    assert call.body
+
+
+def _get_doc_content(
+    i: int,
+) -> dict:
+    return {
+        "root": {
+            "id": i,
+            "name": f"document-{i}",
+            "tags": [f"tag-{j}" for j in range(10)],
+            "values": {f"key-{j}": j * 1.5 for j in range(20)},
+        },
+    }
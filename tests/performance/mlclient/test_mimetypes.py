@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.mimetypes import Mimetypes
+
+URIS = [
+    "/some/dir/doc.xml",
+    "/some/dir/doc.json",
+    "/some/dir/doc.txt",
+    "/some/dir/doc.pdf",
+    "/some/dir/doc.tar.gz",
+    "/some/dir/doc.unknown",
+]
+MIMETYPES = [
+    "application/xml",
+    "application/json",
+    "text/plain",
+    "application/pdf",
+]
+
+
+@pytest.mark.parametrize("uri", URIS)
+def test_getting_mimetype(benchmark, uri):
+    benchmark(Mimetypes.get_mimetype, uri)
+
+
+@pytest.mark.parametrize("uri_or_mimetype", URIS[:-1] + MIMETYPES)
+def test_getting_doc_type(benchmark, uri_or_mimetype):
+    assert benchmark(Mimetypes.get_doc_type, uri_or_mimetype) is not None
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.ml_response_parser import MLResponseParser
+from tests.utils import corpora
+
+
+@pytest.mark.parametrize("output_type", [None, bytes])
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_parsing_documents_response(benchmark, corpus, output_type):
+    resp = corpora.response(corpus, with_metadata=True)
+
+    parsed = benchmark(MLResponseParser.parse, resp, output_type)
+
+    assert len(parsed) == corpus[0] * 2
+
+
+@pytest.mark.parametrize("output_type", [None, bytes])
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_parsing_documents_response_with_headers(benchmark, corpus, output_type):
+    resp = corpora.response(corpus, with_metadata=True)
+
+    parsed = benchmark(MLResponseParser.parse_with_headers, resp, output_type)
+
+    assert len(parsed) == corpus[0] * 2
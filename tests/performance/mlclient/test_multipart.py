@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from mlclient.multipart import decode_multipart_mixed, encode_multipart_mixed
+from tests.utils import corpora
+
+
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_encoding_multipart_mixed(benchmark, corpus):
+    parts = corpora.response_parts(corpus, with_metadata=True)
+
+    body, _ = benchmark(encode_multipart_mixed, parts)
+
+    assert len(body) > sum(len(part.content) for part in parts)
+
+
+@pytest.mark.parametrize("corpus", corpora.CORPORA)
+def test_decoding_multipart_mixed(benchmark, corpus):
+    resp = corpora.response(corpus, with_metadata=True)
+    content_type = resp.headers["Content-Type"]
+
+    parts = benchmark(decode_multipart_mixed, resp.content, content_type)
+
+    assert len(parts) == corpus[0] * 2
@@ -3,6 +3,7 @@ import pytest
 from mlclient import exceptions
 from mlclient.calls import DocumentsPostCall
 from mlclient.models.http import DocumentsBodyPart as BodyPart
+from mlclient.multipart import MultipartStream
 
 
 @pytest.fixture
@@ -70,6 +71,20 @@ def test_body(default_body_part):
     assert call.body == expected_body.encode("utf-8")
 
 
+def test_stream_body(default_body_part):
+    call = DocumentsPostCall(body_parts=[default_body_part], stream=True)
+    boundary = call.headers["Content-Type"].replace("multipart/mixed; boundary=", "")
+    expected_body = f"--{boundary}\r\n"
+    expected_body += 'Content-Disposition: attachment; filename="/filepath.json"\r\n'
+    expected_body += "Content-Type: application/json\r\n"
+    expected_body += "\r\n"
+    expected_body += '{"root": "data"}\r\n'
+    expected_body += f"--{boundary}--\r\n"
+    assert isinstance(call.body, MultipartStream)
+    assert b"".join(call.body) == expected_body.encode("utf-8")
+    assert call.headers["Content-Length"] == str(len(expected_body))
+
+
 def test_body_with_dict_content():
     body_part = {
         "content-disposition": {
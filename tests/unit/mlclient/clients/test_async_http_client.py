@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 import respx
@@ -262,6 +264,46 @@ async def test_delete_with_customized_params_and_headers():
     assert resp.content == b""
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream():
+    ml_mocker = MLRespXMocker(use_router=False)
+    ml_mocker.with_url("http://localhost:8002/manage/v2/servers")
+    ml_mocker.with_response_code(200)
+    ml_mocker.with_response_body(RESOURCES["test-get-response.xml"]["bytes"])
+    ml_mocker.with_response_content_type("application/xml; charset=UTF-8")
+    ml_mocker.mock_get()
+
+    async with (
+        AsyncHttpClient(port=8002) as client,
+        client.stream(
+            "GET",
+            "/manage/v2/servers",
+        ) as resp,
+    ):
+        assert resp.status_code == httpx.codes.OK
+        assert not resp.is_stream_consumed
+        content = b"".join([chunk async for chunk in resp.aiter_bytes()])
+    assert content == RESOURCES["test-get-response.xml"]["bytes"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_when_disconnected():
+    ml_mocker = MLRespXMocker(use_router=False)
+    ml_mocker.with_url("http://localhost:8002/manage/v2/servers")
+    ml_mocker.with_response_code(200)
+    ml_mocker.with_response_body(RESOURCES["test-get-response.xml"]["bytes"])
+    ml_mocker.with_response_content_type("application/xml; charset=UTF-8")
+    ml_mocker.mock_get()
+
+    client = AsyncHttpClient(port=8002)
+    async with client.stream("GET", "/manage/v2/servers") as resp:
+        content = b"".join([chunk async for chunk in resp.aiter_bytes()])
+    assert not client.is_connected()
+    assert content == RESOURCES["test-get-response.xml"]["bytes"]
+
+
 @pytest.mark.asyncio
 @respx.mock
 async def test_request_logs_warning_for_restart_location(mocker: MockerFixture):
@@ -382,3 +424,55 @@ def test_properties():
     assert client.username == "user"
     assert client.password == "pass"
     assert client.base_url == "https://ml.example.com:8123"
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_when_disconnected():
+    assert AsyncHttpClient().pool_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_clients_with_same_settings_share_pool():
+    registry = http_client_module.POOL_REGISTRY
+    loop = asyncio.get_running_loop()
+    async with AsyncHttpClient(port=8100) as first:
+        key = first._pool_key("localhost", 8100)
+        async with AsyncHttpClient(port=8100) as second:
+            pool = first._transport._transport
+            assert second._transport._transport is pool
+            assert registry.references(key, loop) == 2
+        assert registry.references(key, loop) == 1
+
+    assert registry.references(key, loop) == 0
+    assert pool._pool.connections == []
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_pool_stats_count_queued_requests():
+    async def side_effect(_request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b"ok")
+
+    respx.get("http://localhost:8002/manage/v2/servers").mock(side_effect=side_effect)
+
+    limits = httpx.Limits(max_connections=1)
+    async with AsyncHttpClient(port=8002, limits=limits) as client:
+        await asyncio.gather(*(client.get("/manage/v2/servers") for _ in range(3)))
+        stats = client.pool_stats()
+
+    assert stats.requests == 0
+    assert stats.queued == 2
+    assert stats.max_connections == 1
+
+
+@pytest.mark.asyncio
+async def test_http2_transport():
+    pytest.importorskip("h2")
+
+    async with AsyncHttpClient(http2=True) as client:
+        stats = client.pool_stats()
+
+    assert client.http2 is True
+    assert stats.http2 is True
+    assert stats.connections == 0
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+from httpx_retries import Retry
+from pytest_mock import MockerFixture
+
+from mlclient.clients import AsyncHttpClient, HttpClient
+from mlclient.clients.cluster import HostBalancer, parse_host_names
+from mlclient.exceptions import WrongParametersError
+
+HOSTS_URL = "http://localhost:8002/manage/v2/hosts"
+HOSTS_BODY = {
+    "host-default-list": {
+        "list-items": {
+            "list-item": [
+                {"idref": "1", "nameref": "ml-node-1"},
+                {"idref": "2", "nameref": "ml-node-2"},
+                {"idref": "3", "nameref": "ml-node-3"},
+            ],
+        },
+    },
+}
+
+
+def test_balancer_without_hosts():
+    with pytest.raises(WrongParametersError) as err:
+        HostBalancer([])
+
+    assert err.value.args[0] == "HostBalancer requires at least one host!"
+
+
+def test_balancer_with_unknown_strategy():
+    with pytest.raises(WrongParametersError) as err:
+        HostBalancer(["ml-node-1"], "random")
+
+    expected_msg = (
+        "Unknown balancing strategy [random]! Available: round-robin, least-outstanding"
+    )
+    assert err.value.args[0] == expected_msg
+
+
+def test_round_robin():
+    balancer = HostBalancer(["ml-node-1", "ml-node-2", "ml-node-3", "ml-node-1"])
+
+    hosts = [balancer.acquire() for _ in range(6)]
+    assert balancer.hosts == ["ml-node-1", "ml-node-2", "ml-node-3"]
+    assert hosts == ["ml-node-1", "ml-node-2", "ml-node-3"] * 2
+    assert balancer.outstanding("ml-node-1") == 2
+
+
+def test_least_outstanding():
+    balancer = HostBalancer(["ml-node-1", "ml-node-2"], "least-outstanding")
+
+    first = balancer.acquire()
+    second = balancer.acquire()
+    balancer.release(second)
+
+    assert (first, second) == ("ml-node-1", "ml-node-2")
+    assert balancer.acquire() == "ml-node-2"
+    assert balancer.acquire() in {"ml-node-1", "ml-node-2"}
+
+
+def test_unhealthy_host_is_ejected():
+    balancer = HostBalancer(["ml-node-1", "ml-node-2"])
+
+    balancer.release(balancer.acquire(), healthy=False)
+
+    assert balancer.healthy_hosts == ["ml-node-2"]
+    assert [balancer.acquire() for _ in range(3)] == ["ml-node-2"] * 3
+    assert balancer.acquire(exclude=["ml-node-2"]) == "ml-node-1"
+    assert balancer.acquire(exclude=["ml-node-1", "ml-node-2"]) is None
+
+
+@pytest.mark.parametrize("healthy", [True, False])
+def test_ejected_host_is_probed(mocker: MockerFixture, healthy):
+    monotonic = mocker.patch("mlclient.clients.cluster.time.monotonic")
+    monotonic.return_value = 100.0
+    balancer = HostBalancer(["ml-node-1", "ml-node-2"], eject_duration=30.0)
+    balancer.eject("ml-node-1")
+
+    monotonic.return_value = 129.0
+    assert balancer.acquire() == "ml-node-2"
+
+    monotonic.return_value = 130.0
+    assert balancer.acquire() == "ml-node-1"
+    assert balancer.acquire() == "ml-node-2"
+
+    balancer.release("ml-node-1", healthy=healthy)
+    expected_hosts = ["ml-node-1", "ml-node-2"] if healthy else ["ml-node-2"]
+    assert balancer.healthy_hosts == expected_hosts
+
+
+def test_parse_host_names():
+    body = httpx.Response(200, json=HOSTS_BODY).content
+
+    assert parse_host_names(body) == {
+        "1": "ml-node-1",
+        "2": "ml-node-2",
+        "3": "ml-node-3",
+    }
+
+
+@respx.mock
+def test_cluster_client_spreads_requests():
+    respx.get(HOSTS_URL).respond(200, json=HOSTS_BODY)
+    routes = {
+        host: respx.get(f"http://{host}:8000/v1/documents").respond(200)
+        for host in ("ml-node-1", "ml-node-2", "ml-node-3")
+    }
+
+    with HttpClient(cluster=True) as client:
+        for _ in range(6):
+            client.get("/v1/documents")
+        stats = client.pool_stats()
+
+    assert [route.call_count for route in routes.values()] == [2, 2, 2]
+    assert routes["ml-node-1"].calls.last.request.headers["Host"] == "ml-node-1:8000"
+    assert stats.hosts == 3
+    assert stats.requests == 0
+
+
+@respx.mock
+def test_cluster_client_fails_over_on_connect_error():
+    respx.get(HOSTS_URL).respond(200, json=HOSTS_BODY)
+    respx.get("http://ml-node-1:8000/v1/documents").mock(
+        side_effect=httpx.ConnectError("Connection refused"),
+    )
+    respx.get("http://ml-node-2:8000/v1/documents").respond(200)
+    respx.get("http://ml-node-3:8000/v1/documents").respond(200)
+
+    with HttpClient(cluster=True, retry=Retry(total=0)) as client:
+        responses = [client.get("/v1/documents") for _ in range(4)]
+        healthy_hosts = client._transport.balancer.healthy_hosts
+
+    assert all(resp.status_code == httpx.codes.OK for resp in responses)
+    assert healthy_hosts == ["ml-node-2", "ml-node-3"]
+
+
+@respx.mock
+def test_cluster_client_ejects_unavailable_host():
+    respx.get(HOSTS_URL).respond(200, json=HOSTS_BODY)
+    respx.get("http://ml-node-1:8000/v1/documents").respond(503)
+    respx.get("http://ml-node-2:8000/v1/documents").respond(200)
+    respx.get("http://ml-node-3:8000/v1/documents").respond(200)
+
+    with HttpClient(cluster=True, retry=Retry(total=0)) as client:
+        statuses = [client.get("/v1/documents").status_code for _ in range(4)]
+        healthy_hosts = client._transport.balancer.healthy_hosts
+
+    assert statuses == [503, 200, 200, 200]
+    assert healthy_hosts == ["ml-node-2", "ml-node-3"]
+
+
+@respx.mock
+def test_cluster_client_without_discovered_hosts():
+    respx.get(HOSTS_URL).respond(403)
+    route = respx.get("http://localhost:8000/v1/documents").respond(200)
+
+    with HttpClient(cluster=True) as client:
+        client.get("/v1/documents")
+        hosts = client._transport.balancer.hosts
+
+    assert hosts == ["localhost"]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_cluster_client_spreads_requests():
+    respx.get(HOSTS_URL).respond(200, json=HOSTS_BODY)
+    routes = {
+        host: respx.get(f"http://{host}:8000/v1/documents").respond(200)
+        for host in ("ml-node-1", "ml-node-2", "ml-node-3")
+    }
+
+    async with AsyncHttpClient(
+        cluster=True,
+        balancing="least-outstanding",
+    ) as client:
+        for _ in range(3):
+            await client.get("/v1/documents")
+
+    assert sum(route.call_count for route in routes.values()) == 3
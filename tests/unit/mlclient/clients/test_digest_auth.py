@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import re
+
+import httpx
+import pytest
+import respx
+
+from mlclient.clients import AsyncHttpClient, HttpClient
+from mlclient.clients.digest_auth import (
+    DIGEST_SESSION_CACHE,
+    CachedDigestAuth,
+    DigestSessionCache,
+)
+
+URL = "http://localhost:8002/manage/v2/servers"
+
+
+class DigestServer:
+    def __init__(self):
+        self.nonce = "nonce-1"
+        self.authorizations = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        authorization = request.headers.get("Authorization")
+        self.authorizations.append(authorization)
+        if authorization is None:
+            return self._challenge(stale=False)
+        if f'nonce="{self.nonce}"' not in authorization:
+            return self._challenge(stale=True)
+        return httpx.Response(200, content=b"ok")
+
+    def _challenge(self, stale: bool) -> httpx.Response:
+        header = f'Digest realm="public", qop="auth", nonce="{self.nonce}"'
+        if stale:
+            header += ", stale=true"
+        return httpx.Response(401, headers={"WWW-Authenticate": header})
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    DIGEST_SESSION_CACHE.clear()
+    yield
+    DIGEST_SESSION_CACHE.clear()
+
+
+def _nonce_count(authorization: str) -> str:
+    return re.search(r"nc=(\w+)", authorization).group(1)
+
+
+def test_session_cache_increments_nonce_count():
+    cache = DigestSessionCache()
+    key = ("http", "localhost", 8002)
+
+    assert cache.next_use(key) is None
+    assert cache.store(key, "challenge") == 1
+    assert cache.next_use(key) == ("challenge", 2)
+    assert cache.next_use(key) == ("challenge", 3)
+    assert len(cache) == 1
+
+
+@respx.mock
+def test_new_client_authenticates_preemptively():
+    server = DigestServer()
+    respx.get(URL).mock(side_effect=server)
+
+    with HttpClient(port=8002, auth_method="digest") as client:
+        first = client.get("/manage/v2/servers")
+    with HttpClient(port=8002, auth_method="digest") as client:
+        second = client.get("/manage/v2/servers")
+        third = client.get("/manage/v2/servers")
+
+    assert isinstance(client.auth, CachedDigestAuth)
+    assert [first.status_code, second.status_code, third.status_code] == [200] * 3
+    assert len(server.authorizations) == 4
+    assert server.authorizations[0] is None
+    nonce_counts = [_nonce_count(auth) for auth in server.authorizations[1:]]
+    assert nonce_counts == ["00000001", "00000002", "00000003"]
+
+
+@respx.mock
+def test_stale_nonce_is_refreshed():
+    server = DigestServer()
+    respx.get(URL).mock(side_effect=server)
+
+    with HttpClient(port=8002, auth_method="digest") as client:
+        client.get("/manage/v2/servers")
+        server.nonce = "nonce-2"
+        resp = client.get("/manage/v2/servers")
+        client.get("/manage/v2/servers")
+
+    assert resp.status_code == 200
+    assert len(server.authorizations) == 5
+    assert 'nonce="nonce-2"' in server.authorizations[3]
+    assert _nonce_count(server.authorizations[3]) == "00000001"
+    assert _nonce_count(server.authorizations[4]) == "00000002"
+
+
+@respx.mock
+def test_rejected_credentials_are_not_retried_twice():
+    respx.get(URL).respond(
+        401,
+        headers={"WWW-Authenticate": 'Digest realm="public", nonce="abc"'},
+    )
+
+    with HttpClient(port=8002, auth_method="digest") as client:
+        client.get("/manage/v2/servers")
+        resp = client.get("/manage/v2/servers")
+
+    assert resp.status_code == 401
+    assert respx.calls.call_count == 4
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_client_shares_cached_challenge():
+    server = DigestServer()
+    respx.get(URL).mock(side_effect=server)
+
+    with HttpClient(port=8002, auth_method="digest") as client:
+        client.get("/manage/v2/servers")
+    async with AsyncHttpClient(port=8002, auth_method="digest") as client:
+        resp = await client.get("/manage/v2/servers")
+
+    assert resp.status_code == 200
+    assert len(server.authorizations) == 3
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import httpx
+import pytest
 import respx
 from pytest_mock import MockerFixture
 
 from mlclient.clients import http_client as http_client_module
-from mlclient.clients.http_client import HttpClient
+from mlclient.clients.http_client import HttpClient, limits_for_concurrency
+from mlclient.exceptions import WrongParametersError
 from tests.utils import resources as resources_utils
 from tests.utils.ml_mockers import MLRespXMocker
 
@@ -248,6 +250,44 @@ def test_delete_with_customized_params_and_headers():
     assert resp.content == b""
 
 
+@respx.mock
+def test_stream():
+    ml_mocker = MLRespXMocker(use_router=False)
+    ml_mocker.with_url("http://localhost:8002/manage/v2/servers")
+    ml_mocker.with_response_code(200)
+    ml_mocker.with_response_body(RESOURCES["test-get-response.xml"]["bytes"])
+    ml_mocker.with_response_content_type("application/xml; charset=UTF-8")
+    ml_mocker.mock_get()
+
+    with (
+        HttpClient(port=8002) as client,
+        client.stream(
+            "GET",
+            "/manage/v2/servers",
+        ) as resp,
+    ):
+        assert resp.status_code == httpx.codes.OK
+        assert not resp.is_stream_consumed
+        content = b"".join(resp.iter_bytes())
+    assert content == RESOURCES["test-get-response.xml"]["bytes"]
+
+
+@respx.mock
+def test_stream_when_disconnected():
+    ml_mocker = MLRespXMocker(use_router=False)
+    ml_mocker.with_url("http://localhost:8002/manage/v2/servers")
+    ml_mocker.with_response_code(200)
+    ml_mocker.with_response_body(RESOURCES["test-get-response.xml"]["bytes"])
+    ml_mocker.with_response_content_type("application/xml; charset=UTF-8")
+    ml_mocker.mock_get()
+
+    client = HttpClient(port=8002)
+    with client.stream("GET", "/manage/v2/servers") as resp:
+        content = b"".join(resp.iter_bytes())
+    assert not client.is_connected()
+    assert content == RESOURCES["test-get-response.xml"]["bytes"]
+
+
 @respx.mock
 def test_request_logs_warning_for_restart_location(mocker: MockerFixture):
     ml_mocker = MLRespXMocker(use_router=False)
@@ -364,3 +404,58 @@ def test_properties():
     assert client.username == "user"
     assert client.password == "pass"
     assert client.base_url == "https://ml.example.com:8123"
+    assert client.limits == http_client_module.DEFAULT_POOL_LIMITS
+    assert client.http2 is False
+
+
+def test_http2_without_h2(mocker: MockerFixture):
+    mocker.patch("importlib.util.find_spec", return_value=None)
+
+    with pytest.raises(WrongParametersError) as err:
+        HttpClient(http2=True)
+
+    assert err.value.args[0] == "HTTP/2 requires the h2 package to be installed!"
+
+
+def test_limits_for_concurrency():
+    limits = limits_for_concurrency(24)
+
+    assert limits.max_connections == 24
+    assert limits.max_keepalive_connections == 24
+    assert limits.keepalive_expiry == 5.0
+
+
+def test_pool_stats_when_disconnected():
+    assert HttpClient().pool_stats() is None
+
+
+def test_clients_with_same_settings_share_pool():
+    registry = http_client_module.POOL_REGISTRY
+    with HttpClient(port=8100) as first, HttpClient(port=8100) as second:
+        pool = first._transport._transport
+        assert second._transport._transport is pool
+        assert registry.references(first._pool_key("localhost", 8100)) == 2
+    with HttpClient(port=8100) as reused, HttpClient(port=8101) as other:
+        assert reused._transport._transport is pool
+        assert other._transport._transport is not pool
+
+    assert registry.references(first._pool_key("localhost", 8100)) == 0
+
+
+@respx.mock
+def test_pool_stats():
+    respx.get("http://localhost:8002/manage/v2/servers").respond(200, content=b"ok")
+
+    limits = httpx.Limits(max_connections=2, max_keepalive_connections=1)
+    with HttpClient(port=8002, limits=limits) as client:
+        with client.stream("GET", "/manage/v2/servers") as resp:
+            in_flight_stats = client.pool_stats()
+            resp.read()
+        stats = client.pool_stats()
+
+    assert in_flight_stats.requests == 1
+    assert stats.requests == 0
+    assert stats.queued == 0
+    assert stats.max_connections == 2
+    assert stats.max_keepalive_connections == 1
+    assert stats.http2 is False
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+import respx
+from httpx import BasicAuth, Response
+from pytest_mock import MockerFixture
+
+from mlclient.clients import HttpClient, HttpTracer
+from mlclient.clients import http_client as http_client_module
+from mlclient.clients.http_trace import LazyMessage
+from mlclient.exceptions import WrongParametersError
+
+URL = "http://localhost:8002/manage/v2/databases"
+
+
+def test_format_response():
+    tracer = HttpTracer()
+    response = Response(
+        200,
+        headers={"Content-Type": "application/json", "Set-Cookie": "session=abc"},
+        content=b'{"a": 1}',
+    )
+
+    trace = tracer.format_response(response)
+
+    assert trace == (
+        "HTTP/1.1 200 OK\n"
+        "content-type: application/json\n"
+        "set-cookie: [REDACTED]\n"
+        "content-length: 8\n"
+        "\n"
+        '{"a": 1}'
+    )
+
+
+def test_format_response_without_body():
+    tracer = HttpTracer()
+    response = Response(200, headers={"Content-Type": "text/plain"}, content=b"abc")
+
+    trace = tracer.format_response(response, with_body=False)
+
+    assert trace == "HTTP/1.1 200 OK\ncontent-type: text/plain\ncontent-length: 3"
+
+
+def test_format_response_with_truncated_body():
+    tracer = HttpTracer(max_body_size=10)
+    response = Response(200, headers={"Content-Type": "text/plain"}, content=b"x" * 100)
+
+    trace = tracer.format_response(response)
+
+    assert trace.endswith("\n\nxxxxxxxxxx... [90 of 100 truncated]")
+
+
+def test_format_response_with_binary_body():
+    tracer = HttpTracer()
+    response = Response(200, headers={"Content-Type": "image/png"}, content=b"\x89PNG")
+
+    trace = tracer.format_response(response)
+
+    assert trace.endswith("\n\n[binary body of 4 bytes]")
+
+
+def test_format_response_with_redacted_body():
+    tracer = HttpTracer(redact_body=lambda text: text.replace("secret", "***"))
+    response = Response(
+        200,
+        headers={"Content-Type": "text/plain"},
+        content=b"password: secret",
+    )
+
+    trace = tracer.format_response(response)
+
+    assert trace.endswith("\n\npassword: ***")
+
+
+def test_format_request():
+    tracer = HttpTracer(max_body_size=3)
+    request = {
+        "params": {"format": "json"},
+        "headers": {"Content-Type": "text/plain", "Authorization": "Basic YQ=="},
+        "auth": BasicAuth("admin", "admin"),
+        "content": "abcdef",
+    }
+
+    details = tracer.format_request(request)
+
+    assert details == (
+        "params [{'format': 'json'}] "
+        "headers [{'Content-Type': 'text/plain', 'Authorization': '[REDACTED]'}] "
+        "auth [BasicAuth] "
+        "content [abc... [3 of 6 truncated]]"
+    )
+
+
+def test_sample():
+    tracer = HttpTracer(sample_every=3)
+
+    assert [tracer.sample() for _ in range(7)] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_sample_with_wrong_rate():
+    with pytest.raises(WrongParametersError) as err:
+        HttpTracer(sample_every=0)
+
+    expected_msg = "A sampling rate must be a positive number: [0]!"
+    assert err.value.args[0] == expected_msg
+
+
+def test_lazy_message_is_formatted_when_emitted():
+    calls = []
+
+    def build(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    message = LazyMessage(build, "trace")
+    assert calls == []
+    assert str(message) == "TRACE"
+    assert calls == ["trace"]
+
+
+@respx.mock
+def test_response_not_formatted_when_fine_disabled(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    respx.get(URL).respond(200, content=b"x" * 1000)
+    client = HttpClient(port=8002)
+    format_response = mocker.spy(client.tracer, "format_response")
+    format_request = mocker.spy(client.tracer, "format_request")
+
+    with caplog.at_level(logging.INFO, logger="mlclient"):
+        client.get("/manage/v2/databases")
+
+    format_response.assert_not_called()
+    format_request.assert_not_called()
+
+
+@respx.mock
+def test_response_traced_when_fine_enabled(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    respx.get(URL).respond(200, content=b"x" * 10000)
+    client = HttpClient(port=8002, tracer=HttpTracer(max_body_size=100))
+    fine = mocker.patch.object(http_client_module.logger, "fine")
+
+    with caplog.at_level(logging.FINE, logger="mlclient"):
+        client.get("/manage/v2/databases")
+
+    fine.assert_called_once()
+    msg, trace = fine.call_args.args
+    assert msg == "%s"
+    assert str(trace).startswith("HTTP/1.1 200 OK\n")
+    assert str(trace).endswith("x" * 100 + "... [9900 of 10000 truncated]")
+
+
+@respx.mock
+def test_sampled_requests_traced_with_their_responses(
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    respx.get(URL).respond(200, content=b"x")
+    client = HttpClient(port=8002, tracer=HttpTracer(sample_every=2))
+    format_request = mocker.spy(client.tracer, "format_request")
+    format_response = mocker.spy(client.tracer, "format_response")
+
+    with caplog.at_level(logging.FINE, logger="mlclient"):
+        for page in range(4):
+            client.get("/manage/v2/databases", params={"page": page})
+
+    # Lazy messages are formatted by every log handler
+    request_pages = {
+        call.args[0]["params"]["page"] for call in format_request.call_args_list
+    }
+    response_pages = {
+        int(call.args[0].request.url.params["page"])
+        for call in format_response.call_args_list
+    }
+    assert request_pages == {0, 2}
+    assert response_pages == request_pages
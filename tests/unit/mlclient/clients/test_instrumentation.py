@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+from httpx_retries import Retry
+from pytest_mock import MockerFixture
+
+from mlclient.calls import DatabasesGetCall
+from mlclient.clients import (
+    ApiClient,
+    AsyncHttpClient,
+    CallbackInstrumentation,
+    CompositeInstrumentation,
+    HttpClient,
+    Instrumentation,
+    MetricsRegistry,
+    OpenTelemetryInstrumentation,
+    RequestInfo,
+    RequestMetrics,
+)
+from mlclient.clients import instrumentation as instrumentation_module
+from mlclient.exceptions import WrongParametersError
+
+URL = "http://localhost:8002/manage/v2/databases"
+NO_BACKOFF_RETRY = Retry(total=2, backoff_factor=0.0)
+
+
+def _metrics(
+    status_code: int | None = 200,
+    duration: float = 0.02,
+    error: str | None = None,
+) -> RequestMetrics:
+    return RequestMetrics(
+        call="DatabasesGetCall",
+        method="GET",
+        endpoint="/manage/v2/databases",
+        status_code=status_code,
+        duration=duration,
+        bytes_sent=10,
+        bytes_received=100,
+        attempts=2,
+        backoff=0.5,
+        pool_wait=0.001,
+        error=error,
+    )
+
+
+@respx.mock
+def test_request_metrics():
+    respx.post(URL).respond(201, content=b"created")
+    finished = []
+    instrumentation = CallbackInstrumentation(on_finished=finished.append)
+
+    with HttpClient(port=8002, instrumentation=instrumentation) as client:
+        client.post("/manage/v2/databases", body="<database/>")
+
+    (metrics,) = finished
+    assert metrics.call == ""
+    assert metrics.method == "POST"
+    assert metrics.endpoint == "/manage/v2/databases"
+    assert metrics.status_code == httpx.codes.CREATED
+    assert metrics.duration > 0
+    assert metrics.bytes_sent == len("<database/>")
+    assert metrics.bytes_received == len("created")
+    assert metrics.attempts == 1
+    assert metrics.retries == 0
+    assert metrics.backoff == 0
+    assert metrics.error is None
+
+
+@respx.mock
+def test_request_metrics_with_retries():
+    respx.get(URL).mock(
+        side_effect=[httpx.Response(503), httpx.Response(503), httpx.Response(200)],
+    )
+    retried = []
+    finished = []
+    instrumentation = CallbackInstrumentation(
+        on_retried=lambda _info, attempt, _backoff: retried.append(attempt),
+        on_finished=finished.append,
+    )
+
+    with HttpClient(
+        port=8002,
+        retry=NO_BACKOFF_RETRY,
+        instrumentation=instrumentation,
+    ) as client:
+        resp = client.get("/manage/v2/databases")
+
+    assert resp.status_code == httpx.codes.OK
+    assert retried == [2, 3]
+    (metrics,) = finished
+    assert metrics.status_code == httpx.codes.OK
+    assert metrics.attempts == 3
+    assert metrics.retries == 2
+    assert metrics.backoff >= 0
+
+
+@respx.mock
+def test_request_metrics_with_error():
+    respx.get(URL).mock(side_effect=httpx.ConnectError("refused"))
+    finished = []
+    instrumentation = CallbackInstrumentation(on_finished=finished.append)
+
+    with (
+        HttpClient(
+            port=8002,
+            retry=Retry(total=0),
+            instrumentation=instrumentation,
+        ) as client,
+        pytest.raises(httpx.ConnectError),
+    ):
+        client.get("/manage/v2/databases")
+
+    (metrics,) = finished
+    assert metrics.status_code is None
+    assert metrics.bytes_received == 0
+    assert metrics.error == "ConnectError"
+
+
+@respx.mock
+def test_stream_metrics_include_body():
+    respx.get(URL).respond(200, content=b"x" * 1000)
+    finished = []
+    instrumentation = CallbackInstrumentation(on_finished=finished.append)
+
+    with (
+        HttpClient(port=8002, instrumentation=instrumentation) as client,
+        client.stream("GET", "/manage/v2/databases") as resp,
+    ):
+        assert finished == []
+        for _ in resp.iter_bytes():
+            pass
+
+    (metrics,) = finished
+    assert metrics.bytes_received == 1000
+
+
+@respx.mock
+def test_api_client_labels_requests_with_calls():
+    respx.get(URL).respond(200, json={})
+    started = []
+    instrumentation = CallbackInstrumentation(on_started=started.append)
+
+    with HttpClient(port=8002, instrumentation=instrumentation) as client:
+        ApiClient(client).call(DatabasesGetCall())
+
+    assert started == [RequestInfo("DatabasesGetCall", "GET", "/manage/v2/databases")]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_request_metrics_with_retries():
+    respx.get(URL).mock(side_effect=[httpx.Response(503), httpx.Response(200)])
+    registry = MetricsRegistry()
+
+    async with AsyncHttpClient(
+        port=8002,
+        retry=NO_BACKOFF_RETRY,
+        instrumentation=registry,
+    ) as client:
+        await client.request("GET", "/manage/v2/databases", label="DatabasesGetCall")
+
+    (metrics,) = registry.snapshot()
+    assert metrics.call == "DatabasesGetCall"
+    assert metrics.requests == 1
+    assert metrics.outcomes == {"200": 1}
+    assert metrics.retries == 1
+
+
+@respx.mock
+def test_requests_not_recorded_without_instrumentation(mocker: MockerFixture):
+    respx.get(URL).respond(200)
+    record_request = mocker.spy(instrumentation_module, "RequestRecorder")
+
+    with HttpClient(port=8002) as client:
+        client.get("/manage/v2/databases")
+
+    record_request.assert_not_called()
+
+
+def test_composite_instrumentation_passes_own_contexts():
+    class _Instrumentation(Instrumentation):
+        def __init__(self, name: str):
+            self.name = name
+            self.contexts = []
+
+        def request_started(self, _info: RequestInfo) -> str:
+            return self.name
+
+        def request_finished(self, _metrics: RequestMetrics, context: str):
+            self.contexts.append(context)
+
+    first, second = _Instrumentation("first"), _Instrumentation("second")
+    composite = CompositeInstrumentation(first, second)
+
+    context = composite.request_started(RequestInfo("", "GET", "/"))
+    composite.request_finished(_metrics(), context)
+
+    assert first.contexts == ["first"]
+    assert second.contexts == ["second"]
+
+
+def test_metrics_registry_snapshot():
+    registry = MetricsRegistry(buckets=(0.01, 0.1))
+    registry.request_finished(_metrics(duration=0.005), None)
+    registry.request_finished(_metrics(duration=0.05), None)
+    registry.request_finished(_metrics(status_code=None, error="ReadTimeout"), None)
+
+    (metrics,) = registry.snapshot()
+    assert metrics.requests == 3
+    assert metrics.outcomes == {"200": 2, "ReadTimeout": 1}
+    assert metrics.duration_buckets == (1, 3, 3)
+    assert metrics.bytes_sent == 30
+    assert metrics.bytes_received == 300
+    assert metrics.retries == 3
+    assert metrics.backoff == pytest.approx(1.5)
+
+    registry.clear()
+    assert registry.snapshot() == []
+
+
+def test_metrics_registry_with_unsorted_buckets():
+    with pytest.raises(WrongParametersError) as err:
+        MetricsRegistry(buckets=(0.1, 0.01))
+
+    expected_msg = "Histogram buckets must be unique and sorted in ascending order!"
+    assert err.value.args[0] == expected_msg
+
+
+def test_metrics_registry_to_prometheus():
+    registry = MetricsRegistry(buckets=(0.01, 0.1))
+    registry.request_finished(_metrics(duration=0.05), None)
+
+    text = registry.to_prometheus()
+
+    labels = 'call="DatabasesGetCall",method="GET",endpoint="/manage/v2/databases"'
+    assert "# TYPE mlclient_request_duration_seconds histogram\n" in text
+    assert f'mlclient_request_duration_seconds_bucket{{{labels},le="0.01"}} 0\n' in text
+    assert f'mlclient_request_duration_seconds_bucket{{{labels},le="0.1"}} 1\n' in text
+    assert f'mlclient_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n' in text
+    assert f"mlclient_request_duration_seconds_sum{{{labels}}} 0.05\n" in text
+    assert f"mlclient_request_duration_seconds_count{{{labels}}} 1\n" in text
+    assert f'mlclient_requests_total{{{labels},status="200"}} 1\n' in text
+    assert f"mlclient_sent_bytes_total{{{labels}}} 10\n" in text
+    assert f"mlclient_received_bytes_total{{{labels}}} 100\n" in text
+    assert f"mlclient_retries_total{{{labels}}} 1\n" in text
+    assert f"mlclient_backoff_seconds_total{{{labels}}} 0.5\n" in text
+
+
+def test_open_telemetry_instrumentation(mocker: MockerFixture):
+    otel_trace = mocker.patch.object(instrumentation_module, "otel_trace")
+    tracer = mocker.MagicMock()
+    instrumentation = OpenTelemetryInstrumentation(tracer)
+
+    span = instrumentation.request_started(RequestInfo("DatabasesGetCall", "GET", "/"))
+    instrumentation.request_finished(_metrics(error="ReadTimeout"), span)
+
+    tracer.start_span.assert_called_once()
+    assert tracer.start_span.call_args.args == ("GET DatabasesGetCall",)
+    span.set_attribute.assert_any_call("http.response.status_code", 200)
+    span.set_status.assert_called_once_with(otel_trace.StatusCode.ERROR, "ReadTimeout")
+    span.end.assert_called_once()
+
+
+def test_open_telemetry_instrumentation_without_package(mocker: MockerFixture):
+    mocker.patch.object(instrumentation_module, "otel_trace", None)
+
+    with pytest.raises(WrongParametersError) as err:
+        OpenTelemetryInstrumentation()
+
+    expected_msg = "OpenTelemetry spans require the opentelemetry-api package!"
+    assert err.value.args[0] == expected_msg
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from mlclient.clients.pool_registry import (
+    MAX_IDLE_TRANSPORTS,
+    ConnectionPoolRegistry,
+    credentials_digest,
+)
+
+EVICTION_TIMEOUT = 5.0
+
+
+@pytest.fixture
+def registry() -> ConnectionPoolRegistry:
+    return ConnectionPoolRegistry()
+
+
+def test_acquire_reuses_registered_transport(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    factory = mocker.Mock(side_effect=object)
+
+    first = registry.acquire("key", factory)
+    second = registry.acquire("key", factory)
+
+    assert first is second
+    assert factory.call_count == 1
+    assert registry.references("key") == 2
+    assert len(registry) == 1
+
+
+def test_released_sync_transport_stays_registered(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    transport = registry.acquire("key", mocker.Mock)
+
+    assert registry.release("key") is None
+    assert registry.release("key") is None
+    assert registry.references("key") == 0
+    assert registry.acquire("key", mocker.Mock) is transport
+
+
+def test_released_sync_transport_is_closed_after_idle_expiry(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    closed = threading.Event()
+    transport = registry.acquire("key", mocker.Mock, idle_expiry=0.0)
+    transport.close.side_effect = closed.set
+
+    registry.release("key")
+
+    assert closed.wait(EVICTION_TIMEOUT)
+    assert len(registry) == 0
+    assert registry.acquire("key", mocker.Mock, idle_expiry=0.0) is not transport
+
+
+def test_reacquired_sync_transport_is_not_closed_after_idle_expiry(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    transport = registry.acquire("key", mocker.Mock, idle_expiry=60.0)
+    registry.release("key")
+
+    assert registry.acquire("key", mocker.Mock, idle_expiry=60.0) is transport
+    transport.close.assert_not_called()
+    registry.clear()
+
+
+def test_least_recently_released_sync_transports_are_closed_over_limit(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    keys = [f"key-{i}" for i in range(MAX_IDLE_TRANSPORTS + 1)]
+    transports = [registry.acquire(key, mocker.Mock) for key in keys]
+
+    for key in keys:
+        registry.release(key)
+
+    transports[0].close.assert_called_once()
+    for transport in transports[1:]:
+        transport.close.assert_not_called()
+    assert len(registry) == MAX_IDLE_TRANSPORTS
+
+
+def test_released_async_transport_is_returned_with_last_reference(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    loop = asyncio.new_event_loop()
+    try:
+        transport = registry.acquire("key", mocker.Mock, loop)
+        registry.acquire("key", mocker.Mock, loop)
+
+        assert registry.references("key") == 0
+        assert registry.references("key", loop) == 2
+        assert registry.release("key", loop) is None
+        assert registry.release("key", loop) is transport
+        assert len(registry) == 0
+    finally:
+        loop.close()
+
+
+def test_async_transports_are_registered_per_loop(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first = registry.acquire("key", mocker.Mock, first_loop)
+        second = registry.acquire("key", mocker.Mock, second_loop)
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+    assert first is not second
+    assert len(registry) == 2
+
+
+def test_unreferenced_transports_of_closed_loops_are_dropped(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    loop = asyncio.new_event_loop()
+    registry.acquire("key", mocker.Mock, loop)
+    registry._entries[("key", id(loop))].references = 0
+    loop.close()
+
+    registry.acquire("other", mocker.Mock)
+
+    assert len(registry) == 1
+
+
+def test_clear_closes_unreferenced_sync_transports(
+    registry: ConnectionPoolRegistry,
+    mocker: MockerFixture,
+):
+    idle = registry.acquire("idle", mocker.Mock)
+    registry.release("idle")
+    in_use = registry.acquire("in-use", mocker.Mock)
+
+    registry.clear()
+
+    idle.close.assert_called_once()
+    in_use.close.assert_not_called()
+    assert len(registry) == 0
+
+
+def test_credentials_digest_does_not_contain_password():
+    digest = credentials_digest("admin", "secret-password")
+
+    assert "secret-password" not in digest
+    assert digest == credentials_digest("admin", "secret-password")
+    assert digest != credentials_digest("admin", "other-password")
+    assert digest != credentials_digest("admin2", "secret-password")
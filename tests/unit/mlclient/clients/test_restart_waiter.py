@@ -14,6 +14,7 @@ from mlclient import (
     MARKLOGIC_MANAGE_API_PORT,
     RESTART_RETRY_STRATEGY,
 )
+from mlclient.clients.pool_registry import POOL_REGISTRY
 from mlclient.clients.restart_waiter import RestartWaiter
 from tests.utils import resources as resources_utils
 from tests.utils.ml_mockers import MLRespXMocker
@@ -954,3 +955,25 @@ def test_wait_for_restart_completion_uses_custom_probe_timeout(
         headers={"Connection": "close"},
         timeout=custom_timeout,
     )
+
+
+@respx.mock
+def test_wait_for_restart_completion_acquires_probe_transport_from_registry(
+    mocker: MockerFixture,
+    waiter: RestartWaiter,
+    ml_mocker: MLRespXMocker,
+):
+    _mock_timestamp_route(ml_mocker, _timestamp_response(READY_TS))
+    acquire = mocker.spy(POOL_REGISTRY, "acquire")
+    release = mocker.spy(POOL_REGISTRY, "release")
+
+    waiter.wait_for_restart_completion(
+        response=None,
+        timeout=FAST_TIMEOUT,
+        poll_interval=FAST_POLL_INTERVAL,
+        retry=RESTART_RETRY_STRATEGY,
+    )
+
+    assert acquire.call_count == 1
+    assert release.call_count == 1
+    assert release.spy_return is not None
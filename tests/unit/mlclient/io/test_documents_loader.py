@@ -1,13 +1,18 @@
 import io
+import os
 import xml.etree.ElementTree as ElemTree
 import zipfile
+from pathlib import Path
 from types import GeneratorType
 
+import pytest
+
 from mlclient.io import DocumentsLoader
 from mlclient.models import (
     BinaryDocument,
     Document,
     DocumentType,
+    FileContent,
     JSONDocument,
     Metadata,
     TextDocument,
@@ -65,6 +70,20 @@ def test_load_documents():
     assert doc_4.temporal_collection is None
 
 
+@pytest.mark.skipif(os.name != "posix", reason="requires symbolic links")
+def test_load_documents_not_following_directory_symlinks(tmp_path):
+    root = tmp_path / "a"
+    root.mkdir()
+    (root / "d.json").write_text('{"a": 1}')
+    (root / "loop").symlink_to(root, target_is_directory=True)
+
+    docs = list(DocumentsLoader.load(str(root)))
+    parallel_docs = list(DocumentsLoader.load_parallel(str(root)))
+
+    assert [doc.uri for doc in docs] == ["/d.json"]
+    assert [doc.uri for doc in parallel_docs] == ["/d.json"]
+
+
 def test_load_documents_with_metadata():
     path = f"{TEST_RESOURCES_PATH}/root-2"
 
@@ -243,6 +262,17 @@ def test_load_document_with_metadata():
     assert doc.temporal_collection is None
 
 
+def test_load_binary_document_lazily():
+    path = f"{TEST_RESOURCES_PATH}/root-1/dir/doc-4.zip"
+
+    doc = DocumentsLoader.load_document(path)
+    assert type(doc) is BinaryDocument
+    assert isinstance(doc.content_source, FileContent)
+    assert doc.content_length == Path(path).stat().st_size
+    with Path(path).open("rb") as file:
+        assert doc.content_bytes == file.read()
+
+
 def test_load_document_xml_content():
     path = f"{TEST_RESOURCES_PATH}/root-1/dir/doc-1.xml"
 
@@ -290,6 +320,81 @@ def test_load_document_as_documents_with_custom_uri_prefix():
     assert doc.temporal_collection is None
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_load_parallel_documents_with_metadata(ordered):
+    path = f"{TEST_RESOURCES_PATH}/root-2"
+
+    expected_docs = list(DocumentsLoader.load(path))
+    docs = list(DocumentsLoader.load_parallel(path, max_workers=2, ordered=ordered))
+
+    assert len(docs) == 7
+    if ordered:
+        assert [doc.uri for doc in docs] == [doc.uri for doc in expected_docs]
+    else:
+        assert {doc.uri for doc in docs} == {doc.uri for doc in expected_docs}
+    for expected_doc in expected_docs:
+        doc = next(doc for doc in docs if doc.uri == expected_doc.uri)
+        assert type(doc) is type(expected_doc)
+        assert doc.content_bytes == expected_doc.content_bytes
+        assert doc.metadata == expected_doc.metadata
+
+
+def test_load_parallel_documents_with_custom_uri_prefix():
+    path = f"{TEST_RESOURCES_PATH}/root-1"
+
+    docs = list(DocumentsLoader.load_parallel(path, uri_prefix="/custom-root"))
+
+    assert sorted(doc.uri for doc in docs) == [
+        "/custom-root/dir/doc-1.xml",
+        "/custom-root/dir/doc-2.json",
+        "/custom-root/dir/doc-3.xqy",
+        "/custom-root/dir/doc-4.zip",
+    ]
+
+
+def test_load_parallel_document():
+    path = f"{TEST_RESOURCES_PATH}/root-1/dir/doc-1.xml"
+
+    docs = list(DocumentsLoader.load_parallel(path))
+
+    assert len(docs) == 1
+    assert docs[0].uri == "/doc-1.xml"
+    assert docs[0].content_bytes == (
+        b"<root><parent><child>value-1</child></parent></root>"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_aload_documents_with_metadata(ordered):
+    path = f"{TEST_RESOURCES_PATH}/root-2"
+
+    expected_docs = list(DocumentsLoader.load(path))
+    docs = [
+        doc async for doc in DocumentsLoader.aload(path, max_workers=2, ordered=ordered)
+    ]
+
+    assert len(docs) == 7
+    if ordered:
+        assert [doc.uri for doc in docs] == [doc.uri for doc in expected_docs]
+    else:
+        assert {doc.uri for doc in docs} == {doc.uri for doc in expected_docs}
+    for expected_doc in expected_docs:
+        doc = next(doc for doc in docs if doc.uri == expected_doc.uri)
+        assert doc.content_bytes == expected_doc.content_bytes
+        assert doc.metadata == expected_doc.metadata
+
+
+@pytest.mark.asyncio
+async def test_aload_document():
+    path = f"{TEST_RESOURCES_PATH}/root-1/dir/doc-1.xml"
+
+    docs = [doc async for doc in DocumentsLoader.aload(path, uri_prefix="/root")]
+
+    assert len(docs) == 1
+    assert docs[0].uri == "/root/doc-1.xml"
+
+
 def _assert_xml_content_with_value(
     doc: Document,
     value: str,
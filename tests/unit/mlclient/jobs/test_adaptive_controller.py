@@ -0,0 +1,159 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mlclient.exceptions import MarkLogicError
+from mlclient.jobs import AdaptiveController
+
+
+def _server_error():
+    return MarkLogicError(
+        {"statusCode": 503, "status": "Service Unavailable", "message": "Busy"},
+    )
+
+
+def test_invalid_concurrency_bounds():
+    with pytest.raises(ValueError, match="Concurrency bounds"):
+        AdaptiveController(min_concurrency=4, max_concurrency=2)
+
+
+def test_invalid_batch_size_bounds():
+    with pytest.raises(ValueError, match="Batch size bounds"):
+        AdaptiveController(min_batch_size=0)
+
+
+def test_initial_settings_are_clamped():
+    controller = AdaptiveController(
+        min_concurrency=2,
+        max_concurrency=4,
+        min_batch_size=10,
+        max_batch_size=100,
+        concurrency=10,
+        batch_size=5,
+    )
+    assert controller.concurrency == 4
+    assert controller.batch_size == 10
+
+
+def test_fixed_controller_never_changes():
+    controller = AdaptiveController.fixed(8, 100)
+    for _ in range(20):
+        assert not controller.record(100, 0.1)
+    assert not controller.record(100, 0.1, _server_error())
+    assert controller.concurrency == 8
+    assert controller.batch_size == 100
+
+
+def test_additive_increase_after_round():
+    controller = AdaptiveController(
+        max_concurrency=8,
+        min_batch_size=10,
+        max_batch_size=110,
+        concurrency=2,
+        batch_size=50,
+    )
+    assert not controller.record(50, 0.5)
+    assert controller.record(50, 0.5)
+    assert controller.concurrency == 3
+    assert controller.batch_size == 60
+
+
+def test_decrease_when_latency_degrades():
+    controller = AdaptiveController(max_concurrency=8, concurrency=2)
+    controller.record(10, 0.1)
+    controller.record(10, 0.1)
+    assert controller.concurrency == 3
+
+    for _ in range(3):
+        controller.record(10, 10.0)
+    assert controller.concurrency == 2
+
+
+def test_decrease_when_latency_degrades_shrinks_batch_size():
+    controller = AdaptiveController(
+        max_concurrency=8,
+        min_batch_size=10,
+        max_batch_size=110,
+        concurrency=2,
+        batch_size=50,
+    )
+    controller.record(50, 0.5)
+    controller.record(50, 0.5)
+    assert (controller.concurrency, controller.batch_size) == (3, 60)
+
+    for _ in range(3):
+        controller.record(60, 60.0)
+    assert (controller.concurrency, controller.batch_size) == (2, 50)
+
+
+def test_recovery_after_lasting_latency_rise():
+    controller = AdaptiveController(max_concurrency=8, concurrency=4)
+    for _ in range(5):
+        for _ in range(controller.concurrency):
+            controller.record(10, 0.1)
+    assert controller.concurrency == 8
+
+    concurrencies = []
+    for _ in range(40):
+        for _ in range(controller.concurrency):
+            controller.record(10, 0.3)
+        concurrencies.append(controller.concurrency)
+
+    assert min(concurrencies) > 1
+    assert controller.concurrency == 8
+
+
+def test_multiplicative_decrease_once_per_round():
+    controller = AdaptiveController(
+        max_concurrency=16,
+        max_batch_size=400,
+        concurrency=8,
+        batch_size=400,
+    )
+    assert controller.record(400, 1.0, _server_error())
+    assert controller.concurrency == 4
+    assert controller.batch_size == 200
+
+    assert not controller.record(400, 1.0, httpx.ReadTimeout("Timed out"))
+    assert controller.concurrency == 4
+
+
+def test_client_errors_do_not_change_settings():
+    controller = AdaptiveController(concurrency=4, max_concurrency=8)
+    err = MarkLogicError({"statusCode": 401, "status": "Unauthorized"})
+    assert not controller.record(10, 0.1, err)
+    assert controller.concurrency == 4
+
+
+@pytest.mark.parametrize(
+    ("err", "expected"),
+    [
+        (httpx.ConnectTimeout("Timed out"), True),
+        (_server_error(), True),
+        (MarkLogicError({"statusCode": 404, "status": "Not Found"}), False),
+        (MarkLogicError("Raw message"), False),
+        (RuntimeError("Some error"), False),
+    ],
+)
+def test_is_overload_error(err, expected):
+    assert AdaptiveController.is_overload_error(err) is expected
+
+
+@pytest.mark.asyncio
+async def test_slot_limits_concurrency():
+    controller = AdaptiveController(max_concurrency=8, concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def task():
+        nonlocal in_flight, max_in_flight
+        async with controller.slot():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(task() for _ in range(6)))
+
+    assert max_in_flight == 2
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import respx
+
+from mlclient.exceptions import MarkLogicError
+from mlclient.jobs import DeleteDocumentsJob
+from mlclient.models.http import Category
+from tests.utils.ml_mockers import MLDocumentsMocker, MLForestsMocker
+
+EVAL_URL = "http://localhost:8000/v1/eval"
+DOCUMENTS_URL = "http://localhost:8000/v1/documents"
+
+
+def _uris(start: int, count: int) -> list[str]:
+    return [f"/some/dir/doc{i}.xml" for i in range(start, start + count)]
+
+
+def _deleted_uris(route: respx.Route) -> list[str]:
+    return [
+        uri for call in route.calls for uri in call.request.url.params.get_list("uri")
+    ]
+
+
+@respx.mock
+def test_job_deletes_uris_input():
+    route = respx.delete(DOCUMENTS_URL).mock(
+        side_effect=MLDocumentsMocker.delete_documents_side_effect,
+    )
+    uris = _uris(1, 10)
+
+    job = DeleteDocumentsJob(concurrency=2, batch_size=3)
+    job.with_database("Documents")
+    job.with_uris_input(iter(uris))
+    report = job.run_sync()
+
+    assert route.call_count == 4
+    assert sorted(_deleted_uris(route)) == sorted(uris)
+    assert route.calls.last.request.url.params["database"] == "Documents"
+    assert route.calls.last.request.url.params.get("category") is None
+    assert report.successful == 10
+    assert report.failed == 0
+    assert report.pool_stats.max_connections == 2
+
+
+@respx.mock
+def test_job_deletes_enumerated_uris():
+    forests = MLForestsMocker({"111": _uris(1, 5), "222": _uris(6, 4)})
+    eval_route = respx.post(EVAL_URL).mock(side_effect=forests.eval_side_effect)
+    route = respx.delete(DOCUMENTS_URL).mock(
+        side_effect=MLDocumentsMocker.delete_documents_side_effect,
+    )
+
+    job = DeleteDocumentsJob(batch_size=2)
+    job.with_collections("test-collection")
+    job.with_uris_input(["/other/doc.xml"])
+    report = job.run_sync()
+
+    assert eval_route.call_count == 1 + 3 + 3
+    assert sorted(_deleted_uris(route)) == sorted([*_uris(1, 9), "/other/doc.xml"])
+    assert report.successful == 10
+
+
+@respx.mock
+def test_job_without_query_criteria_does_not_enumerate():
+    eval_route = respx.post(EVAL_URL).respond(500)
+    respx.delete(DOCUMENTS_URL).respond(204)
+
+    job = DeleteDocumentsJob()
+    job.with_uris_input(_uris(1, 3))
+    report = job.run_sync()
+
+    assert eval_route.call_count == 0
+    assert report.successful == 3
+
+
+@respx.mock
+def test_job_resets_metadata_of_temporal_documents():
+    route = respx.delete(DOCUMENTS_URL).respond(204)
+
+    job = DeleteDocumentsJob()
+    job.with_uris_input(_uris(1, 2))
+    job.with_metadata(Category.COLLECTIONS, "quality")
+    job.with_temporal_collection("temporal", wipe_temporal=True)
+    job.run_sync()
+
+    params = route.calls.last.request.url.params
+    assert params.get_list("category") == ["collections", "quality"]
+    assert params["temporal-collection"] == "temporal"
+    assert params["result"] == "wiped"
+
+
+@respx.mock
+def test_failing_job():
+    respx.delete(DOCUMENTS_URL).respond(
+        401,
+        json={
+            "errorResponse": {
+                "statusCode": 401,
+                "status": "Unauthorized",
+                "message": "401 Unauthorized",
+            },
+        },
+    )
+    uris = _uris(1, 4)
+
+    job = DeleteDocumentsJob(batch_size=2)
+    job.with_uris_input(uris)
+    report = job.run_sync()
+
+    assert report.failed == 4
+    assert report.successful == 0
+    doc_report = report.get_doc_report(uris[0])
+    assert doc_report.details.error == MarkLogicError
+    assert doc_report.details.message == "[401 Unauthorized] 401 Unauthorized"
@@ -257,3 +257,112 @@ def test_copy():
     assert report_copy.successful == 2
 
     assert report.successful == 1
+
+
+def test_copy_not_affected_by_original():
+    report = DocumentJobReport()
+    report.add_pending_docs(["/some/uri-1.xml", "/some/uri-2.xml"])
+
+    report_copy = copy(report)
+    report.add_successful_doc("/some/uri-1.xml")
+    report.add_failed_doc("/some/uri-2.xml", RuntimeError("Some error"))
+
+    assert report.successful == 1
+    assert report.failed == 1
+    assert report_copy.pending == 2
+    assert report_copy.completed == 0
+    assert report_copy.get_doc_report("/some/uri-2.xml").details is None
+
+
+def test_copy_of_many_docs_not_affected_by_original():
+    uris = [f"/some/uri-{i}.xml" for i in range(10000)]
+    report = DocumentJobReport()
+    report.add_pending_docs(uris)
+
+    report_copy = copy(report)
+    report.add_successful_docs(uris[:5000])
+    report.add_failed_doc(uris[-1], RuntimeError("Some error"))
+    report.add_successful_doc("/some/uri-new.xml")
+
+    assert report.pending == 4999
+    assert report.successful_docs == [*uris[:5000], "/some/uri-new.xml"]
+    assert report.failed_docs == uris[-1:]
+    assert report_copy.pending == 10000
+    assert report_copy.pending_docs == uris
+    assert report_copy.get_doc_report(uris[-1]).details is None
+    assert report_copy.get_doc_report("/some/uri-new.xml") is None
+    assert len(report_copy.full) == 10000
+
+
+def test_copies_registering_new_docs_independently():
+    uris = [f"/some/uri-{i}.xml" for i in range(5000)]
+    report = DocumentJobReport()
+    report.add_successful_docs(uris)
+
+    report_copy = copy(report)
+    report_copy.add_failed_doc("/some/uri-copy.xml", RuntimeError("Some error"))
+    report.add_pending_doc("/some/uri-original.xml")
+
+    assert report.get_doc_report("/some/uri-copy.xml") is None
+    assert report.pending_docs == ["/some/uri-original.xml"]
+    assert report_copy.get_doc_report("/some/uri-original.xml") is None
+    assert report_copy.failed_docs == ["/some/uri-copy.xml"]
+    assert report.successful == report_copy.successful == 5000
+
+
+def test_failed_doc_completed_successfully_on_retry():
+    report = DocumentJobReport()
+    report.add_failed_doc("/some/uri-1.xml", RuntimeError("Some error"))
+    report.add_successful_doc("/some/uri-1.xml")
+
+    doc_report = report.get_doc_report("/some/uri-1.xml")
+    assert report.successful == 1
+    assert report.failed == 0
+    assert doc_report.status == DocumentStatus.success
+    assert doc_report.details is None
+
+
+def test_add_doc_report_with_details():
+    report = DocumentJobReport()
+    report.add_doc_report(
+        DocumentReport(
+            uri="/some/uri-1.xml",
+            status="FAILURE",
+            details={"error": RuntimeError, "message": "Some error"},
+        ),
+    )
+
+    doc_report = report.get_doc_report("/some/uri-1.xml")
+    assert report.failed == 1
+    assert doc_report.details.error is RuntimeError
+    assert doc_report.details.message == "Some error"
+
+
+def test_counters_for_many_docs():
+    uris = [f"/some/uri-{i}.xml" for i in range(10000)]
+    report = DocumentJobReport()
+    report.add_pending_docs(uris)
+    report.add_successful_docs(uris[:6000])
+    report.add_failed_docs(uris[6000:9000], RuntimeError("Some error"))
+
+    assert report.pending == 1000
+    assert report.successful == 6000
+    assert report.failed == 3000
+    assert report.completed == 9000
+    assert report.pending_docs == uris[9000:]
+    assert report.failed_docs == uris[6000:9000]
+    assert len(report.full) == 10000
+
+
+def test_add_tuning():
+    report = DocumentJobReport()
+    report.add_tuning(8, 100)
+    report.add_successful_docs(["/some/uri-1.xml", "/some/uri-2.xml"])
+    report_copy = copy(report)
+    report.add_tuning(9, 110)
+
+    assert [(t.concurrency, t.batch_size, t.completed) for t in report.tuning] == [
+        (8, 100, 0),
+        (9, 110, 2),
+    ]
+    assert len(report_copy.tuning) == 1
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from mlclient.exceptions import WrongParametersError
+from mlclient.jobs import DeleteDocumentsJob, JobJournal, WriteDocumentsJob
+from mlclient.models import XMLDocument
+from tests.utils.ml_mockers import MLDocumentsMocker
+
+DOCUMENTS_URL = "http://localhost:8000/v1/documents"
+
+
+def _uris(count: int) -> list[str]:
+    return [f"/some/dir/doc{i + 1}.xml" for i in range(count)]
+
+
+async def _record_and_reopen(path, resume: bool) -> frozenset[str]:
+    async with JobJournal(path) as journal:
+        journal.record_successful(["/a.xml", "/b.xml"])
+        journal.record_failed(["/c.xml"], ValueError("error"))
+        journal.record_successful(["/c.xml"])
+        journal.record_failed(["/b.xml"], ValueError("error"))
+    async with JobJournal(path, resume=resume) as journal:
+        return journal.completed
+
+
+def test_journal_keeps_latest_outcomes(tmp_path):
+    path = tmp_path / "job.journal"
+
+    completed = asyncio.run(_record_and_reopen(path, resume=True))
+
+    assert completed == {"/a.xml", "/c.xml"}
+
+
+def test_journal_removes_previous_run_outcomes(tmp_path):
+    path = tmp_path / "job.journal"
+
+    completed = asyncio.run(_record_and_reopen(path, resume=False))
+
+    assert completed == frozenset()
+
+
+def test_disabled_journal():
+    async def record():
+        async with JobJournal(None) as journal:
+            journal.record_successful(["/a.xml"])
+            return journal.is_completed("/a.xml")
+
+    assert asyncio.run(record()) is False
+
+
+def test_resume_without_journal():
+    job = DeleteDocumentsJob()
+
+    with pytest.raises(WrongParametersError) as err:
+        job.resume_sync()
+
+    expected_msg = "A job can be resumed only with a journal (see with_journal())!"
+    assert err.value.args[0] == expected_msg
+
+
+@respx.mock
+def test_resumed_job_skips_completed_documents(tmp_path):
+    def failing_batch(request: httpx.Request) -> httpx.Response:
+        if "/some/dir/doc3.xml" in request.url.params.get_list("uri"):
+            return httpx.Response(500, json={"errorResponse": {"message": "error"}})
+        return httpx.Response(204)
+
+    uris = _uris(6)
+    route = respx.delete(DOCUMENTS_URL).mock(side_effect=failing_batch)
+
+    job = DeleteDocumentsJob(concurrency=1, batch_size=2)
+    job.with_journal(str(tmp_path / "delete.journal"))
+    job.with_uris_input(uris)
+    first_report = job.run_sync()
+
+    route.mock(side_effect=MLDocumentsMocker.delete_documents_side_effect)
+    route.calls.clear()
+    resumed_job = DeleteDocumentsJob(concurrency=1, batch_size=2)
+    resumed_job.with_journal(str(tmp_path / "delete.journal"))
+    resumed_job.with_uris_input(uris)
+    resumed_report = resumed_job.resume_sync()
+
+    assert first_report.failed == 2
+    assert route.call_count == 1
+    assert route.calls.last.request.url.params.get_list("uri") == uris[2:4]
+    assert resumed_report.successful == 2
+    assert resumed_report.pending_docs == []
+
+
+@respx.mock
+def test_run_with_journal_starts_over(tmp_path):
+    doc_mocker = MLDocumentsMocker()
+    route = respx.post(DOCUMENTS_URL).mock(
+        side_effect=doc_mocker.post_documents_side_effect,
+    )
+    journal_path = str(tmp_path / "write.journal")
+
+    for _ in range(2):
+        job = WriteDocumentsJob(batch_size=5)
+        job.with_journal(journal_path)
+        job.with_documents_input(XMLDocument(b"<root/>", uri) for uri in _uris(5))
+        job.run_sync()
+    job.with_documents_input(XMLDocument(b"<root/>", uri) for uri in _uris(5))
+    job.resume_sync()
+
+    assert route.call_count == 2
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import respx
+
+from mlclient.exceptions import WrongParametersError
+from mlclient.jobs import QueryBatcher, QueryDocumentsJob
+from mlclient.models.http import DocumentsBodyPart as BodyPart
+from tests.utils.ml_mockers import MLDocumentsMocker, MLForestsMocker
+
+EVAL_URL = "http://localhost:8000/v1/eval"
+DOCUMENTS_URL = "http://localhost:8000/v1/documents"
+TIMESTAMP = MLForestsMocker.TIMESTAMP
+
+
+def _uris(start: int, count: int) -> list[str]:
+    return [f"/some/dir/doc{i}.xml" for i in range(start, start + count)]
+
+
+def _body_parts(count: int) -> list[BodyPart]:
+    return [
+        BodyPart(
+            **{
+                "content-type": "application/xml",
+                "content-disposition": "attachment; "
+                f'filename="{uri}"; category=content; format=xml',
+                "content": f"<root><child>{uri}</child></root>",
+            },
+        )
+        for uri in _uris(1, count)
+    ]
+
+
+@respx.mock
+def test_job_reads_documents_of_all_forests():
+    ml_doc_mocker = MLDocumentsMocker()
+    forests = MLForestsMocker({"111": _uris(1, 7), "222": _uris(8, 5)})
+    eval_route = respx.post(EVAL_URL).mock(side_effect=forests.eval_side_effect)
+    docs_route = respx.get(DOCUMENTS_URL).mock(
+        side_effect=ml_doc_mocker.get_documents_side_effect,
+    )
+    with ml_doc_mocker.scoped():
+        ml_doc_mocker.mock_document(*_body_parts(12))
+
+        job = QueryDocumentsJob(concurrency=2, batch_size=3)
+        job.with_collections("test-collection")
+        job.with_database("Documents")
+        job.with_documents_output()
+        report = job.run_sync()
+
+    assert report.successful == 12
+    assert report.failed == 0
+    assert sorted(doc.uri for doc in job.documents) == sorted(_uris(1, 12))
+    assert job.timestamp == TIMESTAMP
+    assert eval_route.calls[0].request.url.params["database"] == "Documents"
+    assert [page["forest"] for page in forests.pages].count("111") == 3
+    assert [page["forest"] for page in forests.pages].count("222") == 2
+    assert all(page["timestamp"] == TIMESTAMP for page in forests.pages)
+    query = json.loads(forests.pages[0]["query"])
+    assert query == {"collectionQuery": {"uris": ["test-collection"]}}
+    timestamps = {call.request.url.params["timestamp"] for call in docs_route.calls}
+    assert timestamps == {TIMESTAMP}
+
+
+@respx.mock
+def test_job_with_timestamp_and_uris_input():
+    ml_doc_mocker = MLDocumentsMocker()
+    forests = MLForestsMocker({"111": _uris(1, 2)})
+    respx.post(EVAL_URL).mock(side_effect=forests.eval_side_effect)
+    docs_route = respx.get(DOCUMENTS_URL).mock(
+        side_effect=ml_doc_mocker.get_documents_side_effect,
+    )
+    with ml_doc_mocker.scoped():
+        ml_doc_mocker.mock_document(*_body_parts(3))
+
+        job = QueryDocumentsJob(batch_size=10)
+        job.with_directory("/some/dir/")
+        job.with_timestamp("123")
+        job.with_uris_input(_uris(3, 1))
+        report = job.run_sync()
+
+    assert report.successful == 3
+    assert forests.pages[0]["timestamp"] == "123"
+    assert all(
+        call.request.url.params["timestamp"] == "123" for call in docs_route.calls
+    )
+
+
+def test_query_batcher_combines_criteria():
+    batcher = QueryBatcher(
+        collections=["a", "b"],
+        directory="/dir/",
+        query={"wordQuery": {"text": ["foo"]}},
+    )
+
+    assert json.loads(batcher.query) == {
+        "andQuery": {
+            "queries": [
+                {"collectionQuery": {"uris": ["a", "b"]}},
+                {"directoryQuery": {"uris": ["/dir/"], "depth": "infinity"}},
+                {"wordQuery": {"text": ["foo"]}},
+            ],
+        },
+    }
+    assert QueryBatcher().query == ""
+
+
+def test_query_batcher_with_directory_without_slash():
+    with pytest.raises(WrongParametersError) as err:
+        QueryBatcher(directory="/dir")
+
+    assert err.value.args[0] == "A directory must end with a slash: [/dir]!"
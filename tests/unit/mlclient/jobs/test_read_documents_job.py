@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import xml.etree.ElementTree as ElemTree
 from collections.abc import Iterable
 from pathlib import Path
 
+import httpx
+import pytest
 import respx
+from pytest_mock import MockerFixture
 
 from mlclient.exceptions import MarkLogicError
 from mlclient.jobs import ReadDocumentsJob
 from mlclient.models import Document, DocumentType, XMLDocument
 from mlclient.models.http import Category
 from mlclient.models.http import DocumentsBodyPart as BodyPart
+from mlclient.services import AsyncDocumentsService
 from tests.utils import filesystem as fs_utils
 from tests.utils.ml_mockers import MLDocumentsMocker, MLRespXMocker
 
@@ -33,6 +38,7 @@ def test_basic_job_with_documents_output():
 
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -45,6 +51,111 @@ def test_basic_job_with_documents_output():
     _confirm_documents_data(uris, docs)
 
 
+@ml_mocker.router
+def test_basic_job_without_documents_output():
+    with ml_doc_mocker.scoped():
+        uris_count = 5
+        uris = [f"/some/dir/doc{i + 1}.xml" for i in range(uris_count)]
+        ml_doc_mocker.mock_document(*_get_test_document_body_parts(uris_count))
+
+        job = ReadDocumentsJob(batch_size=5)
+
+        job.with_client_config(auth_method="digest")
+        job.with_uris_input(uris)
+        job.run_sync()
+
+    assert ml_mocker.router.calls.call_count == 1
+    assert job.report.successful == uris_count
+    assert job.documents == []
+
+
+@ml_mocker.router
+def test_job_with_adaptive_tuning():
+    with ml_doc_mocker.scoped():
+        uris_count = 200
+        uris = [f"/some/dir/doc{i + 1}.xml" for i in range(uris_count)]
+        ml_doc_mocker.mock_document(*_get_test_document_body_parts(uris_count))
+
+        job = ReadDocumentsJob(concurrency=2, batch_size=5)
+
+        job.with_client_config(auth_method="digest")
+        job.with_uris_input(uris)
+        job.with_adaptive_tuning(max_concurrency=4, max_batch_size=20)
+        job.run_sync()
+
+    tuning = job.report.tuning
+    assert job.report.successful == uris_count
+    assert (tuning[0].concurrency, tuning[0].batch_size) == (2, 5)
+    assert len(tuning) > 1
+    assert all(t.batch_size <= 20 for t in tuning)
+    assert job.report.pool_stats.max_connections == 4
+
+
+@ml_mocker.router
+def test_job_sizes_connection_pool_for_concurrency():
+    with ml_doc_mocker.scoped():
+        uris_count = 20
+        uris = [f"/some/dir/doc{i + 1}.xml" for i in range(uris_count)]
+        ml_doc_mocker.mock_document(*_get_test_document_body_parts(uris_count))
+
+        job = ReadDocumentsJob(concurrency=24, batch_size=5)
+
+        job.with_client_config(auth_method="digest")
+        job.with_uris_input(uris)
+        job.run_sync()
+
+    pool_stats = job.report.pool_stats
+    assert pool_stats.max_connections == 24
+    assert pool_stats.max_keepalive_connections == 24
+    assert pool_stats.requests == 0
+    assert pool_stats.queued == 0
+
+
+@pytest.mark.asyncio
+@ml_mocker.router
+async def test_job_run_stream():
+    with ml_doc_mocker.scoped():
+        uris_count = 50
+        uris = [f"/some/dir/doc{i + 1}.xml" for i in range(uris_count)]
+        ml_doc_mocker.mock_document(*_get_test_document_body_parts(uris_count))
+
+        job = ReadDocumentsJob(concurrency=2, batch_size=10)
+
+        job.with_client_config(auth_method="digest")
+        job.with_uris_input(iter(uris))
+        docs = [doc async for doc in job.run_stream()]
+
+    assert ml_mocker.router.calls.call_count == 5
+    assert job.report.completed == uris_count
+    assert job.report.successful == uris_count
+    assert job.documents == []
+    _confirm_documents_data(uris, docs)
+
+
+@pytest.mark.asyncio
+@ml_mocker.router
+async def test_job_run_stream_with_filesystem_output():
+    with ml_doc_mocker.scoped():
+        uris_count = 20
+        uris = [f"/some/dir/doc{i + 1}.xml" for i in range(uris_count)]
+        ml_doc_mocker.mock_document(*_get_test_document_body_parts(uris_count))
+
+        output_dir = _new_output_dir()
+        try:
+            job = ReadDocumentsJob(concurrency=4, batch_size=5)
+            job.with_client_config(auth_method="digest")
+            job.with_uris_input(uris)
+            job.with_filesystem_output(output_dir)
+            docs = [doc async for doc in job.run_stream()]
+
+            assert ml_mocker.router.calls.call_count == 4
+            assert job.report.successful == uris_count
+            _confirm_documents_data(uris, docs)
+            _confirm_filesystem_data(uris, output_dir)
+        finally:
+            _remove_output_dir(output_dir)
+
+
 @ml_mocker.router
 def test_basic_job_with_filesystem_output():
     with ml_doc_mocker.scoped():
@@ -89,6 +200,7 @@ def test_basic_job_with_multiple_inputs():
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris[:250])
         job.with_uris_input(uris[250:])
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -115,6 +227,7 @@ def test_job_with_documents_output_and_full_metadata():
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
         job.with_metadata()
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -144,6 +257,7 @@ def test_job_with_documents_output_and_some_metadata_categories():
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
         job.with_metadata("quality")
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -173,6 +287,7 @@ def test_job_with_documents_output_and_category_enum():
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
         job.with_metadata(Category.QUALITY)
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -269,6 +384,7 @@ def test_job_with_custom_database():
         job.with_client_config(auth_method="digest")
         job.with_database("Documents")
         job.with_uris_input(uris)
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -295,6 +411,7 @@ def test_job_with_multiple_batches():
 
         job.with_client_config(auth_method="digest")
         job.with_uris_input(uris)
+        job.with_documents_output()
         job.run_sync()
         docs = job.documents
 
@@ -360,6 +477,7 @@ def test_failing_job():
     job = ReadDocumentsJob(batch_size=5)
     job.with_client_config(auth_method="digest")
     job.with_uris_input(uris)
+    job.with_documents_output()
     job.run_sync()
     docs = job.documents
 
@@ -374,6 +492,68 @@ def test_failing_job():
     assert len(docs) == 0
 
 
+def test_job_failing_in_the_middle_of_stream(
+    tmp_path: Path,
+    mocker: MockerFixture,
+):
+    uris = [f"/some/dir/doc{i + 1}.xml" for i in range(5)]
+    requested = []
+
+    async def read_stream(_service, batch: list[str], **_options):
+        requested.append(batch)
+        for uri in batch[:2]:
+            yield XMLDocument(b"<root/>", uri)
+        msg = "Connection lost"
+        raise httpx.ReadError(msg)
+
+    mocker.patch.object(AsyncDocumentsService, "read_stream", read_stream)
+    journal_path = str(tmp_path / "read.journal")
+
+    job = ReadDocumentsJob(batch_size=5)
+    job.with_journal(journal_path)
+    job.with_uris_input(uris)
+    job.with_documents_output()
+    job.run_sync()
+
+    assert job.report.completed == 5
+    assert job.report.successful == 2
+    assert job.report.failed == 3
+    assert job.report.successful_docs == uris[:2]
+    assert job.report.failed_docs == uris[2:]
+    assert [doc.uri for doc in job.documents] == uris[:2]
+
+    resumed_job = ReadDocumentsJob(batch_size=5)
+    resumed_job.with_journal(journal_path)
+    resumed_job.with_uris_input(uris)
+    resumed_job.resume_sync()
+
+    assert requested == [uris, uris[2:]]
+
+
+@pytest.mark.asyncio
+async def test_job_failing_to_build_client_cancels_filesystem_writers(
+    mocker: MockerFixture,
+):
+    msg = "Using HTTP/2 requires the h2 package"
+    mocker.patch(
+        "mlclient.jobs.documents_jobs.AsyncMLClient",
+        side_effect=ImportError(msg),
+    )
+    output_dir = _new_output_dir()
+    try:
+        job = ReadDocumentsJob(batch_size=5)
+        job.with_uris_input(["/some/dir/doc1.xml"])
+        job.with_filesystem_output(output_dir)
+
+        with pytest.raises(ImportError):
+            await job.run()
+        await asyncio.sleep(0)
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+    finally:
+        _remove_output_dir(output_dir)
+
+
 @ml_mocker.router
 def test_failing_filesystem_write_step():
     with ml_doc_mocker.scoped():
@@ -407,6 +587,19 @@ def test_failing_filesystem_write_step():
             assert output_dir_path.exists()
 
 
+def _new_output_dir() -> str:
+    output_dir = str(Path(__file__).resolve().parent / "output")
+    assert not Path(output_dir).exists()
+    return output_dir
+
+
+def _remove_output_dir(
+    output_dir: str,
+):
+    fs_utils.safe_rmdir(output_dir)
+    assert not Path(output_dir).exists()
+
+
 def _get_test_document_body_parts(
     count: int,
     *,
@@ -1,8 +1,11 @@
+import httpx
 import respx
+from pytest_mock import MockerFixture
 
 from mlclient.exceptions import MarkLogicError
 from mlclient.jobs import WriteDocumentsJob
-from mlclient.models import XMLDocument
+from mlclient.models import BinaryDocument, FileContent, Metadata, XMLDocument
+from mlclient.multipart import decode_multipart_mixed
 from tests.utils import resources as resources_utils
 from tests.utils.ml_mockers import MLDocumentsMocker, MLRespXMocker
 
@@ -81,6 +84,218 @@ def test_job_with_custom_database():
     assert job.report.failed == 0
 
 
+@respx.mock
+def test_job_consumes_input_lazily():
+    consumed_uris = []
+    consumed_at_first_request = []
+
+    def docs_input():
+        for doc in _get_test_docs(1000):
+            consumed_uris.append(doc.uri)
+            yield doc
+
+    def post_side_effect(request):
+        if not consumed_at_first_request:
+            consumed_at_first_request.append(len(consumed_uris))
+        return ml_doc_mocker.post_documents_side_effect(request)
+
+    respx.post("http://localhost:8000/v1/documents").mock(side_effect=post_side_effect)
+
+    job = WriteDocumentsJob(concurrency=2, batch_size=10)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(docs_input())
+    job.run_sync()
+
+    # 2 batches in flight, 2 queued and 1 being produced at most
+    assert consumed_at_first_request[0] <= 5 * 10
+    assert respx.calls.call_count == 100
+    assert job.report.completed == 1000
+    assert job.report.successful == 1000
+
+
+@ml_mocker.router
+def test_job_with_max_batch_bytes():
+    docs = list(_get_test_docs(10))  # 32 bytes each
+
+    job = WriteDocumentsJob(batch_size=5, max_batch_bytes=100)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(docs)
+    job.run_sync()
+
+    batch_sizes = [
+        len(_get_request_parts(call.request)) for call in ml_mocker.router.calls
+    ]
+    assert sorted(batch_sizes) == [1, 3, 3, 3]
+    assert job.report.successful == 10
+
+
+@ml_mocker.router
+def test_job_with_max_batch_bytes_sends_oversized_docs_solo():
+    small_docs = list(_get_test_docs(4))
+    big_doc = BinaryDocument(b"\x00" * 1000, "/some/dir/big.bin")
+    docs = [*small_docs[:2], big_doc, *small_docs[2:]]
+
+    job = WriteDocumentsJob(concurrency=1, batch_size=10, max_batch_bytes=100)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(docs)
+    job.run_sync()
+
+    batches = [
+        [
+            part.headers["Content-Disposition"]
+            for part in _get_request_parts(call.request)
+        ]
+        for call in ml_mocker.router.calls
+    ]
+    assert [len(batch) for batch in batches] == [2, 1, 2]
+    assert "/some/dir/big.bin" in batches[1][0]
+    assert job.report.successful == 5
+
+
+@ml_mocker.router
+def test_job_with_max_batch_bytes_serializes_metadata_once(mocker: MockerFixture):
+    docs = [
+        XMLDocument(b"<root/>", f"/some/dir/doc{i + 1}.xml", Metadata(["c1"]))
+        for i in range(10)
+    ]
+    to_json_string = mocker.spy(Metadata, "to_json_string")
+
+    job = WriteDocumentsJob(batch_size=5, max_batch_bytes=400)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(docs)
+    job.run_sync()
+
+    assert ml_mocker.router.calls.call_count == 4
+    assert to_json_string.call_count == 10
+    assert job.report.successful == 10
+
+
+@ml_mocker.router
+def test_job_streams_file_backed_content(tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"\x00" * 200_000)
+    doc = BinaryDocument(FileContent(path), "/some/dir/big.bin")
+
+    job = WriteDocumentsJob(batch_size=5)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input([doc])
+    job.run_sync()
+
+    request = ml_mocker.router.calls.last.request
+    (part,) = _get_request_parts(request)
+    assert part.content == b"\x00" * 200_000
+    assert int(request.headers["Content-Length"]) == len(request.content)
+    assert job.report.successful == 1
+
+
+@ml_mocker.router
+def test_job_records_fixed_settings():
+    job = WriteDocumentsJob(concurrency=4, batch_size=5)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(_get_test_docs(20))
+    job.run_sync()
+
+    tuning = job.report.tuning
+    assert len(tuning) == 1
+    assert tuning[0].concurrency == 4
+    assert tuning[0].batch_size == 5
+    assert tuning[0].completed == 0
+
+
+@ml_mocker.router
+def test_job_with_adaptive_tuning():
+    job = WriteDocumentsJob(concurrency=2, batch_size=10)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(_get_test_docs(1000))
+    job.with_adaptive_tuning(max_concurrency=4, max_batch_size=40)
+    job.run_sync()
+
+    tuning = job.report.tuning
+    assert job.report.successful == 1000
+    assert (tuning[0].concurrency, tuning[0].batch_size) == (2, 10)
+    assert len(tuning) > 1
+    assert all(1 <= t.concurrency <= 4 for t in tuning)
+    assert all(2 <= t.batch_size <= 40 for t in tuning)
+
+
+@ml_mocker.router
+def test_job_sizes_connection_pool_for_concurrency():
+    job = WriteDocumentsJob(concurrency=4, batch_size=5)
+
+    job.with_client_config(auth_method="digest")
+    job.with_documents_input(_get_test_docs(20))
+    job.run_sync()
+
+    pool_stats = job.report.pool_stats
+    assert pool_stats.max_connections == 4
+    assert pool_stats.max_keepalive_connections == 4
+    assert pool_stats.requests == 0
+    assert pool_stats.queued == 0
+
+
+@ml_mocker.router
+def test_job_with_custom_connection_pool_limits():
+    job = WriteDocumentsJob(concurrency=4, batch_size=5)
+
+    job.with_client_config(auth_method="digest", limits=httpx.Limits(max_connections=2))
+    job.with_documents_input(_get_test_docs(20))
+    job.run_sync()
+
+    assert job.report.pool_stats.max_connections == 2
+    assert job.report.successful == 20
+
+
+@respx.mock
+def test_job_in_cluster_mode():
+    respx.get("http://localhost:8002/manage/v2/hosts").respond(
+        200,
+        json={
+            "host-default-list": {
+                "list-items": {
+                    "list-item": [
+                        {"idref": "1", "nameref": "ml-node-1"},
+                        {"idref": "2", "nameref": "ml-node-2"},
+                    ],
+                },
+            },
+        },
+    )
+    routes = [
+        respx.post(f"http://{host}:8000/v1/documents").mock(
+            side_effect=ml_doc_mocker.post_documents_side_effect,
+        )
+        for host in ("ml-node-1", "ml-node-2")
+    ]
+
+    job = WriteDocumentsJob(concurrency=2, batch_size=5)
+
+    job.with_client_config(auth_method="digest", cluster=True)
+    job.with_documents_input(_get_test_docs(40))
+    job.run_sync()
+
+    assert [route.call_count for route in routes] == [4, 4]
+    assert job.report.successful == 40
+    assert job.report.pool_stats.hosts == 2
+
+
+@ml_mocker.router
+def test_job_without_input():
+    job = WriteDocumentsJob(batch_size=5)
+
+    job.with_client_config(auth_method="digest")
+    job.run_sync()
+
+    assert ml_mocker.router.calls.call_count == 0
+    assert job.report.completed == 0
+
+
 @respx.mock
 def test_failing_job():
     docs = _get_test_docs(5)
@@ -123,3 +338,7 @@ def _get_test_docs(
         uri = f"/some/dir/doc{i + 1}.xml"
         content = b"<root><child>data</child></root>"
         yield XMLDocument(content, uri)
+
+
+def _get_request_parts(request):
+    return decode_multipart_mixed(request.content, request.headers["Content-Type"])
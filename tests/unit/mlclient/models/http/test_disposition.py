@@ -3,8 +3,10 @@ from mlclient.models.http.documents import (
     BodyPartType,
     Category,
     Disposition,
+    DispositionRecord,
     Extract,
     Repair,
+    _parse_disposition,
 )
 
 
@@ -174,3 +176,79 @@ def test_serialize_field_uses_enum_values_and_quotes_filename():
         "category=collections; category=quality"
     )
     assert disposition._serialize_field("extract") == "extract=properties"
+
+
+def test_record_from_header_for_attachment():
+    raw = (
+        "attachment; "
+        'filename="/path/to/file.xml"; '
+        "category=content; "
+        "versionId=3; "
+        "format=json"
+    )
+
+    assert DispositionRecord.from_header(raw) == DispositionRecord(
+        type_=BodyPartType.ATTACHMENT,
+        filename="/path/to/file.xml",
+        category=Category.CONTENT,
+        version_id=3,
+        format_=DocumentType.JSON,
+    )
+
+
+def test_record_from_header_for_multiple_categories():
+    raw = 'attachment; filename="/doc.xml"; category=collections; category=quality'
+
+    record = DispositionRecord.from_header(raw)
+    assert record.category == (Category.COLLECTIONS, Category.QUALITY)
+    assert record.is_attachment is True
+
+
+def test_record_from_header_for_filename_with_separators():
+    raw = 'attachment; filename="/dir/a; b=c.xml"; category=content'
+
+    record = DispositionRecord.from_header(raw)
+    assert record.filename == "/dir/a; b=c.xml"
+    assert record.category == Category.CONTENT
+
+
+def test_record_from_header_is_memoized_without_filename():
+    _parse_disposition.cache_clear()
+    first = DispositionRecord.from_header('attachment; filename="/a.xml"; format=xml')
+    second = DispositionRecord.from_header('attachment; filename="/b.xml"; format=xml')
+
+    assert (first.filename, second.filename) == ("/a.xml", "/b.xml")
+    assert first.format_ == second.format_ == DocumentType.XML
+    assert _parse_disposition.cache_info().hits == 1
+
+
+def test_record_to_header_matches_disposition():
+    disposition = Disposition(
+        type=BodyPartType.ATTACHMENT,
+        category=["collections", "quality"],
+        filename="/path/to/file.xml",
+        repair=Repair.FULL,
+        version_id=1,
+        format=DocumentType.JSON,
+    )
+
+    assert disposition.to_record().to_header() == (
+        "attachment; "
+        'filename="/path/to/file.xml"; '
+        "category=collections; "
+        "category=quality; "
+        "repair=full; "
+        "versionId=1; "
+        "format=json"
+    )
+
+
+def test_record_roundtrip_through_disposition():
+    record = DispositionRecord(
+        type_=BodyPartType.INLINE,
+        category=(Category.COLLECTIONS, Category.QUALITY),
+        extract=Extract.PROPERTIES,
+    )
+
+    assert record.to_disposition().to_record() == record
+    assert DispositionRecord.from_header(record.to_header()) == record
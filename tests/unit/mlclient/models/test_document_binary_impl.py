@@ -1,6 +1,6 @@
 import pytest
 
-from mlclient.models import BinaryDocument, Document, DocumentType
+from mlclient.models import BinaryDocument, Document, DocumentType, FileContent
 
 
 def test_is_document_subclass():
@@ -29,3 +29,36 @@ def test_content_string():
 
 def test_doc_type():
     assert BinaryDocument(b'{"root": "data"}').doc_type == DocumentType.BINARY
+
+
+def test_file_content(tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"\x00\x01" * 10)
+    document = BinaryDocument(FileContent(path, chunk_size=8))
+    assert document.content_source == FileContent(path)
+    assert document.content_length == 20
+    assert document.content == b"\x00\x01" * 10
+    assert document.content_bytes == b"\x00\x01" * 10
+    assert [len(chunk) for chunk in document.content_source] == [8, 8, 4]
+
+
+@pytest.mark.asyncio
+async def test_file_content_async_iteration(tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"data" * 5)
+    content = FileContent(path, chunk_size=16)
+    chunks = [chunk async for chunk in content]
+    assert chunks == [b"data" * 4, b"data"]
+
+
+def test_file_content_infers_binary_type(tmp_path):
+    path = tmp_path / "doc.xml"
+    path.write_bytes(b"<root/>")
+    document = Document.create("/doc.xml", FileContent(path))
+    assert type(document) is BinaryDocument
+
+
+def test_file_content_repr(tmp_path):
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"data")
+    assert repr(FileContent(path)) == f"FileContent(path='{path}', size=4)"
@@ -142,3 +142,18 @@ def test_invalidate_without_parsed_keeps_raw():
 
 def test_doc_type():
     assert XMLDocument(ElementTree(Element("root"))).doc_type == DocumentType.XML
+
+
+def test_iterparse():
+    document = XMLDocument(b"<root><child>1</child><child>2</child><other/></root>")
+
+    texts = [element.text for element in document.iterparse("child")]
+    assert texts == ["1", "2"]
+    assert document._parsed is None
+
+
+def test_iterparse_all_elements():
+    document = XMLDocument("<root><child>1</child></root>")
+
+    tags = [element.tag for element in document.iterparse()]
+    assert tags == ["child", "root"]
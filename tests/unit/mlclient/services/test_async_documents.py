@@ -13,6 +13,7 @@ from mlclient.exceptions import MarkLogicError
 from mlclient.models import (
     BinaryDocument,
     DocumentType,
+    FileContent,
     JSONDocument,
     Metadata,
     MetadataDocument,
@@ -187,6 +188,26 @@ async def test_read_doc_with_full_metadata(svc):
     assert document.metadata.collections() == ["xml"]
 
 
+@pytest.mark.asyncio
+@ml_mocker.router
+async def test_read_doc_with_metadata_releases_connection():
+    with ml_doc_mocker.scoped(fresh=False):
+        ml_doc_mocker.mock_document(
+            test_data.doc_full_metadata_body_part(
+                "/some/dir/doc1.xml",
+                MetadataSpec(collections=["xml"]),
+                metadata_category=True,
+            ),
+        )
+        async with AsyncMLClient(auth_method="digest") as ml:
+            await ml.documents.read(
+                "/some/dir/doc1.xml",
+                category=["content", "metadata"],
+            )
+
+            assert ml.http.pool_stats().requests == 0
+
+
 @pytest.mark.asyncio
 @ml_mocker.router
 async def test_read_full_metadata_without_content(svc):
@@ -308,6 +329,22 @@ async def test_create_xml_document_from_bytes(svc):
     assert documents[0]["mime-type"] == "application/xml"
 
 
+@pytest.mark.asyncio
+@ml_mocker.router
+async def test_create_documents_streams_body_with_content_length(svc):
+    docs = [
+        XMLDocument(b"<root><child>data</child></root>", "/some/dir/doc1.xml"),
+        JSONDocument({"root": {"child": "data"}}, "/some/dir/doc2.json"),
+    ]
+
+    resp = await svc.write(docs)
+
+    request = ml_mocker.router.calls.last.request
+    assert "Transfer-Encoding" not in request.headers
+    assert int(request.headers["Content-Length"]) == len(request.content)
+    assert len(resp["documents"]) == 2
+
+
 @pytest.mark.asyncio
 @ml_mocker.router
 async def test_create_xml_document(svc):
@@ -645,3 +682,16 @@ def test_documents_sender_metadata_document_with_metadata_object():
 
     assert len(parts) == 1
     assert '"collections"' in parts[0].content
+
+
+def test_documents_sender_streams_file_content_of_binary_document_subclass(tmp_path):
+    class _BinaryDocument(BinaryDocument):
+        pass
+
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"\x00" * 10)
+    content = FileContent(path)
+    parts = DocumentsSender.parse(_BinaryDocument(content, "/x.bin"))
+
+    assert len(parts) == 1
+    assert parts[0].content is content
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from mlclient import json_codec
+from mlclient.exceptions import WrongParametersError
+
+
+@pytest.fixture(params=["auto", "json", "orjson"])
+def _backend(request):
+    initial_backend = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(initial_backend)
+
+
+@pytest.fixture
+def _orjson_backend():
+    initial_backend = json_codec.get_backend()
+    json_codec.set_backend("orjson")
+    yield
+    json_codec.set_backend(initial_backend)
+
+
+def test_default_backend():
+    assert json_codec.get_backend() == "auto"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b'{"root": {"child": [1, 2.5, true, null]}}',
+        bytearray(b'{"root": {"child": [1, 2.5, true, null]}}'),
+        memoryview(b'{"root": {"child": [1, 2.5, true, null]}}'),
+        '{"root": {"child": [1, 2.5, true, null]}}',
+    ],
+)
+@pytest.mark.usefixtures("_backend")
+def test_loads(data):
+    assert json_codec.loads(data) == {"root": {"child": [1, 2.5, True, None]}}
+
+
+@pytest.mark.usefixtures("_backend")
+def test_loads_invalid_document():
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"<root/>")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"[123456789012345678901234567890, -9223372036854775809]",
+        '{"a": NaN, "b": -Infinity}',
+        b'{"a": 1e400}',
+    ],
+)
+def test_default_backend_loads_like_stdlib(data):
+    assert repr(json_codec.loads(data)) == repr(json.loads(data))
+
+
+@pytest.mark.usefixtures("_backend")
+def test_dumps_roundtrip():
+    data = {"root": {"child": ["żółć", 1, None]}}
+    assert json.loads(json_codec.dumps(data)) == data
+    assert json.loads(json_codec.dumps_bytes(data)) == data
+
+
+@pytest.mark.parametrize("_backend", ["auto", "json"], indirect=True)
+@pytest.mark.usefixtures("_backend")
+def test_dumps_keeps_stdlib_format():
+    assert json_codec.dumps({"root": "data"}) == '{"root": "data"}'
+    assert json_codec.dumps_bytes({"root": "data"}) == b'{"root": "data"}'
+    expected = '{\n    "root": "data"\n}'
+    assert json_codec.dumps({"root": "data"}, indent=4) == expected
+
+
+@pytest.mark.usefixtures("_orjson_backend")
+def test_orjson_dumps_compact():
+    assert json_codec.dumps({"root": "data"}) == '{"root":"data"}'
+    assert json_codec.dumps_bytes({1: "data"}) == b'{"1":"data"}'
+    assert json_codec.dumps({"root": "data"}, indent=2) == '{\n  "root": "data"\n}'
+    expected = '{\n    "root": "data"\n}'
+    assert json_codec.dumps({"root": "data"}, indent=4) == expected
+
+
+@pytest.mark.usefixtures("_orjson_backend")
+def test_orjson_dumps_falls_back_to_stdlib():
+    assert json_codec.dumps_bytes({"big": 2**70}) == b'{"big": 1180591620717411303424}'
+
+
+def test_set_unknown_backend():
+    with pytest.raises(WrongParametersError, match="Unknown JSON backend \\[ujson\\]"):
+        json_codec.set_backend("ujson")
+
+
+def test_set_orjson_backend_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_codec, "orjson", None)
+    with pytest.raises(WrongParametersError, match="requires the orjson package"):
+        json_codec.set_backend("orjson")
+    assert json_codec.get_backend() == "auto"
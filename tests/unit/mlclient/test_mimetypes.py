@@ -113,3 +113,19 @@ def test_doc_type_does_not_match_extension_substring():
 def test_mimetype_anchored_to_dot():
     # A directory named ".t" inside the path must not influence the match.
     assert Mimetypes.get_mimetype("/path/with.t/file.txt") == "text/plain"
+
+
+def test_mimetype_is_case_insensitive():
+    assert Mimetypes.get_mimetype("/some/dir/DOC1.XML") == "application/xml"
+
+
+def test_mimetype_for_compound_name():
+    assert Mimetypes.get_mimetype("/some/dir/doc.backup.zip") == "application/zip"
+
+
+def test_mimetype_ignores_dots_in_directories():
+    assert Mimetypes.get_mimetype("/some/dir.zip/doc5") is None
+
+
+def test_doc_type_for_content_type_text_xml():
+    assert Mimetypes.get_doc_type("text/xml; charset=utf-8") == DocumentType.XML
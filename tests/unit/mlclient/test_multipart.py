@@ -1,9 +1,24 @@
 import pytest
 
 from mlclient.multipart import (
+    MultipartDecoder,
     MultipartPart,
+    MultipartStream,
+    aiter_multipart_mixed,
     decode_multipart_mixed,
     encode_multipart_mixed,
+    iter_multipart_mixed,
+)
+
+RAW_MULTIPART = (
+    b"--boundary\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"part1\r\n"
+    b"--boundary\r\n"
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n" + bytes(range(256)) + b"\r\n"
+    b"--boundary--\r\n"
 )
 
 
@@ -79,6 +94,63 @@ class TestEncodeMultipartMixed:
         assert b"Content-Type: application/json\r\n" in body
 
 
+class TestMultipartStream:
+    def test_stream_matches_encoded_body(self):
+        parts = [
+            MultipartPart(headers={"Content-Type": "text/plain"}, content=b"part1"),
+            MultipartPart(headers={"Content-Type": "text/plain"}, content=b"part2"),
+        ]
+        stream = MultipartStream(parts, boundary="boundary")
+        body, content_type = encode_multipart_mixed(parts, boundary="boundary")
+        assert b"".join(stream) == body
+        assert stream.content_type == content_type
+        assert stream.content_length == len(body)
+
+    def test_stream_does_not_copy_content(self):
+        content = bytes(range(256))
+        stream = MultipartStream([MultipartPart(headers={}, content=content)])
+        assert any(chunk is content for chunk in stream)
+
+    def test_stream_is_reiterable(self):
+        part = MultipartPart(headers={"Content-Type": "text/plain"}, content=b"data")
+        stream = MultipartStream([part])
+        assert b"".join(stream) == b"".join(stream)
+
+    @pytest.mark.asyncio
+    async def test_stream_async_iteration(self):
+        part = MultipartPart(headers={"Content-Type": "text/plain"}, content=b"data")
+        stream = MultipartStream([part])
+        chunks = [chunk async for chunk in stream]
+        assert b"".join(chunks) == b"".join(stream)
+
+    def test_stream_iterable_content(self):
+        content = [b"par", b"t1"]
+        sized = _SizedChunks(content)
+        stream = MultipartStream(
+            [MultipartPart(headers={"Content-Type": "text/plain"}, content=sized)],
+            boundary="boundary",
+        )
+        body, _ = encode_multipart_mixed(
+            [MultipartPart(headers={"Content-Type": "text/plain"}, content=b"part1")],
+            boundary="boundary",
+        )
+        assert b"".join(stream) == body
+        assert stream.content_length == len(body)
+        assert b"par" in list(stream)
+
+    @pytest.mark.asyncio
+    async def test_stream_async_iterable_content(self):
+        sized = _SizedChunks([b"par", b"t1"])
+        stream = MultipartStream([MultipartPart(headers={}, content=sized)])
+        chunks = [chunk async for chunk in stream]
+        assert b"".join(chunks) == b"".join(stream)
+
+    def test_stream_repr(self):
+        part = MultipartPart(headers={}, content=b"data")
+        stream = MultipartStream([part], boundary="b")
+        assert repr(stream) == "MultipartStream(parts=1, content_length=20)"
+
+
 class TestDecodeMultipartMixed:
     def test_decode_single_part(self):
         raw = b"--boundary\r\nContent-Type: text/plain\r\n\r\nhello\r\n--boundary--\r\n"
@@ -148,6 +220,65 @@ class TestDecodeMultipartMixed:
         assert parts[0].content == b"data"
 
 
+class TestMultipartDecoder:
+    def test_feed_returns_parts_once_complete(self):
+        decoder = MultipartDecoder("multipart/mixed; boundary=boundary")
+        assert decoder.feed(b"--boundary\r\nContent-Type: text/plain\r\n\r\npa") == []
+        assert decoder.feed(b"rt1\r\n--bound") == []
+        parts = decoder.feed(b"ary\r\nContent-Type: text/plain\r\n\r\npart2")
+        assert [part.content for part in parts] == [b"part1"]
+        assert not decoder.finished
+        parts = decoder.feed(b"\r\n--boundary--\r\n")
+        assert [part.content for part in parts] == [b"part2"]
+        assert decoder.finished
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024])
+    def test_feed_chunked(self, chunk_size):
+        decoder = MultipartDecoder("multipart/mixed; boundary=boundary")
+        parts = []
+        for i in range(0, len(RAW_MULTIPART), chunk_size):
+            parts.extend(decoder.feed(RAW_MULTIPART[i : i + chunk_size]))
+        assert decoder.finished
+        assert [part.headers for part in parts] == [
+            {"Content-Type": "text/plain"},
+            {"Content-Type": "application/octet-stream"},
+        ]
+        assert [part.content for part in parts] == [b"part1", bytes(range(256))]
+
+    def test_feed_content_resembling_boundary(self):
+        raw = (
+            b"--boundary\r\n"
+            b"Content-Type: text/plain\r\n"
+            b"\r\n"
+            b"--boundar\r\n--bound\r\n-boundary\r\n"
+            b"--boundary--\r\n"
+        )
+        decoder = MultipartDecoder("multipart/mixed; boundary=boundary")
+        parts = [part for byte in raw for part in decoder.feed(bytes([byte]))]
+        assert [part.content for part in parts] == [
+            b"--boundar\r\n--bound\r\n-boundary",
+        ]
+
+    def test_iter_multipart_mixed(self):
+        chunks = (RAW_MULTIPART[i : i + 5] for i in range(0, len(RAW_MULTIPART), 5))
+        parts = list(iter_multipart_mixed(chunks, "multipart/mixed; boundary=boundary"))
+        assert [part.content for part in parts] == [b"part1", bytes(range(256))]
+
+    @pytest.mark.asyncio
+    async def test_aiter_multipart_mixed(self):
+        async def chunks():
+            for i in range(0, len(RAW_MULTIPART), 5):
+                yield RAW_MULTIPART[i : i + 5]
+
+        content_type = "multipart/mixed; boundary=boundary"
+        parts = [part async for part in aiter_multipart_mixed(chunks(), content_type)]
+        assert [part.content for part in parts] == [b"part1", bytes(range(256))]
+
+    def test_iter_empty_stream(self):
+        parts = list(iter_multipart_mixed([], "multipart/mixed; boundary=boundary"))
+        assert parts == []
+
+
 class TestMultipartPart:
     def test_text_default_charset(self):
         part = MultipartPart(
@@ -201,3 +332,14 @@ class TestRoundtrip:
         body, content_type = encode_multipart_mixed(original)
         decoded = decode_multipart_mixed(body, content_type)
         assert decoded[0].content == binary
+
+
+class _SizedChunks:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __iter__(self):
+        return iter(self._chunks)
@@ -0,0 +1,128 @@
+import io
+import xml.etree.ElementTree as ElemTree
+
+import pytest
+
+from mlclient import xml_codec
+from mlclient.exceptions import WrongParametersError
+from mlclient.models import XMLDocument
+
+
+@pytest.fixture
+def _lxml_backend():
+    pytest.importorskip("lxml")
+    initial_backend = xml_codec.get_backend()
+    xml_codec.set_backend("lxml")
+    yield
+    xml_codec.set_backend(initial_backend)
+
+
+def test_default_backend():
+    assert xml_codec.get_backend() == "etree"
+
+
+def test_set_unknown_backend():
+    with pytest.raises(WrongParametersError) as err:
+        xml_codec.set_backend("minidom")
+
+    expected_msg = "Unknown XML backend [minidom]! Available: etree, lxml"
+    assert err.value.args[0] == expected_msg
+
+
+def test_set_lxml_backend_without_lxml(monkeypatch):
+    monkeypatch.setattr(xml_codec, "lxml_etree", None)
+
+    with pytest.raises(WrongParametersError) as err:
+        xml_codec.set_backend("lxml")
+
+    expected_msg = "The lxml backend requires the lxml package to be installed!"
+    assert err.value.args[0] == expected_msg
+    assert xml_codec.get_backend() == "etree"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"<root><child>data</child></root>",
+        "<root><child>data</child></root>",
+    ],
+)
+def test_parse_with_etree(data):
+    tree = xml_codec.parse(data)
+
+    assert isinstance(tree, ElemTree.ElementTree)
+    assert xml_codec.is_tree(tree)
+    assert xml_codec.is_element(tree.getroot())
+    assert tree.getroot().find("child").text == "data"
+
+
+def test_tostring_with_etree():
+    element = xml_codec.fromstring(b"<root><child>\xc5\xbc</child></root>")
+
+    assert xml_codec.tostring(element) == b"<root><child>\xc5\xbc</child></root>"
+    assert xml_codec.tostring(element, xml_declaration=True).startswith(b"<?xml")
+
+
+def test_xpath_with_etree():
+    tree = xml_codec.parse("<root><child>1</child><child>2</child></root>")
+
+    assert [child.text for child in xml_codec.xpath(tree, "child")] == ["1", "2"]
+
+
+def test_iterparse_clears_yielded_elements():
+    source = io.BytesIO(b"<root><child><leaf/></child><child><leaf/></child></root>")
+
+    children = list(xml_codec.iterparse(source, "child"))
+    assert len(children) == 2
+    assert all(len(child) == 0 for child in children)
+
+
+def test_is_element_and_is_tree_with_other_objects():
+    assert not xml_codec.is_element("<root/>")
+    assert not xml_codec.is_tree({"root": None})
+
+
+@pytest.mark.usefixtures("_lxml_backend")
+def test_parse_with_lxml():
+    tree = xml_codec.parse('<?xml version="1.0" encoding="UTF-8"?><root>ż</root>')
+
+    assert isinstance(tree, xml_codec.lxml_etree._ElementTree)
+    assert xml_codec.is_tree(tree)
+    assert xml_codec.is_element(tree.getroot())
+    assert xml_codec.tostring(tree.getroot()) == "<root>ż</root>".encode()
+
+
+@pytest.mark.usefixtures("_lxml_backend")
+def test_xpath_with_lxml():
+    document = XMLDocument(
+        '<med:patient xmlns:med="http://example.com/medical">'
+        "<med:name>Smith</med:name><med:name>Jones</med:name>"
+        "</med:patient>",
+    )
+    namespaces = {"med": "http://example.com/medical"}
+
+    names = document.xpath("//med:name[text()='Jones']", **namespaces)
+    assert [name.text for name in names] == ["Jones"]
+    assert xml_codec.xpath(document.content, "count(//med:name)", namespaces) == 2
+
+
+@pytest.mark.usefixtures("_lxml_backend")
+def test_mixed_backend_nodes():
+    etree_document = XMLDocument(
+        ElemTree.fromstring("<root><child>data</child></root>"),
+    )
+    lxml_document = XMLDocument(
+        xml_codec.fromstring(b"<root><child>data</child></root>"),
+    )
+
+    assert isinstance(etree_document.content, ElemTree.ElementTree)
+    assert len(etree_document.xpath("child")) == 1
+    assert len(lxml_document.xpath("child")) == 1
+    assert etree_document.content_bytes == lxml_document.content_bytes
+
+
+@pytest.mark.usefixtures("_lxml_backend")
+def test_iterparse_with_lxml():
+    document = XMLDocument(b"<root><child>1</child><child>2</child><other/></root>")
+
+    assert [child.text for child in document.iterparse("child")] == ["1", "2"]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from mlclient import yaml_cache
+from mlclient.exceptions import ResourceNotFoundError
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(yaml_cache.CACHE_DIR_ENV_VAR, str(cache_dir))
+    monkeypatch.setattr(yaml_cache, "_MEMORY_CACHE", {})
+    return cache_dir
+
+
+@pytest.fixture
+def yaml_file(
+    tmp_path: Path,
+) -> Path:
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("app-name: my-app\nport: 8000\n")
+    return yaml_file
+
+
+def test_load_file(yaml_file: Path, cache_dir: Path):
+    contents = yaml_cache.load_file(yaml_file)
+
+    assert contents == {"app-name": "my-app", "port": 8000}
+    (cache_file,) = cache_dir.iterdir()
+    assert json.loads(cache_file.read_text())["contents"] == contents
+    if os.name == "posix":
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_load_file_returns_copies(yaml_file: Path):
+    yaml_cache.load_file(yaml_file)["port"] = 8001
+
+    assert yaml_cache.load_file(yaml_file)["port"] == 8000
+
+
+def test_load_file_from_cache_dir(
+    yaml_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+):
+    yaml_cache.load_file(yaml_file)
+    monkeypatch.setattr(yaml_cache, "_MEMORY_CACHE", {})
+    parse = mocker.spy(yaml_cache, "_parse")
+
+    contents = yaml_cache.load_file(yaml_file)
+
+    assert contents == {"app-name": "my-app", "port": 8000}
+    parse.assert_not_called()
+
+
+def test_load_changed_file(yaml_file: Path):
+    yaml_cache.load_file(yaml_file)
+    yaml_file.write_text("app-name: my-app\nport: 18000\n")
+
+    assert yaml_cache.load_file(yaml_file)["port"] == 18000
+
+
+def test_load_file_with_disabled_cache_dir(
+    yaml_file: Path,
+    cache_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv(yaml_cache.CACHE_DIR_ENV_VAR, "")
+
+    assert yaml_cache.load_file(yaml_file)["port"] == 8000
+    assert yaml_cache.get_cache_dir() is None
+    assert not cache_dir.exists()
+
+
+def test_load_file_not_cached_in_default_cache_dir(
+    yaml_file: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delenv(yaml_cache.CACHE_DIR_ENV_VAR)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    assert yaml_cache.load_file(yaml_file)["port"] == 8000
+    assert not (tmp_path / "xdg").exists()
+
+
+def test_load_file_not_cached_in_json_when_not_lossless(
+    tmp_path: Path,
+    cache_dir: Path,
+):
+    yaml_file = tmp_path / "dates.yaml"
+    yaml_file.write_text("date: 2024-01-01\n")
+
+    contents = yaml_cache.load_file(yaml_file)
+
+    assert str(contents["date"]) == "2024-01-01"
+    assert not cache_dir.exists()
+
+
+def test_load_resource():
+    mimetypes = yaml_cache.load_resource("mimetypes.yaml")["mimetypes"]
+
+    expected = {
+        "mime-type": "application/json",
+        "extensions": ["json"],
+        "doc-type": "json",
+    }
+    assert expected in mimetypes
+
+
+def test_load_resource_cached_in_default_cache_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delenv(yaml_cache.CACHE_DIR_ENV_VAR)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    mimetypes = yaml_cache.load_resource("mimetypes.yaml")
+
+    (cache_file,) = (tmp_path / "xdg" / "mlclient").iterdir()
+    assert json.loads(cache_file.read_text())["contents"] == mimetypes
+
+
+def test_load_non_existing_resource():
+    with pytest.raises(ResourceNotFoundError):
+        yaml_cache.load_resource("non-existing.yaml")
+
+
+def test_get_default_cache_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delenv(yaml_cache.CACHE_DIR_ENV_VAR)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert yaml_cache.get_cache_dir() == tmp_path / "mlclient"
+
+
+def test_import_defers_heavy_dependencies():
+    script = (
+        "import sys, mlclient;"
+        "print(sorted({'httpx', 'pydantic', 'yaml'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+from httpx import Response
+
+from mlclient.models import Document, DocumentType, Metadata, Permission
+from mlclient.models.http import Category
+from mlclient.models.http import DocumentsBodyPartType as BodyPartType
+from mlclient.models.http import DocumentsDispositionRecord as DispositionRecord
+from mlclient.multipart import MultipartPart, encode_multipart_mixed
+
+# Corpora of ~1 MiB each, from many small documents to a few large ones
+CORPORA = [
+    pytest.param((1000, 1024), id="1000x1KiB"),
+    pytest.param((100, 10 * 1024), id="100x10KiB"),
+    pytest.param((10, 100 * 1024), id="10x100KiB"),
+]
+DOC_TYPES = [
+    pytest.param(DocumentType.XML, id="xml"),
+    pytest.param(DocumentType.JSON, id="json"),
+    pytest.param(DocumentType.TEXT, id="text"),
+    pytest.param(DocumentType.BINARY, id="binary"),
+]
+_EXTENSIONS = {
+    DocumentType.XML: "xml",
+    DocumentType.JSON: "json",
+    DocumentType.TEXT: "txt",
+    DocumentType.BINARY: "bin",
+}
+_WORD_SIZES = {
+    DocumentType.XML: 29,
+    DocumentType.JSON: 18,
+    DocumentType.TEXT: 15,
+}
+_MIMETYPES = {
+    DocumentType.XML: "application/xml",
+    DocumentType.JSON: "application/json",
+    DocumentType.TEXT: "text/plain",
+    DocumentType.BINARY: "application/octet-stream",
+}
+
+
+def uri(
+    i: int,
+    doc_type: DocumentType = DocumentType.XML,
+) -> str:
+    return f"/perf-tests/corpus/doc-{i}.{_EXTENSIONS[doc_type]}"
+
+
+def content(
+    i: int,
+    size: int,
+    doc_type: DocumentType = DocumentType.XML,
+) -> bytes:
+    """Return deterministic content of roughly the given size in bytes."""
+    if doc_type == DocumentType.BINARY:
+        return random.Random(i).randbytes(size)
+    words = [f"value-{j:08d}" for j in range(size // _WORD_SIZES[doc_type] + 1)]
+    if doc_type == DocumentType.XML:
+        items = "".join(f"<item>{word}</item>" for word in words)
+        return f"<root><id>{i}</id>{items}</root>".encode()
+    if doc_type == DocumentType.JSON:
+        return json.dumps({"root": {"id": i, "items": words}}).encode()
+    return " ".join(words).encode()
+
+
+def metadata(
+    i: int,
+) -> Metadata:
+    return Metadata(
+        collections=["perf-tests", f"perf-tests-{i % 10}"],
+        permissions=[
+            Permission("rest-reader", {Permission.READ}),
+            Permission("rest-writer", {Permission.READ, Permission.UPDATE}),
+        ],
+        properties={"index": str(i), "source": "corpus"},
+        quality=i % 5,
+    )
+
+
+def documents(
+    corpus: tuple[int, int],
+    doc_type: DocumentType = DocumentType.XML,
+    with_metadata: bool = False,
+) -> list[Document]:
+    count, size = corpus
+    return [
+        Document.create(
+            uri(i, doc_type),
+            content(i, size, doc_type),
+            doc_type=doc_type,
+            metadata=metadata(i) if with_metadata else None,
+        )
+        for i in range(count)
+    ]
+
+
+def response_parts(
+    corpus: tuple[int, int],
+    doc_type: DocumentType = DocumentType.XML,
+    with_metadata: bool = False,
+) -> list[MultipartPart]:
+    """Return parts of a multipart /v1/documents GET response."""
+    count, size = corpus
+    parts = []
+    for i in range(count):
+        if with_metadata:
+            disp = DispositionRecord(
+                type_=BodyPartType.ATTACHMENT,
+                filename=uri(i, doc_type),
+                category=Category.METADATA,
+                format_=DocumentType.JSON,
+            )
+            parts.append(
+                MultipartPart(
+                    headers={
+                        "Content-Type": "application/json",
+                        "Content-Disposition": disp.to_header(),
+                    },
+                    content=metadata(i).to_json_string().encode(),
+                ),
+            )
+        disp = DispositionRecord(
+            type_=BodyPartType.ATTACHMENT,
+            filename=uri(i, doc_type),
+            category=Category.CONTENT,
+            format_=doc_type,
+        )
+        parts.append(
+            MultipartPart(
+                headers={
+                    "Content-Type": _MIMETYPES[doc_type],
+                    "Content-Disposition": disp.to_header(),
+                },
+                content=content(i, size, doc_type),
+            ),
+        )
+    return parts
+
+
+def response(
+    corpus: tuple[int, int],
+    doc_type: DocumentType = DocumentType.XML,
+    with_metadata: bool = False,
+) -> Response:
+    """Return a multipart /v1/documents GET response."""
+    parts = response_parts(corpus, doc_type, with_metadata)
+    body, content_type = encode_multipart_mixed(parts)
+    return Response(200, headers={"Content-Type": content_type}, content=body)
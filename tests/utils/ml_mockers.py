@@ -723,3 +723,38 @@ class MLDocumentsMocker:
                 col_str = "(" + ", ".join(f'"{c}"' for c in collections) + ")"
             return f'xdmp:document-set-collections("{uri}", {col_str})'
         raise NotImplementedError
+
+
+class MLForestsMocker:
+    """Mocks URI enumeration of QueryBatcher over /v1/eval."""
+
+    TIMESTAMP = "17000000000000000"
+
+    def __init__(
+        self,
+        forests: dict[str, list[str]],
+    ):
+        self.forests = forests
+        self.pages = []
+
+    def eval_side_effect(
+        self,
+        request: Request,
+    ) -> Response:
+        body = httpx.QueryParams(request.content.decode())
+        variables = json.loads(body.get("vars", "{}"))
+        if "forest" not in variables:
+            result = {"timestamp": self.TIMESTAMP, "forests": list(self.forests)}
+        else:
+            self.pages.append(variables)
+            uris = sorted(self.forests[variables["forest"]])
+            after = variables["after"]
+            page = [uri for uri in uris if uri > after][: variables["limit"]]
+            result = {"uris": page}
+        part = MultipartPart(
+            headers={"Content-Type": "application/json", "X-Primitive": "map"},
+            content=json.dumps(result).encode("utf-8"),
+        )
+        content, content_type = encode_multipart_mixed([part])
+        headers = {"Content-Type": content_type}
+        return Response(status_code=httpx.codes.OK, headers=headers, content=content)
@@ -0,0 +1,665 @@
+"""An offline MarkLogic stand-in server for benchmark and load testing.
+
+It serves a small subset of MarkLogic REST resources from memory, over real
+sockets on localhost, so clients and jobs run unchanged against it:
+    * /v1/documents (GET / POST / DELETE with multipart/mixed bodies)
+    * /v1/eval (URI enumeration scripts of QueryBatcher; other code is a no-op)
+    * /manage/v2/logs
+    * /manage/v2/hosts
+    * /admin/v1/timestamp
+
+Latency, bandwidth, error rate and restarts are configurable, so throughput
+of clients can be measured without a cluster, under reproducible conditions.
+Requests are not authenticated - any credentials are accepted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import ClassVar, NamedTuple
+
+import httpx
+from httpx import Headers, Request, Response
+
+from mlclient.mimetypes import Mimetypes
+from mlclient.models import DocumentType
+from mlclient.models.http import Category
+from mlclient.models.http import DocumentsBodyPartType as BodyPartType
+from mlclient.models.http import DocumentsDispositionRecord as DispositionRecord
+from mlclient.multipart import (
+    MultipartPart,
+    decode_multipart_mixed,
+    encode_multipart_mixed,
+)
+
+HOST_ID = "13544732455686476949"
+_CHUNK_SIZE = 64 * 1024
+_MAX_HEAD_SIZE = 1024 * 1024
+_JSON = "application/json; charset=UTF-8"
+
+
+@dataclass
+class MLStandInConfig:
+    """Settings of an MLStandInServer.
+
+    Attributes
+    ----------
+    host : str
+        A host name to listen on (reported by /manage/v2/hosts)
+    ports : tuple[int, ...]
+        Ports to listen on (0 for a free one); all of them serve all resources
+    latency : float
+        Seconds added to every response
+    bandwidth : int | None
+        Bytes per second transferred in each direction of a connection
+    error_rate : float
+        A fraction of /v1 requests failing with 503 Service Unavailable
+    restart_every : int | None
+        A number of /v1 requests after which the server restarts
+    restart_duration : float
+        Seconds the server responds with 503 Service Unavailable when restarting
+    forests : int
+        A number of forests documents are spread across
+    seed : int | None
+        A seed of the error generator
+    """
+
+    host: str = "localhost"
+    ports: tuple[int, ...] = (8000, 8001, 8002)
+    latency: float = 0.0
+    bandwidth: int | None = None
+    error_rate: float = 0.0
+    restart_every: int | None = None
+    restart_duration: float = 1.0
+    forests: int = 3
+    seed: int | None = None
+
+
+class StoredDocument(NamedTuple):
+    """A document kept by an MLStandInServer."""
+
+    content: bytes
+    content_type: str
+    doc_type: DocumentType
+    metadata: bytes | None
+    collections: frozenset[str]
+
+
+class MLStandInServer:
+    """An offline MarkLogic stand-in server running in a background thread.
+
+    Examples
+    --------
+    >>> from mlclient import MLClient
+    >>> with MLStandInServer(MLStandInConfig(latency=0.005)) as server:
+    ...     with MLClient() as ml:
+    ...         ml.documents.write(documents)
+    ...     assert len(server.documents) == len(documents)
+    """
+
+    def __init__(
+        self,
+        config: MLStandInConfig | None = None,
+    ):
+        self.config: MLStandInConfig = config or MLStandInConfig()
+        self.requests: int = 0
+        self._documents: dict[str, StoredDocument] = {}
+        self._logs: list[dict] = []
+        self._timestamp: int = 17_000_000_000_000_000
+        self._last_startup: str = self._now()
+        self._restarting_until: float = 0.0
+        self._random: random.Random = random.Random(self.config.seed)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._servers: list[asyncio.Server] = []
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    def __enter__(
+        self,
+    ) -> MLStandInServer:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type,
+        exc_val,
+        exc_tb,
+    ):
+        self.stop()
+
+    @property
+    def documents(
+        self,
+    ) -> MappingProxyType[str, StoredDocument]:
+        """Return stored documents keyed by URI."""
+        return MappingProxyType(self._documents)
+
+    @property
+    def ports(
+        self,
+    ) -> list[int]:
+        """Return ports the server listens on."""
+        return [
+            server.sockets[0].getsockname()[1]
+            for server in self._servers
+            if server.sockets
+        ]
+
+    @property
+    def last_startup(
+        self,
+    ) -> str:
+        """Return a timestamp of the last (re)start."""
+        return self._last_startup
+
+    def start(
+        self,
+    ):
+        """Start listening in a background thread."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="ml-stand-in-server",
+            daemon=True,
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_servers(), self._loop).result()
+
+    def stop(
+        self,
+    ):
+        """Close all connections and stop the background thread."""
+        asyncio.run_coroutine_threadsafe(self._stop_servers(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def restart(
+        self,
+    ):
+        """Restart the server, being unavailable for the restart duration."""
+        self._restarting_until = time.monotonic() + self.config.restart_duration
+        self._last_startup = self._now()
+        self._log("Notice", "Restarting MarkLogic Server")
+
+    def clear(
+        self,
+    ):
+        """Remove all documents and logs."""
+        self._documents.clear()
+        self._logs.clear()
+
+    def forest_of(
+        self,
+        uri: str,
+    ) -> str:
+        """Return an id of a forest a document is assigned to."""
+        return str(zlib.crc32(uri.encode("utf-8")) % self.config.forests + 1)
+
+    async def _start_servers(
+        self,
+    ):
+        self._servers = [
+            await asyncio.start_server(
+                self._serve,
+                self.config.host,
+                port,
+                limit=_MAX_HEAD_SIZE,
+            )
+            for port in self.config.ports
+        ]
+
+    async def _stop_servers(
+        self,
+    ):
+        for server in self._servers:
+            server.close()
+        for writer in list(self._writers):
+            writer.close()
+        for server in self._servers:
+            await server.wait_closed()
+
+    async def _serve(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Serve keep-alive HTTP/1.1 requests of a connection."""
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                response = await self._respond(request)
+                await self._write_response(writer, request, response)
+                if request.headers.get("Connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _read_request(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> Request | None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as err:
+            if err.partial:
+                raise
+            return None
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")[:-2]
+        method, target, _ = request_line.split(" ", 2)
+        headers = Headers([line.split(":", 1) for line in header_lines])
+        headers = Headers({name: value.strip() for name, value in headers.items()})
+        if headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = await self._read_chunked_body(reader)
+        else:
+            body = await reader.readexactly(int(headers.get("Content-Length", 0)))
+        await self._throttle(len(body))
+        url = f"http://{headers.get('Host', self.config.host)}{target}"
+        return Request(method, url, headers=headers, content=body)
+
+    @staticmethod
+    async def _read_chunked_body(
+        reader: asyncio.StreamReader,
+    ) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        request: Request,
+        response: Response,
+    ):
+        content = b"" if request.method == "HEAD" else response.content
+        status = response.status_code
+        lines = [f"HTTP/1.1 {status} {httpx.codes.get_reason_phrase(status)}"]
+        lines.extend(
+            f"{name}: {value}"
+            for name, value in response.headers.multi_items()
+            if name.lower() != "content-length"
+        )
+        lines.append(f"Content-Length: {len(content)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        for start in range(0, len(content), _CHUNK_SIZE):
+            chunk = content[start : start + _CHUNK_SIZE]
+            await self._throttle(len(chunk))
+            writer.write(chunk)
+            await writer.drain()
+        await writer.drain()
+
+    async def _throttle(
+        self,
+        size: int,
+    ):
+        """Wait for the time a transfer takes at the configured bandwidth."""
+        if self.config.bandwidth and size:
+            await asyncio.sleep(size / self.config.bandwidth)
+
+    async def _respond(
+        self,
+        request: Request,
+    ) -> Response:
+        self.requests += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        path = request.url.path
+        if path.startswith("/v1/"):
+            failure = self._injected_failure()
+            if failure is not None:
+                return failure
+        if time.monotonic() < self._restarting_until:
+            return self._error_response(503, "XDMP-UNAVAILABLE", "Server restarting")
+        handler = self._HANDLERS.get((request.method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self._HANDLERS):
+                return self._error_response(405, "REST-UNSUPPORTEDMETHOD", path)
+            return self._error_response(404, "REST-INVALIDPATH", path)
+        try:
+            return handler(self, request)
+        except Exception as err:
+            self._log("Error", f"XDMP-UNEXPECTED: {err!r}")
+            return self._error_response(500, "XDMP-UNEXPECTED", repr(err))
+
+    def _injected_failure(
+        self,
+    ) -> Response | None:
+        """Restart the server or fail a request as configured."""
+        restart_every = self.config.restart_every
+        if restart_every and self.requests % restart_every == 0:
+            self.restart()
+        if self._random.random() < self.config.error_rate:
+            self._log("Error", "XDMP-INJECTED: Injected failure")
+            return self._error_response(503, "XDMP-INJECTED", "Injected failure")
+        return None
+
+    def _get_documents(
+        self,
+        request: Request,
+    ) -> Response:
+        uris = request.url.params.get_list("uri")
+        category = request.url.params.get_list("category") or ["content"]
+        if len(uris) == 1 and len(category) == 1:
+            return self._single_part_response(uris[0], category[0])
+        parts = [
+            part
+            for uri in uris
+            if uri in self._documents
+            for part in self._document_parts(uri, category)
+        ]
+        if not parts:
+            headers = {"Content-Type": "multipart/mixed; boundary=ML_BOUNDARY"}
+            return Response(200, headers=headers)
+        content, content_type = encode_multipart_mixed(parts)
+        return Response(200, headers={"Content-Type": content_type}, content=content)
+
+    def _post_documents(
+        self,
+        request: Request,
+    ) -> Response:
+        parts = decode_multipart_mixed(
+            request.content,
+            request.headers.get("Content-Type"),
+        )
+        default_metadata = None
+        pending_metadata = {}
+        results = {}
+        for part in parts:
+            headers = Headers(part.headers)
+            disp = DispositionRecord.from_header(headers["Content-Disposition"])
+            if disp.is_inline:
+                default_metadata = part.content
+            elif disp.category in (None, Category.CONTENT):
+                metadata = pending_metadata.pop(disp.filename, default_metadata)
+                self._store(disp, headers.get("Content-Type"), part.content, metadata)
+                results[disp.filename] = self._stored_result(disp.filename, True)
+            else:
+                pending_metadata[disp.filename] = part.content
+        for uri, metadata in pending_metadata.items():
+            document = self._documents.get(uri)
+            if document is None:
+                msg = f'xdmp:document-set-metadata("{uri}") -- Document not found'
+                return self._error_response(404, "XDMP-DOCNOTFOUND", msg)
+            self._documents[uri] = document._replace(
+                metadata=metadata,
+                collections=self._collections(metadata),
+            )
+            results.setdefault(uri, self._stored_result(uri, False))
+        self._timestamp += 1
+        body = {"documents": list(results.values())}
+        headers = {"Content-Type": _JSON, "vnd.marklogic.document-format": "json"}
+        return Response(200, headers=headers, content=json.dumps(body).encode())
+
+    def _delete_documents(
+        self,
+        request: Request,
+    ) -> Response:
+        for uri in request.url.params.get_list("uri"):
+            self._documents.pop(uri, None)
+        self._timestamp += 1
+        return Response(204)
+
+    def _post_eval(
+        self,
+        request: Request,
+    ) -> Response:
+        form = httpx.QueryParams(request.content.decode("utf-8"))
+        variables = json.loads(form.get("vars", "{}"))
+        script = form.get("javascript", form.get("xquery", ""))
+        if "forest" in variables:
+            result = {"uris": self._forest_page(variables)}
+        elif "databaseForests" in script:
+            result = {
+                "timestamp": str(self._timestamp),
+                "forests": [str(i + 1) for i in range(self.config.forests)],
+            }
+        else:
+            return Response(200, headers={"Content-Type": _JSON})
+        part = MultipartPart(
+            headers={"Content-Type": "application/json", "X-Primitive": "map"},
+            content=json.dumps(result).encode("utf-8"),
+        )
+        content, content_type = encode_multipart_mixed([part])
+        return Response(200, headers={"Content-Type": content_type}, content=content)
+
+    def _get_logs(
+        self,
+        request: Request,
+    ) -> Response:
+        filename = request.url.params.get("filename")
+        if filename is None:
+            items = [
+                {"nameref": name, "roleref": self.config.host}
+                for name in ("ErrorLog.txt", "AccessLog.txt")
+            ]
+            list_items = {"list-count": {"value": len(items)}, "list-item": items}
+            body = {"log-default-list": {"list-items": list_items}}
+        elif "ErrorLog" in filename:
+            body = {"logfile": {"log": list(self._logs)} if self._logs else {}}
+        else:
+            body = {"logfile": {}}
+        return Response(200, headers={"Content-Type": _JSON}, json=body)
+
+    def _get_hosts(
+        self,
+        request: Request,
+    ) -> Response:
+        items = [{"idref": HOST_ID, "nameref": self.config.host}]
+        list_items = {"list-count": {"value": len(items)}, "list-item": items}
+        body = {"host-default-list": {"list-items": list_items}}
+        return Response(200, headers={"Content-Type": _JSON}, json=body)
+
+    def _get_timestamp(
+        self,
+        request: Request,
+    ) -> Response:
+        headers = {"Content-Type": "text/plain; charset=UTF-8"}
+        return Response(200, headers=headers, text=self._last_startup)
+
+    _HANDLERS: ClassVar[dict] = {
+        ("GET", "/v1/documents"): _get_documents,
+        ("POST", "/v1/documents"): _post_documents,
+        ("DELETE", "/v1/documents"): _delete_documents,
+        ("POST", "/v1/eval"): _post_eval,
+        ("GET", "/manage/v2/logs"): _get_logs,
+        ("GET", "/manage/v2/hosts"): _get_hosts,
+        ("GET", "/admin/v1/timestamp"): _get_timestamp,
+    }
+
+    def _single_part_response(
+        self,
+        uri: str,
+        category: str,
+    ) -> Response:
+        document = self._documents.get(uri)
+        if document is None:
+            msg = (
+                "RESTAPI-NODOCUMENT: (err:FOER0000) "
+                "Resource or document does not exist:  "
+                f"category: content message: {uri}"
+            )
+            return self._error_response(404, "RESTAPI-NODOCUMENT", msg)
+        if category != "content":
+            return Response(
+                200,
+                headers={"Content-Type": _JSON},
+                content=document.metadata or b"{}",
+            )
+        headers = {
+            "Content-Type": f"{document.content_type}; charset=utf-8",
+            "vnd.marklogic.document-format": document.doc_type.value,
+        }
+        return Response(200, headers=headers, content=document.content)
+
+    def _document_parts(
+        self,
+        uri: str,
+        category: list[str],
+    ) -> list[MultipartPart]:
+        document = self._documents[uri]
+        parts = []
+        metadata_category = [cat for cat in category if cat != "content"]
+        if metadata_category:
+            disp = DispositionRecord(
+                type_=BodyPartType.ATTACHMENT,
+                filename=uri,
+                category=tuple(Category(cat) for cat in metadata_category),
+                format_=DocumentType.JSON,
+            )
+            parts.append(
+                MultipartPart(
+                    headers={
+                        "Content-Type": "application/json",
+                        "Content-Disposition": disp.to_header(),
+                    },
+                    content=document.metadata or b"{}",
+                ),
+            )
+        if "content" in category:
+            disp = DispositionRecord(
+                type_=BodyPartType.ATTACHMENT,
+                filename=uri,
+                category=Category.CONTENT,
+                format_=document.doc_type,
+            )
+            parts.append(
+                MultipartPart(
+                    headers={
+                        "Content-Type": document.content_type,
+                        "Content-Disposition": disp.to_header(),
+                    },
+                    content=document.content,
+                ),
+            )
+        return parts
+
+    def _store(
+        self,
+        disp: DispositionRecord,
+        content_type: str | None,
+        content: bytes,
+        metadata: bytes | None,
+    ):
+        uri = disp.filename
+        content_type = content_type or Mimetypes.get_mimetype(uri)
+        self._documents[uri] = StoredDocument(
+            content=content,
+            content_type=content_type,
+            doc_type=disp.format_ or Mimetypes.get_doc_type(uri),
+            metadata=metadata,
+            collections=self._collections(metadata),
+        )
+
+    def _stored_result(
+        self,
+        uri: str,
+        with_content: bool,
+    ) -> dict:
+        if with_content:
+            mime_type = self._documents[uri].content_type
+            return {
+                "uri": uri,
+                "mime-type": mime_type,
+                "category": ["metadata", "content"],
+            }
+        return {"uri": uri, "mime-type": "", "category": ["metadata"]}
+
+    def _forest_page(
+        self,
+        variables: dict,
+    ) -> list[str]:
+        """Return URIs of a forest page requested by QueryBatcher."""
+        query = json.loads(variables["query"]) if variables.get("query") else {}
+        uris = sorted(
+            uri
+            for uri, document in self._documents.items()
+            if self.forest_of(uri) == variables["forest"]
+            and uri > variables["after"]
+            and self._matches(uri, document, query)
+        )
+        return uris[: variables["limit"]]
+
+    @classmethod
+    def _matches(
+        cls,
+        uri: str,
+        document: StoredDocument,
+        query: dict,
+    ) -> bool:
+        """Verify if a document matches a serialized cts query.
+
+        Only collection, directory and and-queries are evaluated; other queries
+        match all documents.
+        """
+        if "andQuery" in query:
+            queries = query["andQuery"]["queries"]
+            return all(cls._matches(uri, document, q) for q in queries)
+        if "collectionQuery" in query:
+            collections = query["collectionQuery"]["uris"]
+            return any(col in document.collections for col in collections)
+        if "directoryQuery" in query:
+            directories = query["directoryQuery"]["uris"]
+            return any(uri.startswith(directory) for directory in directories)
+        return True
+
+    @staticmethod
+    def _collections(
+        metadata: bytes | None,
+    ) -> frozenset[str]:
+        if not metadata:
+            return frozenset()
+        try:
+            return frozenset(json.loads(metadata).get("collections") or ())
+        except ValueError:
+            return frozenset()
+
+    def _error_response(
+        self,
+        status_code: int,
+        message_code: str,
+        message: str,
+    ) -> Response:
+        body = {
+            "errorResponse": {
+                "statusCode": status_code,
+                "status": httpx.codes.get_reason_phrase(status_code),
+                "messageCode": message_code,
+                "message": message,
+            },
+        }
+        return Response(status_code, headers={"Content-Type": _JSON}, json=body)
+
+    def _log(
+        self,
+        level: str,
+        message: str,
+    ):
+        self._logs.append(
+            {"timestamp": self._now(), "level": level, "message": message},
+        )
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()